@@ -0,0 +1,70 @@
+"""Add bulk_sms_recipients table and bulk_sms_jobs.heartbeat_at
+
+대량 SMS 발송의 수신자 단위 체크포인트 테이블 추가.
+Job 시작 시 수신자 목록을 확정 저장하고, 재시작 시 미발송 수신자만 이어서 발송한다.
+
+Revision ID: 20260105_000001
+Revises: 20251230_000001
+Create Date: 2026-01-05
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '20260105_000001'
+down_revision = '20251230_000001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # 1. bulk_sms_recipients 테이블 생성
+    op.create_table(
+        "bulk_sms_recipients",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        # 소속 Job (FK 없음)
+        sa.Column("job_id", sa.BigInteger(), nullable=False),
+        # 수신자 정보
+        sa.Column("recipient_type", sa.String(20), nullable=False),  # customer, partner
+        sa.Column("recipient_id", sa.BigInteger(), nullable=False),
+        sa.Column("phone", sa.String(500), nullable=False),  # 암호화
+        sa.Column("name", sa.String(500), nullable=True),  # 암호화
+        sa.Column("label", sa.String(200), nullable=True),
+        # 발송 상태
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("batch_index", sa.Integer(), nullable=True),
+        sa.Column("sms_log_id", sa.BigInteger(), nullable=True),
+        sa.Column("error_message", sa.String(500), nullable=True),
+        # 타임스탬프
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("claimed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_bulk_sms_recipients_job_status",
+        "bulk_sms_recipients",
+        ["job_id", "status", "id"],
+    )
+    op.create_index(
+        "uq_bulk_sms_recipients_job_recipient",
+        "bulk_sms_recipients",
+        ["job_id", "recipient_id"],
+        unique=True,
+    )
+
+    # 2. bulk_sms_jobs 워커 생존 신호 컬럼 추가
+    op.add_column(
+        "bulk_sms_jobs",
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade():
+    op.drop_column("bulk_sms_jobs", "heartbeat_at")
+
+    op.drop_index("uq_bulk_sms_recipients_job_recipient", table_name="bulk_sms_recipients")
+    op.drop_index("idx_bulk_sms_recipients_job_status", table_name="bulk_sms_recipients")
+    op.drop_table("bulk_sms_recipients")
@@ -0,0 +1,32 @@
+"""Add province_code and district_code to applications
+
+신청 주소에서 도출한 지역 코드(평문)를 저장하여 지역 필터를 SQL 조건으로 처리.
+기존 데이터는 scripts/backfill_region_codes.py로 채운다.
+
+Revision ID: 20260105_000002
+Revises: 20260105_000001
+Create Date: 2026-01-05
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '20260105_000002'
+down_revision = '20260105_000001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("applications", sa.Column("province_code", sa.String(2), nullable=True))
+    op.add_column("applications", sa.Column("district_code", sa.String(5), nullable=True))
+    op.create_index("ix_applications_province_code", "applications", ["province_code"])
+    op.create_index("ix_applications_district_code", "applications", ["district_code"])
+
+
+def downgrade():
+    op.drop_index("ix_applications_district_code", table_name="applications")
+    op.drop_index("ix_applications_province_code", table_name="applications")
+    op.drop_column("applications", "district_code")
+    op.drop_column("applications", "province_code")
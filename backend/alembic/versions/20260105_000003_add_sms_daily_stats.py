@@ -0,0 +1,60 @@
+"""Add sms_daily_stats rollup table
+
+SMS 일별 발송 통계 롤업 테이블 추가 및 기존 sms_logs 집계 백필.
+이후에는 SMSLog 기록 시 애플리케이션(after_flush)에서 증분 집계한다.
+
+Revision ID: 20260105_000003
+Revises: 20260105_000002
+Create Date: 2026-01-05
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '20260105_000003'
+down_revision = '20260105_000002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "sms_daily_stats",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        # 집계 키
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("trigger_source", sa.String(20), nullable=False),
+        sa.Column("sms_type", sa.String(50), nullable=False),
+        # 건수
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        # 타임스탬프
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_sms_daily_stats_key",
+        "sms_daily_stats",
+        ["day", "status", "trigger_source", "sms_type"],
+        unique=True,
+    )
+
+    # 기존 로그 백필 (UTC 기준 일자)
+    op.execute("""
+        INSERT INTO sms_daily_stats (day, status, trigger_source, sms_type, count)
+        SELECT
+            (created_at AT TIME ZONE 'UTC')::date,
+            status,
+            COALESCE(trigger_source, 'system'),
+            sms_type,
+            COUNT(*)
+        FROM sms_logs
+        WHERE created_at IS NOT NULL
+        GROUP BY 1, 2, 3, 4;
+    """)
+
+
+def downgrade():
+    op.drop_index("uq_sms_daily_stats_key", table_name="sms_daily_stats")
+    op.drop_table("sms_daily_stats")
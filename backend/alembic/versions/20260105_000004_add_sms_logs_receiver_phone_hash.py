@@ -0,0 +1,37 @@
+"""Add sms_logs.receiver_phone_hash
+
+SMS 로그 수신번호 검색용 Blind Index 컬럼 추가.
+수신번호는 암호화 저장되므로 검색은 해시 일치 조건으로 처리한다.
+기존 로그는 python -m scripts.backfill_sms_log_hashes 로 채운다 (복호화 필요).
+
+Revision ID: 20260105_000004
+Revises: 20260105_000003
+Create Date: 2026-01-05
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '20260105_000004'
+down_revision = '20260105_000003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "sms_logs",
+        sa.Column("receiver_phone_hash", sa.String(64), nullable=True),
+    )
+    op.create_index(
+        op.f("ix_sms_logs_receiver_phone_hash"),
+        "sms_logs",
+        ["receiver_phone_hash"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(op.f("ix_sms_logs_receiver_phone_hash"), table_name="sms_logs")
+    op.drop_column("sms_logs", "receiver_phone_hash")
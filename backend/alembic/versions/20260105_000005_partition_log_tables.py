@@ -0,0 +1,131 @@
+"""Partition sms_logs and audit_logs by month
+
+sms_logs, audit_logs를 created_at 기준 월 단위 RANGE 파티션 테이블로 전환.
+- 파티션명: {table}_YYYYMM (UTC 월 경계)
+- 기존 데이터가 있는 월부터 이번 달 + 3개월까지 파티션 생성
+  (이후 파티션은 애플리케이션의 log_partition 서비스가 미리 생성)
+- 파티션 테이블 PK는 파티션 키를 포함해야 하므로 (id, created_at)로 변경
+- 기존 인덱스 정의와 id 시퀀스는 그대로 유지
+- sms_logs.created_at 인덱스 추가 (최신순 목록이 최근 파티션부터 순서대로 읽고 LIMIT에서 중단)
+
+Revision ID: 20260105_000005
+Revises: 20260105_000004
+Create Date: 2026-01-05
+"""
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '20260105_000005'
+down_revision = '20260105_000004'
+branch_labels = None
+depends_on = None
+
+
+PARTITIONED_TABLES = ("sms_logs", "audit_logs")
+PREMAKE_MONTHS = 3
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _index_definitions(bind, table: str) -> list[str]:
+    """PK를 제외한 인덱스 정의 (파티션 부모 인덱스의 ON ONLY 제거)"""
+    rows = bind.execute(
+        sa.text("""
+            SELECT pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            WHERE i.indrelid = to_regclass(:table) AND NOT i.indisprimary
+        """),
+        {"table": table},
+    ).scalars().all()
+    return [row.replace(" ON ONLY ", " ON ") for row in rows]
+
+
+def _swap_tables(bind, table: str, new_table: str):
+    """기존 테이블 삭제 후 새 테이블로 교체 (id 시퀀스 소유권 이전)"""
+    sequence = bind.execute(
+        sa.text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": table}
+    ).scalar()
+
+    # 기존 테이블 삭제 시 시퀀스가 함께 삭제되지 않도록 소유 관계 해제
+    op.execute(f"ALTER SEQUENCE {sequence} OWNED BY NONE")
+    op.execute(f'DROP TABLE "{table}"')
+    op.execute(f'ALTER TABLE "{new_table}" RENAME TO "{table}"')
+    op.execute(f'ALTER SEQUENCE {sequence} OWNED BY "{table}".id')
+
+
+def _partition_table(bind, table: str):
+    new_table = f"{table}_partitioned"
+    index_defs = _index_definitions(bind, table)
+
+    # 1. 파티션 키 NULL 정리 (server_default now()이므로 일반적으로 없음)
+    op.execute(f'UPDATE "{table}" SET created_at = now() WHERE created_at IS NULL')
+
+    # 2. 동일 컬럼 구조의 파티션 부모 테이블 생성 (기본값/컬럼 주석 포함)
+    op.execute(
+        f'CREATE TABLE "{new_table}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING COMMENTS) '
+        f"PARTITION BY RANGE (created_at)"
+    )
+    op.execute(f'ALTER TABLE "{new_table}" ALTER COLUMN created_at SET NOT NULL')
+
+    # 3. 월 파티션 생성 (기존 데이터 최초 월 ~ 이번 달 + PREMAKE_MONTHS)
+    current = datetime.now(timezone.utc).date().replace(day=1)
+    oldest = bind.execute(sa.text(
+        f"SELECT (date_trunc('month', MIN(created_at) AT TIME ZONE 'UTC'))::date FROM \"{table}\""
+    )).scalar()
+    month = min(oldest, current) if oldest else current
+    last = _add_months(current, PREMAKE_MONTHS)
+    while month <= last:
+        op.execute(
+            f'CREATE TABLE "{table}_{month:%Y%m}" PARTITION OF "{new_table}" '
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{_add_months(month, 1).isoformat()} 00:00:00+00')"
+        )
+        month = _add_months(month, 1)
+
+    # 4. 데이터 이관
+    op.execute(f'INSERT INTO "{new_table}" SELECT * FROM "{table}"')
+
+    # 5. 교체 및 PK/인덱스 생성
+    _swap_tables(bind, table, new_table)
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY (id, created_at)')
+    for index_def in index_defs:
+        op.execute(index_def)
+
+
+def _unpartition_table(bind, table: str):
+    new_table = f"{table}_plain"
+    index_defs = _index_definitions(bind, table)
+
+    op.execute(
+        f'CREATE TABLE "{new_table}" (LIKE "{table}" INCLUDING DEFAULTS INCLUDING COMMENTS)'
+    )
+    op.execute(f'INSERT INTO "{new_table}" SELECT * FROM "{table}"')
+
+    # 파티션도 함께 삭제됨 (이미 분리/아카이브된 파티션 데이터는 복원되지 않음)
+    _swap_tables(bind, table, new_table)
+    op.execute(f'ALTER TABLE "{table}" ADD CONSTRAINT "{table}_pkey" PRIMARY KEY (id)')
+    op.execute(f'ALTER TABLE "{table}" ALTER COLUMN created_at DROP NOT NULL')
+    for index_def in index_defs:
+        op.execute(index_def)
+
+
+def upgrade():
+    bind = op.get_bind()
+    for table in PARTITIONED_TABLES:
+        _partition_table(bind, table)
+
+    op.create_index("idx_sms_logs_created", "sms_logs", ["created_at"])
+
+
+def downgrade():
+    bind = op.get_bind()
+    op.drop_index("idx_sms_logs_created", table_name="sms_logs")
+    for table in PARTITIONED_TABLES:
+        _unpartition_table(bind, table)
@@ -0,0 +1,49 @@
+"""Add (created_at, id) indexes for admin list keyset pagination
+
+관리자 목록의 cursor 페이지네이션용 복합 인덱스 추가.
+목록은 (created_at DESC, id DESC)로 정렬하고 cursor 모드는 (created_at, id) < (:created_at, :id)
+조건으로 조회하므로, 필터 컬럼 + (created_at, id) 인덱스를 역방향 범위 스캔한다.
+- sms_logs: 기존 idx_sms_logs_created(created_at)를 (created_at, id)로 교체
+- audit_logs: 파티션 부모에 생성 (각 월 파티션에 자동 생성)
+
+Revision ID: 20260105_000006
+Revises: 20260105_000005
+Create Date: 2026-01-05
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '20260105_000006'
+down_revision = '20260105_000005'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = (
+    ("idx_applications_created_id", "applications", ["created_at", "id"]),
+    ("idx_applications_status_created_id", "applications", ["status", "created_at", "id"]),
+    ("idx_partners_created_id", "partners", ["created_at", "id"]),
+    ("idx_partners_status_created_id", "partners", ["status", "created_at", "id"]),
+    ("idx_bulk_sms_jobs_created_id", "bulk_sms_jobs", ["created_at", "id"]),
+    ("idx_application_notes_app_created_id", "application_notes", ["application_id", "created_at", "id"]),
+    ("idx_partner_notes_partner_created_id", "partner_notes", ["partner_id", "created_at", "id"]),
+    ("idx_sms_logs_created_id", "sms_logs", ["created_at", "id"]),
+    ("idx_audit_logs_created_id", "audit_logs", ["created_at", "id"]),
+    ("idx_audit_logs_entity_created_id", "audit_logs", ["entity_type", "entity_id", "created_at", "id"]),
+)
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+    # (created_at, id) 인덱스가 대체
+    op.drop_index("idx_sms_logs_created", table_name="sms_logs")
+
+
+def downgrade():
+    op.create_index("idx_sms_logs_created", "sms_logs", ["created_at"])
+
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
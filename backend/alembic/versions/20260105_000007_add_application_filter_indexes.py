@@ -0,0 +1,45 @@
+"""Add indexes for admin application list filters
+
+관리자 신청 목록 필터(ApplicationFilter)용 인덱스 추가.
+- 배정 협력사 / 담당 관리자 필터: (컬럼, created_at, id) 복합 인덱스로 필터 + 최신순 정렬을 인덱스 범위 스캔
+- 서비스 필터: selected_services @> '["코드"]' 조건용 GIN(jsonb_path_ops) 인덱스
+상태 필터 인덱스(status, created_at, id)는 20260105_000006에서 추가됨.
+
+Revision ID: 20260105_000007
+Revises: 20260105_000006
+Create Date: 2026-01-05
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '20260105_000007'
+down_revision = '20260105_000006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_applications_partner_created_id",
+        "applications",
+        ["assigned_partner_id", "created_at", "id"],
+    )
+    op.create_index(
+        "idx_applications_admin_created_id",
+        "applications",
+        ["assigned_admin_id", "created_at", "id"],
+    )
+    op.create_index(
+        "idx_applications_selected_services",
+        "applications",
+        ["selected_services"],
+        postgresql_using="gin",
+        postgresql_ops={"selected_services": "jsonb_path_ops"},
+    )
+
+
+def downgrade():
+    op.drop_index("idx_applications_selected_services", table_name="applications")
+    op.drop_index("idx_applications_admin_created_id", table_name="applications")
+    op.drop_index("idx_applications_partner_created_id", table_name="applications")
@@ -0,0 +1,63 @@
+"""Add dashboard_counters table
+
+관리자 대시보드 카운터 테이블 추가 및 현재 신청/협력사 건수 백필.
+이후에는 신청/협력사 생성, 상태 변경, 삭제 시 애플리케이션(after_flush)에서 증분 집계하고
+dashboard_counters 서비스가 주기적으로 재집계하여 보정한다.
+- {entity}:status:{status}: 상태별 건수
+- {entity}:created:{YYYY-MM-DD}: 최근 40일 생성일(UTC)별 건수
+
+Revision ID: 20260105_000008
+Revises: 20260105_000007
+Create Date: 2026-01-05
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '20260105_000008'
+down_revision = '20260105_000007'
+branch_labels = None
+depends_on = None
+
+
+COUNTED_TABLES = (("applications", "application"), ("partners", "partner"))
+DAY_WINDOW = 40
+
+
+def upgrade():
+    op.create_table(
+        "dashboard_counters",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("counter_key", sa.String(60), nullable=False),
+        sa.Column("value", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_dashboard_counters_key",
+        "dashboard_counters",
+        ["counter_key"],
+        unique=True,
+    )
+
+    # 현재 건수 백필 (UTC 기준 일자)
+    for table, entity in COUNTED_TABLES:
+        op.execute(f"""
+            INSERT INTO dashboard_counters (counter_key, value)
+            SELECT '{entity}:status:' || status, COUNT(*)
+            FROM {table}
+            GROUP BY status;
+        """)
+        op.execute(f"""
+            INSERT INTO dashboard_counters (counter_key, value)
+            SELECT '{entity}:created:' || to_char((created_at AT TIME ZONE 'UTC')::date, 'YYYY-MM-DD'), COUNT(*)
+            FROM {table}
+            WHERE created_at >= (now() AT TIME ZONE 'UTC')::date - {DAY_WINDOW}
+            GROUP BY 1;
+        """)
+
+
+def downgrade():
+    op.drop_index("uq_dashboard_counters_key", table_name="dashboard_counters")
+    op.drop_table("dashboard_counters")
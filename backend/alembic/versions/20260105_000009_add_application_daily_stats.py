@@ -0,0 +1,77 @@
+"""Add application analytics rollup tables
+
+신청 분석(/admin/analytics)용 일별 롤업 테이블 추가.
+- application_daily_stats: 신청일(UTC) x 서비스 x 시/도 x 현재 상태별 건수
+- application_daily_lead_times: 이벤트 발생일(UTC) x 서비스 x 시/도별 최초 배정/완료/취소 건수 및 소요 시간 합계
+service_code '*'는 서비스 구분 없는 신청 단위 합계 행.
+증분 롤업(변경분 조회)용 updated_at / assigned_at 인덱스 추가.
+과거 데이터는 scripts/backfill_application_analytics.py로 집계한다.
+
+Revision ID: 20260105_000009
+Revises: 20260105_000008
+Create Date: 2026-01-05
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers
+revision = '20260105_000009'
+down_revision = '20260105_000008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "application_daily_stats",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("service_code", sa.String(30), nullable=False),
+        sa.Column("province_code", sa.String(2), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False),
+        sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_application_daily_stats_key",
+        "application_daily_stats",
+        ["day", "service_code", "province_code", "status"],
+        unique=True,
+    )
+
+    op.create_table(
+        "application_daily_lead_times",
+        sa.Column("id", sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("service_code", sa.String(30), nullable=False),
+        sa.Column("province_code", sa.String(2), nullable=False),
+        sa.Column("assigned_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("assign_seconds", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("completed_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("complete_seconds", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("cancelled_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "uq_application_daily_lead_times_key",
+        "application_daily_lead_times",
+        ["day", "service_code", "province_code"],
+        unique=True,
+    )
+
+    op.create_index("idx_applications_updated_at", "applications", ["updated_at"])
+    op.create_index("idx_assignments_assigned_at", "application_partner_assignments", ["assigned_at"])
+    op.create_index("idx_assignments_updated_at", "application_partner_assignments", ["updated_at"])
+
+
+def downgrade():
+    op.drop_index("idx_assignments_updated_at", table_name="application_partner_assignments")
+    op.drop_index("idx_assignments_assigned_at", table_name="application_partner_assignments")
+    op.drop_index("idx_applications_updated_at", table_name="applications")
+    op.drop_index("uq_application_daily_lead_times_key", table_name="application_daily_lead_times")
+    op.drop_table("application_daily_lead_times")
+    op.drop_index("uq_application_daily_stats_key", table_name="application_daily_stats")
+    op.drop_table("application_daily_stats")
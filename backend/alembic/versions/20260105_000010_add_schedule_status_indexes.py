@@ -0,0 +1,37 @@
+"""Add (scheduled_date, status) indexes for schedule stats
+
+월간 일정 통계(GROUP BY scheduled_date, status)용 복합 인덱스 추가.
+- applications: 신청 기준 캘린더 (레거시)
+- application_partner_assignments: 배정 기준 캘린더
+월 범위 조건 + 상태 집계를 테이블 행을 읽지 않고 인덱스 범위 스캔으로 처리.
+
+Revision ID: 20260105_000010
+Revises: 20260105_000009
+Create Date: 2026-01-05
+"""
+from alembic import op
+
+
+# revision identifiers
+revision = '20260105_000010'
+down_revision = '20260105_000009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "idx_applications_scheduled_status",
+        "applications",
+        ["scheduled_date", "status"],
+    )
+    op.create_index(
+        "idx_assignments_scheduled_status",
+        "application_partner_assignments",
+        ["scheduled_date", "status"],
+    )
+
+
+def downgrade():
+    op.drop_index("idx_assignments_scheduled_status", table_name="application_partner_assignments")
+    op.drop_index("idx_applications_scheduled_status", table_name="applications")
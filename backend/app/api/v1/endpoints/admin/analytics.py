@@ -0,0 +1,277 @@
+"""
+Admin Analytics API
+관리자 신청 분석 API (기간별 추이, 서비스/지역별 현황, 처리 소요 시간)
+
+원본 테이블 대신 일별 롤업(application_daily_stats, application_daily_lead_times)만 읽는다.
+롤업은 analytics_rollup 서비스가 주기적으로 갱신하므로 최근 데이터는 최대 ROLLUP_INTERVAL만큼 늦게 반영된다.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import BaseModel
+from sqlalchemy import Date, case, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import get_db
+from app.core.security import get_current_admin
+from app.models.admin import Admin
+from app.models.application_daily_stat import (
+    ALL_SERVICES,
+    ApplicationDailyLeadTime,
+    ApplicationDailyStat,
+)
+from app.services.reference_data import get_reference_data
+
+router = APIRouter(prefix="/analytics", tags=["Admin - Analytics"])
+
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 366 * 5
+
+
+class AnalyticsPeriod(BaseModel):
+    """기간별 추이 (period: 구간 시작일)"""
+
+    period: date
+    created: int  # 신청 건수 (신청일 기준)
+    completed_of_created: int  # 해당 구간 신청 중 현재 완료 건수
+    assigned: int  # 최초 배정 건수 (배정일 기준)
+    completed: int  # 완료 건수 (완료일 기준)
+    cancelled: int  # 취소 건수 (취소일 기준)
+    avg_assign_hours: Optional[float] = None  # 신청 → 최초 배정 평균 시간
+    avg_complete_hours: Optional[float] = None  # 신청 → 완료 평균 시간
+
+
+class AnalyticsBreakdown(BaseModel):
+    """서비스/지역별 현황 (신청일 기준)"""
+
+    code: str
+    name: str
+    created: int
+    completed: int
+    cancelled: int
+    completion_rate: float  # 완료 건수 / 신청 건수 (%)
+
+
+class AnalyticsSummary(BaseModel):
+    """기간 합계"""
+
+    created: int
+    status_counts: dict[str, int]  # 기간 내 신청의 현재 상태별 건수
+    completion_rate: float
+    assigned: int
+    completed: int
+    cancelled: int
+    avg_assign_hours: Optional[float] = None
+    avg_complete_hours: Optional[float] = None
+
+
+class AnalyticsResponse(BaseModel):
+    """신청 분석 응답"""
+
+    date_from: date
+    date_to: date
+    granularity: str
+    summary: AnalyticsSummary
+    series: list[AnalyticsPeriod]
+    by_service: list[AnalyticsBreakdown]
+    by_region: list[AnalyticsBreakdown]
+
+
+def _avg_hours(seconds: int, count: int) -> Optional[float]:
+    return round(seconds / count / 3600, 1) if count else None
+
+
+def _rate(part: int, total: int) -> float:
+    return round(part / total * 100, 1) if total else 0.0
+
+
+def _period_start(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def _periods(date_from: date, date_to: date, granularity: str) -> list[date]:
+    """기간 내 구간 시작일 목록 (데이터 없는 구간도 0으로 표시하기 위함)"""
+    periods = []
+    period = _period_start(date_from, granularity)
+    while period <= date_to:
+        periods.append(period)
+        if granularity == "month":
+            period = (period.replace(day=28) + timedelta(days=4)).replace(day=1)
+        else:
+            period += timedelta(days=7 if granularity == "week" else 1)
+    return periods
+
+
+def _breakdown(code: str, name: str, created: int, completed: int, cancelled: int) -> AnalyticsBreakdown:
+    return AnalyticsBreakdown(
+        code=code,
+        name=name,
+        created=created,
+        completed=completed,
+        cancelled=cancelled,
+        completion_rate=_rate(completed, created),
+    )
+
+
+@router.get("", response_model=AnalyticsResponse)
+async def get_analytics(
+    date_from: Optional[date] = Query(None, description="시작일 (YYYY-MM-DD, 기본: 최근 30일)"),
+    date_to: Optional[date] = Query(None, description="종료일 (YYYY-MM-DD, 기본: 오늘)"),
+    granularity: str = Query("day", regex="^(day|week|month)$", description="집계 단위 (day, week, month)"),
+    service: Optional[str] = Query(None, description="서비스 코드 필터"),
+    region: Optional[str] = Query(None, description="시/도 코드 필터"),
+    admin: Admin = Depends(get_current_admin),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    신청 분석 조회
+
+    - 일자는 UTC 기준 (롤업 기준과 동일)
+    - 신청/상태별 건수: 신청일 기준 (기간 내 신청의 현재 상태)
+    - 배정/완료/취소 건수 및 소요 시간: 각 이벤트 발생일 기준
+    - by_service: 서비스별 신청 현황 (신청 1건이 선택한 서비스 수만큼 집계됨)
+    - by_region: 시/도별 신청 현황 (지역 미확인: 빈 코드)
+    """
+    date_to = date_to or datetime.now(timezone.utc).date()
+    date_from = date_from or date_to - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+    if date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일은 종료일보다 이후일 수 없습니다",
+        )
+    if (date_to - date_from).days >= MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조회 기간은 최대 {MAX_RANGE_DAYS}일입니다",
+        )
+
+    def filters(model, service_code: Optional[str] = service):
+        conditions = [model.day >= date_from, model.day <= date_to]
+        if service_code is not None:
+            conditions.append(model.service_code == service_code)
+        if region is not None:
+            conditions.append(model.province_code == region)
+        return conditions
+
+    period = cast(func.date_trunc(granularity, ApplicationDailyStat.day), Date).label("period")
+    lead_period = cast(func.date_trunc(granularity, ApplicationDailyLeadTime.day), Date).label("period")
+    completed_count = func.sum(case((ApplicationDailyStat.status == "completed", ApplicationDailyStat.count), else_=0))
+    cancelled_count = func.sum(case((ApplicationDailyStat.status == "cancelled", ApplicationDailyStat.count), else_=0))
+    scope = service or ALL_SERVICES
+
+    # 신청일 기준 구간 x 상태별 건수
+    result = await db.execute(
+        select(period, ApplicationDailyStat.status, func.sum(ApplicationDailyStat.count))
+        .where(*filters(ApplicationDailyStat, scope))
+        .group_by(period, ApplicationDailyStat.status)
+    )
+    created_by_period: dict[date, int] = {}
+    completed_by_period: dict[date, int] = {}
+    status_counts: dict[str, int] = {}
+    for period_start, app_status, count in result.all():
+        count = int(count)
+        created_by_period[period_start] = created_by_period.get(period_start, 0) + count
+        status_counts[app_status] = status_counts.get(app_status, 0) + count
+        if app_status == "completed":
+            completed_by_period[period_start] = completed_by_period.get(period_start, 0) + count
+
+    # 이벤트 발생일 기준 구간별 배정/완료/취소
+    result = await db.execute(
+        select(
+            lead_period,
+            func.sum(ApplicationDailyLeadTime.assigned_count),
+            func.sum(ApplicationDailyLeadTime.assign_seconds),
+            func.sum(ApplicationDailyLeadTime.completed_count),
+            func.sum(ApplicationDailyLeadTime.complete_seconds),
+            func.sum(ApplicationDailyLeadTime.cancelled_count),
+        )
+        .where(*filters(ApplicationDailyLeadTime, scope))
+        .group_by(lead_period)
+    )
+    lead_by_period = {row[0]: tuple(int(value or 0) for value in row[1:]) for row in result.all()}
+
+    # 서비스별 (서비스 필터가 없으면 전체 서비스)
+    result = await db.execute(
+        select(
+            ApplicationDailyStat.service_code,
+            func.sum(ApplicationDailyStat.count),
+            completed_count,
+            cancelled_count,
+        )
+        .where(*filters(ApplicationDailyStat), ApplicationDailyStat.service_code != ALL_SERVICES)
+        .group_by(ApplicationDailyStat.service_code)
+    )
+    service_rows = result.all()
+
+    # 시/도별
+    result = await db.execute(
+        select(
+            ApplicationDailyStat.province_code,
+            func.sum(ApplicationDailyStat.count),
+            completed_count,
+            cancelled_count,
+        )
+        .where(*filters(ApplicationDailyStat, scope))
+        .group_by(ApplicationDailyStat.province_code)
+    )
+    region_rows = result.all()
+
+    reference = await get_reference_data(db)
+    province_names = {province.code: province.name for province in reference.provinces}
+
+    series = []
+    totals = [0, 0, 0, 0, 0]
+    for period_start in _periods(date_from, date_to, granularity):
+        lead = lead_by_period.get(period_start, (0, 0, 0, 0, 0))
+        totals = [total + value for total, value in zip(totals, lead)]
+        assigned, assign_seconds, completed, complete_seconds, cancelled = lead
+        series.append(AnalyticsPeriod(
+            period=period_start,
+            created=created_by_period.get(period_start, 0),
+            completed_of_created=completed_by_period.get(period_start, 0),
+            assigned=assigned,
+            completed=completed,
+            cancelled=cancelled,
+            avg_assign_hours=_avg_hours(assign_seconds, assigned),
+            avg_complete_hours=_avg_hours(complete_seconds, completed),
+        ))
+
+    created_total = sum(status_counts.values())
+    assigned, assign_seconds, completed, complete_seconds, cancelled = totals
+    summary = AnalyticsSummary(
+        created=created_total,
+        status_counts=status_counts,
+        completion_rate=_rate(status_counts.get("completed", 0), created_total),
+        assigned=assigned,
+        completed=completed,
+        cancelled=cancelled,
+        avg_assign_hours=_avg_hours(assign_seconds, assigned),
+        avg_complete_hours=_avg_hours(complete_seconds, completed),
+    )
+
+    by_service = [
+        _breakdown(code, reference.service_names.get(code, code), *map(int, counts))
+        for code, *counts in service_rows
+    ]
+    by_region = [
+        _breakdown(code, province_names.get(code, "미확인"), *map(int, counts))
+        for code, *counts in region_rows
+    ]
+    by_service.sort(key=lambda item: item.created, reverse=True)
+    by_region.sort(key=lambda item: item.created, reverse=True)
+
+    return AnalyticsResponse(
+        date_from=date_from,
+        date_to=date_to,
+        granularity=granularity,
+        summary=summary,
+        series=series,
+        by_service=by_service,
+        by_region=by_region,
+    )
@@ -4,23 +4,33 @@ Admin Application API endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import desc, or_, and_, select, func
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import desc, and_, select, func, update, any_, bindparam, BigInteger, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from typing import Optional, List
 from datetime import datetime, timezone, date
-import math
 import logging
 
 from app.core.database import get_db
 from app.core.security import get_current_admin
-from app.core.encryption import decrypt_value
+from app.core.encryption import decrypt_value, generate_search_hash
 from app.core.file_token import get_file_url
+from app.core.pagination import paginate, split_page
+from app.services.list_count import (
+    COUNT_QUERY_DESCRIPTION,
+    COUNT_QUERY_PATTERN,
+    count_list,
+    known_total,
+    total_pages,
+)
 from app.models.admin import Admin
 from app.models.application import Application
 from app.models.application_note import ApplicationNote
 from app.models.application_assignment import ApplicationPartnerAssignment
+from app.models.audit_log import AuditLog
 from app.models.partner import Partner
+from app.models.quote_item import QuoteItem
 from app.schemas.application import (
     ApplicationListResponse,
     ApplicationListItem,
@@ -29,6 +39,9 @@ from app.schemas.application import (
     BulkAssignRequest,
     BulkAssignResponse,
     BulkAssignResult,
+    BulkStatusRequest,
+    BulkStatusResponse,
+    BulkStatusResult,
     ScheduleConflict,
     AssignmentSummary,
 )
@@ -47,6 +60,13 @@ from app.schemas.application_note import (
     ApplicationNoteResponse,
     ApplicationNotesListResponse,
 )
+from app.schemas.application_overview import (
+    ApplicationOverviewResponse,
+    CustomerHistory,
+    CustomerHistoryItem,
+    OverviewAssignment,
+)
+from app.schemas.audit_log import AuditLogResponse
 from app.services.sms import (
     send_partner_assignment_notification,
     send_partner_notify_assignment,
@@ -57,6 +77,8 @@ from app.services.sms import (
     send_schedule_changed_notification,
     send_assignment_changed_notification,
     send_application_received_notification,
+    send_bulk_assignment_notifications,
+    send_bulk_status_notifications,
 )
 from app.api.v1.endpoints.partner_portal import (
     get_partner_view_url,
@@ -64,19 +86,29 @@ from app.api.v1.endpoints.partner_portal import (
 )
 from app.services.application_status import (
     check_status_transition,
+    can_assign_partner,
     ASSIGNABLE_STATUSES,
+    STATUS_NAMES,
 )
 from app.services.audit import (
     log_status_change,
     log_assignment,
     log_schedule_change,
     log_cost_change,
-    log_bulk_assignment,
+    log_bulk_assignments,
+    log_status_changes,
     log_change,
 )
-from app.services.search_index import unified_search, detect_search_type
-from app.services.duplicate_check import get_customer_applications
+from app.services.application_filter import ApplicationFilter
+from app.services.export import (
+    CSV_MEDIA_TYPE,
+    export_filename,
+    format_export_datetime,
+    stream_csv_export,
+)
+from app.services.duplicate_check import get_customer_applications, get_customer_applications_by_hash
 from app.services.status_sync import sync_application_from_assignments
+from app.services.dashboard_counters import apply_status_changes
 from app.services.service_utils import (
     convert_service_codes_to_names,
     convert_service_names_to_codes,
@@ -123,10 +155,65 @@ def decrypt_application(app: Application, service_map: dict[str, str]) -> dict:
     }
 
 
+def mask_customer_phone(phone: str) -> str:
+    """전화번호 마스킹 (010-****-1234 형식)"""
+    phone_parts = phone.replace("-", "")
+    if len(phone_parts) >= 7:
+        return f"{phone_parts[:3]}-****-{phone_parts[-4:]}"
+    return phone
+
+
+def id_in_array(column, name: str, ids: list[int]):
+    """column = ANY(:name) 조건 (ID 목록을 배열 파라미터 1개로 전달)"""
+    return column == any_(bindparam(name, ids, type_=ARRAY(BigInteger)))
+
+
+# 목록 조회 컬럼 (ApplicationListItem에 필요한 컬럼만 조회)
+# description, photos, admin_memo, 비용 등 큰 컬럼과 ORM 엔티티 생성(identity map) 비용 제외
+APPLICATION_LIST_COLUMNS = (
+    Application.id,
+    Application.application_number,
+    Application.customer_name,
+    Application.customer_phone,
+    Application.address,
+    Application.selected_services,
+    Application.status,
+    Application.assigned_partner_id,
+    Application.scheduled_date,
+    Application.preferred_consultation_date,
+    Application.preferred_work_date,
+    Application.created_at,
+)
+
+
+def build_application_list_item(row, service_map: dict[str, str]) -> ApplicationListItem:
+    """APPLICATION_LIST_COLUMNS 조회 결과(Row)로 목록 아이템 생성
+
+    Args:
+        row: APPLICATION_LIST_COLUMNS를 select한 결과 행
+        service_map: get_service_code_to_name_map()으로 조회한 서비스 코드→이름 매핑
+    """
+    return ApplicationListItem(
+        id=row.id,
+        application_number=row.application_number,
+        customer_name=decrypt_value(row.customer_name),
+        customer_phone=decrypt_value(row.customer_phone),
+        address=decrypt_value(row.address),
+        selected_services=convert_service_codes_with_map(service_map, row.selected_services),
+        status=row.status,
+        assigned_partner_id=row.assigned_partner_id,
+        scheduled_date=str(row.scheduled_date) if row.scheduled_date else None,
+        preferred_consultation_date=row.preferred_consultation_date,
+        preferred_work_date=row.preferred_work_date,
+        created_at=row.created_at,
+    )
+
+
 @router.get("", response_model=ApplicationListResponse)
 async def get_applications(
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor, 지정 시 page 무시)"),
     status: Optional[str] = Query(None, description="상태 필터"),
     search: Optional[str] = Query(None, description="통합 검색어 (신청번호/고객명/연락처)"),
     search_type: Optional[str] = Query(None, description="검색 타입 (auto/name/phone/number)"),
@@ -135,116 +222,176 @@ async def get_applications(
     services: Optional[str] = Query(None, description="서비스 필터 (콤마 구분)"),
     assigned_admin_id: Optional[int] = Query(None, description="담당 관리자 ID"),
     assigned_partner_id: Optional[int] = Query(None, description="배정 협력사 ID"),
+    region: Optional[str] = Query(None, description="지역 필터 (시/도 코드, 시/군/구 코드 또는 지역명)"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
     """
     신청 목록 조회 (관리자용)
 
-    - 페이징 지원
+    - 페이징 지원 (페이지 번호 또는 cursor)
+    - 전체 개수: count (exact / estimate / none)
     - 상태 필터링
     - 통합 검색 (신청번호/고객명/연락처 자동 감지)
     - 날짜 범위 필터
     - 서비스 필터
     - 담당자 필터
+    - 지역 필터
+    - 목록 표시 컬럼만 조회 (APPLICATION_LIST_COLUMNS)
     """
-    stmt = select(Application)
-
-    # 상태 필터
-    if status:
-        query = stmt.where(Application.status == status)
-
-    # 통합 검색
-    if search:
-        # 검색 타입 자동 감지 또는 지정된 타입 사용
-        detected_type = search_type if search_type and search_type != "auto" else detect_search_type(search)
-
-        if detected_type == "number":
-            # 신청번호 검색 (DB 직접 검색)
-            # 하이픈 없는 형식(20251231001)을 하이픈 있는 형식(20251231-001)으로 변환
-            import re
-            search_normalized = search
-            if re.match(r'^\d{9,11}$', search):
-                # 하이픈 없는 형식: 앞 8자리-나머지
-                search_normalized = f"{search[:8]}-{search[8:]}"
-            query = stmt.where(Application.application_number.ilike(f"%{search_normalized}%"))
-        elif detected_type in ("phone", "name"):
-            # 암호화된 필드 검색 (인덱스 테이블 사용)
-            matching_ids = await unified_search(db, "application", search, detected_type)
-            if matching_ids:
-                query = stmt.where(Application.id.in_(matching_ids))
-            else:
-                # 검색 결과 없음 - 빈 결과 반환
-                query = stmt.where(Application.id == -1)
-
-    # 날짜 범위 필터
-    if date_from:
-        query = stmt.where(Application.created_at >= datetime.combine(date_from, datetime.min.time()))
-    if date_to:
-        query = stmt.where(Application.created_at <= datetime.combine(date_to, datetime.max.time()))
-
-    # 서비스 필터 (JSONB 배열에서 검색)
-    if services:
-        service_list = [s.strip() for s in services.split(",") if s.strip()]
-        if service_list:
-            # selected_services 배열에 지정된 서비스 중 하나라도 포함된 경우
-            service_conditions = [
-                Application.selected_services.contains([svc])
-                for svc in service_list
-            ]
-            query = stmt.where(or_(*service_conditions))
-
-    # 담당 관리자 필터
-    if assigned_admin_id:
-        query = stmt.where(Application.assigned_admin_id == assigned_admin_id)
-
-    # 배정 협력사 필터
-    if assigned_partner_id:
-        query = stmt.where(Application.assigned_partner_id == assigned_partner_id)
-
-    # 전체 개수
-    count_result = await db.execute(select(func.count()).select_from(stmt.subquery()))
-
-    total = count_result.scalar()
+    filters = ApplicationFilter.from_query(
+        status=status,
+        search=search,
+        search_type=search_type,
+        date_from=date_from,
+        date_to=date_to,
+        services=services,
+        assigned_admin_id=assigned_admin_id,
+        assigned_partner_id=assigned_partner_id,
+        region=region,
+    )
+    stmt = await filters.apply(db, select(*APPLICATION_LIST_COLUMNS))
 
     # 정렬 및 페이징
     result = await db.execute(
-
-        stmt.order_by(desc(Application.created_at))
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        
-
+        paginate(stmt, Application.created_at, Application.id, page, page_size, cursor)
+    )
+    applications, next_cursor = split_page(result.all(), page_size)
+
+    # 전체 개수 (마지막 페이지면 COUNT 생략)
+    total, total_estimated = await count_list(
+        db,
+        stmt,
+        "applications",
+        filters.as_dict(),
+        count,
+        total=known_total(page, page_size, len(applications), next_cursor is not None, cursor),
     )
-
-    applications = result.scalars().all()
 
     # 복호화된 목록 생성 (서비스 맵 1회 조회로 N+1 방지)
-    service_map = get_service_code_to_name_map(db)
-    items = []
-    for app in applications:
-        decrypted = decrypt_application(app, service_map)
-        items.append(ApplicationListItem(
-            id=decrypted["id"],
-            application_number=decrypted["application_number"],
-            customer_name=decrypted["customer_name"],
-            customer_phone=decrypted["customer_phone"],
-            address=decrypted["address"],
-            selected_services=decrypted["selected_services"],
-            status=decrypted["status"],
-            assigned_partner_id=decrypted["assigned_partner_id"],
-            scheduled_date=decrypted["scheduled_date"],
-            preferred_consultation_date=decrypted["preferred_consultation_date"],
-            preferred_work_date=decrypted["preferred_work_date"],
-            created_at=decrypted["created_at"],
-        ))
+    service_map = await get_service_code_to_name_map(db)
+    items = [build_application_list_item(row, service_map) for row in applications]
 
     return ApplicationListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=math.ceil(total / page_size) if total > 0 else 1,
+        total_pages=total_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
+    )
+
+
+# 내보내기 컬럼 (CSV 헤더, 조회 컬럼)
+APPLICATION_EXPORT_HEADER = (
+    "신청번호", "상태", "고객명", "연락처", "주소", "상세주소", "서비스",
+    "희망 상담일", "희망 작업일", "예정일", "예정 시간", "견적 금액", "최종 금액",
+    "신청일시", "완료일시",
+)
+APPLICATION_EXPORT_COLUMNS = (
+    Application.id,
+    Application.application_number,
+    Application.status,
+    Application.customer_name,
+    Application.customer_phone,
+    Application.address,
+    Application.address_detail,
+    Application.selected_services,
+    Application.preferred_consultation_date,
+    Application.preferred_work_date,
+    Application.scheduled_date,
+    Application.scheduled_time,
+    Application.estimated_cost,
+    Application.final_cost,
+    Application.created_at,
+    Application.completed_at,
+)
+
+
+def build_application_export_rows(rows, service_map: dict[str, str]) -> list[list]:
+    """APPLICATION_EXPORT_COLUMNS 조회 결과 배치를 CSV 행 목록으로 변환 (복호화 포함)
+
+    Args:
+        rows: APPLICATION_EXPORT_COLUMNS를 select한 결과 행 배치
+        service_map: get_service_code_to_name_map()으로 조회한 서비스 코드→이름 매핑
+    """
+    return [
+        [
+            row.application_number,
+            STATUS_NAMES.get(row.status, row.status),
+            decrypt_value(row.customer_name),
+            decrypt_value(row.customer_phone),
+            decrypt_value(row.address),
+            decrypt_value(row.address_detail) if row.address_detail else "",
+            ", ".join(convert_service_codes_with_map(service_map, row.selected_services)),
+            row.preferred_consultation_date,
+            row.preferred_work_date,
+            row.scheduled_date,
+            row.scheduled_time,
+            row.estimated_cost,
+            row.final_cost,
+            format_export_datetime(row.created_at),
+            format_export_datetime(row.completed_at),
+        ]
+        for row in rows
+    ]
+
+
+@router.get("/export")
+async def export_applications(
+    status: Optional[str] = Query(None, description="상태 필터"),
+    search: Optional[str] = Query(None, description="통합 검색어 (신청번호/고객명/연락처)"),
+    search_type: Optional[str] = Query(None, description="검색 타입 (auto/name/phone/number)"),
+    date_from: Optional[date] = Query(None, description="신청일 시작"),
+    date_to: Optional[date] = Query(None, description="신청일 종료"),
+    services: Optional[str] = Query(None, description="서비스 필터 (콤마 구분)"),
+    assigned_admin_id: Optional[int] = Query(None, description="담당 관리자 ID"),
+    assigned_partner_id: Optional[int] = Query(None, description="배정 협력사 ID"),
+    region: Optional[str] = Query(None, description="지역 필터 (시/도 코드, 시/군/구 코드 또는 지역명)"),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    """
+    신청 목록 CSV 내보내기 (관리자용)
+
+    - 목록 조회와 같은 필터 (ApplicationFilter)
+    - 서버 측 커서로 배치 단위 조회/복호화 후 스트리밍 (건수와 무관하게 메모리 일정)
+    - 내보내기 이력 기록 (audit_logs, action=export)
+    """
+    filters = ApplicationFilter.from_query(
+        status=status,
+        search=search,
+        search_type=search_type,
+        date_from=date_from,
+        date_to=date_to,
+        services=services,
+        assigned_admin_id=assigned_admin_id,
+        assigned_partner_id=assigned_partner_id,
+        region=region,
+    )
+    stmt = await filters.apply(db, select(*APPLICATION_EXPORT_COLUMNS))
+    stmt = stmt.order_by(desc(Application.created_at), desc(Application.id))
+    service_map = await get_service_code_to_name_map(db)
+
+    # 스트림은 별도 세션으로 조회하므로 요청 세션 반환
+    await db.close()
+
+    return StreamingResponse(
+        stream_csv_export(
+            stmt,
+            APPLICATION_EXPORT_HEADER,
+            lambda rows: build_application_export_rows(rows, service_map),
+            "application",
+            filters.as_dict(),
+            current_admin,
+        ),
+        media_type=CSV_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f'attachment; filename="{export_filename("applications")}"',
+            "Cache-Control": "no-cache",
+        },
     )
 
 
@@ -260,7 +407,8 @@ async def bulk_assign_applications(
 
     - 다수의 신청을 한 협력사에 일괄 배정
     - 배정 가능 상태(new, consulting)의 신청만 배정
-    - SMS 알림 발송 옵션
+    - 대상 조회/배정/이력 기록을 각각 쿼리 1회로 처리
+    - SMS 알림 발송 옵션 (협력사에게는 배정 건을 묶은 알림 1건)
     """
     # 협력사 검증
     result = await db.execute(select(Partner).where(Partner.id == data.partner_id))
@@ -272,113 +420,330 @@ async def bulk_assign_applications(
         raise HTTPException(status_code=400, detail="승인된 협력사만 배정할 수 있습니다")
 
     partner_phone = decrypt_value(partner.contact_phone)
-    results: list[BulkAssignResult] = []
-    success_count = 0
-
-    # 서비스 맵 1회 조회로 N+1 방지
-    service_map = get_service_code_to_name_map(db)
-
-    for app_id in data.application_ids:
-        result = await db.execute(select(Application).where(Application.id == app_id))
+    partner_services = set(partner.service_areas or [])
+    unique_ids = list(dict.fromkeys(data.application_ids))
 
-        application = result.scalar_one_or_none()
-
-        if not application:
-            results.append(BulkAssignResult(
-                application_id=app_id,
-                application_number="",
-                success=False,
-                message="신청을 찾을 수 없습니다"
-            ))
-            continue
-
-        # 배정 가능 상태 확인
-        if application.status not in ASSIGNABLE_STATUSES:
-            results.append(BulkAssignResult(
-                application_id=app_id,
-                application_number=application.application_number,
-                success=False,
-                message=f"배정 불가 상태입니다 (현재: {application.status})"
-            ))
-            continue
+    # 대상 신청 일괄 조회 (배정 판단 및 알림에 필요한 컬럼만)
+    result = await db.execute(
+        select(
+            Application.id,
+            Application.application_number,
+            Application.status,
+            Application.selected_services,
+            Application.assigned_partner_id,
+            Application.customer_name,
+            Application.customer_phone,
+            Application.address,
+        ).where(id_in_array(Application.id, "application_ids", unique_ids))
+    )
+    rows = {row.id: row for row in result.all()}
+
+    # 상태/서비스 영역 검증 (메모리에서 처리)
+    failures: dict[int, str] = {}
+    targets = []
+    for app_id in unique_ids:
+        row = rows.get(app_id)
+        if row is None:
+            failures[app_id] = "신청을 찾을 수 없습니다"
+        elif not can_assign_partner(row.status):
+            failures[app_id] = f"배정 불가 상태입니다 (현재: {row.status})"
+        elif row.selected_services and partner_services and not partner_services.intersection(row.selected_services):
+            failures[app_id] = "협력사가 해당 서비스를 제공하지 않습니다"
+        else:
+            targets.append(row)
+
+    # 배정 처리 (UPDATE 1회, 검증 이후 상태가 바뀐 신청은 제외)
+    assigned_ids: set[int] = set()
+    if targets:
+        result = await db.execute(
+            update(Application)
+            .where(
+                id_in_array(Application.id, "target_ids", [row.id for row in targets]),
+                Application.status.in_(ASSIGNABLE_STATUSES),
+            )
+            .values(
+                assigned_partner_id=data.partner_id,
+                status="assigned",
+                assigned_admin_id=current_admin.id,
+            )
+            .returning(Application.id)
+            .execution_options(synchronize_session=False)
+        )
+        assigned_ids = set(result.scalars().all())
+        for row in targets:
+            if row.id not in assigned_ids:
+                failures[row.id] = "배정 중 상태가 변경되었습니다"
+
+        # 대시보드 카운터 (UPDATE 문은 ORM 이벤트로 집계되지 않음)
+        await apply_status_changes(
+            db, "application", [(row.status, "assigned") for row in targets if row.id in assigned_ids]
+        )
 
-        # 서비스 영역 매칭 확인
-        if application.selected_services and partner.service_areas:
-            app_services = set(application.selected_services)
-            partner_services = set(partner.service_areas)
-            if not app_services.intersection(partner_services):
-                results.append(BulkAssignResult(
-                    application_id=app_id,
-                    application_number=application.application_number,
-                    success=False,
-                    message="협력사가 해당 서비스를 제공하지 않습니다"
-                ))
-                continue
+    # 배정 이력 (INSERT 1회)
+    await log_bulk_assignments(
+        db=db,
+        entity_ids=[row.id for row in targets if row.id in assigned_ids],
+        partner_id=data.partner_id,
+        partner_name=partner.company_name,
+        total_count=len(data.application_ids),
+        admin=current_admin,
+    )
 
-        # 배정 처리
-        prev_partner_id = application.assigned_partner_id
-        application.assigned_partner_id = data.partner_id
-        application.status = "assigned"
-        application.assigned_admin_id = current_admin.id
+    await db.commit()
 
-        # SMS 발송 (백그라운드)
-        if data.send_sms and data.partner_id != prev_partner_id:
-            decrypted = decrypt_application(application, service_map)
-            # 고객에게 배정 알림
+    # SMS 발송 (백그라운드 작업 1개, 협력사에게는 묶음 알림 1건)
+    if data.send_sms:
+        notify_rows = [
+            row for row in targets
+            if row.id in assigned_ids and row.assigned_partner_id != data.partner_id
+        ]
+        if notify_rows:
             background_tasks.add_task(
-                send_partner_assignment_notification,
-                decrypted["customer_phone"],
-                application.application_number,
+                send_bulk_assignment_notifications,
                 partner.company_name,
                 partner_phone,
-                decrypted["customer_name"],
-                "",  # scheduled_date (일괄 배정에서는 미정)
-                "",  # scheduled_time
-                "",  # estimated_cost
-            )
-            # 협력사에게 배정 알림
-            background_tasks.add_task(
-                send_partner_notify_assignment,
-                partner_phone,
-                application.application_number,
-                decrypted["customer_name"],
-                decrypted["customer_phone"],
-                decrypted["customer_address"],
-                application.services or [],
-                "",  # scheduled_date (일괄 배정에서는 미정)
+                [
+                    {
+                        "application_number": row.application_number,
+                        "customer_name": decrypt_value(row.customer_name),
+                        "customer_phone": decrypt_value(row.customer_phone),
+                        "address": decrypt_value(row.address),
+                        "services": row.selected_services or [],
+                    }
+                    for row in notify_rows
+                ],
             )
 
+    results: list[BulkAssignResult] = []
+    seen: set[int] = set()
+    for app_id in data.application_ids:
+        row = rows.get(app_id)
+        success = app_id in assigned_ids and app_id not in seen
+        seen.add(app_id)
         results.append(BulkAssignResult(
             application_id=app_id,
-            application_number=application.application_number,
-            success=True,
-            message="배정 완료"
+            application_number=row.application_number if row else "",
+            success=success,
+            message="배정 완료" if success else failures.get(app_id, "중복 요청입니다"),
         ))
-        success_count += 1
+    success_count = len(assigned_ids)
 
-        # 개별 신청에 대한 배정 audit log
-        await log_bulk_assignment(
-            db=db,
-            entity_type="application",
-            entity_id=app_id,
-            partner_id=data.partner_id,
-            partner_name=partner.company_name,
-            total_count=len(data.application_ids),
-            success_count=success_count,
-            admin=current_admin,
+    if success_count > 0:
+        logger.info(f"Bulk assignment: {success_count}/{len(data.application_ids)} to partner {partner.company_name}")
+
+    return BulkAssignResponse(
+        total=len(data.application_ids),
+        success_count=success_count,
+        failed_count=len(data.application_ids) - success_count,
+        results=results,
+        partner_name=partner.company_name
+    )
+
+
+@router.post("/bulk-status", response_model=BulkStatusResponse)
+async def bulk_update_application_status(
+    data: BulkStatusRequest,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    """
+    신청 일괄 상태 변경 (관리자용)
+
+    - 상태 전환 검증(check_status_transition)은 조회 결과로 메모리에서 처리
+    - 변경 가능한 신청만 UPDATE 1회로 변경 (검증한 이전 상태 조건, 완료/취소 시각 기록)
+    - scheduled, completed, cancelled는 진행 중인 배정 상태도 UPDATE 1회로 동기화
+    - 상태 변경 이력은 INSERT 1회로 기록
+    - SMS 알림 발송 옵션 (취소/완료 고객 알림, 백그라운드 작업 1개)
+    """
+    new_status = data.status
+    unique_ids = list(dict.fromkeys(data.application_ids))
+
+    # 대상 신청 일괄 조회
+    result = await db.execute(
+        select(
+            Application.id,
+            Application.application_number,
+            Application.status,
+            Application.assigned_partner_id,
+            Application.customer_name,
+            Application.customer_phone,
+        ).where(id_in_array(Application.id, "application_ids", unique_ids))
+    )
+    rows = {row.id: row for row in result.all()}
+
+    # 상태 전환 검증 (메모리에서 처리)
+    failures: dict[int, str] = {}
+    targets = []
+    for app_id in unique_ids:
+        row = rows.get(app_id)
+        if row is None:
+            failures[app_id] = "신청을 찾을 수 없습니다"
+            continue
+        if row.status == new_status:
+            failures[app_id] = f"이미 {STATUS_NAMES.get(new_status, new_status)} 상태입니다"
+            continue
+        try:
+            check_status_transition(row.status, new_status)
+        except HTTPException as e:
+            failures[app_id] = e.detail
+            continue
+        targets.append(row)
+
+    # 상태 변경 (UPDATE 1회, 검증 이후 다른 요청으로 상태가 바뀐 신청은 제외)
+    updated_ids: set[int] = set()
+    synced_assignments = 0
+    if targets:
+        values = {"status": new_status, "assigned_admin_id": current_admin.id}
+        if new_status == "completed":
+            values["completed_at"] = func.now()
+        elif new_status == "cancelled":
+            values["cancelled_at"] = func.now()
+
+        result = await db.execute(
+            update(Application)
+            .where(
+                id_in_array(Application.id, "target_ids", [row.id for row in targets]),
+                # 검증한 이전 상태 그대로인 신청만 변경 (이력/카운터의 이전 상태와 일치)
+                tuple_(Application.id, Application.status).in_([(row.id, row.status) for row in targets]),
+            )
+            .values(**values)
+            .returning(Application.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated_ids = set(result.scalars().all())
+        for row in targets:
+            if row.id not in updated_ids:
+                failures[row.id] = "변경 중 상태가 변경되었습니다"
+
+        # 대시보드 카운터 (UPDATE 문은 ORM 이벤트로 집계되지 않음)
+        await apply_status_changes(
+            db, "application", [(row.status, new_status) for row in targets if row.id in updated_ids]
+        )
+
+    # 진행 중인 배정 상태 동기화 (update_application과 동일한 규칙, UPDATE 1회)
+    if updated_ids and new_status in ("scheduled", "completed", "cancelled"):
+        values = {"status": new_status}
+        if new_status == "completed":
+            values["completed_at"] = func.now()
+        elif new_status == "cancelled":
+            values["cancelled_at"] = func.now()
+
+        result = await db.execute(
+            update(ApplicationPartnerAssignment)
+            .where(
+                id_in_array(ApplicationPartnerAssignment.application_id, "updated_ids", list(updated_ids)),
+                ApplicationPartnerAssignment.status.notin_(["completed", "cancelled"]),
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
         )
+        synced_assignments = result.rowcount or 0
+
+    # 상태 변경 이력 (INSERT 1회)
+    updated_rows = [row for row in targets if row.id in updated_ids]
+    await log_status_changes(
+        db=db,
+        entity_type="application",
+        changes=[(row.id, row.status, new_status) for row in updated_rows],
+        admin=current_admin,
+    )
+
+    # 완료 알림용 협력사명 / 고객 열람 URL
+    notifications = []
+    if data.send_sms and new_status in ("cancelled", "completed") and updated_rows:
+        partner_names: dict[int, str] = {}
+        view_urls: dict[int, str] = {}
+
+        if new_status == "completed":
+            partner_ids = list({row.assigned_partner_id for row in updated_rows if row.assigned_partner_id})
+            if partner_ids:
+                result = await db.execute(
+                    select(Partner.id, Partner.company_name)
+                    .where(id_in_array(Partner.id, "partner_ids", partner_ids))
+                )
+                partner_names = dict(result.all())
+
+            # 신청별 최신 완료 배정의 고객 열람 토큰 (없으면 발급 후 일괄 저장)
+            result = await db.execute(
+                select(
+                    ApplicationPartnerAssignment.id,
+                    ApplicationPartnerAssignment.application_id,
+                    ApplicationPartnerAssignment.customer_token,
+                )
+                .where(
+                    id_in_array(ApplicationPartnerAssignment.application_id, "view_ids", list(updated_ids)),
+                    ApplicationPartnerAssignment.status == "completed",
+                )
+                .order_by(ApplicationPartnerAssignment.application_id, desc(ApplicationPartnerAssignment.id))
+                .distinct(ApplicationPartnerAssignment.application_id)
+            )
+            new_tokens = []
+            for assignment_id, app_id, token in result.all():
+                if not token:
+                    token = generate_customer_view_token(assignment_id, expires_in_days=7)
+                    token_info = decode_file_token_extended(token)
+                    new_tokens.append({
+                        "id": assignment_id,
+                        "customer_token": token,
+                        "customer_token_expires_at": (
+                            None if isinstance(token_info, str)
+                            else datetime.fromtimestamp(token_info.expires_at, tz=timezone.utc)
+                        ),
+                    })
+                view_urls[app_id] = _build_customer_view_url(token)
+            if new_tokens:
+                await db.execute(update(ApplicationPartnerAssignment), new_tokens)
+
+        notifications = [
+            {
+                "application_number": row.application_number,
+                "customer_name": decrypt_value(row.customer_name),
+                "customer_phone": decrypt_value(row.customer_phone),
+                "partner_name": partner_names.get(row.assigned_partner_id),
+                "customer_view_url": view_urls.get(row.id),
+            }
+            for row in updated_rows
+        ]
 
     await db.commit()
 
+    if notifications:
+        background_tasks.add_task(
+            send_bulk_status_notifications,
+            new_status,
+            notifications,
+            data.cancel_reason,
+        )
+
+    results: list[BulkStatusResult] = []
+    seen: set[int] = set()
+    for app_id in data.application_ids:
+        row = rows.get(app_id)
+        success = app_id in updated_ids and app_id not in seen
+        seen.add(app_id)
+        results.append(BulkStatusResult(
+            application_id=app_id,
+            application_number=row.application_number if row else "",
+            previous_status=row.status if row else None,
+            success=success,
+            message="변경 완료" if success else failures.get(app_id, "중복 요청입니다"),
+        ))
+    success_count = len(updated_ids)
+
     if success_count > 0:
-        logger.info(f"Bulk assignment: {success_count}/{len(data.application_ids)} to partner {partner.company_name}")
+        logger.info(
+            f"Bulk status change: {success_count}/{len(data.application_ids)} to {new_status}, "
+            f"synced_assignments={synced_assignments}"
+        )
 
-    return BulkAssignResponse(
+    return BulkStatusResponse(
         total=len(data.application_ids),
         success_count=success_count,
         failed_count=len(data.application_ids) - success_count,
+        status=new_status,
         results=results,
-        partner_name=partner.company_name
+        synced_assignments=synced_assignments,
     )
 
 
@@ -406,7 +771,7 @@ async def get_assignments_for_application(
 
     # 서비스 맵이 없으면 조회 (하위 호환성)
     if service_map is None:
-        service_map = get_service_code_to_name_map(db)
+        service_map = await get_service_code_to_name_map(db)
 
     # 모든 partner_id를 수집하여 배치 쿼리 (N+1 방지)
     partner_ids = list(set(a.partner_id for a in assignments if a.partner_id))
@@ -464,7 +829,7 @@ async def get_application(
     if not application:
         raise HTTPException(status_code=404, detail="신청을 찾을 수 없습니다")
 
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
     decrypted = decrypt_application(application, service_map)
 
     # 배정 목록 조회 (1:N)
@@ -473,6 +838,150 @@ async def get_application(
     return ApplicationDetailResponse(**decrypted, assignments=assignments)
 
 
+# 상세 화면 통합 조회 설정
+OVERVIEW_NOTES_LIMIT = 10  # 최근 메모 수
+OVERVIEW_HISTORY_LIMIT = 20  # 고객 신청 이력 수
+OVERVIEW_AUDIT_LIMIT = 20  # 최근 변경 이력 수
+
+
+@router.get("/{application_id}/overview", response_model=ApplicationOverviewResponse)
+async def get_application_overview(
+    application_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    """
+    신청 상세 화면 통합 조회 (관리자용)
+
+    상세, 배정/협력사/견적 합계, 최근 메모, 고객 신청 이력, 최근 변경 이력을 한 번에 반환한다.
+    배정 수와 관계없이 쿼리 5회 이내로 조회한다 (scripts/check_application_overview_queries.py).
+
+    1. 신청
+    2. 배정 + 협력사명 + 견적 항목 합계 (LEFT JOIN)
+    3. 최근 메모 + 전체 메모 수 (COUNT(*) OVER ())
+    4. 고객 신청 이력 (저장된 phone_hash)
+    5. 최근 변경 이력
+    """
+    result = await db.execute(select(Application).where(Application.id == application_id))
+    application = result.scalar_one_or_none()
+    if not application:
+        raise HTTPException(status_code=404, detail="신청을 찾을 수 없습니다")
+
+    service_map = await get_service_code_to_name_map(db)
+    decrypted = decrypt_application(application, service_map)
+
+    # 배정 + 협력사명 + 견적 합계
+    quote_totals = (
+        select(
+            QuoteItem.assignment_id,
+            func.count(QuoteItem.id).label("item_count"),
+            func.coalesce(func.sum(QuoteItem.amount), 0).label("total_amount"),
+        )
+        .join(ApplicationPartnerAssignment, ApplicationPartnerAssignment.id == QuoteItem.assignment_id)
+        .where(ApplicationPartnerAssignment.application_id == application_id)
+        .group_by(QuoteItem.assignment_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(
+            ApplicationPartnerAssignment,
+            Partner.company_name,
+            func.coalesce(quote_totals.c.item_count, 0),
+            func.coalesce(quote_totals.c.total_amount, 0),
+        )
+        .outerjoin(Partner, Partner.id == ApplicationPartnerAssignment.partner_id)
+        .outerjoin(quote_totals, quote_totals.c.assignment_id == ApplicationPartnerAssignment.id)
+        .where(ApplicationPartnerAssignment.application_id == application_id)
+        .order_by(ApplicationPartnerAssignment.created_at.desc())
+    )
+    assignments = [
+        OverviewAssignment(
+            id=assignment.id,
+            partner_id=assignment.partner_id,
+            partner_name=company_name or "알 수 없음",
+            partner_company=company_name,
+            assigned_services=convert_service_codes_with_map(service_map, assignment.assigned_services),
+            status=assignment.status,
+            scheduled_date=str(assignment.scheduled_date) if assignment.scheduled_date else None,
+            scheduled_time=assignment.scheduled_time,
+            estimated_cost=assignment.estimated_cost,
+            final_cost=assignment.final_cost,
+            estimate_note=assignment.estimate_note,
+            note=assignment.note,
+            quote_status=assignment.quote_status,
+            quote_sent_at=assignment.quote_sent_at,
+            quote_viewed_at=assignment.quote_viewed_at,
+            quote_item_count=item_count,
+            quote_total_amount=total_amount,
+        )
+        for assignment, company_name, item_count, total_amount in result.all()
+    ]
+
+    # 최근 메모 + 전체 메모 수
+    result = await db.execute(
+        select(ApplicationNote, func.count().over().label("total"))
+        .where(ApplicationNote.application_id == application_id)
+        .order_by(desc(ApplicationNote.created_at), desc(ApplicationNote.id))
+        .limit(OVERVIEW_NOTES_LIMIT)
+    )
+    note_rows = result.all()
+    notes_total = note_rows[0].total if note_rows else 0
+
+    # 고객 신청 이력 (저장된 phone_hash, 레거시 데이터는 복호화된 번호로 계산)
+    customer_phone = decrypted["customer_phone"]
+    phone_hash = application.phone_hash or generate_search_hash(customer_phone, "phone")
+    history = []
+    if phone_hash:
+        result = await db.execute(
+            select(
+                Application.id,
+                Application.application_number,
+                Application.status,
+                Application.selected_services,
+                Application.created_at,
+                Application.completed_at,
+            )
+            .where(Application.phone_hash == phone_hash)
+            .order_by(Application.created_at.desc())
+            .limit(OVERVIEW_HISTORY_LIMIT)
+        )
+        history = [
+            CustomerHistoryItem(
+                id=row.id,
+                application_number=row.application_number,
+                status=row.status,
+                selected_services=row.selected_services or [],
+                created_at=row.created_at,
+                completed_at=row.completed_at,
+                is_current=row.id == application_id,
+            )
+            for row in result.all()
+        ]
+
+    # 최근 변경 이력
+    result = await db.execute(
+        select(AuditLog)
+        .where(AuditLog.entity_type == "application", AuditLog.entity_id == application_id)
+        .order_by(desc(AuditLog.created_at), desc(AuditLog.id))
+        .limit(OVERVIEW_AUDIT_LIMIT)
+    )
+    audit_logs = result.scalars().all()
+
+    return ApplicationOverviewResponse(
+        application=ApplicationDetailResponse(**decrypted, assignments=assignments),
+        assignments=assignments,
+        quote_total_amount=sum(a.quote_total_amount for a in assignments),
+        recent_notes=[ApplicationNoteResponse.model_validate(note) for note, _ in note_rows],
+        notes_total=notes_total,
+        customer_history=CustomerHistory(
+            customer_phone_masked=mask_customer_phone(customer_phone) if customer_phone else None,
+            total_applications=len(history),
+            applications=history,
+        ),
+        recent_audit_logs=[AuditLogResponse.model_validate(log) for log in audit_logs],
+    )
+
+
 @router.put("/{application_id}", response_model=ApplicationDetailResponse)
 async def update_application(
     application_id: int,
@@ -499,7 +1008,7 @@ async def update_application(
         raise HTTPException(status_code=404, detail="신청을 찾을 수 없습니다")
 
     # 서비스 맵 1회 조회 (N+1 방지)
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
 
     # 이전 상태 저장 (SMS 발송 및 Audit 로그용)
     prev_partner_id = application.assigned_partner_id
@@ -875,13 +1384,15 @@ async def get_application_notes(
     application_id: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor, 지정 시 page 무시)"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
     """
     신청 관리자 메모 목록 조회
 
-    - 최신순 정렬
+    - 최신순 정렬 (페이지 번호 또는 cursor)
     - 히스토리 형태로 제공
     """
     result = await db.execute(select(Application).where(Application.id == application_id))
@@ -891,27 +1402,26 @@ async def get_application_notes(
         raise HTTPException(status_code=404, detail="신청을 찾을 수 없습니다")
 
     stmt = select(ApplicationNote).where(ApplicationNote.application_id == application_id)
-    count_result = await db.execute(select(func.count()).select_from(stmt.subquery()))
-
-    total = count_result.scalar()
 
     result = await db.execute(
-
-
-        stmt.order_by(desc(ApplicationNote.created_at))
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        
-
-
+        paginate(stmt, ApplicationNote.created_at, ApplicationNote.id, page, page_size, cursor)
+    )
+    notes, next_cursor = split_page(result.scalars().all(), page_size)
+
+    total, total_estimated = await count_list(
+        db,
+        stmt,
+        "application_notes",
+        {"application_id": application_id},
+        count,
+        total=known_total(page, page_size, len(notes), next_cursor is not None, cursor),
     )
-
-
-    notes = result.scalars().all()
 
     return ApplicationNotesListResponse(
         items=[ApplicationNoteResponse.model_validate(note) for note in notes],
         total=total,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
@@ -1020,7 +1530,7 @@ async def get_application_assignments(
             id=assignment.id,
             application_id=assignment.application_id,
             partner_id=assignment.partner_id,
-            assigned_services=convert_service_codes_to_names(db, assignment.assigned_services) or [],
+            assigned_services=await convert_service_codes_to_names(db, assignment.assigned_services) or [],
             status=assignment.status,
             scheduled_date=str(assignment.scheduled_date) if assignment.scheduled_date else None,
             scheduled_time=assignment.scheduled_time,
@@ -1073,7 +1583,7 @@ async def create_application_assignment(
         raise HTTPException(status_code=400, detail="승인된 협력사만 배정할 수 있습니다")
 
     # 서비스 이름 → 코드 변환 (프론트엔드에서 서비스 이름으로 전송됨)
-    assigned_service_codes = convert_service_names_to_codes(db, data.assigned_services)
+    assigned_service_codes = await convert_service_names_to_codes(db, data.assigned_services)
 
     # 서비스 영역 매칭 확인 (코드 vs 코드 비교)
     if assigned_service_codes and partner.service_areas:
@@ -1082,7 +1592,7 @@ async def create_application_assignment(
         if not assigned_set.issubset(partner_services):
             unmatched = assigned_set - partner_services
             # 매칭되지 않은 코드를 다시 이름으로 변환하여 사용자 친화적 메시지
-            unmatched_names = convert_service_codes_to_names(db, list(unmatched))
+            unmatched_names = await convert_service_codes_to_names(db, list(unmatched))
             raise HTTPException(
                 status_code=400,
                 detail=f"협력사가 해당 서비스를 제공하지 않습니다: {', '.join(unmatched_names)}"
@@ -1177,7 +1687,7 @@ async def create_application_assignment(
         id=assignment.id,
         application_id=assignment.application_id,
         partner_id=assignment.partner_id,
-        assigned_services=convert_service_codes_to_names(db, assignment.assigned_services) or [],
+        assigned_services=await convert_service_codes_to_names(db, assignment.assigned_services) or [],
         status=assignment.status,
         scheduled_date=str(assignment.scheduled_date) if assignment.scheduled_date else None,
         scheduled_time=assignment.scheduled_time,
@@ -1247,7 +1757,7 @@ async def update_application_assignment(
                     assignment.completed_at = datetime.now(timezone.utc)
             elif field == "assigned_services":
                 # 서비스 이름 → 코드 변환
-                value = convert_service_names_to_codes(db, value)
+                value = await convert_service_names_to_codes(db, value)
             setattr(assignment, field, value)
 
     # 일정이 새로 입력되고 현재 pending 상태면 자동으로 scheduled로 전환
@@ -1297,7 +1807,7 @@ async def update_application_assignment(
         id=assignment.id,
         application_id=assignment.application_id,
         partner_id=assignment.partner_id,
-        assigned_services=convert_service_codes_to_names(db, assignment.assigned_services) or [],
+        assigned_services=await convert_service_codes_to_names(db, assignment.assigned_services) or [],
         status=assignment.status,
         scheduled_date=str(assignment.scheduled_date) if assignment.scheduled_date else None,
         scheduled_time=assignment.scheduled_time,
@@ -1428,7 +1938,7 @@ async def batch_update_assignment_status(
     if not application:
         raise HTTPException(status_code=404, detail="신청을 찾을 수 없습니다")
 
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
     decrypted = decrypt_application(application, service_map)
     results = []
     updated_count = 0
@@ -1598,7 +2108,7 @@ async def send_assignment_sms(
         raise HTTPException(status_code=404, detail="협력사 정보를 찾을 수 없습니다")
 
     # 고객 정보 복호화
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
     decrypted = decrypt_application(application, service_map)
     partner_phone = decrypt_value(partner.contact_phone)
 
@@ -1619,6 +2129,7 @@ async def send_assignment_sms(
             scheduled_date_str,
             scheduled_time_str,
             estimated_cost_str,
+            coalesce=False,  # 관리자 수동 발송은 묶음 대기 없이 즉시 발송
         )
         logger.info(f"SMS to customer scheduled: {application.application_number}")
         return {"success": True, "message": "고객에게 SMS가 발송되었습니다"}
@@ -1637,6 +2148,7 @@ async def send_assignment_sms(
             assignment.assigned_services or [],
             scheduled_date_str,
             view_url,
+            coalesce=False,  # 관리자 수동 발송은 묶음 대기 없이 즉시 발송
         )
         logger.info(f"SMS to partner scheduled: {application.application_number}")
         return {"success": True, "message": "협력사에게 SMS가 발송되었습니다"}
@@ -1666,7 +2178,7 @@ async def get_customer_history(
     if not application:
         raise HTTPException(status_code=404, detail="신청을 찾을 수 없습니다")
 
-    # 전화번호 복호화
+    # 전화번호 복호화 (마스킹 표시용)
     customer_phone = decrypt_value(application.customer_phone)
     if not customer_phone:
         return {
@@ -1675,15 +2187,13 @@ async def get_customer_history(
             "applications": [],
         }
 
-    # 동일 전화번호의 모든 신청 조회
-    customer_applications = await get_customer_applications(db, customer_phone, limit=20)
-
-    # 전화번호 마스킹 (010-****-1234 형식)
-    phone_parts = customer_phone.replace("-", "")
-    if len(phone_parts) >= 7:
-        masked_phone = f"{phone_parts[:3]}-****-{phone_parts[-4:]}"
+    # 동일 전화번호의 모든 신청 조회 (저장된 phone_hash 사용, 없으면 계산)
+    if application.phone_hash:
+        customer_applications = await get_customer_applications_by_hash(db, application.phone_hash, limit=20)
     else:
-        masked_phone = customer_phone
+        customer_applications = await get_customer_applications(db, customer_phone, limit=20)
+
+    masked_phone = mask_customer_phone(customer_phone)
 
     # 응답 생성
     applications_list = []
@@ -5,12 +5,19 @@ Admin Audit Log API endpoints
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, func
+from sqlalchemy import select
 from typing import Optional
-import math
 
 from app.core.database import get_db
 from app.core.security import get_current_admin
+from app.core.pagination import paginate, split_page
+from app.services.list_count import (
+    COUNT_QUERY_DESCRIPTION,
+    COUNT_QUERY_PATTERN,
+    count_list,
+    known_total,
+    total_pages,
+)
 from app.models.admin import Admin
 from app.models.audit_log import AuditLog
 from app.schemas.audit_log import AuditLogResponse, AuditLogListResponse
@@ -26,6 +33,8 @@ async def get_audit_logs(
     admin_id: Optional[int] = Query(None, description="관리자 ID 필터"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor, 지정 시 page 무시)"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
@@ -45,18 +54,19 @@ async def get_audit_logs(
     if admin_id:
         stmt = stmt.where(AuditLog.admin_id == admin_id)
 
-    # 전체 개수 조회
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar() or 0
-
-    # 페이지네이션
-    total_pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-
-    stmt = stmt.order_by(desc(AuditLog.created_at)).offset(offset).limit(page_size)
-    result = await db.execute(stmt)
-    logs = result.scalars().all()
+    # 페이지네이션 (페이지 번호 또는 cursor)
+    result = await db.execute(paginate(stmt, AuditLog.created_at, AuditLog.id, page, page_size, cursor))
+    logs, next_cursor = split_page(result.scalars().all(), page_size)
+
+    # 전체 개수 조회 (마지막 페이지면 COUNT 생략)
+    total, total_estimated = await count_list(
+        db,
+        stmt,
+        "audit_logs",
+        {"entity_type": entity_type, "entity_id": entity_id, "action": action, "admin_id": admin_id},
+        count,
+        total=known_total(page, page_size, len(logs), next_cursor is not None, cursor),
+    )
 
     return AuditLogListResponse(
         items=[
@@ -77,7 +87,9 @@ async def get_audit_logs(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages,
+        total_pages=total_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
@@ -87,6 +99,8 @@ async def get_entity_audit_logs(
     entity_id: int,
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(50, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor, 지정 시 page 무시)"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
@@ -99,18 +113,19 @@ async def get_entity_audit_logs(
         AuditLog.entity_id == entity_id,
     )
 
-    # 전체 개수 조회
-    count_stmt = select(func.count()).select_from(stmt.subquery())
-    count_result = await db.execute(count_stmt)
-    total = count_result.scalar() or 0
-
-    # 페이지네이션
-    total_pages = math.ceil(total / page_size) if total > 0 else 1
-    offset = (page - 1) * page_size
-
-    stmt = stmt.order_by(desc(AuditLog.created_at)).offset(offset).limit(page_size)
-    result = await db.execute(stmt)
-    logs = result.scalars().all()
+    # 페이지네이션 (페이지 번호 또는 cursor)
+    result = await db.execute(paginate(stmt, AuditLog.created_at, AuditLog.id, page, page_size, cursor))
+    logs, next_cursor = split_page(result.scalars().all(), page_size)
+
+    # 전체 개수 조회 (마지막 페이지면 COUNT 생략, 목록 필터와 같은 캐시 키)
+    total, total_estimated = await count_list(
+        db,
+        stmt,
+        "audit_logs",
+        {"entity_type": entity_type, "entity_id": entity_id},
+        count,
+        total=known_total(page, page_size, len(logs), next_cursor is not None, cursor),
+    )
 
     return AuditLogListResponse(
         items=[
@@ -131,5 +146,7 @@ async def get_entity_audit_logs(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages,
+        total_pages=total_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
@@ -5,7 +5,7 @@ Admin Dashboard API
 
 from datetime import datetime, timedelta, timezone
 from fastapi import APIRouter, Depends
-from sqlalchemy import select, func
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
@@ -14,6 +14,7 @@ from app.core.security import get_current_admin
 from app.models.admin import Admin
 from app.models.application import Application
 from app.models.partner import Partner
+from app.services.dashboard_counters import created_since, read_dashboard_counters, status_counts
 
 router = APIRouter(prefix="/dashboard", tags=["Admin Dashboard"])
 
@@ -75,83 +76,59 @@ async def get_dashboard(
 ):
     """
     대시보드 데이터 조회
+
+    - 건수 통계: 대시보드 카운터(dashboard_counters) 1회 조회
+    - 최근 신청/협력사: 목록 표시 컬럼만 조회
     """
     now = datetime.now(timezone.utc)
     today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
     week_start = today_start - timedelta(days=today_start.weekday())
     month_start = today_start.replace(day=1)
 
-    # 신청 통계
-    result = await db.execute(select(func.count(Application.id)))
-    applications_total = result.scalar() or 0
-
-    # 상태별 신청 수
-    result = await db.execute(
-        select(Application.status, func.count(Application.id))
-        .group_by(Application.status)
-    )
-    status_counts = result.all()
-    status_map = dict(status_counts)
-
-    # 기간별 신청 수
-    result = await db.execute(
-        select(func.count(Application.id))
-        .where(Application.created_at >= today_start)
-    )
-    applications_today = result.scalar() or 0
-
-    result = await db.execute(
-        select(func.count(Application.id))
-        .where(Application.created_at >= week_start)
-    )
-    applications_this_week = result.scalar() or 0
-
-    # 협력사 통계
-    result = await db.execute(select(func.count(Partner.id)))
-    partners_total = result.scalar() or 0
-
-    result = await db.execute(
-        select(Partner.status, func.count(Partner.id))
-        .group_by(Partner.status)
-    )
-    partner_status_counts = result.all()
-    partner_status_map = dict(partner_status_counts)
-
-    result = await db.execute(
-        select(func.count(Partner.id))
-        .where(Partner.created_at >= month_start)
-    )
-    partners_this_month = result.scalar() or 0
+    # 건수 통계 (상태별 + 기간 내 생성일별 카운터)
+    counters = await read_dashboard_counters(db, since=min(week_start, month_start).date())
+    status_map = status_counts(counters, "application")
+    partner_status_map = status_counts(counters, "partner")
 
     # 최근 신청 (5건)
     result = await db.execute(
-        select(Application)
+        select(
+            Application.id,
+            Application.application_number,
+            Application.status,
+            Application.created_at,
+        )
         .order_by(Application.created_at.desc())
         .limit(5)
     )
-    recent_applications = result.scalars().all()
+    recent_applications = result.all()
 
     # 최근 협력사 (5건)
     result = await db.execute(
-        select(Partner)
+        select(
+            Partner.id,
+            Partner.company_name,
+            Partner.status,
+            Partner.created_at,
+        )
         .order_by(Partner.created_at.desc())
         .limit(5)
     )
-    recent_partners = result.scalars().all()
+    recent_partners = result.all()
 
     stats = DashboardStats(
-        applications_total=applications_total,
+        applications_total=sum(status_map.values()),
         applications_new=status_map.get("new", 0),
         applications_consulting=status_map.get("consulting", 0),
         applications_assigned=status_map.get("assigned", 0),
         applications_scheduled=status_map.get("scheduled", 0),
         applications_completed=status_map.get("completed", 0),
-        applications_today=applications_today,
-        applications_this_week=applications_this_week,
-        partners_total=partners_total,
+        applications_today=created_since(counters, "application", today_start.date()),
+        applications_this_week=created_since(counters, "application", week_start.date()),
+        partners_total=sum(partner_status_map.values()),
         partners_pending=partner_status_map.get("pending", 0),
         partners_approved=partner_status_map.get("approved", 0),
-        partners_this_month=partners_this_month,
+        partners_this_month=created_since(counters, "partner", month_start.date()),
     )
 
     return DashboardResponse(
@@ -4,17 +4,25 @@ Admin Partner API endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc, or_, cast, String, func
+from sqlalchemy import select, desc
 from typing import Optional, List
 from datetime import datetime, timezone, date
-import math
 import logging
 
 from app.core.database import get_db
 from app.core.security import get_current_admin
 from app.core.encryption import decrypt_value
 from app.core.file_token import get_file_url
+from app.core.pagination import paginate, split_page
+from app.services.list_count import (
+    COUNT_QUERY_DESCRIPTION,
+    COUNT_QUERY_PATTERN,
+    count_list,
+    known_total,
+    total_pages,
+)
 from app.models.admin import Admin
 from app.models.partner import Partner
 from app.models.partner_note import PartnerNote
@@ -32,7 +40,13 @@ from app.schemas.partner_note import (
     PartnerStatusChange,
 )
 from app.services.sms import send_partner_approval_notification
-from app.services.search_index import unified_search, detect_search_type
+from app.services.partner_filter import PartnerFilter
+from app.services.export import (
+    CSV_MEDIA_TYPE,
+    export_filename,
+    format_export_datetime,
+    stream_csv_export,
+)
 from app.services.audit import log_status_change
 from app.services.duplicate_check import find_similar_partners
 from app.services.service_utils import (
@@ -89,10 +103,42 @@ def decrypt_partner(partner: Partner, service_map: dict[str, str]) -> dict:
     }
 
 
+# 목록 조회 컬럼 (PartnerListItem에 필요한 컬럼만 조회)
+# introduction, experience, remarks, work_regions 등 큰 컬럼과 ORM 엔티티 생성(identity map) 비용 제외
+PARTNER_LIST_COLUMNS = (
+    Partner.id,
+    Partner.company_name,
+    Partner.representative_name,
+    Partner.contact_phone,
+    Partner.service_areas,
+    Partner.status,
+    Partner.created_at,
+)
+
+
+def build_partner_list_item(row, service_map: dict[str, str]) -> PartnerListItem:
+    """PARTNER_LIST_COLUMNS 조회 결과(Row)로 목록 아이템 생성
+
+    Args:
+        row: PARTNER_LIST_COLUMNS를 select한 결과 행
+        service_map: get_service_code_to_name_map()으로 조회한 서비스 코드→이름 매핑
+    """
+    return PartnerListItem(
+        id=row.id,
+        company_name=row.company_name,
+        representative_name=decrypt_value(row.representative_name),
+        contact_phone=decrypt_value(row.contact_phone),
+        service_areas=convert_service_codes_with_map(service_map, row.service_areas),
+        status=row.status,
+        created_at=row.created_at,
+    )
+
+
 @router.get("", response_model=PartnerListResponse)
 async def get_partners(
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor, 지정 시 page 무시)"),
     status: Optional[str] = Query(None, description="상태 필터"),
     search: Optional[str] = Query(None, description="통합 검색어 (회사명/대표자명/연락처)"),
     search_type: Optional[str] = Query(None, description="검색 타입 (auto/company/name/phone)"),
@@ -101,110 +147,172 @@ async def get_partners(
     services: Optional[str] = Query(None, description="서비스 분야 필터 (콤마 구분)"),
     region: Optional[str] = Query(None, description="활동 지역 필터"),
     approved_by: Optional[int] = Query(None, description="승인 관리자 ID"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
     """
     협력사 목록 조회 (관리자용)
 
-    - 페이징 지원
+    - 페이징 지원 (페이지 번호 또는 cursor)
     - 상태 필터링
     - 통합 검색 (회사명/대표자명/연락처 자동 감지)
     - 날짜 범위 필터
     - 서비스 분야 필터
     - 활동 지역 필터
+    - 목록 표시 컬럼만 조회 (PARTNER_LIST_COLUMNS)
     """
-    query = select(Partner)
-
-    # 상태 필터
-    if status:
-        query = query.where(Partner.status == status)
-
-    # 통합 검색
-    if search:
-        # 검색 타입 자동 감지 또는 지정된 타입 사용
-        if search_type == "company":
-            # 회사명 검색 (DB 직접 검색)
-            query = query.where(Partner.company_name.ilike(f"%{search}%"))
-        else:
-            detected_type = search_type if search_type and search_type != "auto" else detect_search_type(search)
-
-            if detected_type in ("phone", "name"):
-                # 암호화된 필드 검색 (인덱스 테이블 사용)
-                matching_ids = await unified_search(db, "partner", search, detected_type)
-                if matching_ids:
-                    query = query.where(Partner.id.in_(matching_ids))
-                else:
-                    # 인덱스에서 결과가 없으면 회사명에서도 검색 시도
-                    query = query.where(Partner.company_name.ilike(f"%{search}%"))
-            else:
-                # 기본: 회사명 검색
-                query = query.where(Partner.company_name.ilike(f"%{search}%"))
-
-    # 날짜 범위 필터
-    if date_from:
-        query = query.where(Partner.created_at >= datetime.combine(date_from, datetime.min.time()))
-    if date_to:
-        query = query.where(Partner.created_at <= datetime.combine(date_to, datetime.max.time()))
-
-    # 서비스 분야 필터 (JSONB 배열에서 검색)
-    if services:
-        service_list = [s.strip() for s in services.split(",") if s.strip()]
-        if service_list:
-            service_conditions = [
-                Partner.service_areas.contains([svc])
-                for svc in service_list
-            ]
-            query = query.where(or_(*service_conditions))
-
-    # 활동 지역 필터 (work_regions JSONB에서 검색)
-    if region:
-        # work_regions 형식: [{"province": "경기도", "district": "양평군"}, ...]
-        # PostgreSQL JSONB 텍스트 변환 후 검색
-        query = query.where(
-            cast(Partner.work_regions, String).ilike(f"%{region}%")
-        )
-
-    # 승인 관리자 필터
-    if approved_by:
-        query = query.where(Partner.approved_by == approved_by)
-
-    # 전체 개수
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar_one()
+    filters = PartnerFilter.from_query(
+        status=status,
+        search=search,
+        search_type=search_type,
+        date_from=date_from,
+        date_to=date_to,
+        services=services,
+        region=region,
+        approved_by=approved_by,
+    )
+    query = await filters.apply(db, select(*PARTNER_LIST_COLUMNS))
 
     # 정렬 및 페이징
-    query = (
-        query.order_by(desc(Partner.created_at))
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+    result = await db.execute(
+        paginate(query, Partner.created_at, Partner.id, page, page_size, cursor)
+    )
+    partners, next_cursor = split_page(result.all(), page_size)
+
+    # 전체 개수 (마지막 페이지면 COUNT 생략)
+    total, total_estimated = await count_list(
+        db,
+        query,
+        "partners",
+        filters.as_dict(),
+        count,
+        total=known_total(page, page_size, len(partners), next_cursor is not None, cursor),
     )
-
-    result = await db.execute(query)
-    partners = result.scalars().all()
 
     # 복호화된 목록 생성 (서비스 맵 1회 조회로 N+1 방지)
-    service_map = get_service_code_to_name_map(db)
-    items = []
-    for partner in partners:
-        decrypted = decrypt_partner(partner, service_map)
-        items.append(PartnerListItem(
-            id=decrypted["id"],
-            company_name=decrypted["company_name"],
-            representative_name=decrypted["representative_name"],
-            contact_phone=decrypted["contact_phone"],
-            service_areas=decrypted["service_areas"],
-            status=decrypted["status"],
-            created_at=decrypted["created_at"],
-        ))
+    service_map = await get_service_code_to_name_map(db)
+    items = [build_partner_list_item(row, service_map) for row in partners]
 
     return PartnerListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=math.ceil(total / page_size) if total > 0 else 1,
+        total_pages=total_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
+    )
+
+
+# 내보내기 컬럼 (CSV 헤더, 조회 컬럼)
+PARTNER_EXPORT_HEADER = (
+    "회사명", "대표자명", "사업자등록번호", "연락처", "이메일", "주소", "상세주소",
+    "서비스 분야", "활동 지역", "상태", "등록일시", "승인일시",
+)
+PARTNER_EXPORT_COLUMNS = (
+    Partner.id,
+    Partner.company_name,
+    Partner.representative_name,
+    Partner.business_number,
+    Partner.contact_phone,
+    Partner.contact_email,
+    Partner.address,
+    Partner.address_detail,
+    Partner.service_areas,
+    Partner.work_regions,
+    Partner.status,
+    Partner.created_at,
+    Partner.approved_at,
+)
+
+
+def format_work_regions(work_regions: Optional[list]) -> str:
+    """활동 지역 표시 (예: 경기도 양평군, 경기도 가평군)"""
+    return ", ".join(
+        " ".join(filter(None, (region.get("province"), region.get("district"))))
+        if isinstance(region, dict) else str(region)
+        for region in (work_regions or [])
+    )
+
+
+def build_partner_export_rows(rows, service_map: dict[str, str]) -> list[list]:
+    """PARTNER_EXPORT_COLUMNS 조회 결과 배치를 CSV 행 목록으로 변환 (복호화 포함)
+
+    Args:
+        rows: PARTNER_EXPORT_COLUMNS를 select한 결과 행 배치
+        service_map: get_service_code_to_name_map()으로 조회한 서비스 코드→이름 매핑
+    """
+    return [
+        [
+            row.company_name,
+            decrypt_value(row.representative_name),
+            decrypt_value(row.business_number) if row.business_number else "",
+            decrypt_value(row.contact_phone),
+            decrypt_value(row.contact_email) if row.contact_email else "",
+            decrypt_value(row.address),
+            decrypt_value(row.address_detail) if row.address_detail else "",
+            ", ".join(convert_service_codes_with_map(service_map, row.service_areas)),
+            format_work_regions(row.work_regions),
+            STATUS_LABELS.get(row.status, row.status),
+            format_export_datetime(row.created_at),
+            format_export_datetime(row.approved_at),
+        ]
+        for row in rows
+    ]
+
+
+@router.get("/export")
+async def export_partners(
+    status: Optional[str] = Query(None, description="상태 필터"),
+    search: Optional[str] = Query(None, description="통합 검색어 (회사명/대표자명/연락처)"),
+    search_type: Optional[str] = Query(None, description="검색 타입 (auto/company/name/phone)"),
+    date_from: Optional[date] = Query(None, description="등록일 시작"),
+    date_to: Optional[date] = Query(None, description="등록일 종료"),
+    services: Optional[str] = Query(None, description="서비스 분야 필터 (콤마 구분)"),
+    region: Optional[str] = Query(None, description="활동 지역 필터"),
+    approved_by: Optional[int] = Query(None, description="승인 관리자 ID"),
+    db: AsyncSession = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    """
+    협력사 목록 CSV 내보내기 (관리자용)
+
+    - 목록 조회와 같은 필터 (PartnerFilter)
+    - 서버 측 커서로 배치 단위 조회/복호화 후 스트리밍 (건수와 무관하게 메모리 일정)
+    - 내보내기 이력 기록 (audit_logs, action=export)
+    """
+    filters = PartnerFilter.from_query(
+        status=status,
+        search=search,
+        search_type=search_type,
+        date_from=date_from,
+        date_to=date_to,
+        services=services,
+        region=region,
+        approved_by=approved_by,
+    )
+    stmt = await filters.apply(db, select(*PARTNER_EXPORT_COLUMNS))
+    stmt = stmt.order_by(desc(Partner.created_at), desc(Partner.id))
+    service_map = await get_service_code_to_name_map(db)
+
+    # 스트림은 별도 세션으로 조회하므로 요청 세션 반환
+    await db.close()
+
+    return StreamingResponse(
+        stream_csv_export(
+            stmt,
+            PARTNER_EXPORT_HEADER,
+            lambda rows: build_partner_export_rows(rows, service_map),
+            "partner",
+            filters.as_dict(),
+            current_admin,
+        ),
+        media_type=CSV_MEDIA_TYPE,
+        headers={
+            "Content-Disposition": f'attachment; filename="{export_filename("partners")}"',
+            "Cache-Control": "no-cache",
+        },
     )
 
 
@@ -224,7 +332,7 @@ async def get_partner(
     if not partner:
         raise HTTPException(status_code=404, detail="협력사를 찾을 수 없습니다")
 
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
     decrypted = decrypt_partner(partner, service_map)
     return PartnerDetailResponse(**decrypted)
 
@@ -248,7 +356,7 @@ async def get_similar_partners(
         raise HTTPException(status_code=404, detail="협력사를 찾을 수 없습니다")
 
     # 서비스 맵 1회 조회로 N+1 방지
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
 
     # 협력사 정보 복호화
     decrypted = decrypt_partner(partner, service_map)
@@ -323,7 +431,7 @@ async def update_partner(
     await db.commit()
     await db.refresh(partner)
 
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
     decrypted = decrypt_partner(partner, service_map)
     return PartnerDetailResponse(**decrypted)
 
@@ -381,7 +489,7 @@ async def approve_partner(
         )
         logger.info(f"SMS scheduled: partner {'approval' if is_approved else 'rejection'} for {partner.company_name}")
 
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
     decrypted = decrypt_partner(partner, service_map)
     return PartnerDetailResponse(**decrypted)
 
@@ -419,6 +527,9 @@ async def delete_partner(
 @router.get("/{partner_id}/notes", response_model=PartnerNotesResponse)
 async def get_partner_notes(
     partner_id: int,
+    page_size: Optional[int] = Query(None, ge=1, le=100, description="페이지 크기 (생략 시 전체)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor)"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
@@ -427,6 +538,7 @@ async def get_partner_notes(
 
     - 최신순 정렬
     - 메모 + 상태변경 이력 포함
+    - page_size 지정 시 cursor 페이지네이션 (생략 시 전체 반환)
     """
     partner_query = select(Partner).where(Partner.id == partner_id)
     partner_result = await db.execute(partner_query)
@@ -435,17 +547,38 @@ async def get_partner_notes(
     if not partner:
         raise HTTPException(status_code=404, detail="협력사를 찾을 수 없습니다")
 
-    notes_query = (
-        select(PartnerNote)
-        .where(PartnerNote.partner_id == partner_id)
-        .order_by(desc(PartnerNote.created_at))
+    notes_query = select(PartnerNote).where(PartnerNote.partner_id == partner_id)
+
+    if page_size is None:
+        notes_result = await db.execute(
+            notes_query.order_by(desc(PartnerNote.created_at), desc(PartnerNote.id))
+        )
+        notes = notes_result.scalars().all()
+        return PartnerNotesResponse(
+            items=[PartnerNoteResponse.model_validate(note) for note in notes],
+            total=len(notes),
+        )
+
+    notes_result = await db.execute(
+        paginate(notes_query, PartnerNote.created_at, PartnerNote.id, 1, page_size, cursor)
+    )
+    notes, next_cursor = split_page(notes_result.scalars().all(), page_size)
+
+    # 전체 개수 (마지막 페이지면 COUNT 생략)
+    total, total_estimated = await count_list(
+        db,
+        notes_query,
+        "partner_notes",
+        {"partner_id": partner_id},
+        count,
+        total=known_total(1, page_size, len(notes), next_cursor is not None, cursor),
     )
-    notes_result = await db.execute(notes_query)
-    notes = notes_result.scalars().all()
 
     return PartnerNotesResponse(
         items=[PartnerNoteResponse.model_validate(note) for note in notes],
-        total=len(notes),
+        total=total,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
@@ -597,6 +730,6 @@ async def change_partner_status(
         )
         logger.info(f"SMS scheduled: partner status change to {new_status} for {partner.company_name}")
 
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
     decrypted = decrypt_partner(partner, service_map)
     return PartnerDetailResponse(**decrypted)
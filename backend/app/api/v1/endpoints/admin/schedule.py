@@ -21,6 +21,7 @@ from app.services.service_utils import (
     convert_service_codes_with_map,
     get_service_code_to_name_map,
 )
+from app.services.schedule_stats import get_schedule_calendars
 
 router = APIRouter(prefix="/schedule", tags=["Admin - Schedule"])
 
@@ -74,12 +75,19 @@ class ScheduleListResponse(BaseModel):
     total: int
 
 
-class MonthlyStats(BaseModel):
-    """월간 일정 통계"""
+class ScheduleCalendarStats(BaseModel):
+    """일정 캘린더 통계 (취소 제외)"""
     total_scheduled: int
     completed: int
     pending: int
     by_date: dict[str, int]  # 날짜별 일정 수
+    by_status: dict[str, int] = {}  # 상태별 일정 수
+    by_date_status: dict[str, dict[str, int]] = {}  # 날짜별 상태별 일정 수
+
+
+class MonthlyStats(ScheduleCalendarStats):
+    """월간 일정 통계 (최상위: Application 기준 - 레거시, assignments: Assignment 기준)"""
+    assignments: Optional[ScheduleCalendarStats] = None
 
 
 def decrypt_application_for_schedule(
@@ -164,7 +172,7 @@ async def get_schedule_by_assignment(
         partners = {p.id: p for p in partner_list}
 
     # 서비스 코드→이름 매핑 조회 (N+1 방지)
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
 
     # 응답 생성
     items = []
@@ -269,7 +277,7 @@ async def get_schedule(
         partners = {p.id: p for p in partner_list}
 
     # 서비스 코드→이름 매핑 조회 (N+1 방지)
-    service_map = get_service_code_to_name_map(db)
+    service_map = await get_service_code_to_name_map(db)
 
     # 복호화
     items = []
@@ -289,6 +297,9 @@ async def get_monthly_stats(
 ):
     """
     월간 일정 통계 조회
+
+    - 신청 기준(레거시)과 배정 기준 캘린더를 함께 반환
+    - GROUP BY scheduled_date, status 집계 (신청/배정 행을 불러오지 않음)
     """
     # 해당 월의 시작일과 종료일 (date 객체로 생성)
     start = date(year, month, 1)
@@ -297,37 +308,11 @@ async def get_monthly_stats(
     else:
         end = date(year, month + 1, 1)
 
-    # 해당 월의 일정 조회
-    query = select(Application).where(
-        Application.scheduled_date.isnot(None),
-        Application.scheduled_date >= start,
-        Application.scheduled_date < end,
-        Application.status != "cancelled",
-    )
-
-    result = await db.execute(query)
-    applications = result.scalars().all()
-
-    # 통계 계산
-    total_scheduled = len(applications)
-    completed = sum(1 for app in applications if app.status == "completed")
-    pending = total_scheduled - completed
-
-    # 날짜별 일정 수
-    by_date: dict[str, int] = {}
-    for app in applications:
-        # scheduled_date가 date 객체인 경우 문자열로 변환
-        if isinstance(app.scheduled_date, date):
-            date_str = app.scheduled_date.isoformat()
-        else:
-            date_str = str(app.scheduled_date)
-        by_date[date_str] = by_date.get(date_str, 0) + 1
+    calendars = await get_schedule_calendars(db, start, end)
 
     return MonthlyStats(
-        total_scheduled=total_scheduled,
-        completed=completed,
-        pending=pending,
-        by_date=by_date,
+        **calendars["application"],
+        assignments=ScheduleCalendarStats(**calendars["assignment"]),
     )
 
 
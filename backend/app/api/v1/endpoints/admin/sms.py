@@ -4,23 +4,33 @@ Admin SMS API endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import desc, func, select
+from sqlalchemy import func, select
 from typing import Optional
 from datetime import datetime, timezone, timedelta
-import math
-import base64
+import json
 import logging
+from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 from app.core.database import get_db
 from app.core.security import get_current_admin
-from app.core.encryption import decrypt_value, encrypt_value
+from app.core.encryption import decrypt_value, encrypt_value, generate_search_hash
 from app.core.config import settings
 from app.core.file_token import get_file_url
+from app.core.pagination import paginate, split_page
+from app.services.list_count import (
+    COUNT_QUERY_DESCRIPTION,
+    COUNT_QUERY_PATTERN,
+    count_list,
+    known_total,
+    total_pages,
+)
 from app.models.admin import Admin
 from app.models.sms_log import SMSLog
+from app.models.sms_daily_stat import SMSDailyStat
 from app.models.bulk_sms_job import BulkSMSJob
 from app.models.application import Application
 from app.models.partner import Partner
@@ -30,6 +40,7 @@ from app.schemas.sms_log import (
     SMSSendRequest,
     SMSSendResponse,
     SMSStatsResponse,
+    SMSDailyStatsItem,
     MMSSendRequest,
     WorkPhotoMMSRequest,
 )
@@ -43,8 +54,9 @@ from app.schemas.bulk_sms import (
     SMSRecipientsResponse,
     FailedRecipient,
 )
-from app.services.sms import send_sms, send_sms_direct, send_mms
+from app.services.sms import send_sms, send_sms_direct, send_mms, decode_base64_image
 from app.services.bulk_sms import execute_bulk_sms_job
+from app.services.bulk_sms_progress import stream_bulk_sms_progress
 from app.services.image import process_uploaded_image
 
 router = APIRouter(prefix="/sms", tags=["Admin - SMS"])
@@ -117,46 +129,27 @@ async def test_sms_send(
         }
 
 
-def save_mms_images(base64_images: list[str]) -> list[str]:
+def save_mms_images(images: list[bytes]) -> list[str]:
     """
     MMS 이미지들을 저장하고 경로 목록 반환
 
     Args:
-        base64_images: Base64 인코딩된 이미지 목록 (data:image/...;base64,... 형태)
+        images: 이미지 바이트 목록 (Base64 디코딩 완료)
 
     Returns:
         저장된 이미지 경로 목록
     """
     saved_paths = []
 
-    for base64_img in base64_images:
-        if not base64_img:
+    for image_data in images:
+        if not image_data:
             continue
 
         try:
-            # data:image/jpeg;base64,... 형태에서 Base64 부분 추출
-            if "," in base64_img:
-                header, data = base64_img.split(",", 1)
-                # MIME 타입에서 확장자 추출
-                if "jpeg" in header or "jpg" in header:
-                    ext = "jpg"
-                elif "png" in header:
-                    ext = "png"
-                elif "gif" in header:
-                    ext = "gif"
-                else:
-                    ext = "jpg"
-            else:
-                data = base64_img
-                ext = "jpg"
-
-            # Base64 디코딩
-            image_data = base64.b64decode(data)
-
             # 이미지 처리 및 저장
             result = process_uploaded_image(
                 image_data=image_data,
-                original_filename=f"mms_image.{ext}",
+                original_filename="mms_image.jpg",
                 upload_dir=settings.UPLOAD_DIR,
                 entity_type="mms",
             )
@@ -199,64 +192,56 @@ def decrypt_sms_log(log: SMSLog) -> dict:
 
 @router.get("/stats", response_model=SMSStatsResponse)
 async def get_sms_stats(
+    days: int = Query(30, ge=1, le=366, description="일별 추이 조회 일수"),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
     """
     SMS 발송 통계 조회
-    """
-    now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-
-    # 전체 통계
-    result = await db.execute(select(func.count(SMSLog.id)).where(SMSLog.status == "sent"))
-    total_sent = result.scalar() or 0
 
-    result = await db.execute(select(func.count(SMSLog.id)).where(SMSLog.status == "failed"))
-    total_failed = result.scalar() or 0
-
-    # 오늘 통계
-    result = await db.execute(
-        select(func.count(SMSLog.id)).where(
-            SMSLog.status == "sent",
-            SMSLog.created_at >= today_start
-        )
-    )
-    today_sent = result.scalar() or 0
+    일별 롤업(sms_daily_stats)을 한 번만 조회하여 전체/오늘/이번 달 통계와
+    최근 N일 일별 추이를 계산한다 (로그 건수와 무관).
+    """
+    today = datetime.now(timezone.utc).date()
+    month_start = today.replace(day=1)
+    series_start = today - timedelta(days=days - 1)
 
     result = await db.execute(
-        select(func.count(SMSLog.id)).where(
-            SMSLog.status == "failed",
-            SMSLog.created_at >= today_start
+        select(
+            SMSDailyStat.day,
+            SMSDailyStat.status,
+            func.sum(SMSDailyStat.count),
         )
+        .where(SMSDailyStat.status.in_(("sent", "failed")))
+        .group_by(SMSDailyStat.day, SMSDailyStat.status)
     )
-    today_failed = result.scalar() or 0
 
-    # 이번 달 통계
-    result = await db.execute(
-        select(func.count(SMSLog.id)).where(
-            SMSLog.status == "sent",
-            SMSLog.created_at >= month_start
-        )
-    )
-    this_month_sent = result.scalar() or 0
-
-    result = await db.execute(
-        select(func.count(SMSLog.id)).where(
-            SMSLog.status == "failed",
-            SMSLog.created_at >= month_start
-        )
-    )
-    this_month_failed = result.scalar() or 0
+    totals = {"sent": 0, "failed": 0}
+    today_counts = {"sent": 0, "failed": 0}
+    month_counts = {"sent": 0, "failed": 0}
+    daily = {series_start + timedelta(days=i): {"sent": 0, "failed": 0} for i in range(days)}
+
+    for day, status, count in result.all():
+        count = int(count or 0)
+        totals[status] += count
+        if day == today:
+            today_counts[status] += count
+        if day >= month_start:
+            month_counts[status] += count
+        if day in daily:
+            daily[day][status] += count
 
     return SMSStatsResponse(
-        total_sent=total_sent,
-        total_failed=total_failed,
-        today_sent=today_sent,
-        today_failed=today_failed,
-        this_month_sent=this_month_sent,
-        this_month_failed=this_month_failed,
+        total_sent=totals["sent"],
+        total_failed=totals["failed"],
+        today_sent=today_counts["sent"],
+        today_failed=today_counts["failed"],
+        this_month_sent=month_counts["sent"],
+        this_month_failed=month_counts["failed"],
+        daily=[
+            SMSDailyStatsItem(date=day, sent=counts["sent"], failed=counts["failed"])
+            for day, counts in daily.items()
+        ],
     )
 
 
@@ -264,10 +249,12 @@ async def get_sms_stats(
 async def get_sms_logs(
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor, 지정 시 page 무시)"),
     status: Optional[str] = Query(None, description="상태 필터"),
     sms_type: Optional[str] = Query(None, description="유형 필터"),
     trigger_source: Optional[str] = Query(None, description="발송 출처 필터 (system, manual, bulk)"),
-    search: Optional[str] = Query(None, description="검색어 (수신번호)"),
+    search: Optional[str] = Query(None, description="검색어 (수신번호 전체, 하이픈 무관)"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
@@ -278,9 +265,18 @@ async def get_sms_logs(
       - system: 시스템 자동 발송 (이벤트 트리거)
       - manual: 관리자 직접 발송
       - bulk: 대량 발송
+    - search: 수신번호 검색 (receiver_phone_hash 일치, 부분 검색 불가)
+    - cursor: 깊은 페이지 조회 시 페이지 번호 대신 사용 (next_cursor)
     """
     query = select(SMSLog)
 
+    # 수신번호 검색 (Blind Index)
+    if search:
+        search_hash = generate_search_hash(search, "phone")
+        if not search_hash:
+            return SMSLogListResponse(items=[], total=0, page=page, page_size=page_size, total_pages=1)
+        query = query.where(SMSLog.receiver_phone_hash == search_hash)
+
     # 상태 필터
     if status:
         query = query.where(SMSLog.status == status)
@@ -293,30 +289,31 @@ async def get_sms_logs(
     if trigger_source:
         query = query.where(SMSLog.trigger_source == trigger_source)
 
-    # 전체 개수
-    count_result = await db.execute(select(func.count()).select_from(query.subquery()))
-    total = count_result.scalar() or 0
-
     # 정렬 및 페이징
-    query = query.order_by(desc(SMSLog.created_at)).offset((page - 1) * page_size).limit(page_size)
-    result = await db.execute(query)
-    logs = result.scalars().all()
+    result = await db.execute(paginate(query, SMSLog.created_at, SMSLog.id, page, page_size, cursor))
+    logs, next_cursor = split_page(result.scalars().all(), page_size)
+
+    # 전체 개수 (마지막 페이지면 COUNT 생략)
+    total, total_estimated = await count_list(
+        db,
+        query,
+        "sms_logs",
+        {"status": status, "sms_type": sms_type, "trigger_source": trigger_source, "search": search},
+        count,
+        total=known_total(page, page_size, len(logs), next_cursor is not None, cursor),
+    )
 
     # 복호화된 목록 생성
-    items = []
-    for log in logs:
-        decrypted = decrypt_sms_log(log)
-        # 검색 필터 (복호화 후 적용)
-        if search and search not in decrypted["receiver_phone"]:
-            continue
-        items.append(SMSLogListItem(**decrypted))
+    items = [SMSLogListItem(**decrypt_sms_log(log)) for log in logs]
 
     return SMSLogListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=math.ceil(total / page_size) if total > 0 else 1,
+        total_pages=total_pages(total, page_size),
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
@@ -372,23 +369,30 @@ async def send_manual_mms(
     - image1, image2, image3: Base64 인코딩된 이미지 (선택, 각각 data:image/...;base64,... 형태)
     """
     try:
-        # 이미지 목록 생성
-        base64_images = [img for img in [data.image1, data.image2, data.image3] if img]
-        has_images = len(base64_images) > 0
+        # 이미지 목록 생성 (Base64 디코딩은 1회만 수행)
+        images = []
+        for base64_img in [data.image1, data.image2, data.image3]:
+            if not base64_img:
+                continue
+            try:
+                images.append(decode_base64_image(base64_img))
+            except Exception as e:
+                logger.error(f"Failed to decode MMS image: {e}")
+        has_images = len(images) > 0
 
         # 이미지가 있으면 저장
         saved_image_paths = []
         if has_images:
-            saved_image_paths = save_mms_images(base64_images)
+            saved_image_paths = save_mms_images(images)
 
-        # MMS 발송
+        # MMS 발송 (디코딩된 바이트를 그대로 전달)
         result = await send_mms(
             receiver=data.receiver_phone,
             message=data.message,
             title="[전방홈케어]",
-            image1=data.image1,
-            image2=data.image2,
-            image3=data.image3,
+            image1=images[0] if len(images) > 0 else None,
+            image2=images[1] if len(images) > 1 else None,
+            image3=images[2] if len(images) > 2 else None,
         )
 
         success = result.get("result_code") == "1"
@@ -396,6 +400,7 @@ async def send_manual_mms(
         # SMS 로그 기록 (이미지 경로 포함)
         log = SMSLog(
             receiver_phone=encrypt_value(data.receiver_phone),
+            receiver_phone_hash=generate_search_hash(data.receiver_phone, "phone"),
             message=data.message,
             sms_type=data.sms_type if not has_images else "mms_manual",
             trigger_source="manual",
@@ -429,49 +434,40 @@ async def send_manual_mms(
         )
 
 
-def convert_file_to_base64(file_path: str, upload_dir: str) -> Optional[str]:
+def resolve_upload_path(file_path: str, upload_dir: str) -> Optional[str]:
     """
-    저장된 파일을 Base64로 변환
+    저장된 파일의 실제 경로 조회
 
     Args:
         file_path: 파일 상대 경로 (예: /uploads/work_photos/...)
         upload_dir: 업로드 디렉토리 기본 경로
 
     Returns:
-        Base64 인코딩된 이미지 (data:image/...;base64,...) 또는 None
+        파일 전체 경로 또는 None (파일 없음)
     """
     import os
-    import mimetypes
-
-    try:
-        # 상대 경로에서 전체 경로 생성
-        if file_path.startswith("/uploads/"):
-            # /uploads/ 제거하고 upload_dir와 결합
-            relative_path = file_path[len("/uploads/"):]
-            full_path = os.path.join(upload_dir, relative_path)
-        else:
-            full_path = os.path.join(upload_dir, file_path)
 
-        if not os.path.exists(full_path):
-            logger.warning(f"File not found: {full_path}")
-            return None
-
-        # MIME 타입 결정
-        mime_type, _ = mimetypes.guess_type(full_path)
-        if not mime_type or not mime_type.startswith("image/"):
-            mime_type = "image/jpeg"
-
-        # 파일 읽기 및 Base64 변환
-        with open(full_path, "rb") as f:
-            image_data = f.read()
-
-        base64_data = base64.b64encode(image_data).decode("utf-8")
-        return f"data:{mime_type};base64,{base64_data}"
+    # 상대 경로에서 전체 경로 생성
+    if file_path.startswith("/uploads/"):
+        # /uploads/ 제거하고 upload_dir와 결합
+        relative_path = file_path[len("/uploads/"):]
+        full_path = os.path.join(upload_dir, relative_path)
+    else:
+        full_path = os.path.join(upload_dir, file_path)
+
+    # 업로드 디렉토리 외부 접근 차단
+    base_dir = os.path.realpath(upload_dir)
+    full_path = os.path.realpath(full_path)
+    if os.path.commonpath([base_dir, full_path]) != base_dir:
+        logger.warning(f"File outside upload dir: {file_path}")
+        return None
 
-    except Exception as e:
-        logger.error(f"Failed to convert file to base64: {file_path}, error: {e}")
+    if not os.path.isfile(full_path):
+        logger.warning(f"File not found: {full_path}")
         return None
 
+    return full_path
+
 
 @router.post("/send-work-photos-mms", response_model=SMSSendResponse)
 async def send_work_photos_mms(
@@ -502,14 +498,14 @@ async def send_work_photos_mms(
                 message="배정 정보를 찾을 수 없습니다",
             )
 
-        # 선택된 사진들을 Base64로 변환
-        base64_images = []
+        # 선택된 사진 파일 경로 확인 (파일 내용은 send_mms에서 스트리밍)
+        photo_files = []
         for photo_path in data.selected_photos[:3]:  # 최대 3장
-            base64_img = convert_file_to_base64(photo_path, settings.UPLOAD_DIR)
-            if base64_img:
-                base64_images.append(base64_img)
+            full_path = resolve_upload_path(photo_path, settings.UPLOAD_DIR)
+            if full_path:
+                photo_files.append(Path(full_path))
 
-        if len(base64_images) == 0:
+        if len(photo_files) == 0:
             return SMSSendResponse(
                 success=False,
                 message="선택한 사진을 찾을 수 없습니다",
@@ -520,9 +516,9 @@ async def send_work_photos_mms(
             receiver=data.receiver_phone,
             message=data.message,
             title="[전방홈케어]",
-            image1=base64_images[0] if len(base64_images) > 0 else None,
-            image2=base64_images[1] if len(base64_images) > 1 else None,
-            image3=base64_images[2] if len(base64_images) > 2 else None,
+            image1=photo_files[0] if len(photo_files) > 0 else None,
+            image2=photo_files[1] if len(photo_files) > 1 else None,
+            image3=photo_files[2] if len(photo_files) > 2 else None,
         )
 
         success = result.get("result_code") == "1"
@@ -530,6 +526,7 @@ async def send_work_photos_mms(
         # SMS 로그 기록
         log = SMSLog(
             receiver_phone=encrypt_value(data.receiver_phone),
+            receiver_phone_hash=generate_search_hash(data.receiver_phone, "phone"),
             message=data.message,
             sms_type=data.sms_type,
             trigger_source="manual",
@@ -549,7 +546,7 @@ async def send_work_photos_mms(
         if success:
             return SMSSendResponse(
                 success=True,
-                message=f"MMS가 발송되었습니다 ({len(base64_images)}장 첨부)",
+                message=f"MMS가 발송되었습니다 ({len(photo_files)}장 첨부)",
                 sms_log_id=log.id,
             )
         else:
@@ -637,6 +634,8 @@ async def get_sms_recipients(
     search: Optional[str] = Query(None, description="검색어"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(50, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor, 지정 시 page 무시)"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
@@ -652,19 +651,35 @@ async def get_sms_recipients(
 
     recipients = []
     total = 0
+    total_estimated = False
+    next_cursor = None
 
     if target_type == "customer":
-        query = select(Application)
+        # 수신자 표시에 필요한 컬럼만 조회
+        query = select(
+            Application.id,
+            Application.application_number,
+            Application.customer_name,
+            Application.customer_phone,
+            Application.status,
+            Application.created_at,
+        )
         if status:
             query = query.where(Application.status == status)
 
-        count_result = await db.execute(select(func.count()).select_from(query.subquery()))
-        total = count_result.scalar() or 0
-
         # 페이징
-        query = query.order_by(desc(Application.created_at)).offset((page - 1) * page_size).limit(page_size)
-        result = await db.execute(query)
-        applications = result.scalars().all()
+        result = await db.execute(paginate(query, Application.created_at, Application.id, page, page_size, cursor))
+        applications, next_cursor = split_page(result.all(), page_size)
+
+        # 전체 개수 (검색어는 복호화 후 적용하므로 상태 필터 기준, 목록 개수 캐시 공유)
+        total, total_estimated = await count_list(
+            db,
+            query,
+            "applications",
+            {"status": status},
+            count,
+            total=known_total(page, page_size, len(applications), next_cursor is not None, cursor),
+        )
 
         for app in applications:
             try:
@@ -689,17 +704,30 @@ async def get_sms_recipients(
                 continue
 
     elif target_type == "partner":
-        query = select(Partner)
+        query = select(
+            Partner.id,
+            Partner.company_name,
+            Partner.representative_name,
+            Partner.contact_phone,
+            Partner.status,
+            Partner.created_at,
+        )
         if status:
             query = query.where(Partner.status == status)
 
-        count_result = await db.execute(select(func.count()).select_from(query.subquery()))
-        total = count_result.scalar() or 0
-
         # 페이징
-        query = query.order_by(desc(Partner.created_at)).offset((page - 1) * page_size).limit(page_size)
-        result = await db.execute(query)
-        partners = result.scalars().all()
+        result = await db.execute(paginate(query, Partner.created_at, Partner.id, page, page_size, cursor))
+        partners, next_cursor = split_page(result.all(), page_size)
+
+        # 전체 개수 (검색어는 복호화 후 적용하므로 상태 필터 기준, 목록 개수 캐시 공유)
+        total, total_estimated = await count_list(
+            db,
+            query,
+            "partners",
+            {"status": status},
+            count,
+            total=known_total(page, page_size, len(partners), next_cursor is not None, cursor),
+        )
 
         for partner in partners:
             try:
@@ -732,6 +760,8 @@ async def get_sms_recipients(
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
 
 
@@ -767,7 +797,7 @@ async def create_bulk_sms_job(
     await db.refresh(job)
 
     # 백그라운드에서 실행
-    background_tasks.add_task(execute_bulk_sms_job, db, job.id)
+    background_tasks.add_task(execute_bulk_sms_job, job.id)
 
     return BulkSMSJobResponse(
         job_id=job.id,
@@ -822,11 +852,53 @@ async def get_bulk_sms_job(
     )
 
 
+@router.get("/bulk/{job_id}/events")
+async def stream_bulk_sms_job_events(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    current_admin: Admin = Depends(get_current_admin),
+):
+    """
+    복수 SMS 발송 Job 진행 상황 스트림 (Server-Sent Events)
+
+    - 연결 직후 현재 상태(snapshot/started/batch), 이후 변경 시마다 최신 상태 전송
+    - event: started | batch | waiting (게이트웨이 장애 대기) | finished
+    - data: status, sent_count, failed_count, progress, current_batch, total_batches,
+      sent_delta, failed_delta (직전 전송 대비 증가분)
+    - finished 이벤트 후 스트림 종료 (실패 수신자 목록은 GET /bulk/{job_id}로 1회 조회)
+    - 인증 헤더가 필요하므로 EventSource 대신 fetch 스트림으로 구독
+    """
+    result = await db.execute(select(BulkSMSJob.id).where(BulkSMSJob.id == job_id))
+    if result.scalar_one_or_none() is None:
+        raise HTTPException(status_code=404, detail="Job을 찾을 수 없습니다")
+
+    # 스트림이 열려 있는 동안 DB 연결을 점유하지 않도록 세션 반환
+    await db.close()
+
+    async def event_stream():
+        async for state in stream_bulk_sms_progress(job_id):
+            if state is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: {state['event']}\ndata: {json.dumps(state, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 프록시 버퍼링 비활성화
+        },
+    )
+
+
 @router.get("/bulk", response_model=BulkSMSJobListResponse)
 async def get_bulk_sms_jobs(
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (next_cursor, 지정 시 page 무시)"),
     status: Optional[str] = Query(None, description="상태 필터"),
+    count: str = Query("estimate", regex=COUNT_QUERY_PATTERN, description=COUNT_QUERY_DESCRIPTION),
     db: AsyncSession = Depends(get_db),
     current_admin: Admin = Depends(get_current_admin),
 ):
@@ -838,12 +910,17 @@ async def get_bulk_sms_jobs(
     if status:
         query = query.where(BulkSMSJob.status == status)
 
-    count_result = await db.execute(select(func.count()).select_from(query.subquery()))
-    total = count_result.scalar() or 0
+    result = await db.execute(paginate(query, BulkSMSJob.created_at, BulkSMSJob.id, page, page_size, cursor))
+    jobs, next_cursor = split_page(result.scalars().all(), page_size)
 
-    query = query.order_by(desc(BulkSMSJob.created_at)).offset((page - 1) * page_size).limit(page_size)
-    result = await db.execute(query)
-    jobs = result.scalars().all()
+    total, total_estimated = await count_list(
+        db,
+        query,
+        "bulk_sms_jobs",
+        {"status": status},
+        count,
+        total=known_total(page, page_size, len(jobs), next_cursor is not None, cursor),
+    )
 
     items = []
     for job in jobs:
@@ -882,4 +959,6 @@ async def get_bulk_sms_jobs(
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
+        total_estimated=total_estimated,
     )
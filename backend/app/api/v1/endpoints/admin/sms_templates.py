@@ -21,6 +21,7 @@ from app.schemas.sms_template import (
     SMSTemplatePreviewRequest,
     SMSTemplatePreviewResponse,
 )
+from app.services.sms_template_cache import invalidate_sms_template_cache
 
 router = APIRouter(prefix="/sms-templates", tags=["Admin - SMS Templates"])
 
@@ -156,6 +157,7 @@ async def create_sms_template(
     db.add(template)
     await db.commit()
     await db.refresh(template)
+    invalidate_sms_template_cache()
 
     return template_to_response(template)
 
@@ -198,6 +200,7 @@ async def update_sms_template(
 
     await db.commit()
     await db.refresh(template)
+    invalidate_sms_template_cache()
 
     return template_to_response(template)
 
@@ -224,6 +227,7 @@ async def delete_sms_template(
 
     await db.delete(template)
     await db.commit()
+    invalidate_sms_template_cache()
 
     return {"message": "템플릿이 삭제되었습니다"}
 
@@ -4,7 +4,6 @@ Application API endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, BackgroundTasks
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
 from datetime import date
@@ -15,7 +14,6 @@ from app.core.database import get_db
 from app.core.encryption import encrypt_value, generate_search_hash
 from app.core.config import settings
 from app.models.application import Application, generate_application_number
-from app.models.service import ServiceType
 from app.schemas.application import (
     ApplicationCreate,
     ApplicationCreateResponse,
@@ -26,6 +24,8 @@ from app.services.file_upload import process_uploaded_files
 from app.services.background import run_async_in_background
 from app.services.search_index import update_application_search_index
 from app.services.duplicate_check import check_application_duplicate
+from app.services.region_code import derive_region_codes
+from app.services.reference_data import get_reference_data
 
 logger = logging.getLogger(__name__)
 
@@ -107,12 +107,10 @@ async def create_application(
 
     # 준비 중인 서비스 포함 여부 확인
     if services_list:
-        result = await db.execute(
-            select(ServiceType).where(ServiceType.code.in_(services_list))
-        )
-        selected_instances = result.scalars().all()
-        for instance in selected_instances:
-            if instance.booking_status == 'PREPARING':
+        reference = await get_reference_data(db)
+        for code in services_list:
+            instance = reference.service_types_by_code.get(code)
+            if instance is not None and instance.booking_status == 'PREPARING':
                 raise HTTPException(
                     status_code=400,
                     detail=f"서비스 '{instance.name}'(은)는 현재 준비 중이므로 선택할 수 없습니다."
@@ -146,6 +144,9 @@ async def create_application(
     # 전화번호 해시 생성 (중복 감지용)
     phone_hash = generate_search_hash(data.customer_phone, "phone")
 
+    # 지역 코드 도출 (주소는 암호화되므로 평문 코드로 지역 필터 지원)
+    province_code, district_code = await derive_region_codes(db, data.address)
+
     # 신청 데이터 생성 (민감정보 암호화)
     new_application = Application(
         application_number=application_number,
@@ -154,6 +155,8 @@ async def create_application(
         phone_hash=phone_hash,
         address=encrypt_value(data.address),
         address_detail=encrypt_value(data.address_detail) if data.address_detail else None,
+        province_code=province_code,
+        district_code=district_code,
         selected_services=data.selected_services,
         description=data.description,
         preferred_consultation_date=data.preferred_consultation_date,
@@ -226,12 +229,10 @@ async def create_application_simple(
     """
     # 준비 중인 서비스 포함 여부 확인
     if data.selected_services:
-        result = await db.execute(
-            select(ServiceType).where(ServiceType.code.in_(data.selected_services))
-        )
-        selected_instances = result.scalars().all()
-        for instance in selected_instances:
-            if instance.booking_status == 'PREPARING':
+        reference = await get_reference_data(db)
+        for code in data.selected_services:
+            instance = reference.service_types_by_code.get(code)
+            if instance is not None and instance.booking_status == 'PREPARING':
                 raise HTTPException(
                     status_code=400,
                     detail=f"서비스 '{instance.name}'(은)는 현재 준비 중이므로 선택할 수 없습니다."
@@ -258,6 +259,9 @@ async def create_application_simple(
     # 전화번호 해시 생성 (중복 감지용)
     phone_hash = generate_search_hash(data.customer_phone, "phone")
 
+    # 지역 코드 도출 (주소는 암호화되므로 평문 코드로 지역 필터 지원)
+    province_code, district_code = await derive_region_codes(db, data.address)
+
     # 신청 데이터 생성 (민감정보 암호화)
     new_application = Application(
         application_number=application_number,
@@ -266,6 +270,8 @@ async def create_application_simple(
         phone_hash=phone_hash,
         address=encrypt_value(data.address),
         address_detail=encrypt_value(data.address_detail) if data.address_detail else None,
+        province_code=province_code,
+        district_code=district_code,
         selected_services=data.selected_services,
         description=data.description,
         preferred_consultation_date=data.preferred_consultation_date,
@@ -0,0 +1,29 @@
+"""
+Catalog API endpoints
+공개 API - 인증 불필요
+
+공개 사이트 초기 데이터(서비스 + 지역)를 단일 요청으로 제공 (ETag 캐시)
+"""
+
+from fastapi import APIRouter, Request
+
+from app.schemas.catalog import CatalogBootstrapResponse
+from app.services.catalog_cache import catalog_response, render_bootstrap
+from app.services.reference_data import get_reference_data
+
+router = APIRouter(prefix="/catalog", tags=["catalog"])
+
+
+@router.get("/bootstrap", response_model=CatalogBootstrapResponse)
+async def get_catalog_bootstrap(request: Request):
+    """
+    공개 사이트 초기 데이터 조회
+
+    - services: GET /services 와 동일 (비활성 서비스 포함)
+    - regions: GET /regions/all 과 동일
+
+    Returns:
+        CatalogBootstrapResponse
+    """
+    reference = await get_reference_data()
+    return catalog_response(request, reference, ("bootstrap",), render_bootstrap)
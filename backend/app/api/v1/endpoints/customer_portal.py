@@ -435,14 +435,14 @@ async def view_assignment(
         assignment_id=assignment.id,
         assignment_status=assignment.status,
         status_label=STATUS_LABELS.get(assignment.status, assignment.status),
-        assigned_services=convert_service_codes_to_names(db, assignment.assigned_services),
+        assigned_services=await convert_service_codes_to_names(db, assignment.assigned_services),
         scheduled_date=str(assignment.scheduled_date) if assignment.scheduled_date else None,
         scheduled_time=assignment.scheduled_time,
         # 신청 정보 (마스킹)
         application_number=application.application_number,
         customer_name_masked=customer_name_masked,
         address_partial=address_partial,
-        selected_services=convert_service_codes_to_names(db, application.selected_services),
+        selected_services=await convert_service_codes_to_names(db, application.selected_services),
         description=application.description,
         # 협력사 정보 (마스킹)
         partner_company=partner_company,
@@ -243,7 +243,7 @@ async def view_assignment(
         # 배정 정보
         assignment_id=assignment.id,
         assignment_status=assignment.status,
-        assigned_services=convert_service_codes_to_names(db, assignment.assigned_services),
+        assigned_services=await convert_service_codes_to_names(db, assignment.assigned_services),
         scheduled_date=str(assignment.scheduled_date) if assignment.scheduled_date else None,
         scheduled_time=assignment.scheduled_time,
         estimated_cost=assignment.estimated_cost,
@@ -253,7 +253,7 @@ async def view_assignment(
         application_number=application.application_number,
         customer_name_masked=customer_name_masked,
         address_partial=address_partial,
-        selected_services=convert_service_codes_to_names(db, application.selected_services),
+        selected_services=await convert_service_codes_to_names(db, application.selected_services),
         description=application.description or "",
         preferred_consultation_date=(
             str(application.preferred_consultation_date)
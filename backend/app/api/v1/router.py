@@ -5,8 +5,8 @@ API v1 Router
 
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import regions, applications, partners, services, files, partner_portal, customer_portal
-from app.api.v1.endpoints.admin import auth, admins, dashboard, applications as admin_applications, partners as admin_partners, sms as admin_sms, sms_templates as admin_sms_templates, audit_logs as admin_audit_logs, schedule as admin_schedule, settings as admin_settings, quotes as admin_quotes
+from app.api.v1.endpoints import regions, applications, partners, services, catalog, files, partner_portal, customer_portal
+from app.api.v1.endpoints.admin import auth, admins, dashboard, applications as admin_applications, partners as admin_partners, sms as admin_sms, sms_templates as admin_sms_templates, audit_logs as admin_audit_logs, schedule as admin_schedule, settings as admin_settings, quotes as admin_quotes, analytics as admin_analytics
 
 api_router = APIRouter()
 
@@ -15,6 +15,7 @@ api_router.include_router(regions.router)
 api_router.include_router(applications.router)
 api_router.include_router(partners.router)
 api_router.include_router(services.router)
+api_router.include_router(catalog.router)  # 공개 사이트 초기 데이터 (서비스 + 지역)
 api_router.include_router(files.router)  # 토큰 기반 파일 서빙
 api_router.include_router(partner_portal.router)  # 협력사 포털 (배정 열람)
 api_router.include_router(customer_portal.router)  # 고객 포털 (시공 정보 열람)
@@ -31,3 +32,4 @@ api_router.include_router(admin_audit_logs.router, prefix="/admin")
 api_router.include_router(admin_schedule.router, prefix="/admin")
 api_router.include_router(admin_settings.router, prefix="/admin")
 api_router.include_router(admin_quotes.router, prefix="/admin")  # 견적 항목 관리
+api_router.include_router(admin_analytics.router, prefix="/admin")  # 신청 분석 (일별 롤업)
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -30,6 +30,21 @@ class Settings(BaseSettings):
     ALIGO_API_KEY: str = ""
     ALIGO_USER_ID: str = ""
     ALIGO_SENDER: str = ""
+    # 알리고 API 주소 (부하 테스트 시 로컬 시뮬레이터: http://127.0.0.1:8090)
+    ALIGO_API_BASE_URL: str = "https://apis.aligo.in"
+
+    # SMS 템플릿 캐시 (다른 워커의 템플릿 변경 확인 주기, 초)
+    SMS_TEMPLATE_CACHE_TTL: int = 5
+
+    # 기준 데이터 캐시 (서비스/지역, 다른 워커·스크립트의 변경 확인 주기, 초)
+    REFERENCE_DATA_CACHE_TTL: int = 30
+
+    # 알림 SMS 묶음 발송 대기 시간 (템플릿 키=초, 쉼표 구분, 0 또는 미지정: 즉시 발송)
+    # 대기 시간 안에 같은 수신자에게 같은 계열 알림이 여러 건 생기면 1건으로 묶어 발송
+    NOTIFICATION_COALESCE_WINDOWS: str = (
+        "partner_notify_assignment=60,partner_schedule_notify=60,"
+        "partner_assigned=30,assignment_changed=30,schedule_confirmed=30,schedule_changed=30"
+    )
 
     # File Upload
     # 파일 저장 경로 (웹 루트 외부에 격리)
@@ -49,6 +64,11 @@ class Settings(BaseSettings):
     LOG_RETENTION_DAYS: int = 90      # 로그 파일 보관 일수
     LOG_DIR: str = "/data/logs"       # 로그 파일 저장 경로
 
+    # 로그 테이블 월 단위 파티션 (sms_logs, audit_logs)
+    LOG_PARTITION_PREMAKE_MONTHS: int = 3    # 미리 생성해 둘 향후 파티션 수 (이번 달 제외)
+    LOG_PARTITION_RETENTION_MONTHS: int = 0  # DB 보관 개월 수 (초과 파티션은 분리 후 아카이브, 0: 무기한)
+    LOG_ARCHIVE_DIR: str = "/data/archive"   # 분리된 파티션 아카이브 경로 (NDJSON.gz)
+
     # Frontend URL (for partner portal links)
     FRONTEND_URL: str = "http://localhost:3500"
     BASE_PATH: str = ""  # 운영 환경에서 /homecare
@@ -60,6 +80,15 @@ class Settings(BaseSettings):
     def cors_origins_list(self) -> List[str]:
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def notification_coalesce_windows(self) -> Dict[str, int]:
+        windows = {}
+        for item in self.NOTIFICATION_COALESCE_WINDOWS.split(","):
+            key, _, seconds = item.partition("=")
+            if key.strip() and seconds.strip().isdigit():
+                windows[key.strip()] = int(seconds.strip())
+        return windows
+
     class Config:
         env_file = ".env"
         case_sensitive = True
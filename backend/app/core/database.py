@@ -18,7 +18,7 @@ engine = create_engine(
     echo=settings.DEBUG,
 )
 
-# 동기 세션 팩토리 (레거시 코드용 - deprecated)
+# 동기 세션 팩토리 (스크립트용 - 요청 처리 경로에서는 사용하지 않음, deprecated)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -0,0 +1,95 @@
+"""
+목록 페이지네이션 유틸리티
+관리자 목록 공통 정렬(created_at DESC, id DESC) 및 커서(keyset) 페이지네이션
+
+- 페이지 번호 모드: OFFSET 기반 (앞쪽 페이지 이동용)
+- 커서 모드: 마지막 항목의 (created_at, id) 이후만 조회
+  → 깊은 페이지도 인덱스 (..., created_at, id) 범위 스캔으로 일정한 속도
+  → 조회 중 새 항목이 추가되어도 항목이 밀리거나 중복되지 않음
+
+커서는 "{created_at ISO}|{id}"를 base64url 인코딩한 불투명 문자열이다.
+응답의 next_cursor를 다음 요청의 cursor로 그대로 전달하며, 페이지 번호 모드 응답에도
+next_cursor가 포함되므로 앞쪽 페이지에서 커서 모드로 이어서 조회할 수 있다.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import Select, desc, tuple_
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id)를 커서 문자열로 인코딩"""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    커서 문자열 디코딩
+
+    Raises:
+        HTTPException: 형식이 잘못된 커서 (400)
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError, binascii.Error):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
+
+
+def paginate(
+    stmt: Select,
+    created_col: Any,
+    id_col: Any,
+    page: int,
+    page_size: int,
+    cursor: Optional[str] = None,
+) -> Select:
+    """
+    목록 쿼리에 정렬 및 페이지 조건 적용
+
+    다음 페이지 존재 여부 확인을 위해 page_size + 1건을 조회한다 (split_page로 분리).
+
+    Args:
+        stmt: 필터가 적용된 목록 쿼리
+        created_col: 정렬 기준 생성일 컬럼
+        id_col: 동일 생성일 내 정렬 기준 ID 컬럼
+        page: 페이지 번호 (cursor가 있으면 무시)
+        page_size: 페이지 크기
+        cursor: 이전 응답의 next_cursor
+
+    Returns:
+        정렬/페이지 조건이 적용된 쿼리
+    """
+    stmt = stmt.order_by(desc(created_col), desc(id_col))
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        stmt = stmt.where(tuple_(created_col, id_col) < tuple_(created_at, row_id))
+    else:
+        stmt = stmt.offset((page - 1) * page_size)
+    return stmt.limit(page_size + 1)
+
+
+def split_page(rows: Sequence, page_size: int) -> tuple[list, Optional[str]]:
+    """
+    paginate 조회 결과를 현재 페이지 항목과 다음 페이지 커서로 분리
+
+    Args:
+        rows: paginate로 조회한 결과 (created_at, id 속성 필요)
+        page_size: 페이지 크기
+
+    Returns:
+        (현재 페이지 항목, 다음 페이지 커서 - 마지막 페이지면 None)
+    """
+    items = list(rows[:page_size])
+    if len(rows) <= page_size or not items:
+        return items, None
+    last = items[-1]
+    if last.created_at is None:
+        return items, None
+    return items, encode_cursor(last.created_at, last.id)
@@ -2,16 +2,20 @@
 전방홈케어 API - FastAPI Application
 """
 
+import asyncio
+import logging
 import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.core.database import async_engine, engine, Base, AsyncSessionLocal
+from app.core.database import async_engine, Base, AsyncSessionLocal
 from app.core.logging_config import setup_logging
 from app.api.v1.router import api_router
 from app.middleware import LoggingMiddleware
+from app.services.sms_circuit import sms_circuit_breaker
+from app.services.sms_coalesce import notification_coalescer
 
 
 @asynccontextmanager
@@ -27,19 +31,64 @@ async def lifespan(app: FastAPI):
         async with async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
+    # 로그 테이블(sms_logs, audit_logs) 이번 달 및 향후 파티션 생성 (INSERT 대상 파티션 보장)
+    from app.services.log_partition import run_partition_maintenance, partition_maintenance_loop
+    try:
+        await run_partition_maintenance(archive=False)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Failed to ensure log partitions: {e}")
+
     # 업로드 디렉토리 생성
     os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
 
     # 로그 디렉토리 생성
     os.makedirs(settings.LOG_DIR, exist_ok=True)
 
-    # 서비스 코드 캐시 초기화 (SMS 발송 시 사용)
-    from app.services.sms import load_service_cache_async
+    # 기준 데이터 캐시(서비스/지역) / SMS 템플릿 캐시 초기화
+    from app.services.reference_data import load_reference_data_async
+    from app.services.sms_template_cache import load_sms_template_cache_async
     async with AsyncSessionLocal() as db:
-        await load_service_cache_async(db)
+        await load_reference_data_async(db)
+        await load_sms_template_cache_async(db)
+
+    # 대시보드 카운터 재집계 (배포 중 누락된 증감 보정)
+    from app.services.dashboard_counters import reconcile_dashboard_counters, dashboard_counter_loop
+    try:
+        await reconcile_dashboard_counters()
+    except Exception as e:
+        logging.getLogger(__name__).error(f"Failed to reconcile dashboard counters: {e}")
+
+    # 중단된 대량 SMS Job 주기 재개 (서버 재시작/배포로 끊긴 Job을 heartbeat 만료 후 미발송 수신자부터 이어서 발송)
+    from app.services.bulk_sms import bulk_sms_supervisor_loop
+    bulk_sms_supervisor = asyncio.create_task(bulk_sms_supervisor_loop())
+
+    # 로그 파티션 주기 유지보수 (향후 파티션 생성, 보관 기간 초과 파티션 아카이브)
+    partition_maintenance = asyncio.create_task(partition_maintenance_loop())
+
+    # SMS 게이트웨이 회로 차단 중 보류된 발송 재발송
+    from app.services.sms import deferred_sms_loop
+    deferred_sms_worker = asyncio.create_task(deferred_sms_loop())
+
+    # 대시보드 카운터 주기 재집계
+    dashboard_counter_reconciler = asyncio.create_task(dashboard_counter_loop())
+
+    # 신청 분석 일별 롤업 주기 갱신
+    from app.services.analytics_rollup import analytics_rollup_loop
+    analytics_rollup = asyncio.create_task(analytics_rollup_loop())
 
     yield
 
+    partition_maintenance.cancel()
+    dashboard_counter_reconciler.cancel()
+    analytics_rollup.cancel()
+
+    # Shutdown: 묶음 대기 중인 알림 발송 (보류 시 대기열 저장을 위해 재발송 작업보다 먼저)
+    await notification_coalescer.flush_all()
+    deferred_sms_worker.cancel()
+
+    # Shutdown: 재개 작업 중단 (발송 중이던 수신자는 다음 기동 시 정리됨)
+    bulk_sms_supervisor.cancel()
+
     # Shutdown: 비동기 엔진 정리
     await async_engine.dispose()
 
@@ -70,7 +119,13 @@ app.add_middleware(LoggingMiddleware)
 @app.get("/health")
 async def health_check():
     """Health check endpoint for Docker/k8s"""
-    return {"status": "healthy", "version": settings.APP_VERSION}
+    # SMS 게이트웨이 차단은 앱 자체 장애가 아니므로 status에는 반영하지 않음
+    return {
+        "status": "healthy",
+        "version": settings.APP_VERSION,
+        "sms_gateway": sms_circuit_breaker.snapshot(),
+        "sms_coalescing": notification_coalescer.snapshot(),
+    }
 
 
 # API v1 라우터 등록
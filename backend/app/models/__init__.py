@@ -8,11 +8,15 @@ from app.models.partner_note import PartnerNote
 from app.models.service import ServiceCategory, ServiceType
 from app.models.admin import Admin
 from app.models.sms_log import SMSLog
+from app.models.sms_daily_stat import SMSDailyStat
 from app.models.bulk_sms_job import BulkSMSJob
+from app.models.bulk_sms_recipient import BulkSMSRecipient
 from app.models.sms_template import SMSTemplate
 from app.models.audit_log import AuditLog
 from app.models.search_index import SearchIndex
 from app.models.quote_item import QuoteItem
+from app.models.dashboard_counter import DashboardCounter
+from app.models.application_daily_stat import ApplicationDailyStat, ApplicationDailyLeadTime
 
 __all__ = [
     "Province",
@@ -27,9 +31,14 @@ __all__ = [
     "ServiceType",
     "Admin",
     "SMSLog",
+    "SMSDailyStat",
     "BulkSMSJob",
+    "BulkSMSRecipient",
     "SMSTemplate",
     "AuditLog",
     "SearchIndex",
     "QuoteItem",
+    "DashboardCounter",
+    "ApplicationDailyStat",
+    "ApplicationDailyLeadTime",
 ]
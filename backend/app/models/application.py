@@ -8,7 +8,7 @@ No FK constraints - relationships managed at application level
 상태: new → consulting → assigned → scheduled → completed / cancelled
 """
 
-from sqlalchemy import Column, BigInteger, String, Text, Boolean, DateTime, Date, Integer
+from sqlalchemy import Column, BigInteger, String, Text, Boolean, DateTime, Date, Integer, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from datetime import date
@@ -38,6 +38,10 @@ class Application(Base):
     address = Column(String(1000), nullable=False)  # 암호화된 값
     address_detail = Column(String(500), nullable=True)  # 암호화된 값
 
+    # 지역 코드 (평문, 접수 시 주소에서 도출 - 지역 필터용)
+    province_code = Column(String(2), nullable=True, index=True)  # Province.code
+    district_code = Column(String(5), nullable=True, index=True)  # District.code
+
     # 서비스 정보
     selected_services = Column(JSONB, nullable=False, default=list)  # ["제초", "잔디관리"]
     description = Column(Text, nullable=False)  # 상세 요청 내용
@@ -82,6 +86,27 @@ class Application(Base):
     completed_at = Column(DateTime(timezone=True), nullable=True)
     cancelled_at = Column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        # 최신순 목록 (cursor 페이지네이션)
+        Index('idx_applications_created_id', 'created_at', 'id'),
+        # 상태 필터 + 최신순 목록
+        Index('idx_applications_status_created_id', 'status', 'created_at', 'id'),
+        # 배정 협력사 / 담당 관리자 필터 + 최신순 목록
+        Index('idx_applications_partner_created_id', 'assigned_partner_id', 'created_at', 'id'),
+        Index('idx_applications_admin_created_id', 'assigned_admin_id', 'created_at', 'id'),
+        # 월간 일정 통계 (GROUP BY scheduled_date, status)
+        Index('idx_applications_scheduled_status', 'scheduled_date', 'status'),
+        # 분석 증분 롤업 (마지막 롤업 이후 변경분)
+        Index('idx_applications_updated_at', 'updated_at'),
+        # 서비스 필터 (selected_services @> '["코드"]')
+        Index(
+            'idx_applications_selected_services',
+            'selected_services',
+            postgresql_using='gin',
+            postgresql_ops={'selected_services': 'jsonb_path_ops'},
+        ),
+    )
+
     def __repr__(self):
         return f"<Application {self.application_number}: {self.status}>"
 
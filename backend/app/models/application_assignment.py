@@ -11,7 +11,7 @@ No FK constraints - relationships managed at application level
 - 배정별 상태 추적 가능
 """
 
-from sqlalchemy import Column, BigInteger, String, Text, DateTime, Date, Integer
+from sqlalchemy import Column, BigInteger, String, Text, DateTime, Date, Integer, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
@@ -88,5 +88,13 @@ class ApplicationPartnerAssignment(Base):
     customer_token_expires_at = Column(DateTime(timezone=True), nullable=True)  # 토큰 만료 시간
     customer_token_invalidated_before = Column(DateTime(timezone=True), nullable=True)  # 무효화 시점
 
+    __table_args__ = (
+        # 월간 일정 통계 (GROUP BY scheduled_date, status)
+        Index('idx_assignments_scheduled_status', 'scheduled_date', 'status'),
+        # 분석 롤업 (배정일 범위 / 마지막 롤업 이후 변경분)
+        Index('idx_assignments_assigned_at', 'assigned_at'),
+        Index('idx_assignments_updated_at', 'updated_at'),
+    )
+
     def __repr__(self):
         return f"<ApplicationPartnerAssignment app={self.application_id} partner={self.partner_id} status={self.status}>"
@@ -0,0 +1,84 @@
+"""
+Application Daily Stats models
+신청 일별 분석 통계 (롤업)
+
+PK: BIGSERIAL as per CLAUDE.md
+
+분석 조회(/admin/analytics)는 applications / application_partner_assignments 대신
+이 테이블들을 읽으므로 조회 기간과 원본 건수에 관계없이 일정한 비용으로 처리된다.
+analytics_rollup 서비스가 변경된 일자만 주기적으로 다시 집계한다 (일자는 UTC 기준, sms_daily_stats와 동일).
+
+집계 차원:
+- service_code: 신청 서비스 코드 (신청 1건이 서비스 수만큼 집계됨),
+  ALL_SERVICES("*")는 서비스 구분 없는 신청 단위 합계
+- province_code: 시/도 코드 (지역 미확인: "")
+"""
+
+from sqlalchemy import Column, BigInteger, String, Date, DateTime, Index
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+# 서비스 구분 없는 신청 단위 합계 행의 service_code
+ALL_SERVICES = "*"
+
+
+class ApplicationDailyStat(Base):
+    """신청 일별 코호트 통계 (신청일 기준, 현재 상태별 건수)"""
+
+    __tablename__ = "application_daily_stats"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    # 집계 키
+    day = Column(Date, nullable=False)  # 신청일 (UTC)
+    service_code = Column(String(30), nullable=False)  # 서비스 코드 또는 ALL_SERVICES
+    province_code = Column(String(2), nullable=False)  # 시/도 코드 (미확인: "")
+    status = Column(String(20), nullable=False)  # 현재 신청 상태
+
+    # 건수
+    count = Column(BigInteger, nullable=False, default=0)
+
+    # 타임스탬프
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index('uq_application_daily_stats_key', 'day', 'service_code', 'province_code', 'status', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<ApplicationDailyStat {self.day} {self.service_code}/{self.province_code}/{self.status}: {self.count}>"
+
+
+class ApplicationDailyLeadTime(Base):
+    """신청 일별 처리 통계 (이벤트 발생일 기준 건수 + 소요 시간 합계)"""
+
+    __tablename__ = "application_daily_lead_times"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    # 집계 키
+    day = Column(Date, nullable=False)  # 이벤트 발생일 (UTC)
+    service_code = Column(String(30), nullable=False)  # 서비스 코드 또는 ALL_SERVICES
+    province_code = Column(String(2), nullable=False)  # 시/도 코드 (미확인: "")
+
+    # 최초 배정 (신청 → 첫 협력사 배정)
+    assigned_count = Column(BigInteger, nullable=False, default=0)
+    assign_seconds = Column(BigInteger, nullable=False, default=0)
+
+    # 완료 (신청 → 완료)
+    completed_count = Column(BigInteger, nullable=False, default=0)
+    complete_seconds = Column(BigInteger, nullable=False, default=0)
+
+    # 취소
+    cancelled_count = Column(BigInteger, nullable=False, default=0)
+
+    # 타임스탬프
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index('uq_application_daily_lead_times_key', 'day', 'service_code', 'province_code', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<ApplicationDailyLeadTime {self.day} {self.service_code}/{self.province_code}>"
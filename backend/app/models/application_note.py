@@ -6,7 +6,7 @@ PK: BIGSERIAL as per CLAUDE.md
 No FK constraints - relationships managed at application level
 """
 
-from sqlalchemy import Column, BigInteger, String, Text, DateTime
+from sqlalchemy import Column, BigInteger, String, Text, DateTime, Index
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -32,5 +32,10 @@ class ApplicationNote(Base):
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # 신청별 최신순 메모 목록
+        Index('idx_application_notes_app_created_id', 'application_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f"<ApplicationNote {self.id} for Application {self.application_id}>"
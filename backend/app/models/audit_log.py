@@ -3,9 +3,12 @@ Audit Log model
 변경 이력 추적 모델
 
 PK: BIGSERIAL as per CLAUDE.md
+
+created_at 기준 월 단위 RANGE 파티션 테이블 (audit_logs_YYYYMM).
+DB PK는 (id, created_at), ORM 식별자는 id (app.services.log_partition 참고)
 """
 
-from sqlalchemy import Column, BigInteger, String, DateTime
+from sqlalchemy import Column, BigInteger, String, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
@@ -27,7 +30,7 @@ class AuditLog(Base):
     entity_id = Column(BigInteger, nullable=False, index=True)
 
     # 변경 유형
-    # create, update, delete, status_change, assignment, approval 등
+    # create, update, delete, status_change, assignment, approval, export 등
     action = Column(String(50), nullable=False, index=True)
 
     # 변경 전 값 (JSON)
@@ -50,7 +53,16 @@ class AuditLog(Base):
     user_agent = Column(String(500), nullable=True)
 
     # 타임스탬프
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now(), index=True)  # 파티션 키
+
+    __table_args__ = (
+        # 최신순 목록 (cursor 페이지네이션)
+        Index('idx_audit_logs_created_id', 'created_at', 'id'),
+        # 엔티티별 최신순 이력
+        Index('idx_audit_logs_entity_created_id', 'entity_type', 'entity_id', 'created_at', 'id'),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    __mapper_args__ = {"primary_key": [id]}
 
     def __repr__(self):
         return f"<AuditLog {self.id}: {self.entity_type}:{self.entity_id} - {self.action}>"
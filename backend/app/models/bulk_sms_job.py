@@ -6,7 +6,7 @@ PK: BIGSERIAL as per CLAUDE.md
 상태: pending → processing → completed / partial_failed / failed
 """
 
-from sqlalchemy import Column, BigInteger, String, Text, Integer, DateTime
+from sqlalchemy import Column, BigInteger, String, Text, Integer, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
@@ -60,7 +60,13 @@ class BulkSMSJob(Base):
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     started_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)  # 워커 생존 신호 (배치마다 갱신)
     completed_at = Column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        # 최신순 목록 (cursor 페이지네이션)
+        Index('idx_bulk_sms_jobs_created_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f"<BulkSMSJob {self.id}: {self.job_type} - {self.status}>"
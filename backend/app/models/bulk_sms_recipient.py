@@ -0,0 +1,62 @@
+"""
+Bulk SMS Recipient model
+대량 SMS 발송 수신자 체크포인트 모델
+
+PK: BIGSERIAL as per CLAUDE.md
+FK 없음 (애플리케이션 레벨에서 관리)
+
+Job 시작 시 수신자 목록을 한 번만 확정(materialize)하여 저장하고,
+수신자 단위로 발송 상태를 기록한다. 프로세스가 중단되더라도
+재시작 시 pending 상태의 수신자만 이어서 발송할 수 있다.
+
+상태: pending → sending → sent / failed
+"""
+
+from sqlalchemy import Column, BigInteger, String, Integer, DateTime, Index
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class BulkSMSRecipient(Base):
+    """대량 SMS 발송 수신자"""
+
+    __tablename__ = "bulk_sms_recipients"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    # 소속 Job (FK 없음)
+    job_id = Column(BigInteger, nullable=False)  # BulkSMSJob.id
+
+    # 수신자 정보
+    recipient_type = Column(String(20), nullable=False)  # customer, partner
+    recipient_id = Column(BigInteger, nullable=False)  # Application.id / Partner.id
+    phone = Column(String(500), nullable=False)  # 암호화된 전화번호
+    name = Column(String(500), nullable=True)  # 암호화된 이름
+    label = Column(String(200), nullable=True)  # 식별용 (신청번호, 회사명)
+
+    # 발송 상태
+    # pending: 발송 대기
+    # sending: 발송 중 (워커가 점유)
+    # sent: 발송 완료
+    # failed: 발송 실패
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)  # 점유(발송 시도) 횟수
+    batch_index = Column(Integer, nullable=True)  # 처리된 배치 번호
+    sms_log_id = Column(BigInteger, nullable=True)  # SMSLog.id
+    error_message = Column(String(500), nullable=True)
+
+    # 타임스탬프
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    claimed_at = Column(DateTime(timezone=True), nullable=True)  # 워커 점유 시각
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # 미발송 수신자 점유용 (job_id + status, id 순서)
+        Index('idx_bulk_sms_recipients_job_status', 'job_id', 'status', 'id'),
+        # 동일 Job 내 수신자 중복 방지
+        Index('uq_bulk_sms_recipients_job_recipient', 'job_id', 'recipient_id', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<BulkSMSRecipient {self.id}: job={self.job_id} {self.status}>"
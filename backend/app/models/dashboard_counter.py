@@ -0,0 +1,146 @@
+"""
+Dashboard Counter model
+관리자 대시보드 카운터 (증분 집계)
+
+PK: BIGSERIAL as per CLAUDE.md
+
+신청/협력사 생성, 상태 변경, 삭제 시 같은 트랜잭션에서 카운터를 증감한다.
+대시보드는 원본 테이블 집계 대신 이 테이블을 한 번에 읽는다.
+
+카운터 키:
+- {entity}:status:{status}  상태별 건수 (전체 건수 = 상태별 합계)
+- {entity}:created:{YYYY-MM-DD}  생성일(UTC)별 건수 (오늘/이번 주/이번 달 집계용, 최근 DASHBOARD_DAY_WINDOW일만 유지)
+
+ORM 변경은 after_flush 이벤트에서 자동 반영하고, UPDATE 문으로 일괄 변경하는 경로는
+dashboard_counter_upsert로 직접 증감한다. 누락/경합으로 인한 오차는 주기 재집계로 보정한다.
+"""
+
+from collections import Counter
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import Column, BigInteger, String, DateTime, Index, event
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, attributes
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.application import Application
+from app.models.partner import Partner
+
+# 카운터 대상 모델 → 엔티티 이름
+COUNTED_ENTITIES = {
+    Application: "application",
+    Partner: "partner",
+}
+
+# 생성일별 카운터 유지 기간 (이번 달 1일 ~ 오늘을 포함하도록)
+DASHBOARD_DAY_WINDOW = 40
+
+
+class DashboardCounter(Base):
+    """대시보드 카운터"""
+
+    __tablename__ = "dashboard_counters"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    counter_key = Column(String(60), nullable=False)  # application:status:new 등
+    value = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # 증분 집계 UPSERT 키
+        Index('uq_dashboard_counters_key', 'counter_key', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<DashboardCounter {self.counter_key}: {self.value}>"
+
+
+def status_counter_key(entity: str, status: str) -> str:
+    """상태별 카운터 키"""
+    return f"{entity}:status:{status}"
+
+
+def created_counter_key(entity: str, day: date) -> str:
+    """생성일별 카운터 키"""
+    return f"{entity}:created:{day.isoformat()}"
+
+
+def _status(obj) -> str:
+    # status 미지정 신규 객체는 컬럼 기본값 (신청: new, 협력사: pending)
+    return obj.status or type(obj).__table__.c.status.default.arg
+
+
+def _created_day(obj) -> date:
+    # created_at이 지정되지 않은 신규 객체(server_default)는 현재 UTC 날짜
+    created_at: Optional[datetime] = obj.__dict__.get("created_at")
+    if isinstance(created_at, datetime):
+        return created_at.astimezone(timezone.utc).date()
+    return datetime.now(timezone.utc).date()
+
+
+@event.listens_for(Session, "after_flush")
+def _count_dashboard_changes(session: Session, flush_context) -> None:
+    """
+    신청/협력사 INSERT, 상태 변경, DELETE 시 대시보드 카운터 증감 (같은 트랜잭션에서 UPSERT)
+
+    flush 단위로 묶어서 UPSERT 1회로 처리한다.
+    """
+    deltas: Counter = Counter()
+
+    for obj in session.new:
+        entity = COUNTED_ENTITIES.get(type(obj))
+        if entity:
+            deltas[status_counter_key(entity, _status(obj))] += 1
+            deltas[created_counter_key(entity, _created_day(obj))] += 1
+
+    for obj in session.dirty:
+        entity = COUNTED_ENTITIES.get(type(obj))
+        if entity:
+            history = attributes.get_history(obj, "status")
+            if history.added and history.deleted and history.added[0] != history.deleted[0]:
+                deltas[status_counter_key(entity, history.deleted[0])] -= 1
+                deltas[status_counter_key(entity, history.added[0])] += 1
+
+    for obj in session.deleted:
+        entity = COUNTED_ENTITIES.get(type(obj))
+        if entity:
+            history = attributes.get_history(obj, "status")
+            status = history.deleted[0] if history.deleted else _status(obj)
+            deltas[status_counter_key(entity, status)] -= 1
+            deltas[created_counter_key(entity, _created_day(obj))] -= 1
+
+    stmt = dashboard_counter_upsert(deltas)
+    if stmt is not None:
+        session.connection().execute(stmt)
+
+
+def dashboard_counter_upsert(deltas: dict[str, int]):
+    """
+    카운터 증감 UPSERT 문 생성
+
+    Args:
+        deltas: 카운터 키 → 증감 값
+
+    Returns:
+        INSERT ... ON CONFLICT DO UPDATE 문 (증감할 값이 없으면 None)
+    """
+    # 키 순서를 고정하여 동시 트랜잭션 간 교착 방지
+    rows = [
+        {"counter_key": key, "value": delta}
+        for key, delta in sorted(deltas.items())
+        if delta
+    ]
+    if not rows:
+        return None
+
+    table = DashboardCounter.__table__
+    stmt = pg_insert(table).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=["counter_key"],
+        set_={
+            "value": table.c.value + stmt.excluded.value,
+            "updated_at": func.now(),
+        },
+    )
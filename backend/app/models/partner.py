@@ -7,7 +7,7 @@ No FK constraints - relationships managed at application level
 상태: pending → approved / rejected / inactive
 """
 
-from sqlalchemy import Column, BigInteger, String, Text, Boolean, DateTime
+from sqlalchemy import Column, BigInteger, String, Text, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
@@ -76,5 +76,12 @@ class Partner(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    __table_args__ = (
+        # 최신순 목록 (cursor 페이지네이션)
+        Index('idx_partners_created_id', 'created_at', 'id'),
+        # 상태 필터 + 최신순 목록
+        Index('idx_partners_status_created_id', 'status', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f"<Partner {self.company_name}: {self.status}>"
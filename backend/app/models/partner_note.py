@@ -6,7 +6,7 @@ PK: BIGSERIAL as per CLAUDE.md
 No FK constraints - relationships managed at application level
 """
 
-from sqlalchemy import Column, BigInteger, String, Text, DateTime
+from sqlalchemy import Column, BigInteger, String, Text, DateTime, Index
 from sqlalchemy.sql import func
 
 from app.core.database import Base
@@ -39,5 +39,10 @@ class PartnerNote(Base):
     # 타임스탬프
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # 협력사별 최신순 메모 목록
+        Index('idx_partner_notes_partner_created_id', 'partner_id', 'created_at', 'id'),
+    )
+
     def __repr__(self):
         return f"<PartnerNote {self.id} for Partner {self.partner_id}>"
@@ -0,0 +1,105 @@
+"""
+SMS Daily Stats model
+SMS 일별 발송 통계 (롤업)
+
+PK: BIGSERIAL as per CLAUDE.md
+
+sms_logs 기록 시 (일자, 상태, 발송 출처, 유형) 단위로 건수를 증분 집계한다.
+통계 조회는 로그 테이블 대신 이 테이블을 읽으므로 로그 건수와 무관하게 일정한 비용으로 처리된다.
+일자는 sms_logs.created_at의 UTC 기준 날짜.
+"""
+
+from collections import Counter
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, BigInteger, String, Date, DateTime, Index, event, cast
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+from app.models.sms_log import SMSLog
+
+
+class SMSDailyStat(Base):
+    """SMS 일별 발송 통계"""
+
+    __tablename__ = "sms_daily_stats"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+
+    # 집계 키
+    day = Column(Date, nullable=False)  # 발송일 (UTC)
+    status = Column(String(20), nullable=False)  # sent, failed, pending
+    trigger_source = Column(String(20), nullable=False)  # system, manual, bulk
+    sms_type = Column(String(50), nullable=False)  # application_new, bulk_announcement 등
+
+    # 건수
+    count = Column(BigInteger, nullable=False, default=0)
+
+    # 타임스탬프
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # 증분 집계 UPSERT 키
+        Index('uq_sms_daily_stats_key', 'day', 'status', 'trigger_source', 'sms_type', unique=True),
+    )
+
+    def __repr__(self):
+        return f"<SMSDailyStat {self.day} {self.status}/{self.trigger_source}/{self.sms_type}: {self.count}>"
+
+
+@event.listens_for(Session, "after_flush")
+def _rollup_sms_logs(session: Session, flush_context) -> None:
+    """
+    SMSLog INSERT 시 일별 통계 증분 (같은 트랜잭션에서 UPSERT)
+
+    flush 단위로 묶어서 키별 1회만 UPSERT 하므로 대량 발송 배치도 쿼리 수가 늘지 않는다.
+    """
+    counts: Counter = Counter()
+    for obj in session.new:
+        if isinstance(obj, SMSLog):
+            # created_at이 지정되지 않은 경우 INSERT 시각(now())과 동일한 트랜잭션 시각 사용
+            created_at = obj.__dict__.get("created_at")
+            day = created_at.astimezone(timezone.utc).date() if isinstance(created_at, datetime) else None
+            counts[(day, obj.status or "pending", obj.trigger_source or "system", obj.sms_type)] += 1
+
+    if not counts:
+        return
+
+    today_utc = cast(func.timezone("UTC", func.now()), Date)
+    for (day, status, trigger_source, sms_type), count in counts.items():
+        session.connection().execute(
+            sms_daily_stat_upsert(day if day is not None else today_utc, status, trigger_source, sms_type, count)
+        )
+
+
+def sms_daily_stat_upsert(day, status: str, trigger_source: str, sms_type: str, delta: int):
+    """
+    일별 통계 증감 UPSERT 문 생성
+
+    Args:
+        day: 발송일 (UTC, date 또는 SQL 식)
+        status: 로그 상태
+        trigger_source: 발송 출처
+        sms_type: 발송 유형
+        delta: 증감 건수 (상태 변경 시 이전 상태는 음수)
+
+    Returns:
+        INSERT ... ON CONFLICT DO UPDATE 문
+    """
+    table = SMSDailyStat.__table__
+    stmt = pg_insert(table).values(
+        day=day,
+        status=status,
+        trigger_source=trigger_source or "system",
+        sms_type=sms_type,
+        count=delta,
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["day", "status", "trigger_source", "sms_type"],
+        set_={
+            "count": table.c.count + stmt.excluded.count,
+            "updated_at": func.now(),
+        },
+    )
@@ -3,10 +3,14 @@ SMS Log model
 SMS 발송 로그 모델
 
 PK: BIGSERIAL as per CLAUDE.md
-상태: pending → sent / failed
+상태: pending → sent / failed (게이트웨이 회로 차단 시 queued → sent / failed)
+
+created_at 기준 월 단위 RANGE 파티션 테이블 (sms_logs_YYYYMM).
+파티션 테이블의 PK는 파티션 키를 포함해야 하므로 DB PK는 (id, created_at)이며,
+ORM 식별자는 기존과 동일하게 id만 사용한다. 파티션 생성/아카이브는 app.services.log_partition 참고.
 """
 
-from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 
@@ -22,6 +26,7 @@ class SMSLog(Base):
 
     # 발송 정보
     receiver_phone = Column(String(500), nullable=False)  # 수신자 (암호화)
+    receiver_phone_hash = Column(String(64), nullable=True, index=True)  # 수신자 검색용 해시 (Blind Index)
     message = Column(Text, nullable=False)  # 발송 메시지
 
     # 발송 유형
@@ -45,6 +50,7 @@ class SMSLog(Base):
     # pending: 대기중
     # sent: 발송 완료
     # failed: 발송 실패
+    # queued: 게이트웨이 회로 차단으로 보류 (대기열에서 재발송)
     status = Column(String(20), nullable=False, default="pending", index=True)
 
     # 알리고 API 응답
@@ -62,8 +68,15 @@ class SMSLog(Base):
     mms_images = Column(JSONB, nullable=True, default=None)  # ["/uploads/mms/202512/abc.webp", ...]
 
     # 타임스탬프
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())  # 파티션 키
     sent_at = Column(DateTime(timezone=True), nullable=True)
 
+    __table_args__ = (
+        # 최신순 목록 (최근 파티션부터 순서대로 스캔, cursor 페이지네이션)
+        Index('idx_sms_logs_created_id', 'created_at', 'id'),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self):
         return f"<SMSLog {self.id}: {self.sms_type} - {self.status}>"
@@ -30,6 +30,7 @@ from app.schemas.service import (
     ServiceCategoryWithTypesResponse,
     ServicesListResponse,
 )
+from app.schemas.catalog import CatalogBootstrapResponse
 
 __all__ = [
     # Region
@@ -58,4 +59,6 @@ __all__ = [
     "ServiceCategoryResponse",
     "ServiceCategoryWithTypesResponse",
     "ServicesListResponse",
+    # Catalog
+    "CatalogBootstrapResponse",
 ]
@@ -179,10 +179,12 @@ class ApplicationListResponse(BaseModel):
     """신청 목록 응답 (관리자용)"""
 
     items: list[ApplicationListItem]
-    total: int
+    total: Optional[int] = None  # count=none이면 null
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    total_estimated: bool = False  # total이 추정치(통계 추정 또는 캐시된 개수)인지 여부
 
 
 class ApplicationUpdate(BaseModel):
@@ -249,3 +251,56 @@ class BulkAssignResponse(BaseModel):
     failed_count: int
     results: list[BulkAssignResult]
     partner_name: str
+
+
+class BulkStatusRequest(BaseModel):
+    """신청 일괄 상태 변경 요청"""
+
+    application_ids: list[int] = Field(..., min_length=1, description="상태를 변경할 신청 ID 목록")
+    status: str = Field(..., description="변경할 상태")
+    send_sms: bool = Field(False, description="SMS 알림 발송 여부 (취소/완료 시 고객 알림)")
+    cancel_reason: Optional[str] = Field(None, max_length=500, description="취소 사유 (취소 알림에 포함)")
+
+    @field_validator("application_ids")
+    @classmethod
+    def validate_application_ids(cls, v: list[int]) -> list[int]:
+        if not v or len(v) == 0:
+            raise ValueError("최소 1개 이상의 신청을 선택해주세요")
+        if len(v) > 500:
+            raise ValueError("한 번에 최대 500개까지만 변경할 수 있습니다")
+        return v
+
+    @field_validator("status")
+    @classmethod
+    def validate_status(cls, v: str) -> str:
+        valid_statuses = ["new", "consulting", "assigned", "scheduled", "completed", "cancelled"]
+        if v not in valid_statuses:
+            raise ValueError(f"유효하지 않은 상태: {v}")
+        return v
+
+    @field_validator("cancel_reason")
+    @classmethod
+    def validate_cancel_reason_xss(cls, v: Optional[str]) -> Optional[str]:
+        """취소 사유 XSS 검증"""
+        return validate_no_xss(v)
+
+
+class BulkStatusResult(BaseModel):
+    """일괄 상태 변경 결과 (개별 신청)"""
+
+    application_id: int
+    application_number: str
+    previous_status: Optional[str] = None
+    success: bool
+    message: str
+
+
+class BulkStatusResponse(BaseModel):
+    """신청 일괄 상태 변경 응답"""
+
+    total: int
+    success_count: int
+    failed_count: int
+    status: str
+    results: list[BulkStatusResult]
+    synced_assignments: int = 0  # 함께 상태가 변경된 배정 수
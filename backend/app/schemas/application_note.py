@@ -4,6 +4,7 @@ Application Note schemas for API
 """
 
 from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel, Field
 
 
@@ -27,4 +28,6 @@ class ApplicationNoteResponse(BaseModel):
 class ApplicationNotesListResponse(BaseModel):
     """메모 목록 응답"""
     items: list[ApplicationNoteResponse]
-    total: int
+    total: Optional[int] = None  # count=none이면 null
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    total_estimated: bool = False  # total이 추정치(통계 추정 또는 캐시된 개수)인지 여부
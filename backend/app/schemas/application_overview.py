@@ -0,0 +1,47 @@
+"""
+Application Overview schemas
+관리자 신청 상세 화면 통합 조회 스키마
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+from app.schemas.application import ApplicationDetailResponse, AssignmentSummary
+from app.schemas.application_note import ApplicationNoteResponse
+from app.schemas.audit_log import AuditLogResponse
+
+
+class OverviewAssignment(AssignmentSummary):
+    """배정 요약 + 견적 합계"""
+    quote_item_count: int = 0
+    quote_total_amount: int = 0  # 견적 항목 금액 합계 (원)
+
+
+class CustomerHistoryItem(BaseModel):
+    """고객 신청 이력 항목 (동일 전화번호)"""
+    id: int
+    application_number: str
+    status: str
+    selected_services: list[str]
+    created_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    is_current: bool = False
+
+
+class CustomerHistory(BaseModel):
+    """고객 신청 이력"""
+    customer_phone_masked: Optional[str] = None
+    total_applications: int = 0
+    applications: list[CustomerHistoryItem] = []
+
+
+class ApplicationOverviewResponse(BaseModel):
+    """신청 상세 화면 통합 응답"""
+    application: ApplicationDetailResponse
+    assignments: list[OverviewAssignment]
+    quote_total_amount: int = 0  # 전체 배정 견적 합계 (원)
+    recent_notes: list[ApplicationNoteResponse]
+    notes_total: int = 0
+    customer_history: CustomerHistory
+    recent_audit_logs: list[AuditLogResponse]
@@ -28,7 +28,9 @@ class AuditLogResponse(BaseModel):
 class AuditLogListResponse(BaseModel):
     """변경 이력 목록 응답"""
     items: List[AuditLogResponse]
-    total: int
+    total: Optional[int] = None  # count=none이면 null
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    total_estimated: bool = False  # total이 추정치(통계 추정 또는 캐시된 개수)인지 여부
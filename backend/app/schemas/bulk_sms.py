@@ -14,7 +14,7 @@ class BulkSMSSendRequest(BaseModel):
     job_type: str  # announcement, status_notify, manual_select
     title: Optional[str] = None
     target_type: str  # customer, partner
-    target_filter: Optional[dict] = None  # {"status": "new"}
+    target_filter: Optional[dict] = None  # {"status": "new", "region": "41310"}
     target_ids: Optional[list[int]] = None  # [1, 2, 3]
     message: str
 
@@ -86,9 +86,11 @@ class BulkSMSJobListResponse(BaseModel):
     """대량 SMS Job 목록 응답"""
 
     items: list[BulkSMSJobDetailResponse]
-    total: int
+    total: Optional[int] = None  # count=none이면 null
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    total_estimated: bool = False  # total이 추정치(통계 추정 또는 캐시된 개수)인지 여부
 
 
 class SMSRecipient(BaseModel):
@@ -107,6 +109,8 @@ class SMSRecipientsResponse(BaseModel):
     """SMS 수신자 목록 응답"""
 
     items: list[SMSRecipient]
-    total: int
+    total: Optional[int] = None  # count=none이면 null
     page: int
     page_size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    total_estimated: bool = False  # total이 추정치(통계 추정 또는 캐시된 개수)인지 여부
@@ -0,0 +1,16 @@
+"""
+Catalog schemas
+공개 사이트 초기 데이터(서비스 + 지역) 응답
+"""
+
+from pydantic import BaseModel
+
+from app.schemas.region import ProvinceWithDistrictsResponse
+from app.schemas.service import ServicesListResponse
+
+
+class CatalogBootstrapResponse(BaseModel):
+    """공개 사이트 초기 데이터 (GET /services + GET /regions/all)"""
+
+    services: ServicesListResponse
+    regions: list[ProvinceWithDistrictsResponse]
@@ -31,7 +31,9 @@ class PartnerNoteResponse(BaseModel):
 class PartnerNotesResponse(BaseModel):
     """협력사 메모 목록 응답"""
     items: list[PartnerNoteResponse]
-    total: int
+    total: Optional[int] = None  # count=none이면 null
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    total_estimated: bool = False  # total이 추정치(통계 추정 또는 캐시된 개수)인지 여부
 
 
 class PartnerStatusChange(BaseModel):
@@ -5,7 +5,7 @@ SMS 발송 로그 스키마
 
 from pydantic import BaseModel, field_validator
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, date
 
 
 class SMSLogListItem(BaseModel):
@@ -32,10 +32,12 @@ class SMSLogListResponse(BaseModel):
     """SMS 로그 목록 응답"""
 
     items: list[SMSLogListItem]
-    total: int
+    total: Optional[int] = None  # count=none이면 null
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    total_estimated: bool = False  # total이 추정치(통계 추정 또는 캐시된 개수)인지 여부
 
 
 class SMSSendRequest(BaseModel):
@@ -148,6 +150,14 @@ class SMSSendResponse(BaseModel):
     sms_log_id: Optional[int] = None
 
 
+class SMSDailyStatsItem(BaseModel):
+    """SMS 일별 통계 아이템"""
+
+    date: date
+    sent: int
+    failed: int
+
+
 class SMSStatsResponse(BaseModel):
     """SMS 통계 응답"""
 
@@ -157,3 +167,4 @@ class SMSStatsResponse(BaseModel):
     today_failed: int
     this_month_sent: int
     this_month_failed: int
+    daily: list[SMSDailyStatsItem] = []  # 최근 N일 일별 추이 (오래된 날짜순)
@@ -0,0 +1,273 @@
+"""
+Analytics Rollup Service
+신청 분석 일별 롤업 (application_daily_stats, application_daily_lead_times)
+
+- 일자 범위 단위 재집계: 해당 범위의 롤업 행을 지우고 원본 테이블에서 다시 INSERT ... SELECT
+  (같은 범위를 여러 번 실행해도 결과 동일)
+- 증분 실행: 마지막 롤업 이후 변경된 신청/배정이 속한 일자만 재집계
+  - 신청: 신청일(코호트), 완료일, 취소일
+  - 배정: 배정일 (최초 배정 시각 기준)
+  - 최근 ROLLUP_RECENT_DAYS일은 항상 재집계 (삭제된 신청 반영)
+  - 마지막 롤업 시각은 롤업 테이블의 max(updated_at) (별도 상태 저장 없음)
+- 여러 워커가 동시에 실행해도 advisory lock으로 한 워커만 수행
+- 과거 데이터 전체 집계는 scripts.backfill_application_analytics
+
+일자는 UTC 기준 (sms_daily_stats, dashboard_counters와 동일).
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.models.application_daily_stat import ALL_SERVICES
+
+logger = logging.getLogger(__name__)
+
+# 설정
+ROLLUP_INTERVAL = 15 * 60  # 증분 롤업 주기 (초)
+ROLLUP_LOCK_KEY = 2026010503  # pg_try_advisory_xact_lock 키
+ROLLUP_RECENT_DAYS = 2  # 항상 재집계하는 최근 일수
+ROLLUP_OVERLAP = timedelta(minutes=10)  # 롤업 시작 시점에 진행 중이던 트랜잭션 반영용 여유
+
+_DELETE_SQL = {
+    table: text(f"DELETE FROM {table} WHERE day >= :start_day AND day <= :end_day")
+    for table in ("application_daily_stats", "application_daily_lead_times")
+}
+
+# 코호트: 신청일별 현재 상태 건수 (서비스 합계 행 + 서비스별 행)
+_COHORT_SQL = text("""
+    WITH facts AS (
+        SELECT
+            (a.created_at AT TIME ZONE 'UTC')::date AS day,
+            COALESCE(a.province_code, '') AS province_code,
+            a.status,
+            a.selected_services
+        FROM applications a
+        WHERE a.created_at >= :start_at AND a.created_at < :end_at
+    )
+    INSERT INTO application_daily_stats (day, service_code, province_code, status, count)
+    SELECT day, CAST(:all_services AS varchar), province_code, status, COUNT(*)
+    FROM facts
+    GROUP BY day, province_code, status
+    UNION ALL
+    SELECT f.day, s.code, f.province_code, f.status, COUNT(*)
+    FROM facts f
+    CROSS JOIN LATERAL (
+        SELECT DISTINCT jsonb_array_elements_text(COALESCE(f.selected_services, '[]'::jsonb)) AS code
+    ) s
+    GROUP BY f.day, s.code, f.province_code, f.status
+""")
+
+# 처리: 이벤트 발생일별 최초 배정 / 완료 / 취소 건수 및 소요 시간 합계
+_LEAD_TIME_SQL = text("""
+    WITH first_assignments AS (
+        SELECT application_id, MIN(assigned_at) AS assigned_at
+        FROM application_partner_assignments
+        WHERE application_id IN (
+            SELECT application_id
+            FROM application_partner_assignments
+            WHERE assigned_at >= :start_at AND assigned_at < :end_at
+        )
+        GROUP BY application_id
+        HAVING MIN(assigned_at) >= :start_at
+    ),
+    events AS (
+        SELECT
+            fa.assigned_at AS event_at, a.province_code, a.selected_services,
+            1 AS assigned, EXTRACT(EPOCH FROM fa.assigned_at - a.created_at) AS assign_seconds,
+            0 AS completed, 0 AS complete_seconds, 0 AS cancelled
+        FROM first_assignments fa
+        JOIN applications a ON a.id = fa.application_id
+        UNION ALL
+        SELECT
+            a.completed_at, a.province_code, a.selected_services,
+            0, 0,
+            1, EXTRACT(EPOCH FROM a.completed_at - a.created_at), 0
+        FROM applications a
+        WHERE a.status = 'completed' AND a.completed_at >= :start_at AND a.completed_at < :end_at
+        UNION ALL
+        SELECT
+            a.cancelled_at, a.province_code, a.selected_services,
+            0, 0, 0, 0, 1
+        FROM applications a
+        WHERE a.status = 'cancelled' AND a.cancelled_at >= :start_at AND a.cancelled_at < :end_at
+    ),
+    facts AS (
+        SELECT
+            (event_at AT TIME ZONE 'UTC')::date AS day,
+            COALESCE(province_code, '') AS province_code,
+            selected_services,
+            assigned, GREATEST(assign_seconds, 0) AS assign_seconds,
+            completed, GREATEST(complete_seconds, 0) AS complete_seconds,
+            cancelled
+        FROM events
+    ),
+    expanded AS (
+        SELECT day, CAST(:all_services AS varchar) AS service_code, province_code,
+               assigned, assign_seconds, completed, complete_seconds, cancelled
+        FROM facts
+        UNION ALL
+        SELECT f.day, s.code, f.province_code,
+               f.assigned, f.assign_seconds, f.completed, f.complete_seconds, f.cancelled
+        FROM facts f
+        CROSS JOIN LATERAL (
+            SELECT DISTINCT jsonb_array_elements_text(COALESCE(f.selected_services, '[]'::jsonb)) AS code
+        ) s
+    )
+    INSERT INTO application_daily_lead_times (
+        day, service_code, province_code,
+        assigned_count, assign_seconds, completed_count, complete_seconds, cancelled_count
+    )
+    SELECT
+        day, service_code, province_code,
+        SUM(assigned), SUM(assign_seconds)::bigint,
+        SUM(completed), SUM(complete_seconds)::bigint,
+        SUM(cancelled)
+    FROM expanded
+    GROUP BY day, service_code, province_code
+""")
+
+# 마지막 롤업 이후 변경된 신청/배정이 속한 일자
+_AFFECTED_DAYS_SQL = text("""
+    SELECT (a.created_at AT TIME ZONE 'UTC')::date FROM applications a WHERE a.updated_at >= :since
+    UNION
+    SELECT (a.completed_at AT TIME ZONE 'UTC')::date FROM applications a
+    WHERE a.updated_at >= :since AND a.completed_at IS NOT NULL
+    UNION
+    SELECT (a.cancelled_at AT TIME ZONE 'UTC')::date FROM applications a
+    WHERE a.updated_at >= :since AND a.cancelled_at IS NOT NULL
+    UNION
+    SELECT (apa.assigned_at AT TIME ZONE 'UTC')::date FROM application_partner_assignments apa
+    WHERE apa.updated_at >= :since AND apa.assigned_at IS NOT NULL
+""")
+
+_LAST_ROLLUP_SQL = text("""
+    SELECT GREATEST(
+        (SELECT MAX(updated_at) FROM application_daily_stats),
+        (SELECT MAX(updated_at) FROM application_daily_lead_times)
+    )
+""")
+
+
+def _utc_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def contiguous_ranges(days: Iterable[date]) -> list[tuple[date, date]]:
+    """일자 목록을 연속 구간 (시작일, 종료일) 목록으로 변환"""
+    ranges: list[tuple[date, date]] = []
+    for day in sorted(set(days)):
+        if ranges and day == ranges[-1][1] + timedelta(days=1):
+            ranges[-1] = (ranges[-1][0], day)
+        else:
+            ranges.append((day, day))
+    return ranges
+
+
+async def rebuild_range(db: AsyncSession, start_day: date, end_day: date):
+    """
+    일자 범위 재집계 (커밋은 호출자)
+
+    Args:
+        db: 데이터베이스 세션
+        start_day: 시작일 (UTC, 포함)
+        end_day: 종료일 (UTC, 포함)
+    """
+    params = {
+        "start_day": start_day,
+        "end_day": end_day,
+        "start_at": _utc_start(start_day),
+        "end_at": _utc_start(end_day + timedelta(days=1)),
+        "all_services": ALL_SERVICES,
+    }
+    for stmt in _DELETE_SQL.values():
+        await db.execute(stmt, params)
+    await db.execute(_COHORT_SQL, params)
+    await db.execute(_LEAD_TIME_SQL, params)
+
+
+async def _try_lock(db: AsyncSession) -> bool:
+    return bool(await db.scalar(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": ROLLUP_LOCK_KEY}
+    ))
+
+
+async def run_incremental_rollup(db: Optional[AsyncSession] = None) -> Optional[int]:
+    """
+    증분 롤업 (변경된 일자만 재집계)
+
+    Args:
+        db: 데이터베이스 세션 (없으면 자동 생성)
+
+    Returns:
+        재집계한 일수 (다른 워커가 실행 중이면 None)
+    """
+    if db is None:
+        async with AsyncSessionLocal() as session:
+            return await run_incremental_rollup(session)
+
+    if not await _try_lock(db):
+        await db.rollback()
+        return None
+
+    today = datetime.now(timezone.utc).date()
+    days = {today - timedelta(days=offset) for offset in range(ROLLUP_RECENT_DAYS)}
+
+    last_rollup = await db.scalar(_LAST_ROLLUP_SQL)
+    if last_rollup is None:
+        logger.warning("Analytics rollup is empty, run scripts.backfill_application_analytics for history")
+    else:
+        result = await db.execute(_AFFECTED_DAYS_SQL, {"since": last_rollup - ROLLUP_OVERLAP})
+        days.update(day for day in result.scalars().all() if day is not None)
+
+    for start_day, end_day in contiguous_ranges(days):
+        await rebuild_range(db, start_day, end_day)
+    await db.commit()
+
+    logger.info(f"Analytics rollup: {len(days)} day(s) rebuilt")
+    return len(days)
+
+
+async def run_backfill(
+    db: AsyncSession,
+    start_day: date,
+    end_day: date,
+    chunk_days: int = 31,
+) -> int:
+    """
+    과거 데이터 롤업 (chunk_days 단위로 커밋)
+
+    Args:
+        db: 데이터베이스 세션
+        start_day: 시작일 (UTC, 포함)
+        end_day: 종료일 (UTC, 포함)
+        chunk_days: 한 트랜잭션에서 재집계할 일수
+
+    Returns:
+        재집계한 일수
+    """
+    day = start_day
+    while day <= end_day:
+        chunk_end = min(day + timedelta(days=chunk_days - 1), end_day)
+        # 증분 롤업과 같은 일자를 동시에 재집계하지 않도록 대기 잠금
+        await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": ROLLUP_LOCK_KEY})
+        await rebuild_range(db, day, chunk_end)
+        await db.commit()
+        logger.info(f"Analytics backfill: {day} ~ {chunk_end}")
+        day = chunk_end + timedelta(days=1)
+    return (end_day - start_day).days + 1
+
+
+async def analytics_rollup_loop():
+    """증분 롤업 주기 실행 (애플리케이션 수명 동안)"""
+    while True:
+        await asyncio.sleep(ROLLUP_INTERVAL)
+        try:
+            await run_incremental_rollup()
+        except Exception as e:
+            logger.error(f"Analytics rollup failed: {e}")
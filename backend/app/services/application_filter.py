@@ -0,0 +1,162 @@
+"""
+Application Filter Service
+관리자 신청 목록 필터 조건
+
+목록 조회, 전체 개수(count_list), 내보내기가 같은 필터 조건을 사용하도록
+요청 파라미터를 ApplicationFilter로 정규화하고 SQL 조건으로 변환한다.
+
+필터별 인덱스:
+- status: idx_applications_status_created_id (status, created_at, id)
+- services: idx_applications_selected_services (GIN jsonb_path_ops, @> 조건)
+- assigned_partner_id: idx_applications_partner_created_id (assigned_partner_id, created_at, id)
+- assigned_admin_id: idx_applications_admin_created_id (assigned_admin_id, created_at, id)
+- date_from / date_to: idx_applications_created_id (created_at, id) 범위 스캔
+- region: province_code / district_code 인덱스
+- search: 신청번호 인덱스 또는 검색 인덱스 테이블(search_index)로 찾은 ID 목록
+"""
+
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlalchemy import Select, false, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.application import Application
+from app.services.region_code import build_application_region_condition
+from app.services.search_index import detect_search_type, unified_search
+
+# 하이픈 없는 신청번호 (20251231001 → 20251231-001)
+_APPLICATION_NUMBER_WITHOUT_HYPHEN = re.compile(r"^\d{9,11}$")
+
+
+@dataclass
+class ApplicationFilter:
+    """신청 목록 필터 조건 (값이 없는 항목은 필터 없음)"""
+    status: Optional[str] = None
+    search: Optional[str] = None
+    search_type: Optional[str] = None  # auto/name/phone/number
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    services: list[str] = field(default_factory=list)  # 하나라도 포함 (OR)
+    assigned_admin_id: Optional[int] = None
+    assigned_partner_id: Optional[int] = None
+    region: Optional[str] = None  # 시/도 코드, 시/군/구 코드 또는 지역명
+
+    @classmethod
+    def from_query(
+        cls,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        search_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        services: Optional[str] = None,
+        assigned_admin_id: Optional[int] = None,
+        assigned_partner_id: Optional[int] = None,
+        region: Optional[str] = None,
+    ) -> "ApplicationFilter":
+        """
+        쿼리 파라미터로 필터 생성
+
+        Args:
+            services: 서비스 코드 (콤마 구분)
+            나머지: 같은 이름의 쿼리 파라미터
+        """
+        return cls(
+            status=status or None,
+            search=search.strip() if search and search.strip() else None,
+            search_type=search_type,
+            date_from=date_from,
+            date_to=date_to,
+            services=[s.strip() for s in (services or "").split(",") if s.strip()],
+            assigned_admin_id=assigned_admin_id,
+            assigned_partner_id=assigned_partner_id,
+            region=region or None,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """필터 값 (count_list 캐시 키용)"""
+        return asdict(self)
+
+    async def _search_condition(self, db: AsyncSession):
+        detected_type = (
+            self.search_type if self.search_type and self.search_type != "auto"
+            else detect_search_type(self.search)
+        )
+
+        if detected_type == "number":
+            # 신청번호 검색 (하이픈 없는 형식도 허용)
+            search = self.search
+            if _APPLICATION_NUMBER_WITHOUT_HYPHEN.match(search):
+                search = f"{search[:8]}-{search[8:]}"
+            return Application.application_number.ilike(f"%{search}%")
+
+        if detected_type in ("phone", "name"):
+            # 암호화된 필드 검색 (검색 인덱스 테이블 사용)
+            matching_ids = await unified_search(db, "application", self.search, detected_type)
+            if not matching_ids:
+                return false()
+            return Application.id.in_(matching_ids)
+
+        return None
+
+    async def build_conditions(self, db: AsyncSession) -> list:
+        """
+        SQL 조건 목록 생성
+
+        Args:
+            db: 데이터베이스 세션 (검색 인덱스, 지역 코드 조회용)
+
+        Returns:
+            WHERE 조건 목록 (AND 결합)
+        """
+        conditions = []
+
+        if self.status:
+            conditions.append(Application.status == self.status)
+
+        if self.search:
+            condition = await self._search_condition(db)
+            if condition is not None:
+                conditions.append(condition)
+
+        if self.date_from:
+            conditions.append(Application.created_at >= datetime.combine(self.date_from, datetime.min.time()))
+        if self.date_to:
+            conditions.append(Application.created_at <= datetime.combine(self.date_to, datetime.max.time()))
+
+        if self.services:
+            # 서비스 하나당 @> 조건 (GIN jsonb_path_ops 인덱스 사용)
+            conditions.append(or_(*[
+                Application.selected_services.contains([service])
+                for service in self.services
+            ]))
+
+        if self.assigned_admin_id:
+            conditions.append(Application.assigned_admin_id == self.assigned_admin_id)
+
+        if self.assigned_partner_id:
+            conditions.append(Application.assigned_partner_id == self.assigned_partner_id)
+
+        if self.region:
+            conditions.append(await build_application_region_condition(db, self.region))
+
+        return conditions
+
+    async def apply(self, db: AsyncSession, stmt: Select) -> Select:
+        """
+        쿼리에 필터 조건 적용
+
+        Args:
+            db: 데이터베이스 세션
+            stmt: Application 컬럼/엔티티를 조회하는 쿼리
+
+        Returns:
+            필터가 적용된 쿼리
+        """
+        conditions = await self.build_conditions(db)
+        if conditions:
+            stmt = stmt.where(*conditions)
+        return stmt
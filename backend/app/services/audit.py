@@ -4,7 +4,7 @@ Audit Log Service
 """
 
 from typing import Optional, Any, Dict, List
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import AuditLog, Admin
@@ -333,6 +333,192 @@ async def log_bulk_assignment(
     )
 
 
+async def _insert_audit_logs(
+    db: AsyncSession,
+    rows: List[Dict[str, Any]],
+    admin: Optional[Admin] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> int:
+    """
+    변경 이력 여러 건을 INSERT 1회로 기록 (일괄 처리용)
+
+    Args:
+        db: 데이터베이스 세션
+        rows: 이력 목록 (entity_type, entity_id, action, old_value, new_value, summary)
+        admin: 변경자
+        ip_address: IP 주소
+        user_agent: User Agent
+
+    Returns:
+        기록된 이력 수
+    """
+    if not rows:
+        return 0
+
+    common = {
+        "admin_id": admin.id if admin else None,
+        "admin_name": admin.name if admin else None,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+    }
+    await db.execute(
+        insert(AuditLog).values([
+            {"old_value": None, "new_value": None, "summary": None, **row, **common}
+            for row in rows
+        ])
+    )
+    return len(rows)
+
+
+async def log_status_changes(
+    db: AsyncSession,
+    entity_type: str,
+    changes: List[tuple[int, str, str]],
+    admin: Optional[Admin] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> int:
+    """
+    상태 변경 이력 일괄 기록 (log_status_change와 같은 형식, INSERT 1회)
+
+    Args:
+        db: 데이터베이스 세션
+        entity_type: 엔티티 유형
+        changes: (엔티티 ID, 이전 상태, 새 상태) 목록
+        admin: 변경자
+        ip_address: IP 주소
+        user_agent: User Agent
+
+    Returns:
+        기록된 이력 수
+    """
+    return await _insert_audit_logs(
+        db,
+        [
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "action": "status_change",
+                "old_value": {"status": old_status},
+                "new_value": {"status": new_status},
+                "summary": (
+                    f"상태 변경: {get_status_label(entity_type, old_status)} → "
+                    f"{get_status_label(entity_type, new_status)}"
+                ),
+            }
+            for entity_id, old_status, new_status in changes
+        ],
+        admin=admin,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
+
+
+async def log_bulk_assignments(
+    db: AsyncSession,
+    entity_ids: List[int],
+    partner_id: int,
+    partner_name: str,
+    total_count: int,
+    admin: Optional[Admin] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> int:
+    """
+    일괄 배정 이력 기록 (배정된 신청별 이력을 INSERT 1회로 저장)
+
+    Args:
+        db: 데이터베이스 세션
+        entity_ids: 배정에 성공한 신청 ID 목록
+        partner_id: 배정된 협력사 ID
+        partner_name: 협력사명
+        total_count: 전체 배정 시도 건수
+        admin: 변경자
+        ip_address: IP 주소
+        user_agent: User Agent
+
+    Returns:
+        기록된 이력 수
+    """
+    success_count = len(entity_ids)
+    new_value = {
+        "partner_id": partner_id,
+        "partner_name": partner_name,
+        "total_count": total_count,
+        "success_count": success_count,
+    }
+    summary = f"일괄 배정: {partner_name} ({success_count}/{total_count}건)"
+
+    return await _insert_audit_logs(
+        db,
+        [
+            {
+                "entity_type": "application",
+                "entity_id": entity_id,
+                "action": "bulk_assignment",
+                "new_value": new_value,
+                "summary": summary,
+            }
+            for entity_id in entity_ids
+        ],
+        admin=admin,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
+
+
+# 내보내기 대상 한글 이름
+EXPORT_ENTITY_NAMES: Dict[str, str] = {
+    "application": "신청",
+    "partner": "협력사",
+}
+
+
+async def log_export(
+    db: AsyncSession,
+    entity_type: str,
+    row_count: int,
+    completed: bool,
+    filters: Optional[Dict[str, Any]] = None,
+    admin: Optional[Admin] = None,
+    ip_address: Optional[str] = None,
+    user_agent: Optional[str] = None,
+) -> AuditLog:
+    """
+    목록 내보내기 이력 기록 (개별 엔티티가 아니므로 entity_id=0)
+
+    Args:
+        db: 데이터베이스 세션
+        entity_type: 내보낸 목록 유형 (application, partner)
+        row_count: 내보낸 행 수
+        completed: 끝까지 내보냈는지 여부 (False: 연결 종료 등으로 중단)
+        filters: 적용된 필터 값
+        admin: 요청 관리자
+        ip_address: IP 주소
+        user_agent: User Agent
+
+    Returns:
+        생성된 AuditLog 객체
+    """
+    entity_name = EXPORT_ENTITY_NAMES.get(entity_type, entity_type)
+    return await log_change(
+        db=db,
+        entity_type=entity_type,
+        entity_id=0,
+        action="export",
+        new_value={
+            "row_count": row_count,
+            "completed": completed,
+            "filters": filters or {},
+        },
+        summary=f"{entity_name} 목록 내보내기: {row_count:,}건" + ("" if completed else " (중단)"),
+        admin=admin,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
+
+
 async def get_entity_history(
     db: AsyncSession,
     entity_type: str,
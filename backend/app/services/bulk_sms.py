@@ -3,26 +3,35 @@ Bulk SMS Service
 대량 SMS 발송 서비스
 
 핵심 기능:
-- 배치 분할 (50명 단위)
+- 수신자 확정 저장 (Job 시작 시 1회, bulk_sms_recipients)
+- 배치 분할 (50명 단위, SKIP LOCKED 점유로 여러 워커가 나눠 처리 가능)
 - 비동기 병렬 발송
 - 지수 백오프 재시도
-- 진행 상황 업데이트
+- 배치 단위 체크포인트 (중단 후 미발송 수신자만 이어서 발송)
+- 게이트웨이 회로 차단 시 대기 (차단으로 보류된 수신자는 pending으로 되돌려 재발송)
+- 진행 상황 업데이트 (SSE 구독자에게 최신 상태 발행, bulk_sms_progress)
 """
 
 import asyncio
 import math
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func, and_, or_, case, literal
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
 
+from app.core.database import AsyncSessionLocal
 from app.models.bulk_sms_job import BulkSMSJob
+from app.models.bulk_sms_recipient import BulkSMSRecipient
 from app.models.application import Application
 from app.models.partner import Partner
-from app.services.sms import send_sms_direct
-from app.core.encryption import decrypt_value
+from app.services.sms import send_sms, build_sms_log
+from app.services.sms_circuit import sms_circuit_breaker, is_circuit_open_result
+from app.services.bulk_sms_progress import bulk_sms_progress_hub, build_progress_state
+from app.services.region_code import build_application_region_condition
+from app.core.encryption import encrypt_value, decrypt_value
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +40,13 @@ BATCH_SIZE = 50  # 배치당 수신자 수
 RETRY_ATTEMPTS = 3  # 최대 재시도 횟수
 RETRY_DELAY_BASE = 1.0  # 재시도 기본 대기 시간 (초)
 BATCH_DELAY = 0.5  # 배치 간 대기 시간 (초)
+MATERIALIZE_CHUNK_SIZE = 500  # 수신자 확정 저장 시 INSERT 단위
+STALE_JOB_TIMEOUT = 300  # heartbeat 미갱신 시 중단된 Job으로 간주하는 시간 (초)
+STALE_JOB_SCAN_INTERVAL = STALE_JOB_TIMEOUT / 2  # 중단된 Job 주기 확인 간격 (초)
+CIRCUIT_WAIT_INTERVAL = 5.0  # 회로 차단 중 재확인 간격 (초, 대기 중에도 heartbeat 갱신)
+
+# 작업 중단으로 발송 여부를 알 수 없는 수신자 (중복 발송 방지를 위해 재발송하지 않음)
+ABANDONED_ERROR = "발송 중 작업 중단 (중복 발송 방지를 위해 재발송하지 않음)"
 
 
 class BulkSMSService:
@@ -38,15 +54,19 @@ class BulkSMSService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        # 마지막 배치 커밋 시점의 Job 통계 (UPDATE ... RETURNING 결과, 진행 상황 발행용)
+        self._progress_counts: dict = {}
 
     async def execute_bulk_send(self, job_id: int):
         """
-        메인 실행 함수 - BackgroundTask에서 호출
+        메인 실행 함수 - BackgroundTask / 재개 supervisor에서 호출
+
+        1. Job 시작 상태 업데이트 및 수신자 확정 저장 (최초 1회)
+        2. pending 수신자를 배치 단위로 점유하여 발송
+        3. 배치마다 수신자 상태, 통계, heartbeat를 한 번에 커밋
+        4. 남은 수신자가 없으면 완료 상태 업데이트
 
-        1. Job 시작 상태 업데이트
-        2. 수신자 목록 조회
-        3. 배치 분할 처리
-        4. 완료 상태 업데이트
+        중단 후 다시 호출되면 이미 확정된 수신자 중 pending 상태만 발송한다.
         """
         result = await self.db.execute(
             select(BulkSMSJob).where(BulkSMSJob.id == job_id)
@@ -56,109 +76,330 @@ class BulkSMSService:
             logger.error(f"BulkSMSJob {job_id} not found")
             return
 
-        try:
-            # Job 시작
-            job.status = "processing"
-            job.started_at = datetime.now(timezone.utc)
-            await self.db.commit()
-
-            logger.info(f"BulkSMSJob {job_id} started")
+        if job.status not in ("pending", "processing"):
+            logger.info(f"BulkSMSJob {job_id} already {job.status}, skipped")
+            return
 
-            # 수신자 목록 조회
-            recipients = await self._get_recipients(job)
-            job.total_count = len(recipients)
-            job.total_batches = math.ceil(len(recipients) / BATCH_SIZE) if recipients else 0
-            await self.db.commit()
+        try:
+            await self._start_job(job)
 
-            if not recipients:
+            if not job.total_count:
                 logger.warning(f"BulkSMSJob {job_id}: No recipients found")
-                job.status = "completed"
-                job.completed_at = datetime.now(timezone.utc)
-                await self.db.commit()
-                return
 
-            logger.info(f"BulkSMSJob {job_id}: {len(recipients)} recipients, {job.total_batches} batches")
+            # 배치 분할 처리 (pending 수신자가 없을 때까지)
+            while True:
+                await self._wait_for_gateway(job)
+                batch = await self._claim_batch(job.id)
+                if not batch:
+                    break
 
-            # 배치 분할 처리
-            for batch_index, batch in enumerate(self._chunk(recipients, BATCH_SIZE)):
-                await self._process_batch(job, batch, batch_index)
-                job.current_batch = batch_index + 1
-                await self.db.commit()
+                batch_index = await self._process_batch(job, batch)
 
                 logger.info(f"BulkSMSJob {job_id}: Batch {batch_index + 1}/{job.total_batches} completed")
 
-                # 배치 간 딜레이 (마지막 배치 제외)
-                if batch_index < job.total_batches - 1:
-                    await asyncio.sleep(BATCH_DELAY)
+                # 배치 간 딜레이
+                await asyncio.sleep(BATCH_DELAY)
 
             # 완료 처리
-            job.status = "completed" if job.failed_count == 0 else "partial_failed"
-            job.completed_at = datetime.now(timezone.utc)
+            await self._finalize_job(job)
+
+        except Exception as e:
+            logger.error(f"BulkSMSJob {job_id} error: {str(e)}")
+            await self.db.rollback()
+            result = await self.db.execute(
+                update(BulkSMSJob)
+                .where(BulkSMSJob.id == job_id)
+                .values(
+                    status="failed",
+                    error_message=str(e),
+                    completed_at=datetime.now(timezone.utc),
+                )
+                .returning(
+                    BulkSMSJob.total_count,
+                    BulkSMSJob.sent_count,
+                    BulkSMSJob.failed_count,
+                    BulkSMSJob.current_batch,
+                    BulkSMSJob.total_batches,
+                )
+            )
+            counts = result.one()
             await self.db.commit()
+            bulk_sms_progress_hub.publish(
+                job_id, "finished", build_progress_state(job_id, "failed", *counts)
+            )
 
+    def _publish_progress(self, job: BulkSMSJob, event: str, **counts):
+        """SSE 구독자에게 Job 최신 상태 발행 (counts로 전달된 값이 우선)"""
+        bulk_sms_progress_hub.publish(job.id, event, build_progress_state(
+            job.id,
+            counts.get("status", job.status),
+            job.total_count,
+            counts.get("sent_count", job.sent_count),
+            counts.get("failed_count", job.failed_count),
+            counts.get("current_batch", job.current_batch),
+            job.total_batches,
+        ))
+
+    async def _start_job(self, job: BulkSMSJob):
+        """Job 시작 처리 및 수신자 확정 저장 (재개 시에는 확정 저장 생략)"""
+        now = datetime.now(timezone.utc)
+        if job.status == "pending":
+            job.status = "processing"
+            job.started_at = now
+        job.heartbeat_at = now
+        await self.db.commit()
+
+        existing = await self.db.execute(
+            select(BulkSMSRecipient.id)
+            .where(BulkSMSRecipient.job_id == job.id)
+            .limit(1)
+        )
+        if existing.scalar_one_or_none() is not None:
             logger.info(
-                f"BulkSMSJob {job_id} finished: "
-                f"sent={job.sent_count}, failed={job.failed_count}, status={job.status}"
+                f"BulkSMSJob {job.id} resumed: "
+                f"sent={job.sent_count}, failed={job.failed_count}, total={job.total_count}"
             )
+            self._publish_progress(job, "started")
+            return
 
-        except Exception as e:
-            logger.error(f"BulkSMSJob {job_id} error: {str(e)}")
-            job.status = "failed"
-            job.error_message = str(e)
-            job.completed_at = datetime.now(timezone.utc)
+        recipients = await self._get_recipients(job)
+        await self._materialize_recipients(job, recipients)
+
+        # 동시 실행된 워커가 먼저 저장했을 수 있으므로 저장된 행 기준으로 집계
+        count_result = await self.db.execute(
+            select(func.count())
+            .select_from(BulkSMSRecipient)
+            .where(BulkSMSRecipient.job_id == job.id)
+        )
+        total = count_result.scalar() or 0
+        job.total_count = total
+        job.total_batches = math.ceil(total / BATCH_SIZE) if total else 0
+        await self.db.commit()
+
+        logger.info(f"BulkSMSJob {job.id} started: {total} recipients, {job.total_batches} batches")
+        self._publish_progress(job, "started")
+
+    async def _wait_for_gateway(self, job: BulkSMSJob):
+        """게이트웨이 회로가 차단된 동안 배치 점유를 멈추고 대기"""
+        waited = False
+        while (delay := sms_circuit_breaker.retry_after()) > 0:
+            if not waited:
+                logger.warning(f"BulkSMSJob {job.id}: SMS circuit open, pausing for {delay:.0f}s")
+                self._publish_progress(job, "waiting", **self._progress_counts)
+                waited = True
+            await self.db.execute(
+                update(BulkSMSJob)
+                .where(BulkSMSJob.id == job.id)
+                .values(heartbeat_at=datetime.now(timezone.utc))
+                .execution_options(synchronize_session=False)
+            )
             await self.db.commit()
+            await asyncio.sleep(min(delay, CIRCUIT_WAIT_INTERVAL))
+
+        if waited:
+            logger.info(f"BulkSMSJob {job.id}: SMS circuit available, resuming")
+
+    async def _materialize_recipients(self, job: BulkSMSJob, recipients: list):
+        """수신자 목록을 bulk_sms_recipients에 저장 (중복 수신자는 무시)"""
+        for chunk in self._chunk(recipients, MATERIALIZE_CHUNK_SIZE):
+            rows = [
+                {
+                    "job_id": job.id,
+                    "recipient_type": r["type"],
+                    "recipient_id": r["id"],
+                    "phone": encrypt_value(r["phone"]),
+                    "name": encrypt_value(r["name"]) if r.get("name") else None,
+                    "label": r.get("label"),
+                    "status": "pending",
+                    "attempts": 0,
+                }
+                for r in chunk
+            ]
+            stmt = pg_insert(BulkSMSRecipient).values(rows).on_conflict_do_nothing(
+                index_elements=["job_id", "recipient_id"]
+            )
+            await self.db.execute(stmt)
+        await self.db.commit()
+
+    async def _claim_batch(self, job_id: int) -> list:
+        """
+        pending 수신자를 배치 크기만큼 점유 (sending 상태로 변경)
+
+        FOR UPDATE SKIP LOCKED로 점유하므로 여러 워커가 같은 Job을
+        동시에 처리해도 같은 수신자를 중복 발송하지 않는다.
+        """
+        claim_ids = (
+            select(BulkSMSRecipient.id)
+            .where(
+                BulkSMSRecipient.job_id == job_id,
+                BulkSMSRecipient.status == "pending",
+            )
+            .order_by(BulkSMSRecipient.id)
+            .limit(BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(BulkSMSRecipient)
+            .where(BulkSMSRecipient.id.in_(claim_ids))
+            .values(
+                status="sending",
+                attempts=BulkSMSRecipient.attempts + 1,
+                claimed_at=datetime.now(timezone.utc),
+            )
+            .returning(
+                BulkSMSRecipient.id,
+                BulkSMSRecipient.recipient_type,
+                BulkSMSRecipient.recipient_id,
+                BulkSMSRecipient.phone,
+                BulkSMSRecipient.name,
+                BulkSMSRecipient.label,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        rows = result.all()
+        await self.db.commit()
+
+        return [
+            {
+                "row_id": row.id,
+                "type": row.recipient_type,
+                "id": row.recipient_id,
+                "phone": decrypt_value(row.phone),
+                "name": decrypt_value(row.name) if row.name else "",
+                "label": row.label,
+            }
+            for row in sorted(rows, key=lambda r: r.id)
+        ]
+
+    async def _process_batch(self, job: BulkSMSJob, recipients: list) -> int:
+        """
+        단일 배치 처리 (병렬 발송 후 결과를 한 번에 커밋)
 
-    async def _process_batch(self, job: BulkSMSJob, recipients: list, batch_index: int):
-        """단일 배치 처리 (병렬 발송)"""
+        Returns:
+            처리된 배치 번호 (0부터 시작)
+        """
         tasks = []
         for recipient in recipients:
-            task = self._send_with_retry(job, recipient, batch_index)
+            task = self._send_with_retry(job, recipient)
             tasks.append(task)
 
         # 배치 내 병렬 실행
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # 결과 처리
+        # 결과 정리 (회로 차단으로 발송하지 않은 수신자는 다음 배치에서 다시 점유)
+        outcomes = []
+        failed_entries = []
+        deferred_ids = []
         for recipient, result in zip(recipients, results):
             if isinstance(result, Exception):
-                job.failed_count += 1
-                self._add_failed_recipient(job, recipient, str(result))
-            elif not result.get("success"):
-                job.failed_count += 1
-                self._add_failed_recipient(job, recipient, result.get("error", "알 수 없는 오류"))
-            else:
-                job.sent_count += 1
-
-    def _add_failed_recipient(self, job: BulkSMSJob, recipient: dict, error: str):
-        """실패한 수신자 추가"""
-        if job.failed_recipients is None:
-            job.failed_recipients = []
+                result = {"result_code": "-1", "message": str(result), "msg_id": None}
+            if is_circuit_open_result(result):
+                deferred_ids.append(recipient["row_id"])
+                continue
+            is_success = result.get("result_code") == "1"
+            if not is_success:
+                failed_entries.append(
+                    self._failed_recipient_entry(recipient, result.get("message") or "알 수 없는 오류")
+                )
+            outcomes.append((recipient, result, is_success))
+
+        sent = sum(1 for _, _, ok in outcomes if ok)
+        failed = len(outcomes) - sent
+        now = datetime.now(timezone.utc)
+
+        # Job 통계 / 진행 정보 (여러 워커가 동시에 갱신할 수 있으므로 SQL에서 증가)
+        values = {
+            "sent_count": func.coalesce(BulkSMSJob.sent_count, 0) + sent,
+            "failed_count": func.coalesce(BulkSMSJob.failed_count, 0) + failed,
+            "current_batch": func.coalesce(BulkSMSJob.current_batch, 0) + (1 if outcomes else 0),
+            "heartbeat_at": now,
+        }
+        if failed_entries:
+            values["failed_recipients"] = func.coalesce(
+                BulkSMSJob.failed_recipients, literal([], type_=JSONB)
+            ).op("||", return_type=JSONB)(literal(failed_entries, type_=JSONB))
+
+        result = await self.db.execute(
+            update(BulkSMSJob)
+            .where(BulkSMSJob.id == job.id)
+            .values(**values)
+            .returning(BulkSMSJob.sent_count, BulkSMSJob.failed_count, BulkSMSJob.current_batch)
+            .execution_options(synchronize_session=False)
+        )
+        progress = result.one()
+        batch_index = progress.current_batch - 1
+        self._progress_counts = {
+            "sent_count": progress.sent_count,
+            "failed_count": progress.failed_count,
+            "current_batch": progress.current_batch,
+        }
+
+        # 발송 로그
+        logs = [
+            build_sms_log(
+                recipient["phone"],
+                job.message,
+                result,
+                sms_type=f"bulk_{job.job_type}",
+                trigger_source="bulk",
+                reference_type="bulk_job",
+                reference_id=job.id,
+                bulk_job_id=job.id,
+                batch_index=batch_index,
+            )
+            for recipient, result, _ in outcomes
+        ]
+        self.db.add_all(logs)
+        await self.db.flush()
+
+        # 수신자 체크포인트
+        if deferred_ids:
+            await self.db.execute(
+                update(BulkSMSRecipient)
+                .where(BulkSMSRecipient.id.in_(deferred_ids))
+                .values(status="pending", claimed_at=None)
+                .execution_options(synchronize_session=False)
+            )
+            logger.warning(f"BulkSMSJob {job.id}: {len(deferred_ids)} recipients deferred (SMS circuit open)")
+
+        if outcomes:
+            await self.db.execute(
+                update(BulkSMSRecipient),
+                [
+                    {
+                        "id": recipient["row_id"],
+                        "status": "sent" if ok else "failed",
+                        "batch_index": batch_index,
+                        "sms_log_id": log.id,
+                        "error_message": None if ok else (result.get("message") or "알 수 없는 오류")[:500],
+                        "completed_at": now,
+                    }
+                    for (recipient, result, ok), log in zip(outcomes, logs)
+                ],
+            )
+        await self.db.commit()
 
+        self._publish_progress(job, "batch", **self._progress_counts)
+
+        return batch_index
+
+    def _failed_recipient_entry(self, recipient: dict, error: str) -> dict:
+        """실패한 수신자 항목 생성 (failed_recipients 저장용)"""
         # 전화번호 마지막 4자리만 저장 (개인정보 보호)
         phone_last4 = recipient.get("phone", "")[-4:] if recipient.get("phone") else ""
 
-        job.failed_recipients.append({
+        return {
             "phone": phone_last4,
             "name": recipient.get("name", ""),
             "error": error[:200],  # 에러 메시지 길이 제한
-        })
+        }
 
-    async def _send_with_retry(self, job: BulkSMSJob, recipient: dict, batch_index: int) -> dict:
-        """재시도 로직이 포함된 단일 SMS 발송"""
+    async def _send_with_retry(self, job: BulkSMSJob, recipient: dict) -> dict:
+        """재시도 로직이 포함된 단일 SMS 발송 (로그 기록은 배치 단위로 처리)"""
         for attempt in range(RETRY_ATTEMPTS):
             try:
-                result = await send_sms_direct(
-                    receiver=recipient["phone"],
-                    message=job.message,
-                    sms_type=f"bulk_{job.job_type}",
-                    trigger_source="bulk",
-                    reference_type="bulk_job",
-                    reference_id=job.id,
-                    db=self.db,
-                    bulk_job_id=job.id,
-                    batch_index=batch_index,
-                )
-                return result
+                return await send_sms(recipient["phone"], job.message)
 
             except Exception as e:
                 if attempt < RETRY_ATTEMPTS - 1:
@@ -172,9 +413,112 @@ class BulkSMSService:
                     logger.error(
                         f"BulkSMSJob {job.id}: Max retries exceeded for {recipient.get('phone', '')[-4:]}"
                     )
-                    return {"success": False, "error": str(e)}
+                    return {"result_code": "-1", "message": str(e), "msg_id": None}
+
+        return {"result_code": "-1", "message": "최대 재시도 횟수 초과", "msg_id": None}
+
+    async def _finalize_job(self, job: BulkSMSJob):
+        """남은 수신자가 없으면 Job 완료 처리 (다른 워커가 처리 중이면 해당 워커에 위임)"""
+        remaining_result = await self.db.execute(
+            select(func.count())
+            .select_from(BulkSMSRecipient)
+            .where(
+                BulkSMSRecipient.job_id == job.id,
+                BulkSMSRecipient.status.in_(("pending", "sending")),
+            )
+        )
+        remaining = remaining_result.scalar() or 0
+        if remaining:
+            logger.info(f"BulkSMSJob {job.id}: {remaining} recipients still in progress by another worker")
+            # 완료 처리는 다른 워커가 하므로 이 워커의 채널을 닫아 구독자를 DB 조회로 전환
+            bulk_sms_progress_hub.discard(job.id)
+            return
+
+        now = datetime.now(timezone.utc)
+        await self.db.execute(
+            update(BulkSMSJob)
+            .where(BulkSMSJob.id == job.id, BulkSMSJob.status == "processing")
+            .values(
+                status=case(
+                    (func.coalesce(BulkSMSJob.failed_count, 0) == 0, "completed"),
+                    else_="partial_failed",
+                ),
+                completed_at=now,
+                heartbeat_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        await self.db.refresh(job)
+        self._publish_progress(job, "finished")
+
+        logger.info(
+            f"BulkSMSJob {job.id} finished: "
+            f"sent={job.sent_count}, failed={job.failed_count}, status={job.status}"
+        )
+
+    async def claim_stale_job(self, job_id: int, stale_before: datetime) -> bool:
+        """
+        중단된 Job 선점 및 정리
+
+        heartbeat를 조건부로 갱신하여 여러 워커 중 하나만 재개하도록 하고,
+        중단 시점에 발송 중이던 수신자는 발송 여부를 알 수 없으므로 실패 처리한다.
+
+        Returns:
+            선점 성공 여부
+        """
+        result = await self.db.execute(
+            update(BulkSMSJob)
+            .where(
+                BulkSMSJob.id == job_id,
+                BulkSMSJob.status.in_(("pending", "processing")),
+                or_(BulkSMSJob.heartbeat_at.is_(None), BulkSMSJob.heartbeat_at < stale_before),
+            )
+            .values(heartbeat_at=datetime.now(timezone.utc))
+            .returning(BulkSMSJob.id)
+            .execution_options(synchronize_session=False)
+        )
+        if result.scalar_one_or_none() is None:
+            await self.db.rollback()
+            return False
+
+        abandoned_result = await self.db.execute(
+            select(BulkSMSRecipient).where(
+                BulkSMSRecipient.job_id == job_id,
+                BulkSMSRecipient.status == "sending",
+            )
+        )
+        abandoned = abandoned_result.scalars().all()
+        if abandoned:
+            now = datetime.now(timezone.utc)
+            failed_entries = []
+            for row in abandoned:
+                row.status = "failed"
+                row.error_message = ABANDONED_ERROR
+                row.completed_at = now
+                failed_entries.append(self._failed_recipient_entry(
+                    {
+                        "phone": decrypt_value(row.phone),
+                        "name": decrypt_value(row.name) if row.name else "",
+                    },
+                    ABANDONED_ERROR,
+                ))
+
+            await self.db.execute(
+                update(BulkSMSJob)
+                .where(BulkSMSJob.id == job_id)
+                .values(
+                    failed_count=func.coalesce(BulkSMSJob.failed_count, 0) + len(abandoned),
+                    failed_recipients=func.coalesce(
+                        BulkSMSJob.failed_recipients, literal([], type_=JSONB)
+                    ).op("||", return_type=JSONB)(literal(failed_entries, type_=JSONB)),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            logger.warning(f"BulkSMSJob {job_id}: {len(abandoned)} in-flight recipients marked as failed")
 
-        return {"success": False, "error": "최대 재시도 횟수 초과"}
+        await self.db.commit()
+        return True
 
     async def _get_recipients(self, job: BulkSMSJob) -> list:
         """Job 설정에 따라 수신자 목록 조회"""
@@ -188,8 +532,13 @@ class BulkSMSService:
         return recipients
 
     async def _query_customers(self, job: BulkSMSJob) -> list:
-        """고객(신청자) 목록 조회"""
-        stmt = select(Application)
+        """고객(신청자) 목록 조회 (발송에 필요한 컬럼만 조회)"""
+        stmt = select(
+            Application.id,
+            Application.application_number,
+            Application.customer_name,
+            Application.customer_phone,
+        )
 
         # 선택 발송 (target_ids가 있는 경우)
         if job.target_ids:
@@ -199,30 +548,23 @@ class BulkSMSService:
         if job.target_filter:
             if "status" in job.target_filter:
                 stmt = stmt.where(Application.status == job.target_filter["status"])
-            if "region" in job.target_filter:
-                # region은 복호화된 주소에서 확인해야 하므로 애플리케이션 레벨에서 필터링
-                pass
+            if job.target_filter.get("region"):
+                # 지역 필터 (평문 지역 코드 컬럼 - 주소 복호화 불필요)
+                stmt = stmt.where(
+                    await build_application_region_condition(self.db, job.target_filter["region"])
+                )
 
         result = await self.db.execute(stmt)
-        applications = result.scalars().all()
+        applications = result.all()
 
         recipients = []
         for app in applications:
             try:
-                phone = decrypt_value(app.customer_phone)
-                name = decrypt_value(app.customer_name)
-
-                # region 필터 (암호화된 필드는 애플리케이션 레벨에서 필터링)
-                if job.target_filter and "region" in job.target_filter:
-                    address = decrypt_value(app.customer_address) if app.customer_address else ""
-                    if job.target_filter["region"] not in address:
-                        continue
-
                 recipients.append({
                     "type": "customer",
                     "id": app.id,
-                    "phone": phone,
-                    "name": name,
+                    "phone": decrypt_value(app.customer_phone),
+                    "name": decrypt_value(app.customer_name),
                     "label": app.application_number,
                 })
             except Exception as e:
@@ -270,9 +612,91 @@ class BulkSMSService:
             yield lst[i:i + size]
 
 
-async def execute_bulk_sms_job(db: AsyncSession, job_id: int):
+async def execute_bulk_sms_job(job_id: int, db: Optional[AsyncSession] = None):
     """
     백그라운드 태스크에서 호출하는 래퍼 함수
+
+    요청 세션은 응답 후 닫히므로 db를 생략하면 전용 세션을 생성한다.
+    """
+    close_db = False
+    if db is None:
+        db = AsyncSessionLocal()
+        close_db = True
+
+    try:
+        service = BulkSMSService(db)
+        await service.execute_bulk_send(job_id)
+    finally:
+        if close_db:
+            await db.close()
+
+
+async def resume_stale_bulk_sms_jobs() -> int:
+    """
+    중단된 대량 SMS Job 재개 (bulk_sms_supervisor_loop에서 주기 호출)
+
+    heartbeat가 STALE_JOB_TIMEOUT 이상 갱신되지 않은 processing Job과
+    시작되지 못한 채 남은 pending Job을 찾아 미발송 수신자부터 이어서 발송한다.
+
+    Returns:
+        재개한 Job 수
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=STALE_JOB_TIMEOUT)
+
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(BulkSMSJob.id)
+                .where(
+                    or_(
+                        and_(
+                            BulkSMSJob.status == "processing",
+                            or_(BulkSMSJob.heartbeat_at.is_(None), BulkSMSJob.heartbeat_at < stale_before),
+                        ),
+                        and_(
+                            BulkSMSJob.status == "pending",
+                            BulkSMSJob.created_at < stale_before,
+                        ),
+                    )
+                )
+                .order_by(BulkSMSJob.id)
+            )
+            job_ids = result.scalars().all()
+    except Exception as e:
+        logger.error(f"Failed to look up stale bulk SMS jobs: {e}")
+        return 0
+
+    resumed = 0
+    for job_id in job_ids:
+        async with AsyncSessionLocal() as db:
+            service = BulkSMSService(db)
+            try:
+                if not await service.claim_stale_job(job_id, stale_before):
+                    continue
+            except Exception as e:
+                logger.error(f"BulkSMSJob {job_id}: failed to claim for resume: {e}")
+                continue
+
+            logger.info(f"BulkSMSJob {job_id}: resuming after interruption")
+            resumed += 1
+            await service.execute_bulk_send(job_id)
+
+    return resumed
+
+
+async def bulk_sms_supervisor_loop():
+    """
+    중단된 대량 SMS Job 주기 재개 (애플리케이션 수명 동안)
+
+    재시작 직후에는 중단된 Job의 heartbeat가 아직 STALE_JOB_TIMEOUT 이내이므로
+    기동 시 1회 확인만으로는 재개되지 않는다. STALE_JOB_SCAN_INTERVAL마다 다시 확인하여
+    heartbeat가 만료되는 시점에 재개한다 (여러 워커 중 하나만 claim_stale_job으로 선점).
     """
-    service = BulkSMSService(db)
-    await service.execute_bulk_send(job_id)
+    while True:
+        try:
+            resumed = await resume_stale_bulk_sms_jobs()
+            if resumed:
+                logger.info(f"Resumed {resumed} interrupted bulk SMS job(s)")
+        except Exception as e:
+            logger.error(f"Bulk SMS supervisor failed: {e}")
+        await asyncio.sleep(STALE_JOB_SCAN_INTERVAL)
@@ -0,0 +1,220 @@
+"""
+Bulk SMS Progress Hub
+대량 SMS 발송 진행 상황 실시간 전달 (SSE)
+
+- BulkSMSService가 Job 시작, 배치 완료, 회로 차단 대기, 종료 시점에 최신 상태를 발행
+- Job당 채널 1개, 구독자 수 제한 없음
+- 채널은 최신 상태 1건만 보관하므로 느린 구독자는 중간 상태를 건너뛰고 최신 상태만 받음
+  (sent/failed 증가분은 구독자가 마지막으로 받은 상태 기준으로 계산)
+- 다른 워커에서 실행 중이거나 아직 시작되지 않은 Job은 Job 테이블의 진행 컬럼만 주기적으로 조회
+- 이 워커의 발송이 종료 상태 발행 없이 끝나면(남은 수신자를 다른 워커가 처리 중 등) 채널을 닫고
+  구독자는 DB 조회로 전환, 채널 발행이 PROGRESS_KEEPALIVE 동안 없을 때도 DB에서 종료 여부 확인
+"""
+
+import asyncio
+import logging
+import time
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal
+from app.models.bulk_sms_job import BulkSMSJob
+
+logger = logging.getLogger(__name__)
+
+# 설정
+PROGRESS_POLL_INTERVAL = 2.0  # 채널이 없을 때 DB 조회 간격 (초)
+PROGRESS_KEEPALIVE = 15.0  # 이벤트가 없을 때 연결 유지 신호 간격 (초)
+
+# 종료 상태 (최종 이벤트 전송 후 스트림 종료)
+FINAL_STATUSES = ("completed", "partial_failed", "failed")
+
+
+class _JobChannel:
+    """Job 진행 상황 채널 (최신 상태 1건 + 변경 알림)"""
+
+    __slots__ = ("state", "version", "closed", "_changed")
+
+    def __init__(self):
+        self.state: Optional[dict] = None
+        self.version = 0
+        self.closed = False  # 이 워커의 발행 종료 (구독자는 DB 조회로 전환)
+        self._changed = asyncio.Event()
+
+    def publish(self, state: dict):
+        self.state = state
+        self.version += 1
+        # 대기 중인 구독자를 모두 깨우고 다음 변경은 새 이벤트로 알림
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait(self, version: int, timeout: float) -> bool:
+        """version 이후 변경이 있을 때까지 대기 (타임아웃 시 False)"""
+        if self.version != version:
+            return True
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def close(self):
+        """발행 종료 (대기 중인 구독자를 깨움)"""
+        self.closed = True
+        self._changed.set()
+
+
+class BulkSMSProgressHub:
+    """대량 발송 Job별 진행 상황 채널 관리 (프로세스 단위)"""
+
+    def __init__(self):
+        self._channels: dict[int, _JobChannel] = {}
+
+    def get(self, job_id: int) -> Optional[_JobChannel]:
+        return self._channels.get(job_id)
+
+    def publish(self, job_id: int, event: str, state: dict):
+        """
+        Job 최신 상태 발행
+
+        Args:
+            job_id: Job ID
+            event: 이벤트 종류 (started, batch, waiting, finished)
+            state: build_progress_state 결과
+        """
+        channel = self._channels.get(job_id)
+        if channel is None:
+            channel = self._channels[job_id] = _JobChannel()
+        channel.publish({**state, "event": event})
+
+        # 종료된 Job은 채널 제거 (이미 구독 중인 클라이언트는 채널 참조로 최종 상태 수신)
+        if state["status"] in FINAL_STATUSES:
+            self._channels.pop(job_id, None)
+
+    def discard(self, job_id: int):
+        """
+        종료 상태를 발행하지 않고 채널 제거 (이 워커의 발송 종료, Job 완료는 다른 워커가 처리)
+
+        Args:
+            job_id: Job ID
+        """
+        channel = self._channels.pop(job_id, None)
+        if channel is not None:
+            channel.close()
+
+
+def build_progress_state(
+    job_id: int,
+    status: str,
+    total_count: Optional[int],
+    sent_count: Optional[int],
+    failed_count: Optional[int],
+    current_batch: Optional[int],
+    total_batches: Optional[int],
+) -> dict:
+    """진행 상황 상태 생성 (실패 수신자 목록은 제외)"""
+    total = total_count or 0
+    processed = (sent_count or 0) + (failed_count or 0)
+    return {
+        "job_id": job_id,
+        "status": status,
+        "total_count": total,
+        "sent_count": sent_count or 0,
+        "failed_count": failed_count or 0,
+        "progress": round(processed / total * 100, 1) if total else 0.0,
+        "current_batch": current_batch or 0,
+        "total_batches": total_batches or 0,
+    }
+
+
+async def _load_progress(job_id: int) -> Optional[dict]:
+    """Job 진행 컬럼만 조회 (failed_recipients 제외)"""
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(
+                BulkSMSJob.status,
+                BulkSMSJob.total_count,
+                BulkSMSJob.sent_count,
+                BulkSMSJob.failed_count,
+                BulkSMSJob.current_batch,
+                BulkSMSJob.total_batches,
+            ).where(BulkSMSJob.id == job_id)
+        )
+        row = result.one_or_none()
+
+    if row is None:
+        return None
+    state = build_progress_state(job_id, *row)
+    return {**state, "event": "finished" if row.status in FINAL_STATUSES else "snapshot"}
+
+
+async def stream_bulk_sms_progress(job_id: int) -> AsyncIterator[Optional[dict]]:
+    """
+    Job 진행 상황 구독
+
+    최초 1회 현재 상태를 보낸 뒤 변경될 때마다 최신 상태를 보내고,
+    종료 상태를 보내면 끝난다. 변경이 없으면 PROGRESS_KEEPALIVE마다 None을 보낸다.
+    채널이 닫히거나 PROGRESS_KEEPALIVE 동안 발행이 없으면 DB에서 진행 상황을 다시 조회한다.
+
+    Args:
+        job_id: Job ID
+
+    Yields:
+        진행 상황 (sent_delta, failed_delta 포함) 또는 연결 유지용 None
+    """
+    last: Optional[dict] = None
+    seen: tuple = (None, -1)  # (채널, 버전)
+    last_sent_at = time.monotonic()
+
+    while True:
+        channel = bulk_sms_progress_hub.get(job_id)
+        if channel is None and seen[0] is not None and not seen[0].closed:
+            # 구독 중 Job이 종료되어 채널이 제거된 경우에도 최종 상태는 기존 채널에 남아 있음
+            channel = seen[0]
+
+        state = None
+        if channel is not None and channel.state is not None and not channel.closed:
+            if seen != (channel, channel.version):
+                state = channel.state
+                seen = (channel, channel.version)
+            elif await channel.wait(seen[1], PROGRESS_KEEPALIVE):
+                continue
+            else:
+                # 발행이 없는 동안 다른 워커가 Job을 완료했을 수 있으므로 DB에서 종료 여부 확인
+                state = await _load_progress(job_id)
+                if state is None:
+                    return
+                if state["status"] not in FINAL_STATUSES:
+                    yield None
+                    last_sent_at = time.monotonic()
+                    continue
+        else:
+            state = await _load_progress(job_id)
+            if state is None:
+                return
+            if last is not None and all(
+                state[key] == last[key] for key in ("status", "sent_count", "failed_count", "current_batch")
+            ):
+                state = None
+
+        if state is None:
+            if time.monotonic() - last_sent_at >= PROGRESS_KEEPALIVE:
+                yield None
+                last_sent_at = time.monotonic()
+            await asyncio.sleep(PROGRESS_POLL_INTERVAL)
+            continue
+
+        yield {
+            **state,
+            "sent_delta": state["sent_count"] - (last["sent_count"] if last else 0),
+            "failed_delta": state["failed_count"] - (last["failed_count"] if last else 0),
+        }
+        last = state
+        last_sent_at = time.monotonic()
+
+        if state["status"] in FINAL_STATUSES:
+            return
+
+
+bulk_sms_progress_hub = BulkSMSProgressHub()
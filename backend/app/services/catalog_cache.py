@@ -0,0 +1,246 @@
+"""
+Catalog Cache
+공개 카탈로그(서비스/지역) 응답 사전 직렬화 캐시
+
+- 기준 데이터 스냅샷(reference_data)에서 응답 JSON을 한 번만 직렬화하여 bytes로 보관
+- 스냅샷이 교체될 때(기준 데이터 테이블 변경 시)만 다시 직렬화
+- 응답 본문 해시로 강한 ETag 생성, If-None-Match 일치 시 본문 없이 304 응답
+- 기준 데이터 캐시가 유효한 동안은 DB 접근 없음 (엔드포인트는 요청 세션을 열지 않음)
+"""
+
+import hashlib
+from typing import Callable, Hashable, Optional
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.schemas.catalog import CatalogBootstrapResponse
+from app.schemas.region import DistrictResponse, ProvinceResponse, ProvinceWithDistrictsResponse
+from app.schemas.service import (
+    ServiceCategoryResponse,
+    ServiceCategoryWithTypesResponse,
+    ServicesListResponse,
+    ServiceTypeResponse,
+)
+from app.services.reference_data import ReferenceData
+
+# 브라우저/CDN 캐시 60초, 이후 ETag로 재검증
+CATALOG_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+JSON_MEDIA_TYPE = "application/json"
+
+
+class RenderedResponse:
+    """직렬화된 응답 본문 + ETag"""
+
+    __slots__ = ("body", "etag")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+class CatalogCache:
+    """기준 데이터 스냅샷별 직렬화 응답 캐시 (프로세스 단위)"""
+
+    def __init__(self):
+        self._reference: Optional[ReferenceData] = None
+        self._entries: dict[Hashable, RenderedResponse] = {}
+
+    def get(
+        self,
+        reference: ReferenceData,
+        key: Hashable,
+        render: Callable[[ReferenceData], bytes],
+    ) -> RenderedResponse:
+        """
+        직렬화된 응답 조회 (없으면 render로 생성)
+
+        Args:
+            reference: 현재 기준 데이터 스냅샷
+            key: 응답 종류 + 파라미터
+            render: 스냅샷 → JSON bytes
+        """
+        if reference is not self._reference:
+            # 스냅샷 교체(기준 데이터 변경) 시 전체 재생성
+            self._reference = reference
+            self._entries = {}
+
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = RenderedResponse(render(reference))
+            self._entries[key] = entry
+        return entry
+
+
+catalog_cache = CatalogCache()
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+def catalog_response(
+    request: Request,
+    reference: ReferenceData,
+    key: Hashable,
+    render: Callable[[ReferenceData], bytes],
+) -> Response:
+    """
+    카탈로그 응답 생성 (ETag / Cache-Control 포함, If-None-Match 일치 시 304)
+
+    Args:
+        request: 요청 (If-None-Match 확인용)
+        reference: get_reference_data()로 조회한 기준 데이터 스냅샷
+        key: 응답 종류 + 파라미터
+        render: 스냅샷 → JSON bytes
+    """
+    rendered = catalog_cache.get(reference, key, render)
+    headers = {"ETag": rendered.etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+
+    if _etag_matches(request.headers.get("if-none-match"), rendered.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=rendered.body, media_type=JSON_MEDIA_TYPE, headers=headers)
+
+
+def _dump_list(items: list[BaseModel]) -> bytes:
+    return b"[" + b",".join(item.model_dump_json().encode() for item in items) + b"]"
+
+
+# ===== 서비스 =====
+
+def _service_type(service_type) -> ServiceTypeResponse:
+    # 준비 중인 서비스는 비활성으로 표시 (프론트엔드 '준비 중' UI용)
+    return ServiceTypeResponse(
+        code=service_type.code,
+        name=service_type.name,
+        category_code=service_type.category_code,
+        description=service_type.description,
+        sort_order=service_type.sort_order,
+        is_active=bool(service_type.is_active) and service_type.booking_status != "PREPARING",
+        booking_status=service_type.booking_status,
+    )
+
+
+def _filter_service_types(reference: ReferenceData, include_inactive: bool) -> list:
+    return [
+        service_type for service_type in reference.service_types
+        if include_inactive or service_type.is_active
+    ]
+
+
+def _active_categories(reference: ReferenceData) -> list:
+    return [category for category in reference.categories if category.is_active]
+
+
+def build_services_list(reference: ReferenceData, include_inactive: bool) -> ServicesListResponse:
+    """전체 서비스 목록 (활성 카테고리 + 카테고리별 서비스 타입)"""
+    types_by_category: dict[str, list[ServiceTypeResponse]] = {}
+    service_types = sorted(
+        _filter_service_types(reference, include_inactive),
+        key=lambda service_type: service_type.sort_order or 0,
+    )
+    for service_type in service_types:
+        types_by_category.setdefault(service_type.category_code, []).append(_service_type(service_type))
+
+    return ServicesListResponse(categories=[
+        ServiceCategoryWithTypesResponse(
+            code=category.code,
+            name=category.name,
+            icon=category.icon,
+            description=category.description,
+            sort_order=category.sort_order,
+            services=types_by_category.get(category.code, []),
+        )
+        for category in _active_categories(reference)
+    ])
+
+
+def render_services_list(include_inactive: bool) -> Callable[[ReferenceData], bytes]:
+    return lambda reference: build_services_list(reference, include_inactive).model_dump_json().encode()
+
+
+def render_service_categories(reference: ReferenceData) -> bytes:
+    return _dump_list([
+        ServiceCategoryResponse.model_validate(category)
+        for category in _active_categories(reference)
+    ])
+
+
+def render_service_types(category_code: Optional[str], include_inactive: bool) -> Callable[[ReferenceData], bytes]:
+    def render(reference: ReferenceData) -> bytes:
+        return _dump_list([
+            _service_type(service_type)
+            for service_type in _filter_service_types(reference, include_inactive)
+            if not category_code or service_type.category_code == category_code
+        ])
+    return render
+
+
+# ===== 지역 =====
+
+def _active_provinces(reference: ReferenceData) -> list:
+    return [province for province in reference.provinces if province.is_active]
+
+
+def build_all_regions(reference: ReferenceData) -> list[ProvinceWithDistrictsResponse]:
+    """전체 지역 목록 (활성 시/도 + 하위 활성 시/군/구)"""
+    districts_by_province: dict[str, list[DistrictResponse]] = {}
+    for district in reference.districts:
+        if district.is_active:
+            districts_by_province.setdefault(district.province_code, []).append(
+                DistrictResponse.model_validate(district)
+            )
+
+    return [
+        ProvinceWithDistrictsResponse(
+            code=province.code,
+            name=province.name,
+            short_name=province.short_name,
+            districts=districts_by_province.get(province.code, []),
+        )
+        for province in _active_provinces(reference)
+    ]
+
+
+def render_all_regions(reference: ReferenceData) -> bytes:
+    return _dump_list(build_all_regions(reference))
+
+
+def render_provinces(reference: ReferenceData) -> bytes:
+    return _dump_list([
+        ProvinceResponse.model_validate(province)
+        for province in _active_provinces(reference)
+    ])
+
+
+def render_districts(province_code: str) -> Callable[[ReferenceData], bytes]:
+    return lambda reference: _dump_list([
+        DistrictResponse.model_validate(district)
+        for district in reference.districts
+        if district.is_active and district.province_code == province_code
+    ])
+
+
+def has_active_province(reference: ReferenceData, province_code: str) -> bool:
+    """활성 시/도 코드 여부"""
+    return any(province.code == province_code for province in _active_provinces(reference))
+
+
+def has_service_category(reference: ReferenceData, category_code: str) -> bool:
+    """서비스 타입이 있는 카테고리 코드 여부"""
+    return any(service_type.category_code == category_code for service_type in reference.service_types)
+
+
+# ===== 부트스트랩 =====
+
+def render_bootstrap(reference: ReferenceData) -> bytes:
+    """공개 사이트 초기 데이터 (서비스 목록 + 전체 지역) 단일 응답"""
+    return CatalogBootstrapResponse(
+        services=build_services_list(reference, include_inactive=True),
+        regions=build_all_regions(reference),
+    ).model_dump_json().encode()
@@ -0,0 +1,186 @@
+"""
+Dashboard Counter Service
+관리자 대시보드 카운터 조회 / 일괄 변경 반영 / 주기 재집계
+
+- 조회: 상태별 카운터 + 기간 내 생성일별 카운터를 쿼리 1회로 읽음
+- 일괄 변경(UPDATE 문) 경로: apply_status_changes로 같은 트랜잭션에서 증감
+- 재집계: 원본 테이블 기준으로 카운터 전체를 다시 계산하여 누락/경합 오차 보정
+  - 여러 워커가 동시에 실행해도 advisory lock으로 한 워커만 수행
+  - 재집계 중 카운터 테이블을 잠가(SHARE ROW EXCLUSIVE) 동시 증감과 겹치지 않게 함
+    (대시보드 조회는 잠기지 않음)
+"""
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import Date, cast, delete, func, insert, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database import AsyncSessionLocal
+from app.models.dashboard_counter import (
+    COUNTED_ENTITIES,
+    DASHBOARD_DAY_WINDOW,
+    DashboardCounter,
+    created_counter_key,
+    dashboard_counter_upsert,
+    status_counter_key,
+)
+
+logger = logging.getLogger(__name__)
+
+# 설정
+RECONCILE_INTERVAL = 10 * 60  # 재집계 주기 (초)
+RECONCILE_LOCK_KEY = 2026010502  # pg_try_advisory_xact_lock 키
+
+
+async def read_dashboard_counters(db: AsyncSession, since: date) -> dict[str, int]:
+    """
+    대시보드 카운터 조회 (쿼리 1회)
+
+    Args:
+        db: 데이터베이스 세션
+        since: 생성일별 카운터 조회 시작일 (UTC)
+
+    Returns:
+        카운터 키 → 값
+    """
+    today = datetime.now(timezone.utc).date()
+    day_keys = [
+        created_counter_key(entity, since + timedelta(days=offset))
+        for entity in COUNTED_ENTITIES.values()
+        for offset in range((today - since).days + 1)
+    ]
+    result = await db.execute(
+        select(DashboardCounter.counter_key, DashboardCounter.value).where(
+            or_(
+                DashboardCounter.counter_key.like("%:status:%"),
+                DashboardCounter.counter_key.in_(day_keys),
+            )
+        )
+    )
+    return dict(result.all())
+
+
+def status_counts(counters: dict[str, int], entity: str) -> dict[str, int]:
+    """상태별 건수 (read_dashboard_counters 결과에서 추출)"""
+    prefix = f"{entity}:status:"
+    return {
+        key[len(prefix):]: value
+        for key, value in counters.items()
+        if key.startswith(prefix)
+    }
+
+
+def created_since(counters: dict[str, int], entity: str, since: date) -> int:
+    """since(UTC) 이후 생성 건수 (read_dashboard_counters 결과에서 추출)"""
+    today = datetime.now(timezone.utc).date()
+    return sum(
+        counters.get(created_counter_key(entity, since + timedelta(days=offset)), 0)
+        for offset in range((today - since).days + 1)
+    )
+
+
+async def apply_status_changes(
+    db: AsyncSession,
+    entity: str,
+    changes: Iterable[tuple[str, str]],
+):
+    """
+    UPDATE 문으로 일괄 변경한 상태를 카운터에 반영 (같은 트랜잭션)
+
+    Args:
+        db: 데이터베이스 세션
+        entity: application / partner
+        changes: (이전 상태, 새 상태) 목록
+    """
+    deltas: Counter = Counter()
+    for old_status, new_status in changes:
+        if old_status != new_status:
+            deltas[status_counter_key(entity, old_status)] -= 1
+            deltas[status_counter_key(entity, new_status)] += 1
+
+    stmt = dashboard_counter_upsert(deltas)
+    if stmt is not None:
+        await db.execute(stmt)
+
+
+async def _actual_counters(db: AsyncSession, window_start: date) -> dict[str, int]:
+    """원본 테이블 기준 카운터 값"""
+    since = datetime.combine(window_start, time.min, tzinfo=timezone.utc)
+    counters: dict[str, int] = {}
+    for model, entity in COUNTED_ENTITIES.items():
+        result = await db.execute(
+            select(model.status, func.count()).group_by(model.status)
+        )
+        for status, count in result.all():
+            counters[status_counter_key(entity, status)] = count
+
+        created_day = cast(func.timezone("UTC", model.created_at), Date)
+        result = await db.execute(
+            select(created_day, func.count())
+            .where(model.created_at >= since)
+            .group_by(created_day)
+        )
+        for day, count in result.all():
+            counters[created_counter_key(entity, day)] = count
+    return counters
+
+
+async def reconcile_dashboard_counters(db: Optional[AsyncSession] = None) -> Optional[int]:
+    """
+    대시보드 카운터 재집계
+
+    Args:
+        db: 데이터베이스 세션 (없으면 자동 생성)
+
+    Returns:
+        보정된 카운터 수 (다른 워커가 실행 중이면 None)
+    """
+    if db is None:
+        async with AsyncSessionLocal() as session:
+            return await reconcile_dashboard_counters(session)
+
+    locked = await db.scalar(
+        text("SELECT pg_try_advisory_xact_lock(:key)"), {"key": RECONCILE_LOCK_KEY}
+    )
+    if not locked:
+        await db.rollback()
+        return None
+
+    # 동시 증감 차단 후 집계 (잠금 이전에 커밋된 변경만 집계에 포함되고, 이후 변경은 잠금 해제 후 증감)
+    await db.execute(text("LOCK TABLE dashboard_counters IN SHARE ROW EXCLUSIVE MODE"))
+
+    window_start = datetime.now(timezone.utc).date() - timedelta(days=DASHBOARD_DAY_WINDOW)
+    actual = await _actual_counters(db, window_start)
+
+    result = await db.execute(select(DashboardCounter.counter_key, DashboardCounter.value))
+    current = dict(result.all())
+    corrected = sum(
+        1 for key in actual.keys() | current.keys()
+        if actual.get(key, 0) != current.get(key, 0)
+    )
+
+    await db.execute(delete(DashboardCounter))
+    if actual:
+        await db.execute(
+            insert(DashboardCounter),
+            [{"counter_key": key, "value": value} for key, value in sorted(actual.items())],
+        )
+    await db.commit()
+
+    if corrected:
+        logger.warning(f"Dashboard counters reconciled: {corrected} counter(s) corrected")
+    return corrected
+
+
+async def dashboard_counter_loop():
+    """대시보드 카운터 주기 재집계 (애플리케이션 수명 동안)"""
+    while True:
+        await asyncio.sleep(RECONCILE_INTERVAL)
+        try:
+            await reconcile_dashboard_counters()
+        except Exception as e:
+            logger.error(f"Dashboard counter reconciliation failed: {e}")
@@ -127,7 +127,27 @@ async def get_customer_applications(
     if not phone:
         return []
 
-    phone_hash = generate_search_hash(phone, "phone")
+    return await get_customer_applications_by_hash(db, generate_search_hash(phone, "phone"), limit)
+
+
+async def get_customer_applications_by_hash(
+    db: AsyncSession,
+    phone_hash: Optional[str],
+    limit: int = 10,
+) -> list[Application]:
+    """
+    동일 전화번호 해시(applications.phone_hash)의 신청 목록 조회
+
+    저장된 phone_hash를 그대로 사용하므로 전화번호 복호화/해시 계산이 필요 없다.
+
+    Args:
+        db: 데이터베이스 세션
+        phone_hash: 전화번호 해시
+        limit: 최대 조회 건수
+
+    Returns:
+        신청 목록 (최신순)
+    """
     if not phone_hash:
         return []
 
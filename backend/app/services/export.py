@@ -0,0 +1,139 @@
+"""
+Export Service
+관리자 목록 CSV 내보내기 (스트리밍)
+
+- 목록과 같은 필터 쿼리를 서버 측 커서(AsyncSession.stream, yield_per)로 EXPORT_BATCH_SIZE건씩 조회
+- 배치 단위로 복호화/행 변환(스레드에서 실행) 후 CSV 청크로 바로 전송
+  → 전체 건수와 관계없이 메모리 사용량은 배치 1개 분량으로 일정
+- 내보내기 종료(완료/중단) 시 변경 이력(audit_logs, action=export) 기록
+- Excel에서 한글이 깨지지 않도록 UTF-8 BOM 포함
+- 수식으로 해석될 수 있는 셀(=, +, -, @ 시작)은 앞에 '를 붙여 텍스트로 저장 (CSV injection 방지)
+
+스트리밍 응답은 요청 의존성(get_db) 종료 후 전송되므로 조회/이력 기록은 별도 세션을 사용한다.
+"""
+
+import asyncio
+import csv
+import io
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable, Optional, Sequence
+
+from sqlalchemy import Select
+
+from app.core.database import AsyncSessionLocal
+from app.models.admin import Admin
+from app.services.audit import log_export
+
+logger = logging.getLogger(__name__)
+
+# 설정
+EXPORT_BATCH_SIZE = 500  # 서버 측 커서 1회 조회 건수
+EXPORT_TIMEZONE = timezone(timedelta(hours=9))  # 내보내기 일시 표시 기준 (KST)
+
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+CSV_BOM = "\ufeff".encode("utf-8")  # Excel 한글 인식용
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def format_export_datetime(value: Optional[datetime]) -> str:
+    """일시 표시 (KST, 분 단위)"""
+    if value is None:
+        return ""
+    if value.tzinfo is not None:
+        value = value.astimezone(EXPORT_TIMEZONE)
+    return value.strftime("%Y-%m-%d %H:%M")
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return f"'{value}"
+    return value
+
+
+def encode_csv_rows(rows: Sequence[Sequence[Any]]) -> bytes:
+    """행 목록을 CSV 청크(bytes)로 변환"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_csv_cell(value) for value in row] for row in rows)
+    return buffer.getvalue().encode("utf-8")
+
+
+def export_filename(prefix: str) -> str:
+    """내보내기 파일명 (예: applications_20260105_143000.csv)"""
+    return f"{prefix}_{datetime.now(EXPORT_TIMEZONE).strftime('%Y%m%d_%H%M%S')}.csv"
+
+
+async def _log_export_result(
+    entity_type: str,
+    row_count: int,
+    completed: bool,
+    filters: dict[str, Any],
+    admin: Optional[Admin],
+):
+    try:
+        async with AsyncSessionLocal() as db:
+            await log_export(
+                db,
+                entity_type=entity_type,
+                row_count=row_count,
+                completed=completed,
+                filters=filters,
+                admin=admin,
+            )
+            await db.commit()
+    except Exception as e:
+        logger.error(f"Export audit log error: {e}")
+
+
+async def stream_csv_export(
+    stmt: Select,
+    header: Sequence[str],
+    build_rows: Callable[[Sequence[Any]], list[list[Any]]],
+    entity_type: str,
+    filters: dict[str, Any],
+    admin: Optional[Admin] = None,
+) -> AsyncIterator[bytes]:
+    """
+    CSV 내보내기 스트림
+
+    Args:
+        stmt: 필터/정렬이 적용된 조회 쿼리
+        header: CSV 헤더
+        build_rows: 조회 결과 배치 → CSV 행 목록 변환 함수 (복호화 포함, 스레드에서 실행)
+        entity_type: 이력 기록용 엔티티 유형 (application, partner)
+        filters: 이력 기록용 필터 값
+        admin: 내보내기 요청 관리자
+
+    Yields:
+        CSV 청크 (첫 청크는 BOM + 헤더)
+    """
+    row_count = 0
+    completed = False
+    try:
+        yield CSV_BOM + encode_csv_rows([header])
+
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+            async for partition in result.partitions():
+                rows = await asyncio.to_thread(build_rows, partition)
+                row_count += len(rows)
+                yield encode_csv_rows(rows)
+        completed = True
+    finally:
+        # 클라이언트 연결 종료(취소)에도 이력이 남도록 shield
+        await asyncio.shield(_log_export_result(
+            entity_type,
+            row_count,
+            completed,
+            {
+                key: value.isoformat() if isinstance(value, date) else value
+                for key, value in filters.items()
+                if value not in (None, "", [])
+            },
+            admin,
+        ))
+        log = logger.info if completed else logger.warning
+        log(f"Export {'finished' if completed else 'aborted'}: entity={entity_type}, rows={row_count}")
@@ -18,6 +18,12 @@ JPEG_QUALITY = 80  # JPEG 품질
 THUMBNAIL_SIZE = 300  # 썸네일 크기
 WEBP_QUALITY = 80  # WebP 품질
 
+# MMS 발송 규격 (알리고 MMS: JPG 파일, 장당 용량 제한)
+MMS_MAX_SIZE = 1000  # 최대 크기 (긴 쪽 기준)
+MMS_MAX_BYTES = 300 * 1024  # 장당 최대 용량
+MMS_JPEG_QUALITIES = (85, 75, 65, 55, 45)  # 용량 초과 시 순차적으로 낮춤
+MMS_RENDITION_PREFIX = "mms_"  # 원본 옆에 저장되는 MMS용 JPEG 파일 접두사
+
 
 def optimize_image(
     image_data: bytes,
@@ -195,6 +201,121 @@ def process_uploaded_image(
     return result
 
 
+def is_mms_compliant(source) -> bool:
+    """
+    MMS 발송 규격 충족 여부 (JPEG, 용량/해상도 제한)
+
+    Args:
+        source: 파일 경로 또는 이미지 바이트
+
+    Returns:
+        규격 충족 여부 (헤더만 읽어 판단)
+    """
+    try:
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            size = len(source)
+            fp = BytesIO(source)
+        else:
+            size = os.path.getsize(source)
+            fp = source
+
+        if size > MMS_MAX_BYTES:
+            return False
+
+        with Image.open(fp) as img:
+            return img.format == "JPEG" and max(img.size) <= MMS_MAX_SIZE
+    except Exception:
+        return False
+
+
+def render_mms_jpeg(source) -> bytes:
+    """
+    MMS 규격 JPEG 생성 (리사이즈 + 용량 제한까지 품질 조정)
+
+    Args:
+        source: 파일 경로 또는 이미지 바이트
+
+    Returns:
+        JPEG 바이트
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = BytesIO(source)
+
+    with Image.open(source) as opened:
+        img = _apply_exif_orientation(opened)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+
+        max_size = MMS_MAX_SIZE
+        while True:
+            resized = _resize_image(img, max_size)
+            for quality in MMS_JPEG_QUALITIES:
+                output = BytesIO()
+                resized.save(output, format="JPEG", quality=quality, optimize=True)
+                if output.tell() <= MMS_MAX_BYTES:
+                    return output.getvalue()
+
+            # 최저 품질로도 초과하면 해상도를 줄여 재시도
+            max_size = int(max_size * 0.75)
+            if max_size < 200:
+                return output.getvalue()
+
+
+def prepare_mms_image(image_data: bytes) -> bytes:
+    """
+    메모리 이미지의 MMS 규격 변환 (이미 규격에 맞으면 그대로 반환)
+
+    Args:
+        image_data: 이미지 바이트
+
+    Returns:
+        MMS 규격 JPEG 바이트
+    """
+    if is_mms_compliant(image_data):
+        return image_data
+    return render_mms_jpeg(image_data)
+
+
+def get_mms_rendition(file_path: str) -> str:
+    """
+    저장된 이미지의 MMS 규격 JPEG 경로 조회 (없으면 생성하여 원본 옆에 캐시)
+
+    - 원본이 이미 규격에 맞으면 원본 경로 반환
+    - mms_ 접두사 파일이 원본보다 최신이면 재변환 없이 반환
+
+    Args:
+        file_path: 원본 이미지 전체 경로
+
+    Returns:
+        MMS 발송용 JPEG 파일 경로
+    """
+    directory, filename = os.path.split(file_path)
+    rendition_path = os.path.join(
+        directory,
+        f"{MMS_RENDITION_PREFIX}{os.path.splitext(filename)[0]}.jpg",
+    )
+
+    try:
+        if os.path.getmtime(rendition_path) >= os.path.getmtime(file_path):
+            return rendition_path
+    except OSError:
+        pass
+
+    if is_mms_compliant(file_path):
+        return file_path
+
+    jpeg_data = render_mms_jpeg(file_path)
+
+    # 동시 요청 대비: 임시 파일에 쓴 뒤 원자적으로 교체
+    temp_path = f"{rendition_path}.{uuid.uuid4().hex}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(jpeg_data)
+    os.replace(temp_path, rendition_path)
+
+    logger.info(f"MMS rendition created: {rendition_path} ({len(jpeg_data)} bytes)")
+    return rendition_path
+
+
 def _apply_exif_orientation(img: Image.Image) -> Image.Image:
     """EXIF 회전 정보 적용"""
     try:
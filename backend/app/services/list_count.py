@@ -0,0 +1,169 @@
+"""
+List Count Service
+관리자 목록 전체 개수(total) 조회 전략
+
+목록 요청마다 필터 조건 전체를 COUNT하면 목록 조회 시간이 두 배가 되므로 요청의 count 옵션에 따라 처리한다.
+
+- exact: 항상 COUNT 실행 (결과는 캐시에도 저장)
+- estimate (기본):
+  - 필터 없음: pg_class 통계 추정치 (파티션 테이블은 파티션 합계)
+    추정치가 ESTIMATE_MIN_ROWS 미만이면 COUNT가 저렴하므로 정확한 개수 사용
+  - 필터 있음: 정규화한 필터 조건별로 COUNT_CACHE_TTL초 동안 캐시한 개수 (캐시 적중 시 추정치로 표시)
+- none: 개수 조회 안 함 (total = null, cursor 모드 무한 스크롤용)
+
+어떤 모드든 마지막 페이지를 조회한 경우(다음 페이지 없음)에는 COUNT 없이 정확한 개수를 계산한다.
+캐시는 워커(프로세스) 단위이며, 캐시된 개수는 최대 COUNT_CACHE_TTL초 전 값일 수 있다.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from sqlalchemy import Select, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# 설정
+COUNT_CACHE_TTL = 30  # 필터별 개수 캐시 유지 시간 (초)
+COUNT_CACHE_MAX_ENTRIES = 500  # 캐시 최대 항목 수 (오래된 항목부터 제거)
+ESTIMATE_MIN_ROWS = 10000  # 이 이상일 때만 통계 추정치 사용
+
+COUNT_QUERY_PATTERN = "^(exact|estimate|none)$"
+COUNT_QUERY_DESCRIPTION = "전체 개수 조회 방식 (exact: 정확, estimate: 추정/캐시, none: 조회 안 함)"
+
+# (scope, 정규화된 필터) → (조회 시각, 개수)
+_count_cache: "OrderedDict[tuple, tuple[float, int]]" = OrderedDict()
+
+
+def _normalize_filters(filters: dict[str, Any]) -> tuple:
+    """값이 있는 필터만 키 순서로 정렬 (같은 조건은 같은 캐시 키)"""
+    normalized = []
+    for key in sorted(filters):
+        value = filters[key]
+        if value is None or value == "":
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        elif isinstance(value, (list, tuple, set)):
+            value = tuple(sorted(str(v) for v in value))
+        else:
+            value = str(value)
+        normalized.append((key, value))
+    return tuple(normalized)
+
+
+def _cache_get(key: tuple) -> Optional[int]:
+    entry = _count_cache.get(key)
+    if entry is None:
+        return None
+    cached_at, total = entry
+    if time.monotonic() - cached_at >= COUNT_CACHE_TTL:
+        _count_cache.pop(key, None)
+        return None
+    return total
+
+
+def _cache_set(key: tuple, total: int):
+    _count_cache[key] = (time.monotonic(), total)
+    _count_cache.move_to_end(key)
+    while len(_count_cache) > COUNT_CACHE_MAX_ENTRIES:
+        _count_cache.popitem(last=False)
+
+
+async def estimate_table_rows(db: AsyncSession, table: str) -> int:
+    """
+    pg_class 통계 기반 테이블 행 수 추정 (파티션 테이블은 파티션 합계)
+
+    통계가 없으면(ANALYZE 전) 0을 반환한다.
+    """
+    result = await db.execute(
+        text("""
+            SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint
+            FROM pg_class c
+            WHERE c.oid = to_regclass(:table)
+               OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(:table))
+        """),
+        {"table": table},
+    )
+    return result.scalar() or 0
+
+
+def known_total(
+    page: int,
+    page_size: int,
+    item_count: int,
+    has_more: bool,
+    cursor: Optional[str] = None,
+) -> Optional[int]:
+    """
+    조회한 페이지로 전체 개수를 확정할 수 있으면 반환 (페이지 번호 모드의 마지막 페이지)
+
+    Args:
+        page: 페이지 번호
+        page_size: 페이지 크기
+        item_count: 현재 페이지 항목 수
+        has_more: 다음 페이지 존재 여부
+        cursor: cursor 모드면 앞쪽 개수를 알 수 없으므로 None 반환
+
+    Returns:
+        전체 개수 또는 None
+    """
+    if cursor or has_more or (item_count == 0 and page > 1):
+        return None
+    return (page - 1) * page_size + item_count
+
+
+async def count_list(
+    db: AsyncSession,
+    stmt: Select,
+    table: str,
+    filters: dict[str, Any],
+    count: str = "estimate",
+    scope: Optional[str] = None,
+    total: Optional[int] = None,
+) -> tuple[Optional[int], bool]:
+    """
+    목록 전체 개수 조회
+
+    Args:
+        db: 데이터베이스 세션
+        stmt: 필터가 적용된 목록 쿼리 (정렬/페이지 조건 적용 전)
+        table: 대상 테이블명 (필터 없을 때 통계 추정용)
+        filters: 요청 필터 값 (None/빈 값은 필터 없음으로 간주)
+        count: exact | estimate | none
+        scope: 캐시 구분 키 (같은 테이블을 다른 조건으로 조회하는 목록 구분, 기본: table)
+        total: 조회 결과로 이미 확정된 개수 (known_total)
+
+    Returns:
+        (전체 개수 - none이면 None, 추정치 여부 - 이번 요청의 COUNT / 마지막 페이지로 확정한 개수만 False)
+    """
+    if count == "none":
+        return None, False
+
+    key = (scope or table, _normalize_filters(filters))
+    if total is not None:
+        _cache_set(key, total)
+        return total, False
+
+    if count == "estimate":
+        if not key[1]:
+            estimated = await estimate_table_rows(db, table)
+            if estimated >= ESTIMATE_MIN_ROWS:
+                return estimated, True
+
+        # 캐시된 개수는 최대 COUNT_CACHE_TTL초 전 값이므로 추정치로 표시
+        cached = _cache_get(key)
+        if cached is not None:
+            return cached, True
+
+    result = await db.execute(select(func.count()).select_from(stmt.order_by(None).subquery()))
+    total = result.scalar() or 0
+    _cache_set(key, total)
+    return total, False
+
+
+def total_pages(total: Optional[int], page_size: int) -> Optional[int]:
+    """전체 페이지 수 (개수를 조회하지 않았으면 None)"""
+    if total is None:
+        return None
+    return math.ceil(total / page_size) if total > 0 else 1
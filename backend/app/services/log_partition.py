@@ -0,0 +1,268 @@
+"""
+Log Partition Service
+로그 테이블 월 단위 파티션 관리 서비스
+
+대상: sms_logs, audit_logs (created_at 기준 RANGE 파티션, 파티션명 {table}_YYYYMM)
+
+- 향후 파티션 자동 생성: 이번 달 + LOG_PARTITION_PREMAKE_MONTHS 개월을 미리 생성
+- 보관 정책: LOG_PARTITION_RETENTION_MONTHS 개월보다 오래된 파티션을 분리(DETACH)한 뒤
+  LOG_ARCHIVE_DIR/{table}/{partition}.ndjson.gz 로 내보내고 삭제
+- 여러 워커가 동시에 실행해도 advisory lock으로 한 워커만 수행
+
+파티션 경계는 UTC 월 기준 (sms_daily_stats 일자 기준과 동일).
+"""
+
+import asyncio
+import gzip
+import logging
+import os
+from datetime import date, datetime, timezone
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.core.config import settings
+from app.core.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+# 파티션 대상 테이블
+PARTITIONED_TABLES = ("sms_logs", "audit_logs")
+
+# 설정
+MAINTENANCE_INTERVAL = 6 * 60 * 60  # 주기 실행 간격 (초)
+MAINTENANCE_LOCK_KEY = 2026010501  # pg_try_advisory_lock 키
+ARCHIVE_FETCH_SIZE = 1000  # 아카이브 시 한 번에 읽는 행 수
+
+
+def month_start(value: date) -> date:
+    """해당 월 1일"""
+    return value.replace(day=1)
+
+
+def add_months(value: date, months: int) -> date:
+    """월 단위 이동 (1일 기준)"""
+    index = value.year * 12 + value.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """파티션 테이블명 ({table}_YYYYMM)"""
+    return f"{table}_{month:%Y%m}"
+
+
+def _current_month() -> date:
+    return month_start(datetime.now(timezone.utc).date())
+
+
+async def _is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    """파티션 테이블 여부 (개발 환경의 기존 일반 테이블은 관리 대상에서 제외)"""
+    result = await conn.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": table},
+    )
+    return result.scalar() == "p"
+
+
+async def list_partitions(conn: AsyncConnection, table: str) -> list[tuple[str, date, bool]]:
+    """
+    월 파티션 목록 조회 (분리된 후 아카이브되지 않은 테이블 포함)
+
+    Args:
+        conn: DB 연결
+        table: 부모 테이블명
+
+    Returns:
+        (파티션명, 시작 월, 연결 여부) 목록 (오래된 순)
+    """
+    result = await conn.execute(
+        text("""
+            SELECT c.relname, c.relispartition
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = current_schema()
+              AND c.relkind = 'r'
+              AND c.relname ~ :pattern
+            ORDER BY c.relname
+        """),
+        {"pattern": f"^{table}_[0-9]{{6}}$"},
+    )
+
+    partitions = []
+    for name, attached in result.all():
+        suffix = name[len(table) + 1:]
+        partitions.append((name, date(int(suffix[:4]), int(suffix[4:]), 1), attached))
+    return partitions
+
+
+async def ensure_future_partitions(
+    conn: AsyncConnection,
+    months_ahead: Optional[int] = None,
+) -> list[str]:
+    """
+    이번 달부터 months_ahead 개월 뒤까지의 파티션 생성 (없는 것만)
+
+    Args:
+        conn: DB 연결
+        months_ahead: 미리 생성할 개월 수 (기본: LOG_PARTITION_PREMAKE_MONTHS)
+
+    Returns:
+        생성된 파티션명 목록
+    """
+    if months_ahead is None:
+        months_ahead = settings.LOG_PARTITION_PREMAKE_MONTHS
+
+    current = _current_month()
+    created = []
+    for table in PARTITIONED_TABLES:
+        if not await _is_partitioned(conn, table):
+            logger.warning(f"{table} is not a partitioned table, skipping partition maintenance")
+            continue
+
+        existing = {name for name, _, _ in await list_partitions(conn, table)}
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            name = partition_name(table, month)
+            if name in existing:
+                continue
+            await conn.execute(text(
+                f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" '
+                f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+                f"TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+            ))
+            await conn.commit()
+            created.append(name)
+            logger.info(f"Log partition created: {name}")
+
+    await conn.commit()
+    return created
+
+
+async def _export_partition(conn: AsyncConnection, name: str, path: str) -> int:
+    """파티션 전체 행을 NDJSON.gz로 내보내기 (임시 파일 작성 후 교체)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+
+    rows = 0
+    result = await conn.stream(text(f'SELECT row_to_json(t)::text FROM "{name}" AS t ORDER BY t.id'))
+    fh = await asyncio.to_thread(gzip.open, tmp_path, "wt", encoding="utf-8")
+    try:
+        async for chunk in result.partitions(ARCHIVE_FETCH_SIZE):
+            await asyncio.to_thread(fh.write, "".join(row[0] + "\n" for row in chunk))
+            rows += len(chunk)
+    finally:
+        await asyncio.to_thread(fh.close)
+    await conn.commit()
+
+    os.replace(tmp_path, path)
+    return rows
+
+
+async def archive_old_partitions(
+    conn: AsyncConnection,
+    retention_months: int,
+    archive_dir: Optional[str] = None,
+    dry_run: bool = False,
+) -> list[dict]:
+    """
+    보관 기간이 지난 파티션 분리 → NDJSON.gz 내보내기 → 삭제
+
+    이번 달과 직전 retention_months 개월은 유지한다.
+    내보내기 도중 실패하면 분리된 테이블이 남으므로 다음 실행 시 이어서 처리된다.
+
+    Args:
+        conn: DB 연결
+        retention_months: DB 보관 개월 수 (1 이상)
+        archive_dir: 아카이브 경로 (기본: LOG_ARCHIVE_DIR)
+        dry_run: True면 대상만 반환하고 변경하지 않음
+
+    Returns:
+        [{"table", "partition", "path", "rows"}] 목록
+    """
+    if retention_months < 1:
+        return []
+    archive_dir = archive_dir or settings.LOG_ARCHIVE_DIR
+    cutoff = add_months(_current_month(), -retention_months)
+
+    archived = []
+    for table in PARTITIONED_TABLES:
+        for name, month, attached in await list_partitions(conn, table):
+            if add_months(month, 1) > cutoff:
+                continue
+
+            path = os.path.join(archive_dir, table, f"{name}.ndjson.gz")
+            if dry_run:
+                archived.append({"table": table, "partition": name, "path": path, "rows": None})
+                continue
+
+            # 1. 분리 (이후 조회/통계 쿼리 대상에서 즉시 제외)
+            if attached:
+                await conn.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{name}"'))
+                await conn.commit()
+
+            # 2. 내보내기
+            rows = await _export_partition(conn, name, path)
+
+            # 3. 삭제
+            await conn.execute(text(f'DROP TABLE "{name}"'))
+            await conn.commit()
+
+            archived.append({"table": table, "partition": name, "path": path, "rows": rows})
+            logger.info(f"Log partition archived: {name} ({rows} rows) -> {path}")
+
+    return archived
+
+
+async def run_partition_maintenance(
+    archive: bool = True,
+    retention_months: Optional[int] = None,
+    dry_run: bool = False,
+) -> dict:
+    """
+    파티션 유지보수 1회 실행 (향후 파티션 생성 + 보관 정책 적용)
+
+    Args:
+        archive: 보관 정책 적용 여부
+        retention_months: DB 보관 개월 수 (기본: LOG_PARTITION_RETENTION_MONTHS, 0이면 적용 안 함)
+        dry_run: True면 아카이브 대상만 조회
+
+    Returns:
+        {"created": [...], "archived": [...]}, 다른 워커가 실행 중이면 빈 dict
+    """
+    if retention_months is None:
+        retention_months = settings.LOG_PARTITION_RETENTION_MONTHS
+
+    async with async_engine.connect() as conn:
+        # advisory lock은 세션 단위이므로 같은 연결에서 작업 후 해제
+        result = await conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+        )
+        locked = result.scalar()
+        await conn.commit()
+        if not locked:
+            logger.info("Log partition maintenance is running in another worker, skipped")
+            return {}
+
+        try:
+            created = [] if dry_run else await ensure_future_partitions(conn)
+            archived = []
+            if archive and retention_months > 0:
+                archived = await archive_old_partitions(conn, retention_months, dry_run=dry_run)
+            return {"created": created, "archived": archived}
+        finally:
+            await conn.rollback()
+            await conn.execute(
+                text("SELECT pg_advisory_unlock(:key)"), {"key": MAINTENANCE_LOCK_KEY}
+            )
+            await conn.commit()
+
+
+async def partition_maintenance_loop():
+    """파티션 유지보수 주기 실행 (애플리케이션 수명 동안)"""
+    while True:
+        await asyncio.sleep(MAINTENANCE_INTERVAL)
+        try:
+            await run_partition_maintenance()
+        except Exception as e:
+            logger.error(f"Log partition maintenance failed: {e}")
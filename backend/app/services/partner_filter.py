@@ -0,0 +1,135 @@
+"""
+Partner Filter Service
+관리자 협력사 목록 필터 조건
+
+목록 조회, 전체 개수(count_list), 내보내기가 같은 필터 조건을 사용하도록
+요청 파라미터를 PartnerFilter로 정규화하고 SQL 조건으로 변환한다 (ApplicationFilter와 동일한 구조).
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Any, Optional
+
+from sqlalchemy import Select, String, cast, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.partner import Partner
+from app.services.search_index import detect_search_type, unified_search
+
+
+@dataclass
+class PartnerFilter:
+    """협력사 목록 필터 조건 (값이 없는 항목은 필터 없음)"""
+    status: Optional[str] = None
+    search: Optional[str] = None
+    search_type: Optional[str] = None  # auto/company/name/phone
+    date_from: Optional[date] = None
+    date_to: Optional[date] = None
+    services: list[str] = field(default_factory=list)  # 하나라도 포함 (OR)
+    region: Optional[str] = None  # 활동 지역명 (work_regions 텍스트 검색)
+    approved_by: Optional[int] = None
+
+    @classmethod
+    def from_query(
+        cls,
+        status: Optional[str] = None,
+        search: Optional[str] = None,
+        search_type: Optional[str] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        services: Optional[str] = None,
+        region: Optional[str] = None,
+        approved_by: Optional[int] = None,
+    ) -> "PartnerFilter":
+        """
+        쿼리 파라미터로 필터 생성
+
+        Args:
+            services: 서비스 코드 (콤마 구분)
+            나머지: 같은 이름의 쿼리 파라미터
+        """
+        return cls(
+            status=status or None,
+            search=search.strip() if search and search.strip() else None,
+            search_type=search_type,
+            date_from=date_from,
+            date_to=date_to,
+            services=[s.strip() for s in (services or "").split(",") if s.strip()],
+            region=region or None,
+            approved_by=approved_by,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """필터 값 (count_list 캐시 키용)"""
+        return asdict(self)
+
+    async def _search_condition(self, db: AsyncSession):
+        company_condition = Partner.company_name.ilike(f"%{self.search}%")
+        if self.search_type == "company":
+            return company_condition
+
+        detected_type = (
+            self.search_type if self.search_type and self.search_type != "auto"
+            else detect_search_type(self.search)
+        )
+        if detected_type in ("phone", "name"):
+            # 암호화된 필드 검색 (검색 인덱스 테이블 사용), 결과가 없으면 회사명 검색
+            matching_ids = await unified_search(db, "partner", self.search, detected_type)
+            if matching_ids:
+                return Partner.id.in_(matching_ids)
+
+        return company_condition
+
+    async def build_conditions(self, db: AsyncSession) -> list:
+        """
+        SQL 조건 목록 생성
+
+        Args:
+            db: 데이터베이스 세션 (검색 인덱스 조회용)
+
+        Returns:
+            WHERE 조건 목록 (AND 결합)
+        """
+        conditions = []
+
+        if self.status:
+            conditions.append(Partner.status == self.status)
+
+        if self.search:
+            conditions.append(await self._search_condition(db))
+
+        if self.date_from:
+            conditions.append(Partner.created_at >= datetime.combine(self.date_from, datetime.min.time()))
+        if self.date_to:
+            conditions.append(Partner.created_at <= datetime.combine(self.date_to, datetime.max.time()))
+
+        if self.services:
+            conditions.append(or_(*[
+                Partner.service_areas.contains([service])
+                for service in self.services
+            ]))
+
+        if self.region:
+            # work_regions 형식: [{"province": "경기도", "district": "양평군"}, ...]
+            conditions.append(cast(Partner.work_regions, String).ilike(f"%{self.region}%"))
+
+        if self.approved_by:
+            conditions.append(Partner.approved_by == self.approved_by)
+
+        return conditions
+
+    async def apply(self, db: AsyncSession, stmt: Select) -> Select:
+        """
+        쿼리에 필터 조건 적용
+
+        Args:
+            db: 데이터베이스 세션
+            stmt: Partner 컬럼/엔티티를 조회하는 쿼리
+
+        Returns:
+            필터가 적용된 쿼리
+        """
+        conditions = await self.build_conditions(db)
+        if conditions:
+            stmt = stmt.where(*conditions)
+        return stmt
@@ -0,0 +1,237 @@
+"""
+Reference Data Cache
+기준 데이터(서비스 카테고리/타입, 시/도, 시/군/구) 캐시
+
+- 시작 시(lifespan) 4개 테이블을 비동기 세션으로 로드하여 불변 스냅샷(ReferenceData)으로 보관
+- 요청 처리 중에는 DB 조회 없이 메모리 스냅샷 사용 (동기 엔진/세션 미사용, 이벤트 루프 블로킹 없음)
+- 버전: 테이블별 (건수, max(updated_at))를 단일 쿼리로 조회
+  - 현재 워커에서 변경 시 invalidate_reference_data()로 즉시 무효화
+  - 다른 워커/스크립트(seed, 마이그레이션)의 변경은 REFERENCE_DATA_CACHE_TTL 주기의 버전 확인으로 반영
+- 스냅샷은 교체만 되고 수정되지 않으므로 반환된 매핑/목록은 읽기 전용으로 사용
+"""
+
+import asyncio
+import time
+import logging
+from typing import Any, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.region import Province, District
+from app.models.service import ServiceCategory, ServiceType
+
+logger = logging.getLogger(__name__)
+
+# 버전 확인 대상 테이블
+REFERENCE_MODELS = (ServiceCategory, ServiceType, Province, District)
+
+
+class ReferenceData:
+    """
+    기준 데이터 스냅샷 (활성/비활성 모두 포함, 정렬순)
+
+    각 목록은 컬럼 조회 결과(Row) 튜플:
+    - categories: code, name, icon, description, sort_order, is_active
+    - service_types: code, name, category_code, description, sort_order, is_active, booking_status
+    - provinces: code, name, short_name, sort_order, is_active
+    - districts: code, province_code, name, sort_order, is_active
+    """
+
+    __slots__ = (
+        "version",
+        "categories",
+        "service_types",
+        "provinces",
+        "districts",
+        "service_names",
+        "service_codes",
+        "service_types_by_code",
+    )
+
+    def __init__(
+        self,
+        version: tuple,
+        categories: tuple,
+        service_types: tuple,
+        provinces: tuple,
+        districts: tuple,
+    ):
+        self.version = version
+        self.categories = categories
+        self.service_types = service_types
+        self.provinces = provinces
+        self.districts = districts
+
+        # 서비스 코드 ↔ 이름 (비활성 서비스 포함: 과거 신청/배정의 코드도 이름으로 표시)
+        self.service_names: dict[str, str] = {t.code: t.name for t in service_types}
+        self.service_codes: dict[str, str] = {t.name: t.code for t in service_types}
+        self.service_types_by_code: dict[str, Any] = {t.code: t for t in service_types}
+
+
+def _version_query():
+    columns = []
+    for model in REFERENCE_MODELS:
+        columns.append(select(func.count(model.id)).scalar_subquery())
+        columns.append(select(func.max(model.updated_at)).scalar_subquery())
+    return select(*columns)
+
+
+class ReferenceDataRegistry:
+    """기준 데이터 레지스트리 (프로세스 단위)"""
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._data: Optional[ReferenceData] = None
+        self._checked_at = 0.0
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def current(self) -> Optional[ReferenceData]:
+        """현재 스냅샷 (DB 확인 없음, 로드 전이면 None)"""
+        return self._data
+
+    async def _fetch_version(self, db: AsyncSession) -> tuple:
+        result = await db.execute(_version_query())
+        return tuple(result.one())
+
+    async def load(self, db: AsyncSession) -> ReferenceData:
+        """
+        기준 데이터 전체 로드
+
+        Returns:
+            새 스냅샷
+        """
+        version = await self._fetch_version(db)
+
+        categories = await db.execute(
+            select(
+                ServiceCategory.code,
+                ServiceCategory.name,
+                ServiceCategory.icon,
+                ServiceCategory.description,
+                ServiceCategory.sort_order,
+                ServiceCategory.is_active,
+            ).order_by(ServiceCategory.sort_order, ServiceCategory.id)
+        )
+        service_types = await db.execute(
+            select(
+                ServiceType.code,
+                ServiceType.name,
+                ServiceType.category_code,
+                ServiceType.description,
+                ServiceType.sort_order,
+                ServiceType.is_active,
+                ServiceType.booking_status,
+            ).order_by(ServiceType.category_code, ServiceType.sort_order, ServiceType.id)
+        )
+        provinces = await db.execute(
+            select(
+                Province.code,
+                Province.name,
+                Province.short_name,
+                Province.sort_order,
+                Province.is_active,
+            ).order_by(Province.sort_order, Province.code)
+        )
+        districts = await db.execute(
+            select(
+                District.code,
+                District.province_code,
+                District.name,
+                District.sort_order,
+                District.is_active,
+            ).order_by(District.sort_order, District.code)
+        )
+
+        data = ReferenceData(
+            version=version,
+            categories=tuple(categories.all()),
+            service_types=tuple(service_types.all()),
+            provinces=tuple(provinces.all()),
+            districts=tuple(districts.all()),
+        )
+        self._data = data
+        self._checked_at = time.monotonic()
+        self._loaded = True
+
+        logger.info(
+            f"Reference data loaded: {len(data.categories)} categories, "
+            f"{len(data.service_types)} service types, "
+            f"{len(data.provinces)} provinces, {len(data.districts)} districts"
+        )
+        return data
+
+    def invalidate(self):
+        """캐시 무효화 (다음 조회 시 다시 로드)"""
+        self._loaded = False
+
+    def _is_fresh(self) -> bool:
+        return self._loaded and time.monotonic() - self._checked_at < self._ttl
+
+    async def _ensure_fresh(self, db: AsyncSession):
+        async with self._lock:
+            # 대기 중 다른 요청이 갱신했으면 생략
+            if self._is_fresh():
+                return
+
+            if not self._loaded:
+                await self.load(db)
+                return
+
+            # 다른 워커의 변경 확인
+            self._checked_at = time.monotonic()
+            version = await self._fetch_version(db)
+            if version != self._data.version:
+                logger.info("Reference data changed, reloading cache")
+                await self.load(db)
+
+    async def get(self, db: Optional[AsyncSession] = None) -> ReferenceData:
+        """
+        기준 데이터 스냅샷 조회
+
+        Args:
+            db: 데이터베이스 세션 (캐시 갱신이 필요할 때만 사용, 없으면 자동 생성)
+
+        Returns:
+            ReferenceData
+        """
+        if not self._is_fresh():
+            if db is None:
+                async with AsyncSessionLocal() as session:
+                    await self._ensure_fresh(session)
+            else:
+                await self._ensure_fresh(db)
+
+        return self._data
+
+
+reference_data_registry = ReferenceDataRegistry(ttl=settings.REFERENCE_DATA_CACHE_TTL)
+
+
+async def get_reference_data(db: Optional[AsyncSession] = None) -> ReferenceData:
+    """기준 데이터 스냅샷 조회 (reference_data_registry.get)"""
+    return await reference_data_registry.get(db)
+
+
+async def load_reference_data_async(db: AsyncSession) -> int:
+    """
+    애플리케이션 시작 시 기준 데이터 캐시 로드
+
+    Returns:
+        로드된 서비스 타입 수
+    """
+    try:
+        data = await reference_data_registry.load(db)
+        return len(data.service_types)
+    except Exception as e:
+        logger.error(f"Failed to load reference data cache: {e}")
+        return 0
+
+
+def invalidate_reference_data():
+    """기준 데이터 변경 시 호출 (현재 워커 즉시 반영)"""
+    reference_data_registry.invalidate()
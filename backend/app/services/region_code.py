@@ -0,0 +1,206 @@
+"""
+Region Code Service
+주소 → 행정구역 코드 변환 서비스
+
+신청 주소는 암호화 저장되므로 DB에서 지역 조건으로 검색할 수 없다.
+신청 접수 시점(평문 주소 보유)에 시/도, 시/군/구 코드를 도출하여
+applications.province_code / district_code (평문, 인덱스)에 저장하고,
+지역 필터(대량 SMS, 관리자 목록)는 이 코드에 대한 SQL 조건으로 처리한다.
+
+지역 데이터는 provinces / districts 테이블(seed_regions)을 기준 데이터 캐시(reference_data)로 조회한다.
+"""
+
+import logging
+from typing import Optional
+
+from sqlalchemy import or_, false
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.application import Application
+from app.services.reference_data import get_reference_data
+
+logger = logging.getLogger(__name__)
+
+# 구 명칭 → 현재 short_name (행정구역 개편 전 주소 대응)
+_PROVINCE_ALIASES = {
+    "강원도": "강원",
+    "전라북도": "전북",
+    "서울시": "서울",
+    "세종시": "세종",
+    "제주도": "제주",
+}
+
+
+class RegionMatcher:
+    """주소 문자열을 행정구역 코드로 매칭"""
+
+    def __init__(self, provinces: list[tuple[str, str, str]], districts: list[tuple[str, str, str]]):
+        """
+        Args:
+            provinces: (code, name, short_name) 목록
+            districts: (code, province_code, name) 목록
+        """
+        # 시/도 토큰 → 코드 (전체 이름, 짧은 이름, 구 명칭)
+        self._province_by_token: dict[str, str] = {}
+        short_to_code: dict[str, str] = {}
+        for code, name, short_name in provinces:
+            self._province_by_token[name] = code
+            self._province_by_token[short_name] = code
+            short_to_code[short_name] = code
+        for alias, short_name in _PROVINCE_ALIASES.items():
+            if short_name in short_to_code:
+                self._province_by_token.setdefault(alias, short_to_code[short_name])
+
+        # 시/군/구: 시/도별 이름 → 코드, 전체 이름 → 코드 목록 (동명 구 존재: 중구, 동구 등)
+        self._districts_by_province: dict[str, dict[str, str]] = {}
+        self._districts_by_name: dict[str, list[str]] = {}
+        self._province_of_district: dict[str, str] = {}
+        for code, province_code, name in districts:
+            self._districts_by_province.setdefault(province_code, {})[name] = code
+            self._districts_by_name.setdefault(name, []).append(code)
+            self._province_of_district[code] = province_code
+
+    @property
+    def is_loaded(self) -> bool:
+        """지역 데이터 로드 여부"""
+        return bool(self._province_by_token)
+
+    def match(self, address: Optional[str]) -> tuple[Optional[str], Optional[str]]:
+        """
+        주소에서 시/도, 시/군/구 코드 도출
+
+        Args:
+            address: 평문 주소 (예: "경기 양평군 양평읍 ...", "경기도 수원시 영통구 ...")
+
+        Returns:
+            (province_code, district_code) - 매칭 실패 시 None
+        """
+        if not address:
+            return None, None
+
+        tokens = address.split()
+        if not tokens:
+            return None, None
+
+        province_code = self._province_by_token.get(tokens[0])
+
+        if province_code:
+            districts = self._districts_by_province.get(province_code, {})
+            for token in tokens[1:3]:
+                if token in districts:
+                    return province_code, districts[token]
+            # 시/군/구가 하나뿐인 시/도 (세종)
+            if len(districts) == 1:
+                return province_code, next(iter(districts.values()))
+            return province_code, None
+
+        # 시/도 생략 주소: 시/군/구 이름이 유일할 때만 매칭
+        codes = self._districts_by_name.get(tokens[0], [])
+        if len(codes) == 1:
+            return self._province_of_district[codes[0]], codes[0]
+
+        return None, None
+
+    def resolve_filter(self, value: str) -> tuple[list[str], list[str]]:
+        """
+        지역 필터 값을 코드 목록으로 변환
+
+        Args:
+            value: 시/도 코드(2자리), 시/군/구 코드(5자리), 또는 지역명 ("경기", "양평군")
+
+        Returns:
+            (province_codes, district_codes)
+        """
+        value = value.strip()
+        if value.isdigit():
+            if len(value) == 2:
+                return [value], []
+            if len(value) == 5:
+                return [], [value]
+            return [], []
+
+        if value in self._province_by_token:
+            return [self._province_by_token[value]], []
+
+        # "경기 양평군" 형태
+        province_code, district_code = self.match(value)
+        if district_code:
+            return [], [district_code]
+
+        # 동명 시/군/구는 모두 포함 (예: "중구")
+        return [], list(self._districts_by_name.get(value, []))
+
+
+# (기준 데이터 버전, 매처) - 기준 데이터가 갱신되면 다시 생성
+_region_matcher: Optional[tuple[tuple, RegionMatcher]] = None
+
+
+async def get_region_matcher(db: Optional[AsyncSession] = None) -> RegionMatcher:
+    """
+    지역 매처 조회 (기준 데이터 캐시 기반, 버전이 바뀔 때만 다시 생성)
+
+    Args:
+        db: 데이터베이스 세션 (기준 데이터 갱신이 필요할 때만 사용)
+
+    Returns:
+        RegionMatcher
+    """
+    global _region_matcher
+
+    reference = await get_reference_data(db)
+    if _region_matcher is not None and _region_matcher[0] == reference.version:
+        return _region_matcher[1]
+
+    matcher = RegionMatcher(
+        [(p.code, p.name, p.short_name) for p in reference.provinces],
+        [(d.code, d.province_code, d.name) for d in reference.districts],
+    )
+    _region_matcher = (reference.version, matcher)
+    logger.info("Region matcher loaded")
+    return matcher
+
+
+async def derive_region_codes(
+    db: AsyncSession,
+    address: Optional[str],
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    평문 주소에서 시/도, 시/군/구 코드 도출
+
+    Args:
+        db: 데이터베이스 세션
+        address: 평문 주소
+
+    Returns:
+        (province_code, district_code)
+    """
+    try:
+        matcher = await get_region_matcher(db)
+        return matcher.match(address)
+    except Exception as e:
+        logger.warning(f"Failed to derive region codes: {e}")
+        return None, None
+
+
+async def build_application_region_condition(db: AsyncSession, region: str):
+    """
+    신청 지역 필터 SQL 조건 생성
+
+    Args:
+        db: 데이터베이스 세션
+        region: 시/도 코드, 시/군/구 코드, 또는 지역명
+
+    Returns:
+        SQLAlchemy 조건 (매칭되는 지역이 없으면 항상 거짓)
+    """
+    matcher = await get_region_matcher(db)
+    province_codes, district_codes = matcher.resolve_filter(region)
+
+    conditions = []
+    if province_codes:
+        conditions.append(Application.province_code.in_(province_codes))
+    if district_codes:
+        conditions.append(Application.district_code.in_(district_codes))
+    if not conditions:
+        return false()
+    return or_(*conditions)
@@ -0,0 +1,87 @@
+"""
+Schedule Stats Service
+일정 캘린더 집계 (신청 기준 / 배정 기준)
+
+- 신청(applications)과 배정(application_partner_assignments)의 일정을
+  GROUP BY scheduled_date, status로 DB에서 집계 (UNION ALL 쿼리 1회)
+- 행을 불러오지 않고 (scheduled_date, status) 인덱스만으로 집계
+- 취소된 일정은 제외 (일정 목록 기본 필터와 동일)
+"""
+
+from datetime import date
+
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.application import Application
+from app.models.application_assignment import ApplicationPartnerAssignment
+
+# 캘린더 종류 → 모델
+SCHEDULE_SOURCES = {
+    "application": Application,  # 레거시 (Application.scheduled_date)
+    "assignment": ApplicationPartnerAssignment,  # 배정 기준 (권장)
+}
+
+
+def _grouped_counts(source: str, model, start: date, end: date):
+    return (
+        select(
+            literal(source).label("source"),
+            model.scheduled_date,
+            model.status,
+            func.count().label("count"),
+        )
+        .where(
+            model.scheduled_date >= start,
+            model.scheduled_date < end,
+            model.status != "cancelled",
+        )
+        .group_by(model.scheduled_date, model.status)
+    )
+
+
+def _empty_calendar() -> dict:
+    return {
+        "total_scheduled": 0,
+        "completed": 0,
+        "pending": 0,
+        "by_date": {},
+        "by_status": {},
+        "by_date_status": {},
+    }
+
+
+async def get_schedule_calendars(db: AsyncSession, start: date, end: date) -> dict[str, dict]:
+    """
+    기간 내 일정 집계 (신청 기준 + 배정 기준)
+
+    Args:
+        db: 데이터베이스 세션
+        start: 시작일 (포함)
+        end: 종료일 (미포함)
+
+    Returns:
+        캘린더 종류(application / assignment) → 집계
+        (total_scheduled, completed, pending, by_date, by_status, by_date_status)
+    """
+    query = union_all(*(
+        _grouped_counts(source, model, start, end)
+        for source, model in SCHEDULE_SOURCES.items()
+    ))
+    result = await db.execute(query)
+
+    calendars = {source: _empty_calendar() for source in SCHEDULE_SOURCES}
+    for source, scheduled_date, status, count in result.all():
+        calendar = calendars[source]
+        date_str = scheduled_date.isoformat()
+
+        calendar["total_scheduled"] += count
+        if status == "completed":
+            calendar["completed"] += count
+        calendar["by_date"][date_str] = calendar["by_date"].get(date_str, 0) + count
+        calendar["by_status"][status] = calendar["by_status"].get(status, 0) + count
+        calendar["by_date_status"].setdefault(date_str, {})[status] = count
+
+    for calendar in calendars.values():
+        calendar["pending"] = calendar["total_scheduled"] - calendar["completed"]
+    return calendars
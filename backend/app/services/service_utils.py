@@ -1,62 +1,31 @@
 """
 서비스 코드 → 이름 변환 유틸리티
-DB service_types 테이블 기반 동적 변환
+DB service_types 테이블 기반 동적 변환 (기준 데이터 캐시 사용, 요청 중 DB 조회 없음)
 """
 
-from functools import lru_cache
-from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.models.service import ServiceType
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.reference_data import get_reference_data
 
-@lru_cache(maxsize=1)
-def _get_service_code_to_name_map(cache_key: str = "default") -> dict[str, str]:
-    """
-    서비스 코드 → 이름 매핑 조회 (캐시됨)
 
-    Note: lru_cache는 세션 간에 공유되지 않으므로,
-    이 함수는 앱 시작 시 한 번만 호출되어야 합니다.
-    실제 운영에서는 Redis 등의 외부 캐시 사용 권장.
+async def get_service_code_to_name_map(db: Optional[AsyncSession] = None) -> dict[str, str]:
     """
-    return {}
-
+    서비스 코드 → 이름 매핑 조회 (기준 데이터 캐시, 읽기 전용)
 
-@lru_cache(maxsize=1)
-def _get_cached_service_map(cache_key: int) -> dict[str, str]:
-    """
-    실제 DB 조회를 수행하고 결과를 캐싱하는 내부 함수.
-    cache_key는 시간(분 단위) 등을 사용하여 주기적으로 갱신되도록 함.
-    """
-    # ⚠️ 순환 참조 방지를 위해 함수 내부에서 import
-    from app.core.database import SessionLocal
-    
-    db = SessionLocal()
-    try:
-        service_types = db.query(ServiceType.code, ServiceType.name).all()
-        return {st.code: st.name for st in service_types}
-    finally:
-        db.close()
-
-
-def get_service_code_to_name_map(db: Session = None) -> dict[str, str]:
-    """
-    서비스 코드 → 이름 매핑 조회 (10분 캐시)
-    
     Args:
-        db: 데이터베이스 세션 (캐시된 경우 사용되지 않음)
+        db: 데이터베이스 세션 (캐시 갱신이 필요할 때만 사용)
 
     Returns:
         서비스 코드를 키로, 서비스 이름을 값으로 하는 딕셔너리
     """
-    # 10분 단위로 캐시 키 변경 (600초)
-    import time
-    cache_key = int(time.time() / 600)
-    return _get_cached_service_map(cache_key)
+    reference = await get_reference_data(db)
+    return reference.service_names
 
 
-def convert_service_codes_to_names(
-    db: Session,
+async def convert_service_codes_to_names(
+    db: Optional[AsyncSession],
     codes: list[str] | None
 ) -> list[str]:
     """
@@ -73,7 +42,7 @@ def convert_service_codes_to_names(
     if not codes:
         return []
 
-    code_to_name = get_service_code_to_name_map(db)
+    code_to_name = await get_service_code_to_name_map(db)
     return [code_to_name.get(code, code) for code in codes]
 
 
@@ -102,8 +71,8 @@ def convert_service_codes_with_map(
     return [service_map.get(code, code) for code in codes]
 
 
-def convert_service_code_to_name(
-    db: Session,
+async def convert_service_code_to_name(
+    db: Optional[AsyncSession],
     code: str | None
 ) -> str | None:
     """
@@ -120,13 +89,13 @@ def convert_service_code_to_name(
     if not code:
         return None
 
-    code_to_name = get_service_code_to_name_map(db)
+    code_to_name = await get_service_code_to_name_map(db)
     return code_to_name.get(code, code)
 
 
-def get_service_name_to_code_map(db: Session) -> dict[str, str]:
+async def get_service_name_to_code_map(db: Optional[AsyncSession] = None) -> dict[str, str]:
     """
-    서비스 이름 → 코드 매핑 조회
+    서비스 이름 → 코드 매핑 조회 (기준 데이터 캐시, 읽기 전용)
 
     Args:
         db: 데이터베이스 세션
@@ -134,12 +103,12 @@ def get_service_name_to_code_map(db: Session) -> dict[str, str]:
     Returns:
         서비스 이름을 키로, 서비스 코드를 값으로 하는 딕셔너리
     """
-    service_types = db.query(ServiceType.code, ServiceType.name).all()
-    return {st.name: st.code for st in service_types}
+    reference = await get_reference_data(db)
+    return reference.service_codes
 
 
-def convert_service_names_to_codes(
-    db: Session,
+async def convert_service_names_to_codes(
+    db: Optional[AsyncSession],
     names: list[str] | None
 ) -> list[str]:
     """
@@ -156,12 +125,12 @@ def convert_service_names_to_codes(
     if not names:
         return []
 
-    name_to_code = get_service_name_to_code_map(db)
+    name_to_code = await get_service_name_to_code_map(db)
     return [name_to_code.get(name, name) for name in names]
 
 
-def convert_service_name_to_code(
-    db: Session,
+async def convert_service_name_to_code(
+    db: Optional[AsyncSession],
     name: str | None
 ) -> str | None:
     """
@@ -178,5 +147,5 @@ def convert_service_name_to_code(
     if not name:
         return None
 
-    name_to_code = get_service_name_to_code_map(db)
+    name_to_code = await get_service_name_to_code_map(db)
     return name_to_code.get(name, name)
@@ -3,17 +3,30 @@ SMS Service using Aligo API
 알리고 SMS 발송 서비스
 """
 
+import asyncio
+import os
+import time
 import httpx
-from typing import Optional
-from datetime import datetime, date, timezone
+from typing import Optional, Union
+from datetime import datetime, date, timedelta, timezone
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.config import settings
-from app.core.encryption import encrypt_value, decrypt_value
+from app.core.encryption import encrypt_value, decrypt_value, generate_search_hash
 from app.core.database import AsyncSessionLocal
+from app.services.reference_data import reference_data_registry
+from app.services.sms_template_cache import sms_template_registry
+from app.services.sms_circuit import sms_circuit_breaker, circuit_open_result, is_circuit_open_result
+from app.services.sms_coalesce import (
+    DIGEST_TITLES,
+    build_digest_messages,
+    is_coalesced_result,
+    notification_coalescer,
+)
+from app.services.image import get_mms_rendition, prepare_mms_image
 
 logger = logging.getLogger(__name__)
 
@@ -26,43 +39,27 @@ async def get_template_message(
     **kwargs,
 ) -> Optional[str]:
     """
-    데이터베이스에서 SMS 템플릿을 조회하고 변수를 치환합니다.
+    SMS 템플릿 캐시에서 템플릿을 조회하고 변수를 치환합니다.
 
     Args:
         template_key: 템플릿 키 (예: 'new_application', 'partner_assigned')
-        db: 데이터베이스 세션 (없으면 자동 생성)
+        db: 데이터베이스 세션 (캐시 갱신 시에만 사용, 없으면 자동 생성)
         **kwargs: 템플릿 변수 (예: customer_name="홍길동")
 
     Returns:
         변수가 치환된 메시지 문자열, 템플릿이 없거나 비활성이면 None
     """
-    from app.models.sms_template import SMSTemplate
-
-    close_db = False
-    if db is None:
-        db = AsyncSessionLocal()
-        close_db = True
-
     try:
-        result = await db.execute(
-            select(SMSTemplate).where(
-                SMSTemplate.template_key == template_key,
-                SMSTemplate.is_active == True,
-            )
-        )
-        template = result.scalar_one_or_none()
+        template = await sms_template_registry.get(template_key, db)
 
         if not template:
             logger.warning(f"SMS template '{template_key}' not found or inactive")
             return None
 
-        return template.format_message(**kwargs)
+        return template.render(kwargs)
     except Exception as e:
         logger.error(f"Failed to get SMS template '{template_key}': {e}")
         return None
-    finally:
-        if close_db:
-            await db.close()
 
 
 async def get_admin_phones(db: Optional[AsyncSession] = None) -> list[str]:
@@ -107,14 +104,20 @@ async def get_admin_phones(db: Optional[AsyncSession] = None) -> list[str]:
         if close_db:
             await db.close()
 
-# Aligo API Endpoint
-ALIGO_API_URL = "https://apis.aligo.in/send/"
+# Aligo API Endpoint (ALIGO_API_BASE_URL로 로컬 시뮬레이터 지정 가능)
+ALIGO_API_URL = f"{settings.ALIGO_API_BASE_URL.rstrip('/')}/send/"
 
-# ===== 서비스 코드 → 한글 명칭 캐시 =====
-# DB에서 로드된 매핑 (앱 시작 시 load_service_cache로 초기화)
-_service_cache: dict[str, str] = {}
+# 게이트웨이 호출 전체 제한 시간 (초, 연결~응답 수신까지)
+SMS_GATEWAY_DEADLINE = 5.0
+MMS_GATEWAY_DEADLINE = 30.0  # 이미지 업로드 포함
 
-# Fallback 매핑 (DB 조회 실패 시 사용, 이전 코드 호환성 유지)
+# MMS 첨부 이미지 (파일 경로 / 바이트 / Base64 문자열)
+MMSImage = Union[str, bytes, os.PathLike]
+
+# ===== 서비스 코드 → 한글 명칭 =====
+# 기준 데이터 캐시(reference_data, 앱 시작 시 로드 후 요청 처리 중 갱신) 사용
+
+# Fallback 매핑 (기준 데이터 로드 실패 시 사용, 이전 코드 호환성 유지)
 _SERVICE_CODE_FALLBACK = {
     "HOUSE_CONSTRUCTION": "주택 건축",
     "WEEDING": "제초 작업",
@@ -164,38 +167,12 @@ _SERVICE_CODE_FALLBACK = {
 }
 
 
-async def load_service_cache_async(db: AsyncSession) -> int:
-    """
-    DB에서 서비스 코드→이름 매핑을 캐시로 로드 (비동기)
-    앱 시작 시 호출하여 초기화
-
-    Args:
-        db: AsyncSession 인스턴스
-
-    Returns:
-        로드된 서비스 타입 수
-    """
-    global _service_cache
-    try:
-        from app.models.service import ServiceType
-        result = await db.execute(
-            select(ServiceType).where(ServiceType.is_active == True)
-        )
-        types = result.scalars().all()
-        _service_cache = {t.code: t.name for t in types}
-        logger.info(f"Service cache loaded: {len(_service_cache)} types from DB")
-        return len(_service_cache)
-    except Exception as e:
-        logger.warning(f"Failed to load service cache from DB, using fallback: {e}")
-        _service_cache = _SERVICE_CODE_FALLBACK.copy()
-        return len(_service_cache)
-
-
 def get_service_name(code: str) -> str:
-    """서비스 코드를 한글 명칭으로 변환 (캐시 우선, fallback 사용)"""
+    """서비스 코드를 한글 명칭으로 변환 (기준 데이터 캐시 우선, fallback 사용)"""
+    reference = reference_data_registry.current
     # 캐시가 로드되어 있으면 캐시에서 조회
-    if _service_cache:
-        return _service_cache.get(code, code)
+    if reference is not None and reference.service_names:
+        return reference.service_names.get(code, code)
     # 캐시가 비어있으면 fallback 사용
     return _SERVICE_CODE_FALLBACK.get(code, code)
 
@@ -316,50 +293,78 @@ async def send_sms(
     if msg_type == "LMS" and title:
         data["title"] = title
 
+    # 회로 차단 중이면 게이트웨이를 호출하지 않고 즉시 반환
+    if not sms_circuit_breaker.allow_request():
+        return circuit_open_result()
+
+    started = time.perf_counter()
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(ALIGO_API_URL, data=data)
+        async with httpx.AsyncClient(timeout=SMS_GATEWAY_DEADLINE) as client:
+            response = await asyncio.wait_for(
+                client.post(ALIGO_API_URL, data=data),
+                timeout=SMS_GATEWAY_DEADLINE,
+            )
             result = response.json()
-
-            if result.get("result_code") == "1":
-                logger.info(f"SMS sent successfully to {receiver[:3]}***{receiver[-4:]} ({msg_type})")
-            else:
-                logger.error(f"SMS send failed: {result.get('message')}")
-
-            return result
     except Exception as e:
-        logger.error(f"SMS send error: {str(e)}")
+        sms_circuit_breaker.record(False, time.perf_counter() - started)
+        error = str(e) or f"SMS gateway timeout ({SMS_GATEWAY_DEADLINE}s)"
+        logger.error(f"SMS send error: {error}")
         return {
             "result_code": "-1",
-            "message": str(e),
+            "message": error,
             "msg_id": None,
         }
 
+    sms_circuit_breaker.record(_is_gateway_available(response), time.perf_counter() - started)
+
+    if result.get("result_code") == "1":
+        logger.info(f"SMS sent successfully to {receiver[:3]}***{receiver[-4:]} ({msg_type})")
+    else:
+        logger.error(f"SMS send failed: {result.get('message')}")
+
+    return result
+
+
+def _is_gateway_available(response: httpx.Response) -> bool:
+    """게이트웨이 응답 상태 판단 (5xx, 429는 게이트웨이 장애로 집계)"""
+    return response.status_code < 500 and response.status_code != 429
+
+
+def decode_base64_image(base64_data: str) -> bytes:
+    """Base64 이미지 디코딩 (data:image/...;base64,... 형태 또는 순수 Base64)"""
+    import base64
+
+    if ";base64," in base64_data:
+        base64_data = base64_data.split(";base64,", 1)[1]
+    return base64.b64decode(base64_data)
+
 
 async def send_mms(
     receiver: str,
     message: str,
     title: Optional[str] = None,
-    image1: Optional[str] = None,
-    image2: Optional[str] = None,
-    image3: Optional[str] = None,
+    image1: Optional[MMSImage] = None,
+    image2: Optional[MMSImage] = None,
+    image3: Optional[MMSImage] = None,
 ) -> dict:
     """
     MMS 발송 (이미지 첨부)
 
+    이미지는 MMS 규격 JPEG로 맞춘 뒤 multipart 본문으로 바로 전송한다.
+    파일 경로는 캐시된 MMS용 JPEG를 열어 스트리밍하고, 바이트는 메모리 버퍼를 그대로 사용한다.
+
     Args:
         receiver: 수신자 전화번호
         message: 메시지 내용
         title: MMS 제목 (선택)
-        image1, image2, image3: Base64 인코딩된 이미지 데이터 (data:image/...;base64,... 형태)
+        image1, image2, image3: 첨부 이미지
+            - 파일 경로 (os.PathLike): 저장된 이미지 파일
+            - bytes: 이미지 바이트
+            - str: Base64 인코딩된 이미지 (data:image/...;base64,... 형태)
 
     Returns:
         API 응답 결과
     """
-    import base64
-    import tempfile
-    from pathlib import Path
-
     # 전화번호 형식 정리 (하이픈 제거)
     receiver = receiver.replace("-", "")
 
@@ -389,89 +394,178 @@ async def send_mms(
     if msg_type in ["LMS", "MMS"] and title:
         data["title"] = title
 
-    # 임시 파일 목록 (정리용)
-    temp_files = []
+    # 회로 차단 중이면 즉시 반환 (MMS는 첨부 이미지를 보관하지 않으므로 대기열 없이 실패 처리)
+    if not sms_circuit_breaker.allow_request():
+        return circuit_open_result(deferred=False)
+
     files = {}
+    started = None
 
     try:
-        # Base64 이미지를 임시 파일로 변환
-        for idx, base64_data in enumerate(images, start=1):
+        # 첨부 이미지 준비 (MMS 규격 변환은 블로킹 작업이므로 스레드에서 처리)
+        for idx, image in enumerate(images, start=1):
             try:
-                # data:image/jpeg;base64,... 형태에서 실제 데이터 추출
-                if ";base64," in base64_data:
-                    header, encoded = base64_data.split(";base64,", 1)
-                    # 확장자 결정
-                    if "jpeg" in header or "jpg" in header:
-                        ext = ".jpg"
-                    elif "png" in header:
-                        ext = ".png"
-                    elif "gif" in header:
-                        ext = ".gif"
-                    else:
-                        ext = ".jpg"  # 기본값
+                if isinstance(image, os.PathLike):
+                    rendition_path = await asyncio.to_thread(get_mms_rendition, os.fspath(image))
+                    content = open(rendition_path, "rb")
                 else:
-                    encoded = base64_data
-                    ext = ".jpg"
-
-                image_bytes = base64.b64decode(encoded)
+                    if isinstance(image, str):
+                        image = decode_base64_image(image)
+                    content = await asyncio.to_thread(prepare_mms_image, image)
 
-                # 임시 파일 생성
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False,
-                    suffix=ext,
-                    prefix=f"mms_image{idx}_"
-                )
-                temp_file.write(image_bytes)
-                temp_file.flush()
-                temp_file.close()
-                temp_files.append(temp_file.name)
-
-                # files 딕셔너리에 추가 (파일 핸들)
-                files[f"image{idx}"] = (
-                    f"image{idx}{ext}",
-                    open(temp_file.name, "rb"),
-                    f"image/{ext[1:]}"
-                )
+                files[f"image{idx}"] = (f"image{idx}.jpg", content, "image/jpeg")
             except Exception as e:
                 logger.error(f"Failed to process image{idx}: {e}")
                 continue
 
         # API 요청
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if files:
-                response = await client.post(ALIGO_API_URL, data=data, files=files)
-            else:
-                response = await client.post(ALIGO_API_URL, data=data)
-
+        started = time.perf_counter()
+        async with httpx.AsyncClient(timeout=MMS_GATEWAY_DEADLINE) as client:
+            response = await asyncio.wait_for(
+                client.post(ALIGO_API_URL, data=data, files=files or None),
+                timeout=MMS_GATEWAY_DEADLINE,
+            )
             result = response.json()
 
-            if result.get("result_code") == "1":
-                logger.info(f"MMS sent successfully to {receiver[:3]}***{receiver[-4:]} (images: {len(images)})")
-            else:
-                logger.error(f"MMS send failed: {result.get('message')}")
+        sms_circuit_breaker.record(_is_gateway_available(response), time.perf_counter() - started)
 
-            return result
+        if result.get("result_code") == "1":
+            logger.info(f"MMS sent successfully to {receiver[:3]}***{receiver[-4:]} (images: {len(files)})")
+        else:
+            logger.error(f"MMS send failed: {result.get('message')}")
+
+        return result
     except Exception as e:
-        logger.error(f"MMS send error: {str(e)}")
+        # 게이트웨이 호출 전(이미지 준비) 실패는 게이트웨이 장애로 집계하지 않음
+        if started is None:
+            sms_circuit_breaker.cancel()
+        else:
+            sms_circuit_breaker.record(False, time.perf_counter() - started)
+        error = str(e) or f"MMS gateway timeout ({MMS_GATEWAY_DEADLINE}s)"
+        logger.error(f"MMS send error: {error}")
         return {
             "result_code": "-1",
-            "message": str(e),
+            "message": error,
             "msg_id": None,
         }
     finally:
         # 파일 핸들 닫기
-        for key in files:
-            try:
-                files[key][1].close()
-            except Exception:
-                pass
+        for _, content, _ in files.values():
+            if hasattr(content, "close"):
+                try:
+                    content.close()
+                except Exception:
+                    pass
+
+
+# ===== 알림 동시 발송 (fan-out) =====
+
+NOTIFICATION_CONCURRENCY = 5  # 알림 1건당 동시 발송 수 제한
+
+
+async def fan_out_sms(
+    receivers: list[str],
+    message: str,
+    title: Optional[str] = None,
+    template_key: Optional[str] = None,
+    concurrency: int = NOTIFICATION_CONCURRENCY,
+    digest_line: Optional[str] = None,
+    coalesce_key: Optional[str] = None,
+    coalesce: bool = True,
+) -> list[dict]:
+    """
+    여러 수신자에게 동시 발송 (동시 실행 수 제한)
 
-        # 임시 파일 삭제
-        for temp_path in temp_files:
+    수신자별 발송은 서로 독립적이므로 순차 대기 없이 병렬로 처리하고,
+    결과를 모아 요약 로그를 1건 남긴다.
+    묶음 대기 시간이 설정된 템플릿은 즉시 발송하지 않고 수신자별로 모아서 발송한다 (sms_coalesce).
+
+    Args:
+        receivers: 수신자 전화번호 목록 (빈 값은 제외)
+        message: 메시지 내용
+        title: LMS 제목
+        template_key: 템플릿 키 (요약 로그, 묶음 발송 설정용)
+        concurrency: 최대 동시 발송 수
+        digest_line: 묶음 발송 시 요약 메시지에 들어갈 한 줄 요약
+        coalesce_key: 묶음 발송 시 같은 대상 식별 키 (예: 신청번호, 최신 알림만 유지)
+        coalesce: False면 묶음 설정과 관계없이 즉시 발송
+
+    Returns:
+        수신자별 발송 결과 리스트 [{"phone": ..., "result": ...}] (입력 순서 유지)
+    """
+    receivers = [phone for phone in receivers if phone]
+    if not receivers:
+        return []
+
+    if coalesce and notification_coalescer.window_for(template_key) > 0:
+        return [
+            {
+                "phone": phone,
+                "result": notification_coalescer.add(
+                    phone, message, title, template_key, digest_line, coalesce_key
+                ),
+            }
+            for phone in receivers
+        ]
+
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    started = time.perf_counter()
+
+    async def _send(phone: str) -> tuple[dict, float]:
+        async with semaphore:
+            begin = time.perf_counter()
             try:
-                Path(temp_path).unlink()
+                result = await send_sms(phone, message, title)
             except Exception as e:
-                logger.warning(f"Failed to delete temp file {temp_path}: {e}")
+                result = {"result_code": "-1", "message": str(e), "msg_id": None}
+            return {"phone": phone, "result": result}, time.perf_counter() - begin
+
+    outcomes = await asyncio.gather(*(_send(phone) for phone in receivers))
+    results = [result for result, _ in outcomes]
+
+    # 회로 차단으로 보류된 발송은 대기열에 보관 (게이트웨이 복구 후 재발송)
+    deferred = [r["phone"] for r in results if is_circuit_open_result(r["result"])]
+    if deferred:
+        await enqueue_deferred_sms(deferred, message, sms_type=template_key or "notification")
+
+    failed = [r for r in results if r["result"].get("result_code") != "1"]
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    slowest_ms = max(duration for _, duration in outcomes) * 1000
+    failed_phones = ",".join(f"***{r['phone'][-4:]}" for r in failed)
+
+    log = logger.warning if failed else logger.info
+    log(
+        f"SMS fan-out: template={template_key or '-'}, recipients={len(results)}, "
+        f"sent={len(results) - len(failed)}, failed={len(failed) - len(deferred)}, queued={len(deferred)}, "
+        f"elapsed_ms={elapsed_ms:.0f}, slowest_ms={slowest_ms:.0f}"
+        + (f", failed_to=[{failed_phones}]" if failed else "")
+    )
+
+    return results
+
+
+async def send_notification_sms(
+    receiver: str,
+    message: str,
+    title: Optional[str] = None,
+    template_key: Optional[str] = None,
+    digest_line: Optional[str] = None,
+    coalesce_key: Optional[str] = None,
+    coalesce: bool = True,
+) -> dict:
+    """단일 수신자 알림 발송 (fan_out_sms 경유, 발송 결과만 반환)"""
+    results = await fan_out_sms(
+        [receiver],
+        message,
+        title,
+        template_key,
+        digest_line=digest_line,
+        coalesce_key=coalesce_key,
+        coalesce=coalesce,
+    )
+    if not results:
+        return {"result_code": "-1", "message": "수신자 연락처 없음", "msg_id": None}
+    return results[0]["result"]
 
 
 async def send_application_notification(
@@ -552,13 +646,8 @@ async def send_application_notification(
         if message is None:
             return []
 
-        # 모든 관리자에게 발송
-        results = []
-        for phone in admin_phones:
-            result = await send_sms(phone, message, "[신규신청]")
-            results.append({"phone": phone, "result": result})
-
-        return results
+        # 모든 관리자에게 동시 발송
+        return await fan_out_sms(admin_phones, message, "[신규신청]", template_key)
     finally:
         if close_db:
             await db.close()
@@ -611,13 +700,8 @@ async def send_partner_notification(
         if message is None:
             return []
 
-        # 모든 관리자에게 발송
-        results = []
-        for phone in admin_phones:
-            result = await send_sms(phone, message, "[협력사등록]")
-            results.append({"phone": phone, "result": result})
-
-        return results
+        # 모든 관리자에게 동시 발송
+        return await fan_out_sms(admin_phones, message, "[협력사등록]", template_key)
     finally:
         if close_db:
             await db.close()
@@ -633,6 +717,7 @@ async def send_partner_assignment_notification(
     scheduled_time: str = "",
     estimated_cost: str = "",
     db: Optional[AsyncSession] = None,
+    coalesce: bool = True,
 ) -> dict:
     """
     협력사 배정 알림 SMS 발송 (고객에게)
@@ -647,6 +732,7 @@ async def send_partner_assignment_notification(
         scheduled_time: 예정 시간 (예: "오전 10시" 또는 "미정")
         estimated_cost: 견적 비용 (예: "150,000원" 또는 "협의")
         db: 데이터베이스 세션
+        coalesce: False면 묶음 발송 대기 없이 즉시 발송 (관리자 수동 발송)
 
     Returns:
         발송 결과
@@ -677,7 +763,15 @@ async def send_partner_assignment_notification(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(customer_phone, message, "[배정안내]")
+        return await send_notification_sms(
+            customer_phone,
+            message,
+            "[배정안내]",
+            template_key,
+            digest_line=f"{application_number} 담당: {partner_name} ({partner_phone})",
+            coalesce_key=application_number,
+            coalesce=coalesce,
+        )
     finally:
         if close_db:
             await db.close()
@@ -693,6 +787,7 @@ async def send_partner_notify_assignment(
     scheduled_date: str = "",
     view_url: str = "",
     db: Optional[AsyncSession] = None,
+    coalesce: bool = True,
 ) -> dict:
     """
     협력사 배정 알림 SMS 발송 (협력사에게)
@@ -707,6 +802,7 @@ async def send_partner_notify_assignment(
         scheduled_date: 예정일 (선택)
         view_url: 신청 상세 열람 URL (협력사 포털)
         db: 데이터베이스 세션
+        coalesce: False면 묶음 발송 대기 없이 즉시 발송 (관리자 수동 발송)
 
     Returns:
         발송 결과
@@ -737,12 +833,157 @@ async def send_partner_notify_assignment(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(partner_phone, message, "[배정알림]")
+        return await send_notification_sms(
+            partner_phone,
+            message,
+            "[배정알림]",
+            template_key,
+            digest_line=" ".join(
+                part for part in (
+                    application_number, customer_name, variables["address"], scheduled_date, view_url
+                ) if part
+            ),
+            coalesce_key=application_number,
+            coalesce=coalesce,
+        )
     finally:
         if close_db:
             await db.close()
 
 
+async def send_bulk_assignment_notifications(
+    partner_name: str,
+    partner_phone: str,
+    assignments: list[dict],
+) -> dict:
+    """
+    일괄 배정 알림 SMS 발송
+
+    고객에게는 신청별 배정 안내를, 협력사에게는 배정 건 전체를 묶은 알림 1건
+    (DIGEST_MAX_CHARS 초과 시 여러 건)을 발송한다. DB 세션 1개를 공유한다.
+
+    Args:
+        partner_name: 협력사명
+        partner_phone: 협력사 연락처
+        assignments: 배정된 신청 목록
+            [{"application_number", "customer_name", "customer_phone", "address", "services"}]
+
+    Returns:
+        {"customer_results": [...], "partner_results": [...]}
+    """
+    if not assignments:
+        return {"customer_results": [], "partner_results": []}
+
+    async with AsyncSessionLocal() as db:
+        # 고객 알림 (수신자가 모두 다르므로 신청별 발송)
+        customer_results = []
+        for item in assignments:
+            try:
+                result = await send_partner_assignment_notification(
+                    item["customer_phone"],
+                    item["application_number"],
+                    partner_name,
+                    partner_phone,
+                    item["customer_name"],
+                    db=db,
+                )
+            except Exception as e:
+                result = {"result_code": "-1", "message": str(e), "msg_id": None}
+            customer_results.append({"phone": item["customer_phone"], "result": result})
+
+        # 협력사 알림 (1건이면 기존 템플릿 메시지 그대로)
+        if len(assignments) == 1:
+            item = assignments[0]
+            result = await send_partner_notify_assignment(
+                partner_phone,
+                item["application_number"],
+                item["customer_name"],
+                item["customer_phone"],
+                item["address"],
+                item["services"],
+                db=db,
+            )
+            partner_results = [{"phone": partner_phone, "result": result}]
+        else:
+            title, header = DIGEST_TITLES["partner_assignment"]
+            lines = [
+                " ".join(part for part in (
+                    item["application_number"],
+                    item["customer_name"],
+                    (item["address"] or "")[:30],
+                    format_services_list(item["services"]),
+                ) if part)
+                for item in assignments
+            ]
+            partner_results = []
+            for message in build_digest_messages(header, lines):
+                partner_results.extend(await fan_out_sms(
+                    [partner_phone], message, title, "partner_notify_assignment", coalesce=False
+                ))
+
+    logger.info(
+        f"Bulk assignment SMS: partner={partner_name}, applications={len(assignments)}, "
+        f"partner_messages={len(partner_results)}"
+    )
+    return {"customer_results": customer_results, "partner_results": partner_results}
+
+
+async def send_bulk_status_notifications(
+    status: str,
+    applications: list[dict],
+    cancel_reason: Optional[str] = None,
+) -> list[dict]:
+    """
+    일괄 상태 변경 알림 SMS 발송 (고객에게, DB 세션 1개 공유)
+
+    취소(cancelled) / 완료(completed)만 알림을 발송한다 (update_application과 동일).
+
+    Args:
+        status: 변경된 상태
+        applications: 상태가 변경된 신청 목록
+            [{"application_number", "customer_name", "customer_phone", "partner_name", "customer_view_url"}]
+        cancel_reason: 취소 사유
+
+    Returns:
+        신청별 발송 결과 리스트 [{"phone": ..., "result": ...}]
+    """
+    if status not in ("cancelled", "completed") or not applications:
+        return []
+
+    results = []
+    async with AsyncSessionLocal() as db:
+        for item in applications:
+            try:
+                if status == "cancelled":
+                    result = await send_application_cancelled_notification(
+                        item["customer_phone"],
+                        item["application_number"],
+                        cancel_reason,
+                        item["customer_name"],
+                        db=db,
+                    )
+                else:
+                    result = await send_completion_notification(
+                        item["customer_phone"],
+                        item["application_number"],
+                        item.get("partner_name"),
+                        item["customer_name"],
+                        item.get("customer_view_url"),
+                        db=db,
+                    )
+            except Exception as e:
+                result = {"result_code": "-1", "message": str(e), "msg_id": None}
+            results.append({"phone": item["customer_phone"], "result": result})
+
+    # 묶음 대기 중인 알림은 실패로 집계하지 않음
+    failed = sum(
+        1 for r in results
+        if r["result"].get("result_code") != "1" and not is_coalesced_result(r["result"])
+    )
+    logger.info(f"Bulk status SMS: status={status}, applications={len(results)}, failed={failed}")
+    return results
+
+
 async def send_schedule_confirmation(
     customer_phone: str,
     application_number: str,
@@ -791,7 +1032,14 @@ async def send_schedule_confirmation(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(customer_phone, message, "[일정확정]")
+        return await send_notification_sms(
+            customer_phone,
+            message,
+            "[일정확정]",
+            template_key,
+            digest_line=f"{application_number} 일정 확정: {scheduled_date} {scheduled_time or ''}".rstrip(),
+            coalesce_key=application_number,
+        )
     finally:
         if close_db:
             await db.close()
@@ -851,7 +1099,14 @@ async def send_partner_schedule_notification(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(partner_phone, message, "[작업일정]")
+        return await send_notification_sms(
+            partner_phone,
+            message,
+            "[작업일정]",
+            template_key,
+            digest_line=f"{application_number} {customer_name} {scheduled_date} {scheduled_time or ''}".rstrip(),
+            coalesce_key=application_number,
+        )
     finally:
         if close_db:
             await db.close()
@@ -901,7 +1156,7 @@ async def send_partner_approval_notification(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(partner_phone, message, "[협력사안내]")
+        return await send_notification_sms(partner_phone, message, "[협력사안내]", template_key)
     finally:
         if close_db:
             await db.close()
@@ -949,7 +1204,7 @@ async def send_application_cancelled_notification(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(customer_phone, message, "[신청취소]")
+        return await send_notification_sms(customer_phone, message, "[신청취소]", template_key)
     finally:
         if close_db:
             await db.close()
@@ -1003,7 +1258,14 @@ async def send_assignment_changed_notification(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(customer_phone, message, "[배정변경]")
+        return await send_notification_sms(
+            customer_phone,
+            message,
+            "[배정변경]",
+            template_key,
+            digest_line=f"{application_number} 배정 변경: {scheduled_date} {scheduled_time or ''}".rstrip(),
+            coalesce_key=application_number,
+        )
     finally:
         if close_db:
             await db.close()
@@ -1054,7 +1316,7 @@ async def send_completion_notification(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(customer_phone, message, "[완료안내]")
+        return await send_notification_sms(customer_phone, message, "[완료안내]", template_key)
     finally:
         if close_db:
             await db.close()
@@ -1101,7 +1363,7 @@ async def send_application_received_notification(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        return await send_sms(customer_phone, message, "[접수확인]")
+        return await send_notification_sms(customer_phone, message, "[접수확인]", template_key)
     finally:
         if close_db:
             await db.close()
@@ -1154,19 +1416,85 @@ async def send_schedule_changed_notification(
         if message is None:
             return {"result_code": "-1", "message": "템플릿 없음/비활성"}
 
-        # 고객에게 발송
-        customer_result = await send_sms(customer_phone, message, "[일정변경]")
-
-        # 협력사에게도 발송
-        if partner_phone:
-            await send_sms(partner_phone, message, "[일정변경]")
+        # 고객 및 협력사에게 동시 발송
+        results = await fan_out_sms(
+            [customer_phone, partner_phone] if partner_phone else [customer_phone],
+            message,
+            "[일정변경]",
+            template_key,
+            digest_line=f"{application_number} 일정 변경: {old_date} → {new_date} {new_time or ''}".rstrip(),
+            coalesce_key=application_number,
+        )
 
-        return customer_result
+        # 고객 발송 결과 반환
+        if not results or results[0]["phone"] != customer_phone:
+            return {"result_code": "-1", "message": "수신자 연락처 없음", "msg_id": None}
+        return results[0]["result"]
     finally:
         if close_db:
             await db.close()
 
 
+def build_sms_log(
+    receiver: str,
+    message: str,
+    result: dict,
+    sms_type: str = "manual",
+    trigger_source: str = "system",
+    reference_type: Optional[str] = None,
+    reference_id: Optional[int] = None,
+    bulk_job_id: Optional[int] = None,
+    batch_index: Optional[int] = None,
+    template_key: Optional[str] = None,
+):
+    """
+    발송 결과로 SMSLog 객체 생성 (세션 추가/커밋은 호출자가 담당)
+
+    Args:
+        receiver: 수신자 전화번호 (평문, 암호화하여 저장)
+        message: 메시지 내용
+        result: send_sms() 반환값
+        sms_type: 발송 유형
+        trigger_source: 발송 출처 (system, manual, bulk)
+        reference_type: 참조 타입
+        reference_id: 참조 ID
+        bulk_job_id: 복수 발송 Job ID
+        batch_index: 배치 번호
+        template_key: 사용된 템플릿 키
+
+    Returns:
+        SMSLog 인스턴스 (회로 차단으로 보류된 발송은 queued 상태, drain_deferred_sms가 재발송)
+    """
+    from app.models.sms_log import SMSLog
+
+    is_success = result.get("result_code") == "1"
+    if is_success:
+        status = "sent"
+    elif is_circuit_open_result(result):
+        status = "queued"
+    else:
+        status = "failed"
+
+    return SMSLog(
+        receiver_phone=encrypt_value(receiver),
+        receiver_phone_hash=generate_search_hash(receiver, "phone"),
+        message=message,
+        sms_type=sms_type,
+        trigger_source=trigger_source,
+        reference_type=reference_type,
+        reference_id=reference_id,
+        bulk_job_id=bulk_job_id,
+        batch_index=batch_index,
+        status=status,
+        result_code=result.get("result_code"),
+        result_message=result.get("message"),
+        msg_id=result.get("msg_id"),
+        sender_phone=settings.ALIGO_SENDER,
+        sent_at=datetime.now(timezone.utc) if is_success else None,
+        template_key=template_key,
+    )
+
+
 async def send_sms_direct(
     receiver: str,
     message: str,
@@ -1197,8 +1525,6 @@ async def send_sms_direct(
     Returns:
         발송 결과
     """
-    from app.models.sms_log import SMSLog
-
     # SMS 발송
     result = await send_sms(receiver, message)
 
@@ -1206,21 +1532,16 @@ async def send_sms_direct(
     if db:
         try:
             is_success = result.get("result_code") == "1"
-            sms_log = SMSLog(
-                receiver_phone=encrypt_value(receiver),
-                message=message,
+            sms_log = build_sms_log(
+                receiver,
+                message,
+                result,
                 sms_type=sms_type,
                 trigger_source=trigger_source,
                 reference_type=reference_type,
                 reference_id=reference_id,
                 bulk_job_id=bulk_job_id,
                 batch_index=batch_index,
-                status="sent" if is_success else "failed",
-                result_code=result.get("result_code"),
-                result_message=result.get("message"),
-                msg_id=result.get("msg_id"),
-                sender_phone=settings.ALIGO_SENDER,
-                sent_at=datetime.now(timezone.utc) if is_success else None,
                 template_key=template_key,
             )
             db.add(sms_log)
@@ -1229,6 +1550,7 @@ async def send_sms_direct(
 
             return {
                 "success": is_success,
+                "queued": sms_log.status == "queued",
                 "sms_log_id": sms_log.id,
                 "error": None if is_success else result.get("message"),
             }
@@ -1236,8 +1558,157 @@ async def send_sms_direct(
             logger.error(f"SMS log save error: {str(e)}")
             await db.rollback()
 
+    queued = False
+    if is_circuit_open_result(result):
+        queued = await enqueue_deferred_sms(
+            [receiver],
+            message,
+            sms_type=sms_type,
+            trigger_source=trigger_source,
+            reference_type=reference_type,
+            reference_id=reference_id,
+            template_key=template_key,
+        ) > 0
+
     return {
         "success": result.get("result_code") == "1",
+        "queued": queued,
         "sms_log_id": None,
         "error": None if result.get("result_code") == "1" else result.get("message"),
     }
+
+
+# ===== 발송 보류 대기열 (회로 차단 시) =====
+
+DEFERRED_DRAIN_INTERVAL = 15  # 대기열 확인 주기 (초)
+DEFERRED_BATCH_SIZE = 20  # 1회 재발송 건수
+DEFERRED_MAX_AGE = timedelta(hours=6)  # 보류 후 재발송하지 않고 실패 처리하는 기한
+DEFERRED_EXPIRED_MESSAGE = "발송 보류 기한 초과 (게이트웨이 장애 지속)"
+
+
+async def enqueue_deferred_sms(
+    receivers: list[str],
+    message: str,
+    sms_type: str = "notification",
+    trigger_source: str = "system",
+    reference_type: Optional[str] = None,
+    reference_id: Optional[int] = None,
+    template_key: Optional[str] = None,
+) -> int:
+    """
+    회로 차단으로 보류된 발송을 queued 상태의 SMSLog로 저장 (전용 세션 사용)
+
+    Returns:
+        저장된 건수
+    """
+    try:
+        async with AsyncSessionLocal() as db:
+            db.add_all([
+                build_sms_log(
+                    receiver,
+                    message,
+                    circuit_open_result(),
+                    sms_type=sms_type,
+                    trigger_source=trigger_source,
+                    reference_type=reference_type,
+                    reference_id=reference_id,
+                    template_key=template_key,
+                )
+                for receiver in receivers
+            ])
+            await db.commit()
+        logger.warning(f"SMS deferred: {len(receivers)} message(s) queued while gateway circuit is open")
+        return len(receivers)
+    except Exception as e:
+        logger.error(f"Failed to queue deferred SMS: {e}")
+        return 0
+
+
+async def drain_deferred_sms(limit: int = DEFERRED_BATCH_SIZE) -> int:
+    """
+    보류된 발송(queued) 재발송
+
+    대상 행을 FOR UPDATE SKIP LOCKED로 잠근 채 발송하고 같은 트랜잭션에서 결과를 기록하므로
+    여러 워커가 동시에 실행해도 같은 메시지를 중복 발송하지 않는다.
+    회로가 다시 차단되면 남은 건은 queued로 유지한다.
+
+    Returns:
+        처리(발송 완료/실패 확정)된 건수
+    """
+    from collections import Counter
+
+    from app.models.sms_log import SMSLog
+    from app.models.sms_daily_stat import sms_daily_stat_upsert
+
+    if sms_circuit_breaker.retry_after() > 0:
+        return 0
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(SMSLog)
+            .where(SMSLog.status == "queued")
+            .order_by(SMSLog.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        logs = result.scalars().all()
+        if not logs:
+            await db.rollback()
+            return 0
+
+        now = datetime.now(timezone.utc)
+        expired = [log for log in logs if log.created_at and now - log.created_at > DEFERRED_MAX_AGE]
+        pending = [log for log in logs if log not in expired]
+
+        semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+
+        async def _resend(log) -> dict:
+            async with semaphore:
+                try:
+                    return await send_sms(decrypt_value(log.receiver_phone), log.message)
+                except Exception as e:
+                    return {"result_code": "-1", "message": str(e), "msg_id": None}
+
+        results = await asyncio.gather(*(_resend(log) for log in pending))
+        expired_result = {"result_code": "-1", "message": DEFERRED_EXPIRED_MESSAGE, "msg_id": None}
+        outcomes = [(log, expired_result) for log in expired] + list(zip(pending, results))
+
+        processed = 0
+        transitions: Counter = Counter()
+        for log, send_result in outcomes:
+            if is_circuit_open_result(send_result):
+                continue
+            is_success = send_result.get("result_code") == "1"
+            log.status = "sent" if is_success else "failed"
+            log.result_code = send_result.get("result_code")
+            log.result_message = send_result.get("message")
+            log.msg_id = send_result.get("msg_id")
+            log.sent_at = datetime.now(timezone.utc) if is_success else None
+
+            day = log.created_at.astimezone(timezone.utc).date()
+            transitions[(day, "queued", log.trigger_source, log.sms_type)] -= 1
+            transitions[(day, log.status, log.trigger_source, log.sms_type)] += 1
+            processed += 1
+
+        # 일별 통계 상태 이동 (queued → sent / failed)
+        for (day, status, trigger_source, sms_type), delta in transitions.items():
+            if delta:
+                await db.execute(sms_daily_stat_upsert(day, status, trigger_source, sms_type, delta))
+
+        await db.commit()
+
+    if processed:
+        logger.info(f"Deferred SMS drained: processed={processed}, expired={len(expired)}")
+    return processed
+
+
+async def deferred_sms_loop():
+    """보류 대기열 주기 재발송 (애플리케이션 수명 동안)"""
+    while True:
+        try:
+            # 한 번에 DEFERRED_BATCH_SIZE건씩, 대기열이 빌 때까지 (회로 재차단 시 중단)
+            while await drain_deferred_sms() >= DEFERRED_BATCH_SIZE:
+                pass
+        except Exception as e:
+            logger.error(f"Deferred SMS drain failed: {e}")
+        await asyncio.sleep(DEFERRED_DRAIN_INTERVAL)
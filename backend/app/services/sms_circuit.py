@@ -0,0 +1,218 @@
+"""
+SMS Circuit Breaker
+SMS 게이트웨이(알리고) 호출 회로 차단기
+
+게이트웨이 장애/지연 시 요청마다 타임아웃까지 대기하지 않도록 최근 호출 결과로 차단 여부를 판단한다.
+
+상태:
+- closed: 정상 호출. 최근 WINDOW_SECONDS 동안의 호출이 MIN_CALLS 이상이고
+  실패율 또는 지연 호출 비율이 임계값 이상이면 open으로 전환
+- open: 호출하지 않고 즉시 실패 반환 (발송은 호출자가 대기열에 보관). OPEN_SECONDS 후 half_open
+- half_open: HALF_OPEN_MAX_CALLS건만 시험 호출. 모두 성공하면 closed, 하나라도 실패하면 다시 open
+
+게이트웨이 실패: 네트워크 오류, 타임아웃, HTTP 5xx/429, 응답 파싱 실패
+(수신번호 오류 등 알리고 업무 오류 코드는 게이트웨이 실패로 보지 않음)
+
+상태는 워커(프로세스) 단위로 관리한다.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# 설정
+WINDOW_SECONDS = 60  # 실패율 집계 구간 (초)
+MIN_CALLS = 10  # 차단 판단 최소 호출 수
+FAILURE_RATE_THRESHOLD = 0.5  # 실패율 임계값
+SLOW_CALL_SECONDS = 3.0  # 지연 호출 기준 (초)
+SLOW_CALL_RATE_THRESHOLD = 0.8  # 지연 호출 비율 임계값
+OPEN_SECONDS = 30  # 차단 유지 시간 (초)
+HALF_OPEN_MAX_CALLS = 3  # 반개방 상태 시험 호출 수
+
+# 상태
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# 차단 시 반환하는 결과 코드 (sms_logs.result_code)
+CIRCUIT_OPEN_CODE = "circuit_open"
+
+
+class SMSCircuitBreaker:
+    """SMS 게이트웨이 회로 차단기"""
+
+    def __init__(
+        self,
+        window_seconds: float = WINDOW_SECONDS,
+        min_calls: int = MIN_CALLS,
+        failure_rate_threshold: float = FAILURE_RATE_THRESHOLD,
+        slow_call_seconds: float = SLOW_CALL_SECONDS,
+        slow_call_rate_threshold: float = SLOW_CALL_RATE_THRESHOLD,
+        open_seconds: float = OPEN_SECONDS,
+        half_open_max_calls: int = HALF_OPEN_MAX_CALLS,
+    ):
+        self.window_seconds = window_seconds
+        self.min_calls = min_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+
+        self._state = STATE_CLOSED
+        self._calls: deque = deque()  # (시각, 성공 여부, 지연 여부)
+        self._opened_at = 0.0
+        self._half_open_inflight = 0
+        self._half_open_successes = 0
+
+        # 누적 통계 (health 표시용)
+        self._trips = 0
+        self._rejected = 0
+        self._last_trip_reason: Optional[str] = None
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open 유지 시간이 지났으면 half_open)"""
+        if self._state == STATE_OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self._to_half_open()
+        return self._state
+
+    def retry_after(self) -> float:
+        """호출 가능해지기까지 남은 시간 (초, 호출 가능하면 0)"""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (time.monotonic() - self._opened_at))
+
+    def allow_request(self) -> bool:
+        """
+        호출 허용 여부 (허용 시 반드시 record로 결과를 기록해야 함)
+
+        Returns:
+            True: 호출 가능, False: 차단 중 (즉시 실패 처리)
+        """
+        state = self.state
+        if state == STATE_OPEN:
+            self._rejected += 1
+            return False
+        if state == STATE_HALF_OPEN:
+            if self._half_open_inflight >= self.half_open_max_calls:
+                self._rejected += 1
+                return False
+            self._half_open_inflight += 1
+        return True
+
+    def record(self, success: bool, latency: float):
+        """
+        호출 결과 기록
+
+        Args:
+            success: 게이트웨이 호출 성공 여부
+            latency: 호출 소요 시간 (초)
+        """
+        slow = latency >= self.slow_call_seconds
+
+        if self._state == STATE_HALF_OPEN:
+            self._half_open_inflight = max(0, self._half_open_inflight - 1)
+            if not success or slow:
+                self._trip("half-open probe failed" if not success else "half-open probe slow")
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._to_closed()
+            return
+
+        if self._state == STATE_OPEN:
+            # 차단 전에 시작된 호출의 결과는 무시
+            return
+
+        now = time.monotonic()
+        self._calls.append((now, success, slow))
+        self._prune(now)
+
+        total = len(self._calls)
+        if total < self.min_calls:
+            return
+
+        failure_rate = sum(1 for _, ok, _ in self._calls if not ok) / total
+        slow_rate = sum(1 for _, _, is_slow in self._calls if is_slow) / total
+        if failure_rate >= self.failure_rate_threshold:
+            self._trip(f"failure rate {failure_rate:.0%} over {total} calls")
+        elif slow_rate >= self.slow_call_rate_threshold:
+            self._trip(f"slow call rate {slow_rate:.0%} over {total} calls")
+
+    def cancel(self):
+        """허용받은 호출을 게이트웨이에 보내지 않은 경우 (half_open 시험 호출 슬롯 반환)"""
+        if self._state == STATE_HALF_OPEN:
+            self._half_open_inflight = max(0, self._half_open_inflight - 1)
+
+    def snapshot(self) -> dict:
+        """현재 상태 요약 (health 엔드포인트용)"""
+        state = self.state
+        now = time.monotonic()
+        self._prune(now)
+        total = len(self._calls)
+        failures = sum(1 for _, ok, _ in self._calls if not ok)
+        slow = sum(1 for _, _, is_slow in self._calls if is_slow)
+
+        return {
+            "state": state,
+            "window_calls": total,
+            "failure_rate": round(failures / total, 3) if total else 0.0,
+            "slow_call_rate": round(slow / total, 3) if total else 0.0,
+            "retry_after_seconds": round(self.retry_after(), 1),
+            "trips": self._trips,
+            "rejected": self._rejected,
+            "last_trip_reason": self._last_trip_reason,
+        }
+
+    def _prune(self, now: float):
+        while self._calls and now - self._calls[0][0] > self.window_seconds:
+            self._calls.popleft()
+
+    def _trip(self, reason: str):
+        self._state = STATE_OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_inflight = 0
+        self._half_open_successes = 0
+        self._trips += 1
+        self._last_trip_reason = reason
+        logger.warning(f"SMS circuit opened: {reason} (retry in {self.open_seconds}s)")
+
+    def _to_half_open(self):
+        self._state = STATE_HALF_OPEN
+        self._half_open_inflight = 0
+        self._half_open_successes = 0
+        logger.info("SMS circuit half-open: probing gateway")
+
+    def _to_closed(self):
+        self._state = STATE_CLOSED
+        self._calls.clear()
+        logger.info("SMS circuit closed: gateway recovered")
+
+
+def circuit_open_result(deferred: bool = True) -> dict:
+    """
+    차단 중 발송 결과 (send_sms 반환 형식)
+
+    Args:
+        deferred: 대기열 재발송 대상 여부 (MMS는 False)
+    """
+    return {
+        "result_code": CIRCUIT_OPEN_CODE,
+        "message": (
+            "SMS 게이트웨이 장애로 발송 보류 (대기열에서 재발송)" if deferred
+            else "SMS 게이트웨이 장애로 발송 실패 (잠시 후 다시 시도하세요)"
+        ),
+        "msg_id": None,
+    }
+
+
+def is_circuit_open_result(result: Optional[dict]) -> bool:
+    """차단으로 발송되지 않은 결과인지 확인"""
+    return bool(result) and result.get("result_code") == CIRCUIT_OPEN_CODE
+
+
+sms_circuit_breaker = SMSCircuitBreaker()
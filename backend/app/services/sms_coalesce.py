@@ -0,0 +1,229 @@
+"""
+SMS Notification Coalescer
+알림 SMS 묶음 발송
+
+일괄 배정/상태 변경처럼 짧은 시간에 같은 수신자에게 같은 계열 알림이 반복되는 경우
+대기 시간(window) 동안 모았다가 1건의 요약(digest) 메시지로 발송한다.
+
+- 묶음 단위: (수신자, 템플릿 계열) - 예: 협력사 배정 알림 10건 → "새로운 서비스 10건 배정" 1건
+- 대기 시간: 템플릿 키별 설정 (NOTIFICATION_COALESCE_WINDOWS, 0 또는 미지정이면 즉시 발송)
+- 같은 신청(coalesce_key)의 알림이 다시 들어오면 최신 알림만 유지 (일정 반복 수정 시 마지막 일정만 발송)
+- 모인 알림이 1건이면 원래 메시지 그대로 발송
+- 요약 메시지가 DIGEST_MAX_CHARS를 넘으면 여러 건으로 나누어 발송
+
+대기 중인 알림은 워커(프로세스) 메모리에 보관하며, 종료 시 flush_all로 모두 발송한다.
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 템플릿 계열 (같은 계열의 알림끼리 묶음)
+COALESCE_FAMILIES = {
+    "partner_notify_assignment": "partner_assignment",
+    "partner_schedule_notify": "partner_schedule",
+    "partner_assigned": "assignment",
+    "assignment_changed": "assignment",
+    "schedule_confirmed": "schedule",
+    "schedule_changed": "schedule",
+}
+
+# 계열별 요약 메시지 (LMS 제목, 머리말)
+DIGEST_TITLES = {
+    "partner_assignment": ("[배정알림]", "새로운 서비스 {count}건이 배정되었습니다."),
+    "partner_schedule": ("[작업일정]", "작업 일정 {count}건이 확정되었습니다."),
+    "assignment": ("[배정안내]", "서비스 배정 안내 {count}건입니다."),
+    "schedule": ("[일정안내]", "서비스 일정 안내 {count}건입니다."),
+}
+
+DIGEST_MAX_CHARS = 900  # 요약 메시지 1건 최대 길이 (LMS 2,000byte 이내)
+
+# 묶음 대기 중 발송 결과 코드 (send_sms 반환 형식)
+COALESCED_CODE = "coalesced"
+
+
+class _PendingDigest:
+    """수신자 + 계열 단위 대기 알림"""
+
+    __slots__ = ("receiver", "family", "template_key", "title", "items", "received", "task")
+
+    def __init__(self, receiver: str, family: str, template_key: str, title: Optional[str]):
+        self.receiver = receiver
+        self.family = family
+        self.template_key = template_key
+        self.title = title
+        # coalesce_key → (메시지, 요약 라인, LMS 제목, 템플릿 키), 입력 순서 유지
+        self.items: dict[str, tuple] = {}
+        self.received = 0
+        self.task: Optional[asyncio.Task] = None
+
+
+class NotificationCoalescer:
+    """알림 SMS 묶음 발송기"""
+
+    def __init__(self, windows: dict[str, int]):
+        self.windows = windows
+        self._pending: dict[tuple[str, str], _PendingDigest] = {}
+
+        # 누적 통계 (health 표시용)
+        self._received = 0
+        self._sent = 0
+        self._digests = 0
+
+    def window_for(self, template_key: Optional[str]) -> int:
+        """템플릿 키의 묶음 대기 시간 (초, 0이면 즉시 발송)"""
+        if not template_key:
+            return 0
+        return max(0, self.windows.get(template_key, 0))
+
+    def add(
+        self,
+        receiver: str,
+        message: str,
+        title: Optional[str],
+        template_key: str,
+        digest_line: Optional[str] = None,
+        coalesce_key: Optional[str] = None,
+    ) -> dict:
+        """
+        알림을 묶음 대기열에 추가 (첫 알림 기준 대기 시간 후 발송)
+
+        Args:
+            receiver: 수신자 전화번호
+            message: 단건 발송 시 메시지
+            title: 단건 발송 시 LMS 제목
+            template_key: 템플릿 키 (window_for가 0보다 커야 함)
+            digest_line: 요약 메시지에 들어갈 한 줄 요약 (없으면 메시지 전체)
+            coalesce_key: 같은 대상 식별 키 (예: 신청번호, 같은 키는 최신 알림만 유지)
+
+        Returns:
+            묶음 대기 결과 (send_sms 반환 형식)
+        """
+        family = COALESCE_FAMILIES.get(template_key, template_key)
+        key = (receiver, family)
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = _PendingDigest(receiver, family, template_key, title)
+            self._pending[key] = pending
+            window = self.window_for(template_key)
+            pending.task = asyncio.create_task(self._flush_later(key, window))
+
+        # 같은 대상의 이전 알림은 제거 후 뒤에 추가 (최신 알림만 유지)
+        item_key = coalesce_key or f"#{pending.received}"
+        pending.items.pop(item_key, None)
+        pending.items[item_key] = (message, digest_line or message, title, template_key)
+        pending.received += 1
+        self._received += 1
+
+        return {
+            "result_code": COALESCED_CODE,
+            "message": f"묶음 발송 대기 ({self.window_for(pending.template_key)}초 이내 발송)",
+            "msg_id": None,
+        }
+
+    async def _flush_later(self, key: tuple[str, str], window: int):
+        await asyncio.sleep(window)
+        await self.flush(key)
+
+    async def flush(self, key: tuple[str, str]) -> int:
+        """
+        대기 알림 발송
+
+        Args:
+            key: (수신자, 계열)
+
+        Returns:
+            실제 발송 건수
+        """
+        from app.services.sms import fan_out_sms
+
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return 0
+
+        if len(pending.items) == 1:
+            message, _, title, template_key = next(iter(pending.items.values()))
+            messages = [(message, title, template_key)]
+        else:
+            title, header = DIGEST_TITLES.get(pending.family, (pending.title, "알림 {count}건입니다."))
+            lines = [line for _, line, _, _ in pending.items.values()]
+            messages = [
+                (digest, title, pending.template_key)
+                for digest in build_digest_messages(header, lines)
+            ]
+            self._digests += len(messages)
+
+        for message, title, template_key in messages:
+            try:
+                await fan_out_sms([pending.receiver], message, title, template_key, coalesce=False)
+            except Exception as e:
+                logger.error(f"Coalesced SMS send error: {e}")
+
+        self._sent += len(messages)
+        if pending.received > len(messages):
+            logger.info(
+                f"SMS coalesced: family={pending.family}, receiver=***{pending.receiver[-4:]}, "
+                f"received={pending.received}, sent={len(messages)}, saved={pending.received - len(messages)}"
+            )
+        return len(messages)
+
+    async def flush_all(self) -> int:
+        """대기 중인 알림 전체 즉시 발송 (애플리케이션 종료 시)"""
+        sent = 0
+        for key in list(self._pending):
+            pending = self._pending.get(key)
+            if pending and pending.task:
+                pending.task.cancel()
+            sent += await self.flush(key)
+        return sent
+
+    def snapshot(self) -> dict:
+        """현재 상태 요약 (health 엔드포인트용)"""
+        return {
+            "pending_receivers": len(self._pending),
+            "pending_messages": sum(len(p.items) for p in self._pending.values()),
+            "received": self._received,
+            "sent": self._sent,
+            "digests": self._digests,
+            "saved": self._received - self._sent - sum(p.received for p in self._pending.values()),
+        }
+
+
+def build_digest_messages(header: str, lines: list[str]) -> list[str]:
+    """
+    요약 메시지 생성 (DIGEST_MAX_CHARS 초과 시 여러 건으로 분할)
+
+    Args:
+        header: 머리말 ({count}는 해당 메시지의 항목 수로 치환)
+        lines: 항목별 한 줄 요약
+
+    Returns:
+        요약 메시지 목록
+    """
+    chunks: list[list[str]] = [[]]
+    length = 0
+    for line in lines:
+        entry = f"- {line}"
+        if chunks[-1] and length + len(entry) + 1 > DIGEST_MAX_CHARS:
+            chunks.append([])
+            length = 0
+        chunks[-1].append(entry)
+        length += len(entry) + 1
+
+    return [
+        "\n".join([f"[전방홈케어] {header.format(count=len(chunk))}", *chunk])
+        for chunk in chunks
+    ]
+
+
+def is_coalesced_result(result: Optional[dict]) -> bool:
+    """묶음 대기로 아직 발송되지 않은 결과인지 확인"""
+    return bool(result) and result.get("result_code") == COALESCED_CODE
+
+
+notification_coalescer = NotificationCoalescer(settings.notification_coalesce_windows)
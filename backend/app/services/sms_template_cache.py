@@ -0,0 +1,228 @@
+"""
+SMS Template Cache
+SMS 템플릿 컴파일 캐시
+
+- 시작 시 활성 템플릿을 모두 로드하여 치환 구간(segment)과 라인 제거 규칙으로 미리 컴파일
+- 발송 시에는 DB 조회 없이 메모리에서 렌더링 (CPU 연산만 수행)
+- 템플릿 생성/수정/삭제 시 현재 워커는 즉시 무효화,
+  다른 워커는 버전(count, max(updated_at)) 확인으로 SMS_TEMPLATE_CACHE_TTL 이내 반영
+
+렌더링 규칙은 기존 SMSTemplate.format_message와 동일:
+- 전달된 변수만 치환 ({key} → 값, 빈 값은 "")
+- 전달되지 않은 변수는 원문 유지
+- 콜론(:)으로 끝나는 라인, 빈 라인 제거 후 전체 strip
+"""
+
+import re
+import time
+import logging
+from typing import Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+_PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+
+# 라인 제거 규칙
+LINE_KEEP = 0  # 항상 포함
+LINE_DROP = 1  # 항상 제거 (빈 라인, 콜론으로 끝나는 고정 라인)
+LINE_CHECK = 2  # 렌더링 후 판단 (라인이 변수로 끝나는 경우)
+
+
+def _is_dropped(line: str) -> bool:
+    """렌더링된 라인 제거 여부 (빈 라인 또는 콜론으로 끝나는 라인)"""
+    stripped = line.rstrip()
+    return not stripped or stripped.endswith(":")
+
+
+class CompiledTemplate:
+    """
+    컴파일된 SMS 템플릿
+
+    각 라인은 (literals, names, rule) 형태:
+    - literals: 변수 사이의 고정 문자열 (len(names) + 1개)
+    - names: 변수명 목록
+    - rule: LINE_KEEP / LINE_DROP / LINE_CHECK
+    """
+
+    __slots__ = ("template_key", "content", "lines", "variables")
+
+    def __init__(self, content: str, template_key: Optional[str] = None):
+        self.template_key = template_key
+        self.content = content
+        self.lines = tuple(self._compile_line(line) for line in content.split("\n"))
+        self.variables = frozenset(name for _, names, _ in self.lines for name in names)
+
+    @staticmethod
+    def _compile_line(line: str) -> tuple:
+        parts = _PLACEHOLDER_RE.split(line)
+        literals = tuple(parts[0::2])
+        names = tuple(parts[1::2])
+
+        if not names:
+            rule = LINE_DROP if _is_dropped(line) else LINE_KEEP
+        elif literals[-1].strip():
+            # 마지막 변수 뒤 고정 문자열이 있으면 제거 여부가 값과 무관하게 결정됨
+            rule = LINE_DROP if literals[-1].rstrip().endswith(":") else LINE_KEEP
+        else:
+            rule = LINE_CHECK
+
+        return literals, names, rule
+
+    def render(self, variables: dict) -> str:
+        """
+        변수를 치환하여 메시지 생성
+
+        Args:
+            variables: 변수명 → 값 (빈 값은 ""로 치환)
+
+        Returns:
+            변수가 치환된 메시지 (빈 값이 포함된 라인은 자동 제거)
+        """
+        values = {}
+        multiline = False
+        for name in self.variables:
+            if name in variables:
+                value = variables[name]
+                text = str(value) if value else ""
+                if "\n" in text:
+                    multiline = True
+                values[name] = text
+
+        output = []
+        for literals, names, rule in self.lines:
+            if not names:
+                if rule == LINE_KEEP:
+                    output.append(literals[0])
+                continue
+
+            buf = [literals[0]]
+            for name, literal in zip(names, literals[1:]):
+                buf.append(values.get(name, "{" + name + "}"))
+                buf.append(literal)
+            line = "".join(buf)
+
+            if multiline and "\n" in line:
+                # 값에 줄바꿈이 포함되면 실제 라인 단위로 다시 판단
+                output.extend(part for part in line.split("\n") if not _is_dropped(part))
+            elif rule == LINE_KEEP or (rule == LINE_CHECK and not _is_dropped(line)):
+                output.append(line)
+
+        return "\n".join(output).strip()
+
+
+def compile_template(content: str, template_key: Optional[str] = None) -> CompiledTemplate:
+    """템플릿 내용을 컴파일"""
+    return CompiledTemplate(content, template_key)
+
+
+class SMSTemplateRegistry:
+    """활성 SMS 템플릿 레지스트리 (프로세스 단위)"""
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._templates: dict[str, CompiledTemplate] = {}
+        self._version: Optional[tuple] = None
+        self._checked_at = 0.0
+        self._loaded = False
+
+    async def _fetch_version(self, db: AsyncSession) -> tuple:
+        from app.models.sms_template import SMSTemplate
+
+        result = await db.execute(
+            select(func.count(SMSTemplate.id), func.max(SMSTemplate.updated_at))
+        )
+        count, updated_at = result.one()
+        return count, updated_at
+
+    async def load(self, db: AsyncSession) -> int:
+        """
+        활성 템플릿 전체 로드 및 컴파일
+
+        Returns:
+            로드된 템플릿 수
+        """
+        from app.models.sms_template import SMSTemplate
+
+        version = await self._fetch_version(db)
+        result = await db.execute(
+            select(SMSTemplate.template_key, SMSTemplate.content).where(
+                SMSTemplate.is_active == True,
+            )
+        )
+        self._templates = {
+            key: compile_template(content, key)
+            for key, content in result.all()
+        }
+        self._version = version
+        self._checked_at = time.monotonic()
+        self._loaded = True
+
+        logger.info(f"SMS template cache loaded: {len(self._templates)} templates")
+        return len(self._templates)
+
+    def invalidate(self):
+        """캐시 무효화 (다음 조회 시 다시 로드)"""
+        self._loaded = False
+
+    async def _ensure_fresh(self, db: AsyncSession):
+        if not self._loaded:
+            await self.load(db)
+            return
+
+        now = time.monotonic()
+        if now - self._checked_at < self._ttl:
+            return
+
+        # 다른 워커의 변경 확인
+        self._checked_at = now
+        version = await self._fetch_version(db)
+        if version != self._version:
+            logger.info("SMS templates changed, reloading cache")
+            await self.load(db)
+
+    async def get(
+        self,
+        template_key: str,
+        db: Optional[AsyncSession] = None,
+    ) -> Optional[CompiledTemplate]:
+        """
+        컴파일된 활성 템플릿 조회
+
+        Args:
+            template_key: 템플릿 키
+            db: 데이터베이스 세션 (캐시 갱신이 필요할 때만 사용, 없으면 자동 생성)
+
+        Returns:
+            CompiledTemplate, 템플릿이 없거나 비활성이면 None
+        """
+        if not self._loaded or time.monotonic() - self._checked_at >= self._ttl:
+            if db is None:
+                async with AsyncSessionLocal() as session:
+                    await self._ensure_fresh(session)
+            else:
+                await self._ensure_fresh(db)
+
+        return self._templates.get(template_key)
+
+
+sms_template_registry = SMSTemplateRegistry(ttl=settings.SMS_TEMPLATE_CACHE_TTL)
+
+
+async def load_sms_template_cache_async(db: AsyncSession) -> int:
+    """애플리케이션 시작 시 템플릿 캐시 로드"""
+    try:
+        return await sms_template_registry.load(db)
+    except Exception as e:
+        logger.error(f"Failed to load SMS template cache: {e}")
+        return 0
+
+
+def invalidate_sms_template_cache():
+    """템플릿 변경 시 호출 (현재 워커 즉시 반영)"""
+    sms_template_registry.invalidate()
@@ -0,0 +1,181 @@
+"""
+알리고 SMS API 로컬 시뮬레이터
+
+사용법:
+    cd backend
+    python -m scripts.aligo_simulator --port 8090 --latency-ms 80 --jitter-ms 40 --error-rate 0.01 --rate-limit 200
+
+    # 백엔드 설정 (.env)
+    ALIGO_API_BASE_URL=http://127.0.0.1:8090
+    ALIGO_API_KEY=simulator  # 비어 있으면 send_sms가 HTTP 호출 없이 반환하므로 임의 값 지정
+
+기능:
+    - 알리고 /send/ 엔드포인트 대체 (form-urlencoded SMS/LMS, multipart MMS 모두 수신)
+    - 응답 지연 주입 (고정 지연 + 무작위 편차)
+    - 오류 주입 (지정 비율로 result_code 음수 응답)
+    - 처리량 제한 (초당 요청 수 초과 시 HTTP 429 + result_code -429 응답)
+    - GET /stats: 요청/성공/오류/제한 건수, POST /stats/reset: 통계 초기화
+    - 실제 문자는 발송되지 않음 (과금 없음)
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+# 알리고 필수 파라미터
+REQUIRED_FIELDS = ("key", "user_id", "sender", "receiver", "msg")
+
+# 시뮬레이터 전용 결과 코드
+RESULT_MISSING_PARAM = "-101"  # 필수 파라미터 누락
+RESULT_INJECTED_ERROR = "-99"  # 주입된 오류
+RESULT_THROTTLED = "-429"  # 처리량 제한
+
+
+class TokenBucket:
+    """초당 요청 수 제한 (토큰 버킷)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated_at = time.monotonic()
+
+    def acquire(self) -> bool:
+        """토큰 1개 사용 (부족하면 False)"""
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+def create_app(
+    latency_ms: float = 0,
+    jitter_ms: float = 0,
+    error_rate: float = 0.0,
+    rate_limit: float = 0,
+    seed: int | None = None,
+) -> FastAPI:
+    """
+    시뮬레이터 앱 생성
+
+    Args:
+        latency_ms: 고정 응답 지연 (ms)
+        jitter_ms: 무작위 추가 지연 상한 (ms)
+        error_rate: 오류 응답 비율 (0.0 ~ 1.0)
+        rate_limit: 초당 허용 요청 수 (0이면 제한 없음)
+        seed: 난수 시드 (재현 가능한 오류 주입)
+
+    Returns:
+        FastAPI 앱
+    """
+    app = FastAPI(title="Aligo Simulator")
+    rng = random.Random(seed)
+    bucket = TokenBucket(rate_limit) if rate_limit > 0 else None
+    stats = Counter()
+    state = {"msg_id": 0, "started_at": time.monotonic()}
+
+    @app.post("/send/")
+    async def send(request: Request):
+        form = await request.form()
+        stats["requests"] += 1
+
+        # 처리량 제한은 지연 전에 판단 (실제 게이트웨이의 즉시 거절과 동일)
+        if bucket and not bucket.acquire():
+            stats["throttled"] += 1
+            return JSONResponse(
+                status_code=429,
+                content={"result_code": RESULT_THROTTLED, "message": "too many requests (simulated)"},
+            )
+
+        delay = latency_ms + (rng.uniform(0, jitter_ms) if jitter_ms else 0)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+
+        missing = [field for field in REQUIRED_FIELDS if not form.get(field)]
+        if missing:
+            stats["errors"] += 1
+            return {"result_code": RESULT_MISSING_PARAM, "message": f"missing parameter: {', '.join(missing)}"}
+
+        if error_rate and rng.random() < error_rate:
+            stats["errors"] += 1
+            return {"result_code": RESULT_INJECTED_ERROR, "message": "injected error (simulated)"}
+
+        has_image = any(key in form for key in ("image", "image1", "image2", "image3"))
+        msg_type = "MMS" if has_image else (form.get("msg_type") or "SMS")
+        stats["sent"] += 1
+        stats[f"sent_{msg_type.lower()}"] += 1
+        state["msg_id"] += 1
+
+        return {
+            "result_code": "1",
+            "message": "success",
+            "msg_id": str(state["msg_id"]),
+            "success_cnt": 1,
+            "error_cnt": 0,
+            "msg_type": msg_type,
+        }
+
+    @app.get("/stats")
+    async def get_stats():
+        elapsed = time.monotonic() - state["started_at"]
+        return {
+            **stats,
+            "elapsed_seconds": round(elapsed, 3),
+            "requests_per_second": round(stats["requests"] / elapsed, 2) if elapsed else 0,
+        }
+
+    @app.post("/stats/reset")
+    async def reset_stats():
+        stats.clear()
+        state["started_at"] = time.monotonic()
+        return {"reset": True}
+
+    return app
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="알리고 SMS API 로컬 시뮬레이터")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8090, help="포트")
+    parser.add_argument("--latency-ms", type=float, default=50, help="고정 응답 지연 (ms)")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="무작위 추가 지연 상한 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0.0 ~ 1.0)")
+    parser.add_argument("--rate-limit", type=float, default=0, help="초당 허용 요청 수 (0: 제한 없음)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("알리고 SMS API 시뮬레이터")
+    print("=" * 60)
+    print(f"  주소: http://{args.host}:{args.port}/send/")
+    print(f"  지연: {args.latency_ms}ms (+0~{args.jitter_ms}ms)")
+    print(f"  오류 비율: {args.error_rate:.1%}")
+    print(f"  처리량 제한: {args.rate_limit or '없음'}{'/s' if args.rate_limit else ''}")
+    print("=" * 60)
+
+    app = create_app(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        seed=args.seed,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
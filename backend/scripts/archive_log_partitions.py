@@ -0,0 +1,84 @@
+"""
+로그 테이블(sms_logs, audit_logs) 파티션 유지보수 스크립트
+
+사용법:
+    cd backend
+    python -m scripts.archive_log_partitions [--retention-months 12] [--dry-run]
+
+기능:
+    - 이번 달 및 향후 파티션 생성 (LOG_PARTITION_PREMAKE_MONTHS)
+    - 보관 기간이 지난 파티션을 분리 → LOG_ARCHIVE_DIR에 NDJSON.gz로 내보내기 → 삭제
+    - --retention-months 생략 시 LOG_PARTITION_RETENTION_MONTHS 사용 (0이면 아카이브 안 함)
+    - --dry-run: 아카이브 대상 파티션만 출력 (변경 없음)
+    - 애플리케이션도 주기적으로 같은 작업을 수행하며, 동시 실행 시 한쪽만 진행됨 (advisory lock)
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.core.database import async_engine
+from app.services.log_partition import PARTITIONED_TABLES, list_partitions, run_partition_maintenance
+
+
+async def show_partitions():
+    """현재 파티션 목록 출력"""
+    async with async_engine.connect() as conn:
+        for table in PARTITIONED_TABLES:
+            partitions = await list_partitions(conn, table)
+            print(f"\n{table}: {len(partitions)}개 파티션")
+            for name, month, attached in partitions:
+                print(f"  {name} ({month:%Y-%m}){'' if attached else ' [분리됨, 아카이브 대기]'}")
+
+
+async def run(args):
+    result = await run_partition_maintenance(
+        retention_months=args.retention_months,
+        dry_run=args.dry_run,
+    )
+    if not result:
+        print("다른 프로세스에서 유지보수가 진행 중입니다. 잠시 후 다시 실행하세요.")
+        return
+
+    print(f"\n생성된 파티션: {', '.join(result['created']) or '없음'}")
+
+    label = "아카이브 대상" if args.dry_run else "아카이브 완료"
+    print(f"{label}: {len(result['archived'])}개")
+    for item in result["archived"]:
+        rows = "" if item["rows"] is None else f" ({item['rows']}행)"
+        print(f"  {item['partition']}{rows} -> {item['path']}")
+
+    await show_partitions()
+    await async_engine.dispose()
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="로그 테이블 파티션 유지보수")
+    parser.add_argument(
+        "--retention-months",
+        type=int,
+        default=None,
+        help=f"DB 보관 개월 수 (기본: {settings.LOG_PARTITION_RETENTION_MONTHS}, 0: 아카이브 안 함)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="아카이브 대상만 출력")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("로그 파티션 유지보수 스크립트")
+    print("=" * 60)
+
+    asyncio.run(run(args))
+
+    print("\n" + "=" * 60)
+    print("완료!")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+신청 분석 일별 롤업(application_daily_stats, application_daily_lead_times) 백필 스크립트
+
+사용법:
+    cd backend
+    python -m scripts.backfill_application_analytics [--from 2025-01-01] [--to 2026-01-05] [--chunk-days 31]
+
+기능:
+    - 지정 기간(UTC 일자)의 롤업 행을 지우고 원본 테이블에서 다시 집계 (재실행해도 결과 동일)
+    - --from 생략 시 가장 오래된 신청일, --to 생략 시 오늘
+    - --chunk-days 단위로 커밋 (대량 데이터에서 트랜잭션 크기 제한)
+    - 애플리케이션의 증분 롤업과 동시에 실행되면 잠금을 기다렸다가 진행 (advisory lock)
+    - 배포 직후 1회, 또는 롤업 누락(장기 중단, 과거 신청 삭제 등)이 의심될 때 실행
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+from datetime import date, datetime, timezone
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.services.analytics_rollup import run_backfill
+
+
+async def run(args) -> bool:
+    async with AsyncSessionLocal() as db:
+        start_day = args.date_from
+        if start_day is None:
+            start_day = await db.scalar(
+                text("SELECT (MIN(created_at) AT TIME ZONE 'UTC')::date FROM applications")
+            )
+            await db.rollback()
+            if start_day is None:
+                print("집계할 신청 데이터가 없습니다.")
+                return True
+        end_day = args.date_to or datetime.now(timezone.utc).date()
+
+        if start_day > end_day:
+            print(f"❌ 시작일({start_day})이 종료일({end_day})보다 이후입니다.")
+            return False
+
+        print(f"\n집계 기간: {start_day} ~ {end_day} ({args.chunk_days}일 단위 커밋)")
+        days = await run_backfill(db, start_day, end_day, chunk_days=args.chunk_days)
+
+        result = await db.execute(text("""
+            SELECT
+                (SELECT COUNT(*) FROM application_daily_stats WHERE day BETWEEN :start_day AND :end_day),
+                (SELECT COUNT(*) FROM application_daily_lead_times WHERE day BETWEEN :start_day AND :end_day)
+        """), {"start_day": start_day, "end_day": end_day})
+        stat_rows, lead_time_rows = result.one()
+
+    await async_engine.dispose()
+
+    print(f"✅ {days}일 집계 완료 (application_daily_stats {stat_rows}행, application_daily_lead_times {lead_time_rows}행)")
+    return True
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="신청 분석 일별 롤업 백필")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, default=None,
+                        help="시작일 (YYYY-MM-DD, 기본: 가장 오래된 신청일)")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, default=None,
+                        help="종료일 (YYYY-MM-DD, 기본: 오늘)")
+    parser.add_argument("--chunk-days", type=int, default=31, help="커밋 단위 일수 (기본: 31)")
+    args = parser.parse_args()
+
+    if args.chunk_days < 1:
+        parser.error("--chunk-days는 1 이상이어야 합니다")
+
+    print("=" * 60)
+    print("신청 분석 롤업 백필 스크립트")
+    print("=" * 60)
+
+    ok = asyncio.run(run(args))
+
+    print("\n" + "=" * 60)
+    print("완료!" if ok else "실패")
+    print("=" * 60)
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+기존 신청 데이터에 대한 지역 코드(province_code, district_code) 생성 스크립트
+
+사용법:
+    cd backend
+    python -m scripts.backfill_region_codes
+
+기능:
+    - province_code가 NULL인 Application의 주소를 복호화하여 지역 코드 도출
+    - provinces / districts 테이블 기준 매칭 (seed_regions 선행 필요)
+    - 매칭 실패 주소는 NULL로 유지 (재실행 시 다시 시도)
+    - 배치 처리로 대량 데이터 처리 지원
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.database import SessionLocal
+from app.core.encryption import decrypt_value
+from app.models import Application, Province, District
+from app.services.region_code import RegionMatcher
+
+
+def load_matcher(db) -> RegionMatcher:
+    """지역 데이터로 매처 생성"""
+    provinces = db.query(Province.code, Province.name, Province.short_name).all()
+    districts = db.query(District.code, District.province_code, District.name).all()
+    return RegionMatcher(
+        [tuple(row) for row in provinces],
+        [tuple(row) for row in districts],
+    )
+
+
+def backfill_applications(db, matcher: RegionMatcher, batch_size: int = 500):
+    """신청 데이터 지역 코드 생성"""
+    print("\n=== 신청(Application) 지역 코드 생성 ===")
+
+    total = db.query(Application).filter(Application.province_code.is_(None)).count()
+    print(f"총 {total}개의 신청 데이터 처리 예정 (province_code가 NULL인 데이터)")
+
+    if total == 0:
+        print("처리할 데이터가 없습니다.")
+        return
+
+    processed = 0
+    unmatched = 0
+    errors = 0
+    last_id = 0
+
+    # 배치 처리 (매칭 실패 행은 NULL로 남으므로 id 기준으로 진행)
+    while True:
+        applications = (
+            db.query(Application)
+            .filter(
+                Application.province_code.is_(None),
+                Application.id > last_id,
+            )
+            .order_by(Application.id)
+            .limit(batch_size)
+            .all()
+        )
+
+        if not applications:
+            break
+
+        for app in applications:
+            last_id = app.id
+            try:
+                address = decrypt_value(app.address) if app.address else None
+                province_code, district_code = matcher.match(address)
+
+                if province_code:
+                    app.province_code = province_code
+                    app.district_code = district_code
+                    processed += 1
+                else:
+                    unmatched += 1
+                    print(f"  매칭 실패 (ID={app.id})")
+
+            except Exception as e:
+                errors += 1
+                print(f"  오류 (ID={app.id}): {e}")
+
+        # 배치 커밋
+        db.commit()
+        current = processed + unmatched + errors
+        print(f"  진행: {current}/{total} ({processed} 성공, {unmatched} 매칭 실패, {errors} 오류)")
+
+    print(f"완료: {processed}개 지역 코드 생성, {unmatched}개 매칭 실패, {errors}개 오류")
+
+
+def show_statistics(db):
+    """결과 통계"""
+    print("\n=== 지역 코드 통계 ===")
+
+    app_total = db.query(Application).count()
+    with_province = db.query(Application).filter(Application.province_code.isnot(None)).count()
+    with_district = db.query(Application).filter(Application.district_code.isnot(None)).count()
+
+    print(f"Application province_code: {with_province}/{app_total}")
+    print(f"Application district_code: {with_district}/{app_total}")
+
+
+def main():
+    """메인 함수"""
+    print("=" * 60)
+    print("지역 코드 백필 스크립트")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        matcher = load_matcher(db)
+        if not matcher.is_loaded:
+            print("지역 데이터가 없습니다. 먼저 python -m scripts.seed_regions 를 실행하세요.")
+            return
+
+        backfill_applications(db, matcher)
+
+        show_statistics(db)
+
+        print("\n" + "=" * 60)
+        print("백필 완료!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n오류 발생: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+기존 SMS 로그에 대한 수신번호 해시(receiver_phone_hash) 생성 스크립트
+
+사용법:
+    cd backend
+    python -m scripts.backfill_sms_log_hashes
+
+기능:
+    - receiver_phone_hash가 NULL인 SMSLog의 수신번호를 복호화하여 해시 생성
+    - 필요한 컬럼(id, receiver_phone)만 조회하고 PK 기준 일괄 UPDATE
+    - 복호화 실패/빈 번호는 NULL로 유지 (id 기준으로 진행하므로 무한 반복 없음)
+    - 배치 처리로 대량 데이터 처리 지원
+"""
+
+import sys
+import os
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import update
+
+from app.core.database import SessionLocal
+from app.core.encryption import decrypt_value, generate_search_hash
+from app.models import SMSLog
+
+
+def backfill_sms_logs(db, batch_size: int = 1000):
+    """SMS 로그 receiver_phone_hash 생성"""
+    print("\n=== SMS 로그(SMSLog) receiver_phone_hash 생성 ===")
+
+    total = db.query(SMSLog).filter(SMSLog.receiver_phone_hash.is_(None)).count()
+    print(f"총 {total}개의 로그 처리 예정 (receiver_phone_hash가 NULL인 데이터)")
+
+    if total == 0:
+        print("처리할 데이터가 없습니다.")
+        return
+
+    processed = 0
+    skipped = 0
+    errors = 0
+    last_id = 0
+
+    while True:
+        rows = (
+            db.query(SMSLog.id, SMSLog.receiver_phone)
+            .filter(
+                SMSLog.receiver_phone_hash.is_(None),
+                SMSLog.id > last_id,
+            )
+            .order_by(SMSLog.id)
+            .limit(batch_size)
+            .all()
+        )
+
+        if not rows:
+            break
+
+        updates = []
+        for log_id, receiver_phone in rows:
+            last_id = log_id
+            try:
+                phone = decrypt_value(receiver_phone) if receiver_phone else None
+                phone_hash = generate_search_hash(phone, "phone")
+                if phone_hash:
+                    updates.append({"id": log_id, "receiver_phone_hash": phone_hash})
+                    processed += 1
+                else:
+                    skipped += 1
+            except Exception as e:
+                errors += 1
+                print(f"  오류 (ID={log_id}): {e}")
+
+        # PK 기준 일괄 UPDATE 후 배치 커밋
+        if updates:
+            db.execute(update(SMSLog), updates)
+        db.commit()
+        current = processed + skipped + errors
+        print(f"  진행: {current}/{total} ({processed} 성공, {skipped} 건너뜀, {errors} 오류)")
+
+    print(f"완료: {processed}개 해시 생성, {skipped}개 건너뜀, {errors}개 오류")
+
+
+def show_statistics(db):
+    """결과 통계"""
+    print("\n=== 해시 생성 통계 ===")
+
+    log_total = db.query(SMSLog).count()
+    with_hash = db.query(SMSLog).filter(SMSLog.receiver_phone_hash.isnot(None)).count()
+    print(f"SMSLog receiver_phone_hash: {with_hash}/{log_total}")
+
+
+def main():
+    """메인 함수"""
+    print("=" * 60)
+    print("SMS 로그 수신번호 해시 백필 스크립트")
+    print("=" * 60)
+
+    db = SessionLocal()
+    try:
+        backfill_sms_logs(db)
+
+        show_statistics(db)
+
+        print("\n" + "=" * 60)
+        print("백필 완료!")
+        print("=" * 60)
+
+    except Exception as e:
+        print(f"\n오류 발생: {e}")
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
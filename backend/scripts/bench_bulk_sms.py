@@ -0,0 +1,238 @@
+"""
+대량 SMS 발송 처리량 벤치마크 (로컬 알리고 시뮬레이터 사용)
+
+사용법:
+    cd backend
+    python -m scripts.aligo_simulator --latency-ms 80 --jitter-ms 40   # 별도 터미널
+    python -m scripts.bench_bulk_sms --recipients 1000 [--batch-delay 0] [--keep]
+
+기능:
+    - 벤치마크용 BulkSMSJob과 가상 수신자(bulk_sms_recipients)를 생성하고
+      BulkSMSService.execute_bulk_send를 그대로 실행 (실제 발송 경로 + DB 기록)
+    - 초당 발송 건수, 건별 발송 지연 p50/p99, 메시지당 DB 커밋 수 측정
+    - 알리고 주소가 로컬(localhost/127.0.0.1)이 아니면 실행 거부 (실발송/과금 방지)
+    - 종료 시 벤치마크 Job, 수신자, 로그, 일별 통계 증분을 정리 (--keep 지정 시 유지)
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import math
+import time
+from urllib.parse import urlparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+BENCH_JOB_TYPE = "benchmark"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="대량 SMS 발송 처리량 벤치마크")
+    parser.add_argument("--recipients", type=int, default=1000, help="가상 수신자 수")
+    parser.add_argument("--aligo-url", default="http://127.0.0.1:8090", help="알리고 시뮬레이터 주소")
+    parser.add_argument("--batch-delay", type=float, default=None, help="배치 간 대기 시간 (기본: BATCH_DELAY)")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 데이터 유지")
+    return parser.parse_args()
+
+
+def configure_environment(aligo_url: str):
+    """앱 설정 로드 전에 알리고 주소/인증값을 시뮬레이터용으로 지정"""
+    host = urlparse(aligo_url).hostname
+    if host not in LOCAL_HOSTS:
+        print(f"알리고 주소가 로컬이 아닙니다: {aligo_url} (실발송 방지를 위해 중단)")
+        sys.exit(1)
+
+    # 환경 변수가 .env보다 우선하므로 실제 키가 설정되어 있어도 시뮬레이터로만 요청됨
+    os.environ["ALIGO_API_BASE_URL"] = aligo_url
+    os.environ["ALIGO_API_KEY"] = "simulator"
+    os.environ["ALIGO_USER_ID"] = "simulator"
+    os.environ["ALIGO_SENDER"] = "0000000000"
+    os.environ["DEBUG"] = "false"  # SQL echo 비활성화
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """백분위수 (최근접 순위)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+async def create_job(db, count: int) -> int:
+    """벤치마크 Job 및 가상 수신자 생성 (수신자 확정 저장 단계는 생략)"""
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    from app.core.encryption import encrypt_value
+    from app.models import BulkSMSJob, BulkSMSRecipient
+    from app.services import bulk_sms
+
+    job = BulkSMSJob(
+        job_type=BENCH_JOB_TYPE,
+        title="throughput benchmark",
+        target_type="customer",
+        message="[전방홈케어] 대량 발송 벤치마크 메시지입니다.",
+        total_count=count,
+        total_batches=math.ceil(count / bulk_sms.BATCH_SIZE),
+        created_by=0,
+    )
+    db.add(job)
+    await db.commit()
+
+    for start in range(0, count, bulk_sms.MATERIALIZE_CHUNK_SIZE):
+        rows = [
+            {
+                "job_id": job.id,
+                "recipient_type": "customer",
+                "recipient_id": i + 1,
+                "phone": encrypt_value(f"0109{i:07d}"),
+                "name": encrypt_value(f"벤치{i}"),
+                "label": f"BENCH-{i}",
+                "status": "pending",
+                "attempts": 0,
+            }
+            for i in range(start, min(start + bulk_sms.MATERIALIZE_CHUNK_SIZE, count))
+        ]
+        await db.execute(pg_insert(BulkSMSRecipient).values(rows))
+    await db.commit()
+
+    return job.id
+
+
+async def cleanup_job(db, job_id: int):
+    """벤치마크 데이터 정리 (일별 통계 증분도 되돌림)"""
+    from sqlalchemy import text
+
+    await db.execute(
+        text("""
+            UPDATE sms_daily_stats AS s
+            SET count = s.count - l.cnt, updated_at = now()
+            FROM (
+                SELECT (created_at AT TIME ZONE 'UTC')::date AS day, status,
+                       trigger_source, sms_type, COUNT(*) AS cnt
+                FROM sms_logs
+                WHERE bulk_job_id = :job_id
+                GROUP BY 1, 2, 3, 4
+            ) AS l
+            WHERE s.day = l.day AND s.status = l.status
+              AND s.trigger_source = l.trigger_source AND s.sms_type = l.sms_type
+        """),
+        {"job_id": job_id},
+    )
+    await db.execute(text("DELETE FROM sms_logs WHERE bulk_job_id = :job_id"), {"job_id": job_id})
+    await db.execute(text("DELETE FROM bulk_sms_recipients WHERE job_id = :job_id"), {"job_id": job_id})
+    await db.execute(text("DELETE FROM bulk_sms_jobs WHERE id = :job_id"), {"job_id": job_id})
+    await db.commit()
+
+
+async def fetch_simulator_stats(aligo_url: str, reset: bool = False) -> dict:
+    """시뮬레이터 통계 조회 / 초기화"""
+    import httpx
+
+    async with httpx.AsyncClient() as client:
+        if reset:
+            await client.post(f"{aligo_url.rstrip('/')}/stats/reset")
+            return {}
+        response = await client.get(f"{aligo_url.rstrip('/')}/stats")
+        return response.json()
+
+
+async def run(args):
+    from sqlalchemy import event, select
+    from sqlalchemy.orm import Session
+
+    from app.core.database import AsyncSessionLocal, async_engine
+    from app.models import BulkSMSJob
+    from app.services import bulk_sms
+
+    try:
+        await fetch_simulator_stats(args.aligo_url, reset=True)
+    except Exception as e:
+        print(f"시뮬레이터에 연결할 수 없습니다 ({args.aligo_url}): {e}")
+        print("먼저 python -m scripts.aligo_simulator 를 실행하세요.")
+        return
+
+    if args.batch_delay is not None:
+        bulk_sms.BATCH_DELAY = args.batch_delay
+
+    # 건별 발송 지연 측정 (BulkSMSService가 사용하는 send_sms를 감싸서 기록)
+    latencies: list[float] = []
+    original_send_sms = bulk_sms.send_sms
+
+    async def timed_send_sms(*send_args, **send_kwargs):
+        started = time.perf_counter()
+        try:
+            return await original_send_sms(*send_args, **send_kwargs)
+        finally:
+            latencies.append(time.perf_counter() - started)
+
+    bulk_sms.send_sms = timed_send_sms
+
+    # DB 커밋 수 측정 (AsyncSession 내부 동기 Session 기준)
+    commits = {"count": 0}
+
+    def count_commit(session):
+        commits["count"] += 1
+
+    async with AsyncSessionLocal() as db:
+        job_id = await create_job(db, args.recipients)
+    print(f"\n벤치마크 Job {job_id}: 수신자 {args.recipients}명, 배치 크기 {bulk_sms.BATCH_SIZE}, "
+          f"배치 간 대기 {bulk_sms.BATCH_DELAY}s")
+
+    event.listen(Session, "after_commit", count_commit)
+    started = time.perf_counter()
+    try:
+        await bulk_sms.execute_bulk_sms_job(job_id)
+    finally:
+        elapsed = time.perf_counter() - started
+        event.remove(Session, "after_commit", count_commit)
+        bulk_sms.send_sms = original_send_sms
+
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(
+            select(BulkSMSJob.status, BulkSMSJob.sent_count, BulkSMSJob.failed_count)
+            .where(BulkSMSJob.id == job_id)
+        )
+        status, sent, failed = result.one()
+        simulator = await fetch_simulator_stats(args.aligo_url)
+
+        processed = (sent or 0) + (failed or 0)
+        print("\n" + "=" * 60)
+        print("결과")
+        print("=" * 60)
+        print(f"  Job 상태: {status} (성공 {sent}, 실패 {failed})")
+        print(f"  소요 시간: {elapsed:.2f}s")
+        print(f"  처리량: {processed / elapsed:.1f} msg/s" if elapsed else "  처리량: -")
+        print(f"  발송 지연 p50: {percentile(latencies, 50) * 1000:.1f}ms, "
+              f"p99: {percentile(latencies, 99) * 1000:.1f}ms, max: {max(latencies, default=0) * 1000:.1f}ms")
+        print(f"  DB 커밋: {commits['count']}회 ({commits['count'] / processed:.3f}/msg)" if processed
+              else f"  DB 커밋: {commits['count']}회")
+        print(f"  시뮬레이터: 요청 {simulator.get('requests', 0)}, 성공 {simulator.get('sent', 0)}, "
+              f"오류 {simulator.get('errors', 0)}, 제한 {simulator.get('throttled', 0)}")
+
+        if args.keep:
+            print(f"\n벤치마크 데이터 유지 (Job {job_id})")
+        else:
+            await cleanup_job(db, job_id)
+            print("\n벤치마크 데이터 정리 완료")
+
+    await async_engine.dispose()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+    configure_environment(args.aligo_url)
+
+    print("=" * 60)
+    print("대량 SMS 발송 벤치마크")
+    print("=" * 60)
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+관리자 목록 페이지네이션 벤치마크 (OFFSET vs cursor)
+
+사용법:
+    cd backend
+    python -m scripts.bench_list_pagination [--rows 120000] [--page-size 20] [--runs 5] [--keep]
+
+기능:
+    - audit_logs에 벤치마크용 이력(entity_type=benchmark)을 생성한 뒤
+      관리자 목록과 같은 쿼리(app.core.pagination.paginate)로 페이지별 조회 시간 측정
+    - 페이지 1 ~ 5,000에서 OFFSET 모드와 cursor 모드의 중앙값/최대 지연 비교
+      (cursor 모드는 직전 페이지 마지막 항목의 커서로 조회)
+    - 종료 시 벤치마크 이력 삭제 (--keep 지정 시 유지)
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import statistics
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, text
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.core.pagination import encode_cursor, paginate
+from app.models.audit_log import AuditLog
+
+BENCH_ENTITY_TYPE = "benchmark"
+PAGES = (1, 10, 100, 1000, 5000)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="관리자 목록 페이지네이션 벤치마크")
+    parser.add_argument("--rows", type=int, default=120000, help="생성할 이력 수")
+    parser.add_argument("--page-size", type=int, default=20, help="페이지 크기")
+    parser.add_argument("--runs", type=int, default=5, help="페이지별 반복 측정 횟수")
+    parser.add_argument("--keep", action="store_true", help="벤치마크 데이터 유지")
+    return parser.parse_args()
+
+
+async def seed(db, rows: int):
+    """벤치마크 이력 생성 (이번 달 파티션 안에 들어가도록 10ms 간격, 일부 동일 시각 포함)"""
+    await db.execute(
+        text("""
+            INSERT INTO audit_logs (entity_type, entity_id, action, summary, admin_name, created_at)
+            SELECT :entity_type, i, 'update', 'pagination benchmark', 'benchmark',
+                   date_trunc('month', now()) + interval '1 hour' + (i / 2) * interval '10 milliseconds'
+            FROM generate_series(1, :rows) AS i
+        """),
+        {"entity_type": BENCH_ENTITY_TYPE, "rows": rows},
+    )
+    await db.commit()
+    await db.execute(text("ANALYZE audit_logs"))
+    await db.commit()
+
+
+async def cleanup(db):
+    await db.execute(
+        text("DELETE FROM audit_logs WHERE entity_type = :entity_type"),
+        {"entity_type": BENCH_ENTITY_TYPE},
+    )
+    await db.commit()
+
+
+async def measure(db, stmt, runs: int) -> list[float]:
+    """같은 쿼리를 runs회 실행한 소요 시간 (ms, 첫 실행은 캐시 예열로 제외)"""
+    await db.execute(stmt)
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = await db.execute(stmt)
+        result.all()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+async def cursor_for_page(db, page: int, page_size: int):
+    """page 직전 페이지 마지막 항목의 커서 (1페이지는 None)"""
+    if page == 1:
+        return None
+    result = await db.execute(
+        select(AuditLog.created_at, AuditLog.id)
+        .order_by(AuditLog.created_at.desc(), AuditLog.id.desc())
+        .offset((page - 1) * page_size - 1)
+        .limit(1)
+    )
+    row = result.one_or_none()
+    return encode_cursor(row.created_at, row.id) if row else None
+
+
+async def run(args):
+    async with AsyncSessionLocal() as db:
+        print(f"\n벤치마크 이력 {args.rows}건 생성 중...")
+        await seed(db, args.rows)
+
+        try:
+            print(f"\n{'페이지':>8} | {'OFFSET p50':>12} {'max':>9} | {'cursor p50':>12} {'max':>9}")
+            print("-" * 60)
+            for page in PAGES:
+                if (page - 1) * args.page_size >= args.rows:
+                    print(f"{page:>8} | 데이터 부족 (--rows 증가 필요)")
+                    continue
+
+                offset_stmt = paginate(
+                    select(AuditLog), AuditLog.created_at, AuditLog.id, page, args.page_size
+                )
+                cursor = await cursor_for_page(db, page, args.page_size)
+                cursor_stmt = paginate(
+                    select(AuditLog), AuditLog.created_at, AuditLog.id, 1, args.page_size, cursor
+                )
+
+                offset_ms = await measure(db, offset_stmt, args.runs)
+                cursor_ms = await measure(db, cursor_stmt, args.runs)
+                print(
+                    f"{page:>8} | {statistics.median(offset_ms):>10.2f}ms {max(offset_ms):>7.2f}ms | "
+                    f"{statistics.median(cursor_ms):>10.2f}ms {max(cursor_ms):>7.2f}ms"
+                )
+        finally:
+            if args.keep:
+                print(f"\n벤치마크 데이터 유지 (audit_logs.entity_type={BENCH_ENTITY_TYPE})")
+            else:
+                await cleanup(db)
+                print("\n벤치마크 데이터 정리 완료")
+
+    await async_engine.dispose()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+
+    print("=" * 60)
+    print("관리자 목록 페이지네이션 벤치마크")
+    print("=" * 60)
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
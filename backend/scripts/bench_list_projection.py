@@ -0,0 +1,152 @@
+"""
+관리자 목록 컬럼 조회 벤치마크 (ORM 엔티티 vs 표시 컬럼 Row)
+
+사용법:
+    cd backend
+    python -m scripts.bench_list_projection [--page-size 100] [--pages 5] [--runs 5]
+
+기능:
+    - 신청/협력사 목록 첫 N페이지를 두 방식으로 조회하여 응답 아이템 생성까지 측정
+      - 기존: select(Application) 전체 컬럼 → ORM 엔티티 → decrypt_application → ListItem
+      - 변경: select(*APPLICATION_LIST_COLUMNS) → Row → build_application_list_item
+    - 페이지당 중앙값/최대 지연(ms) 및 최대 메모리 할당량(KB, tracemalloc) 비교
+    - 두 방식의 목록 아이템이 동일한지 검증
+    - 기존 데이터를 읽기만 함 (데이터 생성/변경 없음)
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.core.pagination import paginate, split_page
+from app.models.application import Application
+from app.models.partner import Partner
+from app.schemas.application import ApplicationListItem
+from app.schemas.partner import PartnerListItem
+from app.services.service_utils import get_service_code_to_name_map
+from app.api.v1.endpoints.admin.applications import (
+    APPLICATION_LIST_COLUMNS,
+    build_application_list_item,
+    decrypt_application,
+)
+from app.api.v1.endpoints.admin.partners import (
+    PARTNER_LIST_COLUMNS,
+    build_partner_list_item,
+    decrypt_partner,
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="관리자 목록 컬럼 조회 벤치마크")
+    parser.add_argument("--page-size", type=int, default=100, help="페이지 크기")
+    parser.add_argument("--pages", type=int, default=5, help="측정할 페이지 수 (1페이지부터)")
+    parser.add_argument("--runs", type=int, default=5, help="페이지별 반복 측정 횟수")
+    return parser.parse_args()
+
+
+def application_item_from_entity(app: Application, service_map: dict[str, str]) -> ApplicationListItem:
+    """기존 방식: 엔티티 전체 복호화 후 목록 아이템 생성"""
+    decrypted = decrypt_application(app, service_map)
+    return ApplicationListItem(**{key: decrypted[key] for key in ApplicationListItem.model_fields})
+
+
+def partner_item_from_entity(partner: Partner, service_map: dict[str, str]) -> PartnerListItem:
+    """기존 방식: 엔티티 전체 복호화 후 목록 아이템 생성"""
+    decrypted = decrypt_partner(partner, service_map)
+    return PartnerListItem(**{key: decrypted[key] for key in PartnerListItem.model_fields})
+
+
+async def load_entities(model, build, page: int, page_size: int, service_map: dict[str, str]) -> list:
+    # 세션마다 identity map이 새로 생성되도록 요청 단위 세션 사용 (API와 동일)
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(paginate(select(model), model.created_at, model.id, page, page_size))
+        rows, _ = split_page(result.scalars().all(), page_size)
+        return [build(row, service_map) for row in rows]
+
+
+async def load_rows(model, columns, build, page: int, page_size: int, service_map: dict[str, str]) -> list:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(paginate(select(*columns), model.created_at, model.id, page, page_size))
+        rows, _ = split_page(result.all(), page_size)
+        return [build(row, service_map) for row in rows]
+
+
+async def measure(load, runs: int) -> tuple[list[float], int, list]:
+    """load를 runs회 실행한 소요 시간(ms), 최대 메모리 할당량(bytes), 마지막 결과 (첫 실행은 예열로 제외)"""
+    items = await load()
+    timings = []
+    peak = 0
+    for _ in range(runs):
+        tracemalloc.start()
+        started = time.perf_counter()
+        items = await load()
+        timings.append((time.perf_counter() - started) * 1000)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return timings, peak, items
+
+
+async def bench_list(label: str, model, columns, build_entity, build_row, args, service_map):
+    print(f"\n[{label}] page_size={args.page_size}")
+    print(f"{'페이지':>6} | {'ORM p50':>10} {'max':>9} {'peak':>9} | {'Row p50':>10} {'max':>9} {'peak':>9}")
+    print("-" * 76)
+
+    for page in range(1, args.pages + 1):
+        entity_ms, entity_peak, entity_items = await measure(
+            lambda: load_entities(model, build_entity, page, args.page_size, service_map), args.runs
+        )
+        row_ms, row_peak, row_items = await measure(
+            lambda: load_rows(model, columns, build_row, page, args.page_size, service_map), args.runs
+        )
+
+        if not entity_items:
+            print(f"{page:>6} | 데이터 없음")
+            break
+        if entity_items != row_items:
+            print(f"{page:>6} | ❌ 결과 불일치")
+            continue
+
+        print(
+            f"{page:>6} | {statistics.median(entity_ms):>8.2f}ms {max(entity_ms):>7.2f}ms {entity_peak / 1024:>7.0f}KB | "
+            f"{statistics.median(row_ms):>8.2f}ms {max(row_ms):>7.2f}ms {row_peak / 1024:>7.0f}KB"
+        )
+
+
+async def run(args):
+    service_map = await get_service_code_to_name_map()
+
+    await bench_list(
+        "신청 목록", Application, APPLICATION_LIST_COLUMNS,
+        application_item_from_entity, build_application_list_item, args, service_map,
+    )
+    await bench_list(
+        "협력사 목록", Partner, PARTNER_LIST_COLUMNS,
+        partner_item_from_entity, build_partner_list_item, args, service_map,
+    )
+
+    await async_engine.dispose()
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+
+    print("=" * 60)
+    print("관리자 목록 컬럼 조회 벤치마크")
+    print("=" * 60)
+
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+SMS 템플릿 렌더링 마이크로 벤치마크
+
+사용법:
+    cd backend
+    python -m scripts.bench_sms_template [반복 횟수]
+
+기능:
+    - 기존 방식(변수별 str.replace + 라인 재분할)과 컴파일 템플릿 렌더링 비교
+    - 렌더링 1회당 소요 시간(µs) 및 최대 임시 메모리 할당량(bytes) 측정
+    - 두 방식의 결과가 동일한지 검증
+    - DB 연결 불필요 (순수 CPU 연산만 측정)
+"""
+
+import sys
+import os
+import time
+import tracemalloc
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.sms_template_cache import compile_template
+
+
+# 실제 운영 템플릿과 동일한 형태 (partner_assigned, application_cancelled, 관리자 신규 신청 알림)
+SAMPLE_TEMPLATES = {
+    "partner_assigned": (
+        "[전방홈케어] {customer_name}님, 담당 협력사({partner_name})가 배정되었습니다.\n"
+        "예정일: {scheduled_date} {scheduled_time}\n"
+        "견적: {estimated_cost}\n"
+        "곧 연락드릴 예정입니다.",
+        {
+            "customer_name": "홍길동",
+            "partner_name": "전방조경",
+            "scheduled_date": "2026-01-10",
+            "scheduled_time": "오전",
+            "estimated_cost": "",
+        },
+    ),
+    "application_cancelled": (
+        "[전방홈케어] {customer_name}님, 서비스 신청(번호: {application_number})이 취소되었습니다.\n"
+        "사유: {cancel_reason}\n"
+        "문의사항은 연락주세요.",
+        {
+            "customer_name": "홍길동",
+            "application_number": "20260105-001",
+            "cancel_reason": None,
+        },
+    ),
+    "new_application": (
+        "[전방홈케어] 새 서비스 신청\n"
+        "신청번호: {application_number}\n"
+        "연락처: {customer_phone}\n"
+        "서비스: {services}\n"
+        "희망상담일: {preferred_consultation_date}\n"
+        "희망작업일: {preferred_work_date}\n"
+        "{duplicate_notice}",
+        {
+            "application_number": "20260105-001",
+            "customer_phone": "010-1234-5678",
+            "services": "제초, 잔디관리 외 1건",
+            "preferred_consultation_date": "2026-01-07",
+            "preferred_work_date": "",
+            "duplicate_notice": "",
+        },
+    ),
+}
+
+
+def legacy_format(content: str, **kwargs) -> str:
+    """기존 SMSTemplate.format_message 방식 (비교 기준)"""
+    message = content
+    for key, value in kwargs.items():
+        message = message.replace(f"{{{key}}}", str(value) if value else "")
+
+    lines = message.split('\n')
+    cleaned_lines = []
+    for line in lines:
+        stripped = line.rstrip()
+        if stripped.endswith(':') or stripped.endswith(': '):
+            continue
+        if stripped:
+            cleaned_lines.append(line)
+
+    return '\n'.join(cleaned_lines).strip()
+
+
+def measure(render, iterations: int) -> tuple[float, int]:
+    """렌더링 1회당 시간(µs)과 최대 임시 할당량(bytes) 측정"""
+    # 워밍업
+    for _ in range(min(iterations, 1000)):
+        render()
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    render()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return elapsed / iterations * 1_000_000, peak - base
+
+
+def main():
+    """메인 함수"""
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    print("=" * 60)
+    print(f"SMS 템플릿 렌더링 벤치마크 (반복 {iterations:,}회)")
+    print("=" * 60)
+
+    for key, (content, variables) in SAMPLE_TEMPLATES.items():
+        compiled = compile_template(content, key)
+
+        expected = legacy_format(content, **variables)
+        actual = compiled.render(variables)
+        if expected != actual:
+            print(f"\n[{key}] 결과 불일치!")
+            print(f"  기존: {expected!r}")
+            print(f"  컴파일: {actual!r}")
+            sys.exit(1)
+
+        legacy_us, legacy_bytes = measure(lambda: legacy_format(content, **variables), iterations)
+        compiled_us, compiled_bytes = measure(lambda: compiled.render(variables), iterations)
+
+        print(f"\n[{key}]")
+        print(f"  기존 방식  : {legacy_us:7.2f} µs/회, {legacy_bytes:6d} bytes (peak)")
+        print(f"  컴파일 방식: {compiled_us:7.2f} µs/회, {compiled_bytes:6d} bytes (peak)")
+        print(f"  속도 향상  : {legacy_us / compiled_us:.2f}x")
+
+    print("\n" + "=" * 60)
+    print("결과 동일성 검증 통과")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
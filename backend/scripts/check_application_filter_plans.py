@@ -0,0 +1,141 @@
+"""
+관리자 신청 목록 필터 실행 계획 점검
+
+사용법:
+    cd backend
+    python -m scripts.check_application_filter_plans [--no-seqscan] [--page-size 20]
+
+기능:
+    - 관리자 신청 목록과 같은 쿼리(ApplicationFilter + paginate)를 필터별로 EXPLAIN
+    - 필터가 없는 쿼리와 실행 계획이 달라지는지 검증 (필터가 쿼리에 반영되는지 확인)
+    - 필터별로 사용된 인덱스 출력
+    - --no-seqscan: enable_seqscan=off로 실행하여 필터별 인덱스 사용 가능 여부 확인
+      (데이터가 적은 개발 DB에서는 플래너가 순차 스캔을 선택하므로)
+    - 필터 중 하나라도 실행 계획이 같으면 종료 코드 1
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+import json
+from datetime import date, timedelta
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.core.pagination import paginate
+from app.models.application import Application
+from app.services.application_filter import ApplicationFilter
+from app.api.v1.endpoints.admin.applications import APPLICATION_LIST_COLUMNS
+
+# 점검할 필터 (이름, 필터, 기대 인덱스 - 인덱스 사용이 선택적인 필터는 None)
+FILTER_CASES = (
+    ("status", ApplicationFilter(status="new"), "idx_applications_status_created_id"),
+    ("search(number)", ApplicationFilter(search="20260105-001", search_type="number"), None),
+    ("date_from", ApplicationFilter(date_from=date.today() - timedelta(days=7)), "idx_applications_created_id"),
+    ("date_to", ApplicationFilter(date_to=date.today() - timedelta(days=30)), "idx_applications_created_id"),
+    ("services", ApplicationFilter(services=["WEEDING", "SNOW_REMOVAL"]), "idx_applications_selected_services"),
+    ("assigned_admin_id", ApplicationFilter(assigned_admin_id=1), "idx_applications_admin_created_id"),
+    ("assigned_partner_id", ApplicationFilter(assigned_partner_id=1), "idx_applications_partner_created_id"),
+    ("region", ApplicationFilter(region="41"), None),
+)
+
+
+class explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <쿼리>"""
+
+    inherit_cache = False
+
+    def __init__(self, stmt):
+        self.statement = stmt
+
+
+@compiles(explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="관리자 신청 목록 필터 실행 계획 점검")
+    parser.add_argument("--no-seqscan", action="store_true", help="순차 스캔 비활성화 (enable_seqscan=off)")
+    parser.add_argument("--page-size", type=int, default=20, help="페이지 크기")
+    return parser.parse_args()
+
+
+def normalize_plan(node: dict) -> dict:
+    """비용/행 수 추정치를 제외한 계획 구조 (데이터 통계와 무관하게 비교)"""
+    return {
+        key: ([normalize_plan(child) for child in value] if key == "Plans" else value)
+        for key, value in node.items()
+        if key not in ("Startup Cost", "Total Cost", "Plan Rows", "Plan Width")
+    }
+
+
+def used_indexes(node: dict) -> set[str]:
+    indexes = {node["Index Name"]} if "Index Name" in node else set()
+    for child in node.get("Plans", []):
+        indexes |= used_indexes(child)
+    return indexes
+
+
+async def explain_plan(db, filters: ApplicationFilter, page_size: int) -> dict:
+    stmt = await filters.apply(db, select(*APPLICATION_LIST_COLUMNS))
+    stmt = paginate(stmt, Application.created_at, Application.id, 1, page_size)
+    result = await db.execute(explain(stmt))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+async def run(args) -> bool:
+    ok = True
+    async with AsyncSessionLocal() as db:
+        if args.no_seqscan:
+            await db.execute(text("SET enable_seqscan = off"))
+
+        baseline = await explain_plan(db, ApplicationFilter(), args.page_size)
+        print(f"\n필터 없음: {', '.join(sorted(used_indexes(baseline))) or '순차 스캔'}")
+
+        print(f"\n{'필터':<22} {'계획 변경':<10} 사용 인덱스")
+        print("-" * 60)
+        for name, filters, expected_index in FILTER_CASES:
+            plan = await explain_plan(db, filters, args.page_size)
+            changed = normalize_plan(plan) != normalize_plan(baseline)
+            indexes = used_indexes(plan)
+
+            status = "✅" if changed else "❌"
+            note = ""
+            if expected_index and args.no_seqscan and expected_index not in indexes:
+                note = f" (기대 인덱스 미사용: {expected_index})"
+            print(f"{name:<22} {status:<10} {', '.join(sorted(indexes)) or '순차 스캔'}{note}")
+
+            if not changed:
+                ok = False
+
+    await async_engine.dispose()
+    return ok
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+
+    print("=" * 60)
+    print("관리자 신청 목록 필터 실행 계획 점검")
+    print("=" * 60)
+
+    ok = asyncio.run(run(args))
+
+    print("\n" + ("모든 필터가 실행 계획에 반영됨" if ok else "실행 계획에 반영되지 않은 필터가 있음"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
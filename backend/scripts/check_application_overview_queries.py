@@ -0,0 +1,141 @@
+"""
+신청 상세 통합 조회 쿼리 수 점검
+
+사용법:
+    cd backend
+    python -m scripts.check_application_overview_queries [--id 신청ID]
+
+기능:
+    - GET /admin/applications/{id}/overview 핸들러를 직접 호출하여 실행된 SQL 수 측정
+    - 기존 화면 구성(상세 + 배정 + 메모 + 고객 이력 + 변경 이력 개별 요청)의 쿼리 수와 비교
+    - 통합 조회 쿼리 수가 OVERVIEW_QUERY_BUDGET을 넘으면 종료 코드 1
+    - --id 미지정 시 배정이 가장 많은 신청으로 점검 (배정 수와 무관하게 일정한지 확인)
+    - 기준 데이터 캐시(서비스 코드 맵)는 측정 전에 미리 로드하여 제외
+"""
+
+import sys
+import os
+import argparse
+import asyncio
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, func, select
+
+from app.core.database import AsyncSessionLocal, async_engine
+from app.models.application_assignment import ApplicationPartnerAssignment
+from app.services.service_utils import get_service_code_to_name_map
+from app.api.v1.endpoints.admin.applications import (
+    get_application,
+    get_application_notes,
+    get_application_overview,
+    get_customer_history,
+)
+from app.api.v1.endpoints.admin.audit_logs import get_entity_audit_logs
+
+OVERVIEW_QUERY_BUDGET = 5
+
+
+class QueryCounter:
+    """async_engine에서 실행된 SQL 수 집계"""
+
+    def __init__(self):
+        self.count = 0
+        self.statements: list[str] = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(" ".join(statement.split())[:100])
+
+    def reset(self):
+        self.count = 0
+        self.statements = []
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="신청 상세 통합 조회 쿼리 수 점검")
+    parser.add_argument("--id", type=int, default=None, help="점검할 신청 ID")
+    return parser.parse_args()
+
+
+async def pick_application_id(db) -> int | None:
+    """배정이 가장 많은 신청 ID"""
+    result = await db.execute(
+        select(ApplicationPartnerAssignment.application_id)
+        .group_by(ApplicationPartnerAssignment.application_id)
+        .order_by(func.count().desc())
+        .limit(1)
+    )
+    return result.scalar()
+
+
+async def count_queries(counter: QueryCounter, call) -> int:
+    async with AsyncSessionLocal() as db:
+        counter.reset()
+        await call(db)
+        return counter.count
+
+
+async def run(args) -> bool:
+    counter = QueryCounter()
+    event.listen(async_engine.sync_engine, "before_cursor_execute", counter)
+
+    await get_service_code_to_name_map()
+
+    application_id = args.id
+    if application_id is None:
+        async with AsyncSessionLocal() as db:
+            application_id = await pick_application_id(db)
+    if application_id is None:
+        print("\n배정이 있는 신청이 없습니다 (--id로 지정)")
+        return False
+
+    overview = await count_queries(
+        counter, lambda db: get_application_overview(application_id, db=db, current_admin=None)
+    )
+    overview_statements = list(counter.statements)
+
+    legacy_calls = {
+        "상세 + 배정": lambda db: get_application(application_id, db=db, current_admin=None),
+        "메모": lambda db: get_application_notes(
+            application_id, page=1, page_size=50, cursor=None, count="estimate", db=db, current_admin=None
+        ),
+        "고객 이력": lambda db: get_customer_history(application_id, db=db, current_admin=None),
+        "변경 이력": lambda db: get_entity_audit_logs(
+            "application", application_id, page=1, page_size=50, cursor=None, count="estimate",
+            db=db, current_admin=None,
+        ),
+    }
+    legacy = {name: await count_queries(counter, call) for name, call in legacy_calls.items()}
+
+    await async_engine.dispose()
+
+    print(f"\n신청 ID: {application_id}")
+    print(f"\n[기존 개별 요청] {len(legacy)}회 요청, 쿼리 {sum(legacy.values())}회")
+    for name, count in legacy.items():
+        print(f"  {name:<10} {count}회")
+
+    print(f"\n[통합 조회] 1회 요청, 쿼리 {overview}회 (기준 {OVERVIEW_QUERY_BUDGET}회 이하)")
+    for statement in overview_statements:
+        print(f"  - {statement}")
+
+    return overview <= OVERVIEW_QUERY_BUDGET
+
+
+def main():
+    """메인 함수"""
+    args = parse_args()
+
+    print("=" * 60)
+    print("신청 상세 통합 조회 쿼리 수 점검")
+    print("=" * 60)
+
+    ok = asyncio.run(run(args))
+
+    print("\n" + ("✅ 쿼리 수 기준 충족" if ok else "❌ 쿼리 수 기준 초과"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState, useCallback } from "react";
+import { useEffect, useRef, useState } from "react";
 import {
   Loader2,
   CheckCircle,
@@ -10,7 +10,7 @@ import {
   RefreshCw,
 } from "lucide-react";
 import { useAuthStore } from "@/lib/stores/auth";
-import { getBulkSMSJob, BulkSMSJobDetail } from "@/lib/api/admin";
+import { getBulkSMSJob, subscribeBulkSMSProgress, BulkSMSJobDetail } from "@/lib/api/admin";
 import { cn } from "@/lib/utils";
 
 interface BulkSMSProgressProps {
@@ -19,45 +19,91 @@ interface BulkSMSProgressProps {
   onClose?: () => void;
 }
 
+const FINAL_STATUSES = ["completed", "partial_failed", "failed"];
+
 export function BulkSMSProgress({ jobId, onComplete, onClose }: BulkSMSProgressProps) {
   const { getValidToken } = useAuthStore();
 
   const [job, setJob] = useState<BulkSMSJobDetail | null>(null);
   const [error, setError] = useState<string | null>(null);
-  const [isPolling, setIsPolling] = useState(true);
+  const [attempt, setAttempt] = useState(0);
 
-  const fetchJobStatus = useCallback(async () => {
-    try {
-      const token = await getValidToken();
-      if (!token) return;
+  // 부모가 매 렌더마다 새 콜백을 넘겨도 구독을 다시 열지 않도록 ref로 보관
+  const onCompleteRef = useRef(onComplete);
+  onCompleteRef.current = onComplete;
 
+  useEffect(() => {
+    const controller = new AbortController();
+
+    // 상세 조회 (제목 등 기본 정보, 종료 후 실패 수신자 목록)
+    const loadDetail = async (token: string) => {
       const data = await getBulkSMSJob(token, jobId);
+      if (controller.signal.aborted) return null;
       setJob(data);
-
-      // Stop polling when job is done
-      if (["completed", "partial_failed", "failed"].includes(data.status)) {
-        setIsPolling(false);
-        onComplete?.(data);
+      if (FINAL_STATUSES.includes(data.status)) {
+        onCompleteRef.current?.(data);
       }
-    } catch (err) {
-      setError(err instanceof Error ? err.message : "상태를 불러올 수 없습니다");
-      setIsPolling(false);
-    }
-  }, [jobId, getValidToken, onComplete]);
+      return data;
+    };
 
-  useEffect(() => {
-    fetchJobStatus();
+    const run = async () => {
+      const token = await getValidToken();
+      if (!token) return;
 
-    // Poll every 2 seconds while processing
-    let interval: NodeJS.Timeout;
-    if (isPolling) {
-      interval = setInterval(fetchJobStatus, 2000);
-    }
+      try {
+        const initial = await loadDetail(token);
+        if (!initial || FINAL_STATUSES.includes(initial.status)) return;
 
-    return () => {
-      if (interval) clearInterval(interval);
+        // 진행 상황은 SSE 스트림으로 수신 (폴링 없음)
+        let finished = false;
+        try {
+          await subscribeBulkSMSProgress(
+            token,
+            jobId,
+            (event) => {
+              setJob((prev) =>
+                prev
+                  ? {
+                      ...prev,
+                      status: event.status,
+                      total_count: event.total_count,
+                      sent_count: event.sent_count,
+                      failed_count: event.failed_count,
+                      progress: event.progress,
+                      current_batch: event.current_batch,
+                      total_batches: event.total_batches,
+                    }
+                  : prev
+              );
+              if (FINAL_STATUSES.includes(event.status)) finished = true;
+            },
+            controller.signal
+          );
+        } catch (err) {
+          if (controller.signal.aborted) return;
+          // 스트림 오류 시 상세 1회 조회로 대체 (종료되지 않았으면 다시 시도 안내)
+          const data = await loadDetail(token);
+          if (data && !FINAL_STATUSES.includes(data.status)) {
+            throw err;
+          }
+          return;
+        }
+
+        if (controller.signal.aborted) return;
+        // 종료 이벤트 후 실패 수신자 목록 포함 상세 1회 조회
+        const data = await loadDetail(token);
+        if (!finished && data && !FINAL_STATUSES.includes(data.status)) {
+          setError("진행 상황 연결이 끊어졌습니다");
+        }
+      } catch (err) {
+        if (controller.signal.aborted) return;
+        setError(err instanceof Error ? err.message : "상태를 불러올 수 없습니다");
+      }
     };
-  }, [isPolling, fetchJobStatus]);
+
+    run();
+    return () => controller.abort();
+  }, [jobId, attempt, getValidToken]);
 
   const getStatusConfig = (status: string) => {
     const configs: Record<string, { icon: React.ReactNode; label: string; color: string }> = {
@@ -98,7 +144,7 @@ export function BulkSMSProgress({ jobId, onComplete, onClose }: BulkSMSProgressP
         <button
           onClick={() => {
             setError(null);
-            setIsPolling(true);
+            setAttempt((n) => n + 1);
           }}
           className="inline-flex items-center px-4 py-2 text-sm font-medium text-primary hover:bg-primary-50 rounded-lg transition-colors"
         >
@@ -119,7 +165,7 @@ export function BulkSMSProgress({ jobId, onComplete, onClose }: BulkSMSProgressP
   }
 
   const statusConfig = getStatusConfig(job.status);
-  const isFinished = ["completed", "partial_failed", "failed"].includes(job.status);
+  const isFinished = FINAL_STATUSES.includes(job.status);
 
   return (
     <div className="p-6 space-y-6">
@@ -54,6 +54,7 @@ export type {
   BulkSMSJobResponse,
   FailedRecipient,
   BulkSMSJobDetail,
+  BulkSMSProgressEvent,
   BulkSMSJobListResponse,
   BulkSMSJobListParams,
   // Schedule
@@ -173,6 +174,7 @@ export {
   getSMSRecipients,
   createBulkSMSJob,
   getBulkSMSJob,
+  subscribeBulkSMSProgress,
   getBulkSMSJobs,
 } from "./sms";
 
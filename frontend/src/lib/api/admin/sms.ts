@@ -3,7 +3,7 @@
  * SMS 발송 관리 API
  */
 
-import { fetchWithToken } from "../client";
+import { fetchStreamWithToken, fetchWithToken } from "../client";
 import type {
   SMSStats,
   SMSLogListResponse,
@@ -18,6 +18,7 @@ import type {
   BulkSMSSendRequest,
   BulkSMSJobResponse,
   BulkSMSJobDetail,
+  BulkSMSProgressEvent,
   BulkSMSJobListResponse,
   BulkSMSJobListParams,
 } from "./types";
@@ -133,7 +134,7 @@ export async function createBulkSMSJob(
 }
 
 /**
- * 복수 SMS 발송 Job 상태 조회 (폴링용)
+ * 복수 SMS 발송 Job 상세 조회 (실패 수신자 목록 포함)
  */
 export async function getBulkSMSJob(
   token: string,
@@ -142,6 +143,49 @@ export async function getBulkSMSJob(
   return fetchWithToken<BulkSMSJobDetail>(`/admin/sms/bulk/${jobId}`, token);
 }
 
+/**
+ * 복수 SMS 발송 Job 진행 상황 구독 (Server-Sent Events)
+ *
+ * 인증 헤더가 필요하므로 EventSource 대신 fetch 스트림으로 읽는다.
+ * finished 이벤트 후 서버가 스트림을 닫으면 resolve, 연결 오류 시 reject.
+ */
+export async function subscribeBulkSMSProgress(
+  token: string,
+  jobId: number,
+  onEvent: (event: BulkSMSProgressEvent) => void,
+  signal?: AbortSignal
+): Promise<void> {
+  const response = await fetchStreamWithToken(`/admin/sms/bulk/${jobId}/events`, token, {
+    headers: { Accept: "text/event-stream" },
+    signal,
+  });
+
+  const reader = response.body!.pipeThrough(new TextDecoderStream()).getReader();
+  let buffer = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) return;
+
+    buffer += value.replace(/\r\n/g, "\n");
+    let boundary: number;
+    while ((boundary = buffer.indexOf("\n\n")) >= 0) {
+      const block = buffer.slice(0, boundary);
+      buffer = buffer.slice(boundary + 2);
+
+      // ": keep-alive" 등 주석 줄은 무시하고 data 줄만 사용
+      const data = block
+        .split("\n")
+        .filter((line) => line.startsWith("data:"))
+        .map((line) => line.slice(5).trimStart())
+        .join("\n");
+      if (data) {
+        onEvent(JSON.parse(data) as BulkSMSProgressEvent);
+      }
+    }
+  }
+}
+
 /**
  * 복수 SMS 발송 Job 목록 조회
  */
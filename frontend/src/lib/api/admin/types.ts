@@ -487,6 +487,21 @@ export interface BulkSMSJobDetail {
   completed_at?: string;
 }
 
+// 대량 발송 진행 상황 스트림 이벤트 (GET /admin/sms/bulk/{job_id}/events)
+export interface BulkSMSProgressEvent {
+  event: "snapshot" | "started" | "batch" | "waiting" | "finished";
+  job_id: number;
+  status: BulkSMSJobDetail["status"];
+  total_count: number;
+  sent_count: number;
+  failed_count: number;
+  progress: number; // 0-100%
+  current_batch: number;
+  total_batches: number;
+  sent_delta: number; // 직전 이벤트 대비 증가분
+  failed_delta: number;
+}
+
 export interface BulkSMSJobListResponse {
   items: BulkSMSJobDetail[];
   total: number;
@@ -521,11 +536,18 @@ export interface ScheduleListResponse {
   total: number;
 }
 
-export interface MonthlyStats {
+export interface ScheduleCalendarStats {
   total_scheduled: number;
   completed: number;
   pending: number;
   by_date: Record<string, number>;
+  by_status: Record<string, number>;
+  by_date_status: Record<string, Record<string, number>>;
+}
+
+// 최상위: 신청 기준 (레거시), assignments: 배정 기준
+export interface MonthlyStats extends ScheduleCalendarStats {
+  assignments: ScheduleCalendarStats | null;
 }
 
 export interface SchedulePartner {
@@ -300,6 +300,47 @@ export async function fetchWithToken<T>(
   }
 }
 
+/**
+ * 스트리밍 응답 API 호출 (토큰 직접 전달, SSE 등 본문을 직접 읽는 경우)
+ */
+export async function fetchStreamWithToken(
+  endpoint: string,
+  token: string,
+  options: FetchOptions = {}
+): Promise<Response> {
+  const { params, body, ...fetchOptions } = options;
+
+  const url = buildUrl(endpoint, params);
+
+  const headers: HeadersInit = {
+    Authorization: `Bearer ${token}`,
+    ...fetchOptions.headers,
+  };
+
+  let response: Response;
+  try {
+    response = await fetch(url, {
+      ...fetchOptions,
+      headers,
+      body: body ? JSON.stringify(body) : undefined,
+    });
+  } catch (error) {
+    if (error instanceof DOMException && error.name === "AbortError") {
+      throw error;
+    }
+    throw new NetworkError();
+  }
+
+  if (!response.ok) {
+    throw await parseErrorResponse(response);
+  }
+  if (!response.body) {
+    throw new NetworkError("스트리밍을 지원하지 않는 환경입니다");
+  }
+
+  return response;
+}
+
 /**
  * FormData 업로드 (인증 포함)
  */